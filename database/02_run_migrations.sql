@@ -39,5 +39,10 @@
 \i /docker-entrypoint-initdb.d/02_migrations/034_add_unique_constraint_extracted_parliamentary_group_members.sql
 \i /docker-entrypoint-initdb.d/02_migrations/035_create_users_table.sql
 \i /docker-entrypoint-initdb.d/02_migrations/036_add_user_id_to_work_tables.sql
+\i /docker-entrypoint-initdb.d/02_migrations/037_add_speakers_name_trigram_index.sql
+\i /docker-entrypoint-initdb.d/02_migrations/038_add_trigram_search_indexes.sql
+\i /docker-entrypoint-initdb.d/02_migrations/039_add_keyset_pagination_indexes.sql
+\i /docker-entrypoint-initdb.d/02_migrations/040_create_statistics_materialized_views.sql
+\i /docker-entrypoint-initdb.d/02_migrations/041_add_conversations_minutes_speaker_index.sql
 
 \echo 'Migrations completed.'
@@ -0,0 +1,9 @@
+-- Migration: Add trigram index on speakers.name
+-- Speaker IDs for a whole minutes record are resolved in one query that
+-- matches each name exactly or with LIKE '%name%'. The B-tree index from
+-- migration 019 cannot serve a leading-wildcard LIKE; a pg_trgm GIN index can.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_speakers_name_trgm
+ON speakers USING gin (name gin_trgm_ops);
@@ -0,0 +1,21 @@
+-- Migration: Add trigram indexes for name and comment searches
+-- Name searches use ILIKE '%name%' and the speaker linking UPDATE joins on
+-- ILIKE '%' || s.name || '%'. The B-tree indexes from migration 019 cannot
+-- serve a leading wildcard; pg_trgm GIN indexes can, and also back the
+-- similarity() ranking of search results. speakers.name is covered by 037.
+--
+-- conversations.comment gets a trigram index rather than a tsvector index:
+-- the built-in text search configurations do not segment Japanese, so a
+-- to_tsvector() index would only match whole unspaced sentences, while a
+-- trigram index serves substring keyword search in any language.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_politicians_name_trgm
+ON politicians USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_conversations_speaker_name_trgm
+ON conversations USING gin (speaker_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_conversations_comment_trgm
+ON conversations USING gin (comment gin_trgm_ops);
@@ -0,0 +1,12 @@
+-- Migration: Add indexes for keyset (cursor) pagination of meetings
+-- Meeting listings page by (COALESCE(date, '-infinity'), id) descending so
+-- the row comparison against the cursor never meets a NULL date. These
+-- expression indexes let each page start directly at the cursor instead of
+-- sorting and skipping every earlier row. Conversations page by id DESC,
+-- which the primary key already serves.
+
+CREATE INDEX IF NOT EXISTS idx_meetings_keyset
+ON meetings ((COALESCE(date, '-infinity'::date)) DESC, id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_meetings_conference_keyset
+ON meetings (conference_id, (COALESCE(date, '-infinity'::date)) DESC, id DESC);
@@ -0,0 +1,223 @@
+-- Migration: Precompute dashboard statistics in materialized views
+-- The monitoring and data coverage dashboards used to aggregate conversations,
+-- speakers, politicians and meetings on every page load. These views hold the
+-- aggregates instead; each row carries refreshed_at so readers can show how
+-- fresh the numbers are.
+--
+-- Every view has a unique index so it can be refreshed with
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY, which does not block readers.
+-- Refresh them with refresh_statistics_views() from a scheduler
+-- (`sagebase refresh-stats`) or after minutes processing.
+
+-- 全体の集計値（1行のみ）
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_coverage_summary AS
+SELECT
+    1 AS id,
+    (SELECT COUNT(*) FROM governing_bodies) AS total_governing_bodies,
+    (SELECT COUNT(DISTINCT governing_body_id) FROM conferences)
+        AS governing_bodies_with_conferences,
+    (SELECT COUNT(DISTINCT c.governing_body_id)
+     FROM conferences c
+     JOIN meetings m ON c.id = m.conference_id)
+        AS governing_bodies_with_meetings,
+    (SELECT COUNT(*) FROM conferences) AS total_conferences,
+    (SELECT COUNT(DISTINCT conference_id) FROM meetings) AS active_conferences,
+    (SELECT COUNT(*) FROM meetings) AS total_meetings,
+    (SELECT COUNT(DISTINCT meeting_id) FROM minutes) AS meetings_with_minutes,
+    (SELECT COUNT(DISTINCT mi.meeting_id)
+     FROM minutes mi
+     WHERE EXISTS (SELECT 1 FROM conversations c WHERE c.minutes_id = mi.id))
+        AS meetings_with_conversations,
+    (SELECT COUNT(*) FROM politicians) AS total_politicians,
+    (SELECT COUNT(DISTINCT politician_id) FROM politician_affiliations)
+        AS active_politicians,
+    (SELECT COUNT(*) FROM political_parties) AS total_parties,
+    (SELECT COUNT(DISTINCT political_party_id) FROM politicians
+     WHERE political_party_id IS NOT NULL) AS active_parties,
+    (SELECT COUNT(*) FROM conversations) AS total_conversations,
+    (SELECT COUNT(*) FROM conversations WHERE speaker_id IS NOT NULL)
+        AS linked_conversations,
+    (SELECT COUNT(*) FROM conversations WHERE minutes_id IS NOT NULL)
+        AS conversations_with_minutes,
+    (SELECT COUNT(*) FROM speakers) AS total_speakers,
+    (SELECT COUNT(*) FROM speakers WHERE type IN ('politician', '政治家'))
+        AS matched_speakers,
+    now() AS refreshed_at;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_coverage_summary_id
+ON mv_coverage_summary (id);
+
+-- 会議体ごとの集計
+-- 会議・所属・発言を別々に集計してから結合し、JOINによる行の膨張を避ける
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_conference_coverage AS
+WITH meeting_counts AS (
+    SELECT
+        conference_id,
+        COUNT(*) AS meeting_count,
+        MIN(date) AS first_meeting_date,
+        MAX(date) AS last_meeting_date
+    FROM meetings
+    GROUP BY conference_id
+),
+politician_counts AS (
+    SELECT conference_id, COUNT(DISTINCT politician_id) AS politician_count
+    FROM politician_affiliations
+    GROUP BY conference_id
+),
+conversation_counts AS (
+    SELECT m.conference_id, COUNT(*) AS conversation_count
+    FROM conversations cv
+    JOIN minutes mi ON cv.minutes_id = mi.id
+    JOIN meetings m ON mi.meeting_id = m.id
+    GROUP BY m.conference_id
+)
+SELECT
+    c.id AS conference_id,
+    c.name AS conference_name,
+    c.type AS conference_type,
+    gb.id AS governing_body_id,
+    gb.name AS governing_body_name,
+    COALESCE(mc.meeting_count, 0) AS meeting_count,
+    COALESCE(pc.politician_count, 0) AS politician_count,
+    COALESCE(cc.conversation_count, 0) AS conversation_count,
+    mc.first_meeting_date,
+    mc.last_meeting_date,
+    now() AS refreshed_at
+FROM conferences c
+JOIN governing_bodies gb ON c.governing_body_id = gb.id
+LEFT JOIN meeting_counts mc ON c.id = mc.conference_id
+LEFT JOIN politician_counts pc ON c.id = pc.conference_id
+LEFT JOIN conversation_counts cc ON c.id = cc.conference_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_conference_coverage_id
+ON mv_conference_coverage (conference_id);
+
+-- 開催主体ごとの集計
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_governing_body_coverage AS
+WITH conference_counts AS (
+    SELECT governing_body_id, COUNT(*) AS conference_count
+    FROM conferences
+    GROUP BY governing_body_id
+),
+meeting_counts AS (
+    SELECT
+        c.governing_body_id,
+        COUNT(*) AS meeting_count,
+        MIN(m.date) AS first_meeting_date,
+        MAX(m.date) AS last_meeting_date
+    FROM meetings m
+    JOIN conferences c ON m.conference_id = c.id
+    GROUP BY c.governing_body_id
+),
+politician_counts AS (
+    SELECT c.governing_body_id, COUNT(DISTINCT pa.politician_id) AS politician_count
+    FROM politician_affiliations pa
+    JOIN conferences c ON pa.conference_id = c.id
+    GROUP BY c.governing_body_id
+),
+conversation_counts AS (
+    SELECT c.governing_body_id, COUNT(*) AS conversation_count
+    FROM conversations cv
+    JOIN minutes mi ON cv.minutes_id = mi.id
+    JOIN meetings m ON mi.meeting_id = m.id
+    JOIN conferences c ON m.conference_id = c.id
+    GROUP BY c.governing_body_id
+)
+SELECT
+    gb.id AS governing_body_id,
+    gb.name,
+    gb.type,
+    gb.organization_code,
+    gb.organization_type,
+    COALESCE(cf.conference_count, 0) AS conference_count,
+    COALESCE(mc.meeting_count, 0) AS meeting_count,
+    COALESCE(pc.politician_count, 0) AS politician_count,
+    COALESCE(cc.conversation_count, 0) AS conversation_count,
+    mc.first_meeting_date,
+    mc.last_meeting_date,
+    now() AS refreshed_at
+FROM governing_bodies gb
+LEFT JOIN conference_counts cf ON gb.id = cf.governing_body_id
+LEFT JOIN meeting_counts mc ON gb.id = mc.governing_body_id
+LEFT JOIN politician_counts pc ON gb.id = pc.governing_body_id
+LEFT JOIN conversation_counts cc ON gb.id = cc.governing_body_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_governing_body_coverage_id
+ON mv_governing_body_coverage (governing_body_id);
+
+-- 日別の活動量
+-- 会議・発言は会議の開催日、発言者・政治家は登録日で集計する
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_daily_activity AS
+WITH meeting_days AS (
+    SELECT date AS activity_date, COUNT(*) AS meetings_count
+    FROM meetings
+    WHERE date IS NOT NULL
+    GROUP BY date
+),
+conversation_days AS (
+    SELECT m.date AS activity_date, COUNT(*) AS conversations_count
+    FROM conversations cv
+    JOIN minutes mi ON cv.minutes_id = mi.id
+    JOIN meetings m ON mi.meeting_id = m.id
+    WHERE m.date IS NOT NULL
+    GROUP BY m.date
+),
+speaker_days AS (
+    SELECT created_at::date AS activity_date, COUNT(*) AS speakers_count
+    FROM speakers
+    WHERE created_at IS NOT NULL
+    GROUP BY created_at::date
+),
+politician_days AS (
+    SELECT created_at::date AS activity_date, COUNT(*) AS politicians_count
+    FROM politicians
+    WHERE created_at IS NOT NULL
+    GROUP BY created_at::date
+)
+SELECT
+    activity_date,
+    COALESCE(md.meetings_count, 0) AS meetings_count,
+    COALESCE(cd.conversations_count, 0) AS conversations_count,
+    COALESCE(sd.speakers_count, 0) AS speakers_count,
+    COALESCE(pd.politicians_count, 0) AS politicians_count,
+    now() AS refreshed_at
+FROM meeting_days md
+FULL JOIN conversation_days cd USING (activity_date)
+FULL JOIN speaker_days sd USING (activity_date)
+FULL JOIN politician_days pd USING (activity_date);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_daily_activity_date
+ON mv_daily_activity (activity_date);
+
+-- 統計ビューの一括更新
+-- min_interval より新しい集計がある場合や、別のセッションが更新中の場合は
+-- 何もせず FALSE を返す
+CREATE OR REPLACE FUNCTION refresh_statistics_views(
+    min_interval INTERVAL DEFAULT INTERVAL '0'
+)
+RETURNS BOOLEAN AS $$
+DECLARE
+    last_refreshed_at TIMESTAMPTZ;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('refresh_statistics_views')) THEN
+        RETURN FALSE;
+    END IF;
+
+    SELECT refreshed_at INTO last_refreshed_at FROM mv_coverage_summary;
+    IF last_refreshed_at IS NOT NULL
+        AND clock_timestamp() - last_refreshed_at < min_interval THEN
+        RETURN FALSE;
+    END IF;
+
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_coverage_summary;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_conference_coverage;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_governing_body_coverage;
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_activity;
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql;
+
+COMMENT ON MATERIALIZED VIEW mv_coverage_summary IS 'ダッシュボード用の全体集計';
+COMMENT ON MATERIALIZED VIEW mv_conference_coverage IS '会議体ごとのデータ集計';
+COMMENT ON MATERIALIZED VIEW mv_governing_body_coverage IS '開催主体ごとのデータ集計';
+COMMENT ON MATERIALIZED VIEW mv_daily_activity IS '日別の活動量';
@@ -0,0 +1,12 @@
+-- Migration: Add a covering index for per-meeting conversation counts
+-- Meeting processing status counts conversations and distinct linked
+-- speakers per minutes record. With (minutes_id, speaker_id) indexed the
+-- count is answered by an index-only scan and never touches the heap, where
+-- the comment text lives. Its leading minutes_id column also serves lookups
+-- by minutes_id, so the single-column indexes on minutes_id are dropped.
+
+CREATE INDEX IF NOT EXISTS idx_conversations_minutes_speaker
+ON conversations (minutes_id, speaker_id);
+
+DROP INDEX IF EXISTS idx_conversations_minutes;
+DROP INDEX IF EXISTS idx_conversations_minutes_id;
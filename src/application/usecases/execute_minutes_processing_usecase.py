@@ -15,16 +15,23 @@ from src.domain.entities.conversation import Conversation
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
 from src.domain.entities.speaker import Speaker
+from src.domain.repositories.data_coverage_repository import IDataCoverageRepository
 from src.domain.services.interfaces.minutes_processing_service import (
     IMinutesProcessingService,
 )
 from src.domain.services.interfaces.storage_service import IStorageService
 from src.domain.services.interfaces.unit_of_work import IUnitOfWork
+from src.domain.services.meeting_processing_status_service import (
+    invalidate_processing_status,
+)
 from src.domain.services.speaker_domain_service import SpeakerDomainService
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 
 logger = get_logger(__name__)
 
+# 統計の再集計は処理が続いてもこの間隔（秒）より頻繁には行わない
+STATISTICS_REFRESH_INTERVAL_SECONDS = 300.0
+
 
 @dataclass
 class ExecuteMinutesProcessingDTO:
@@ -47,6 +54,7 @@ class ExecuteMinutesProcessingUseCase:
         minutes_processing_service: IMinutesProcessingService,
         storage_service: IStorageService,
         unit_of_work: IUnitOfWork,
+        data_coverage_repository: IDataCoverageRepository | None = None,
     ):
         """ユースケースを初期化する
 
@@ -55,11 +63,13 @@ class ExecuteMinutesProcessingUseCase:
             minutes_processing_service: 議事録処理サービス
             storage_service: ストレージサービス
             unit_of_work: Unit of Work for transaction management
+            data_coverage_repository: 処理後に統計を再集計するリポジトリ（任意）
         """
         self.speaker_service = speaker_domain_service
         self.minutes_processing_service = minutes_processing_service
         self.storage_service = storage_service
         self.uow = unit_of_work
+        self.data_coverage_repo = data_coverage_repository
 
     async def execute(
         self, request: ExecuteMinutesProcessingDTO
@@ -96,7 +106,9 @@ class ExecuteMinutesProcessingUseCase:
 
             # 既存のConversationsをチェック・削除
             if existing_minutes and existing_minutes.id:
-                conversations = await self.uow.conversation_repository.get_by_minutes(
+                # 存在確認と削除にはIDのみ必要なため本文は読み込まない
+                conversation_repo = self.uow.conversation_repository
+                conversations = await conversation_repo.get_refs_by_minutes(
                     existing_minutes.id
                 )
                 if conversations:
@@ -112,7 +124,7 @@ class ExecuteMinutesProcessingUseCase:
                         )
                         for conv in conversations:
                             if conv.id:
-                                await self.uow.conversation_repository.delete(conv.id)
+                                await conversation_repo.delete(conv.id)
                         # Flush to ensure deletions are applied
                         await self.uow.flush()
                         logger.info("Existing conversations deleted")
@@ -150,6 +162,10 @@ class ExecuteMinutesProcessingUseCase:
             # トランザクションをコミット（単一コミット）
             await self.uow.commit()
             logger.info("Transaction committed successfully")
+            invalidate_processing_status([meeting.id])
+
+            # ダッシュボード用の統計を再集計
+            await self._refresh_statistics()
 
             # 処理完了時間を計算
             end_time = datetime.now()
@@ -173,6 +189,23 @@ class ExecuteMinutesProcessingUseCase:
             logger.info("Transaction rolled back")
             raise
 
+    async def _refresh_statistics(self) -> None:
+        """ダッシュボード用の統計を再集計する
+
+        再集計に失敗しても議事録処理の結果には影響させない。
+        """
+        if self.data_coverage_repo is None:
+            return
+
+        try:
+            refreshed = await self.data_coverage_repo.refresh_statistics(
+                min_interval_seconds=STATISTICS_REFRESH_INTERVAL_SECONDS
+            )
+            if refreshed:
+                logger.info("Coverage statistics refreshed")
+        except Exception as e:
+            logger.warning(f"Failed to refresh coverage statistics: {e}")
+
     async def _fetch_minutes_text(self, meeting: Meeting) -> str:
         """議事録テキストを取得する
 
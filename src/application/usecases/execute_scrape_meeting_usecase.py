@@ -2,6 +2,7 @@
 
 このモジュールは、会議一覧画面からWebスクレイピング処理を実行するユースケースを提供します。
 会議URLから議事録をスクレイピングし、GCSにアップロードしてMeetingエンティティを更新します。
+再スクレイピングで議事録本文が変わっていない場合はアップロードと更新を省略します。
 """
 
 import logging
@@ -37,6 +38,8 @@ class ScrapeMeetingResultDTO:
     processing_time_seconds: float
     processed_at: datetime
     errors: list[str] | None = None
+    # 前回取得時から議事録本文が変わったか（Falseなら発言抽出の再実行は不要）
+    content_changed: bool = True
 
 
 class ExecuteScrapeMeetingUseCase:
@@ -101,10 +104,11 @@ class ExecuteScrapeMeetingUseCase:
             # ScraperServiceを初期化
             service = ScraperService(enable_gcs=request.upload_to_gcs)
 
-            # スクレイピング実行
-            minutes = await service.fetch_from_meeting_id(
-                request.meeting_id, use_cache=not request.force_rescrape
+            # スクレイピング実行（前回取得時からの変更有無も判定される）
+            result = await service.scrape(
+                meeting.url, use_cache=not request.force_rescrape
             )
+            minutes = result.minutes
 
             if not minutes:
                 raise ValueError(f"Failed to scrape minutes for meeting {meeting.url}")
@@ -115,6 +119,25 @@ class ExecuteScrapeMeetingUseCase:
                 f"{len(minutes.content)} characters"
             )
 
+            # 本文が変わっていなければ既存のGCSデータをそのまま使う
+            if not result.changed and (meeting.gcs_text_uri or meeting.gcs_pdf_uri):
+                logger.info(
+                    f"Minutes of meeting {request.meeting_id} are unchanged, "
+                    "skipping upload"
+                )
+                end_time = datetime.now()
+                return ScrapeMeetingResultDTO(
+                    meeting_id=request.meeting_id,
+                    title=minutes.title,
+                    speakers_count=len(minutes.speakers),
+                    content_length=len(minutes.content),
+                    gcs_text_uri=meeting.gcs_text_uri,
+                    gcs_pdf_uri=meeting.gcs_pdf_uri,
+                    processing_time_seconds=(end_time - start_time).total_seconds(),
+                    processed_at=end_time,
+                    content_changed=False,
+                )
+
             # 一時ディレクトリに保存してGCSにアップロード
             output_dir = Path("tmp/scraped")
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -166,6 +189,7 @@ class ExecuteScrapeMeetingUseCase:
                 processing_time_seconds=processing_time,
                 processed_at=end_time,
                 errors=errors if errors else None,
+                content_changed=result.changed,
             )
 
         except Exception as e:
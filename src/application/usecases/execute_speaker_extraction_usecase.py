@@ -8,12 +8,15 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.domain.entities.conversation import Conversation
 from src.domain.entities.speaker import Speaker
 from src.domain.repositories.conversation_repository import ConversationRepository
 from src.domain.repositories.minutes_repository import MinutesRepository
 from src.domain.repositories.speaker_repository import SpeakerRepository
+from src.domain.services.meeting_processing_status_service import (
+    invalidate_processing_status,
+)
 from src.domain.services.speaker_domain_service import SpeakerDomainService
+from src.domain.value_objects.conversation_ref import ConversationRef
 
 logger = logging.getLogger(__name__)
 
@@ -89,8 +92,8 @@ class ExecuteSpeakerExtractionUseCase:
             if not minutes or not minutes.id:
                 raise ValueError(f"No minutes found for meeting {request.meeting_id}")
 
-            # Conversationsを取得
-            conversations = await self.conversation_repo.get_by_minutes(minutes.id)
+            # Conversationsを取得（発言者の解決に発言本文は不要なため読み込まない）
+            conversations = await self.conversation_repo.get_refs_by_minutes(minutes.id)
             if not conversations:
                 raise ValueError(
                     f"No conversations found for meeting {request.meeting_id}"
@@ -119,14 +122,14 @@ class ExecuteSpeakerExtractionUseCase:
                         f"{len(conversations_with_speakers)} conversations "
                         f"for force reprocessing"
                     )
-                    for conv in conversations_with_speakers:
-                        conv.speaker_id = None
-                        if conv.id:
-                            await self.conversation_repo.update(conv)
+                    await self.conversation_repo.update_speaker_ids(
+                        {c.id: None for c in conversations_with_speakers if c.id}
+                    )
                     logger.info("Speaker links cleared")
 
             # 発言者を抽出・作成
             extraction_result = await self._extract_and_create_speakers(conversations)
+            invalidate_processing_status([request.meeting_id])
 
             # 処理完了時間を計算
             end_time = datetime.now()
@@ -149,12 +152,12 @@ class ExecuteSpeakerExtractionUseCase:
             raise
 
     async def _extract_and_create_speakers(
-        self, conversations: list[Conversation]
+        self, conversations: list[ConversationRef]
     ) -> dict[str, int]:
         """発言から一意な発言者を抽出し、発言者レコードを作成し、conversationsにリンクする
 
         Args:
-            conversations: 発言エンティティのリスト
+            conversations: 発言の参照（本文を含まない）のリスト
 
         Returns:
             dict: 抽出結果の統計情報
@@ -162,68 +165,49 @@ class ExecuteSpeakerExtractionUseCase:
                 - new_speakers: 新規作成された発言者数
                 - existing_speakers: 既存の発言者数
         """
-        speaker_names: set[tuple[str, str | None]] = set()
-
-        # 全conversationsから発言者名を抽出
+        # 同じ表記の発言者名は一度だけ解析する
+        parsed_names: dict[str, tuple[str, str | None]] = {}
         for conv in conversations:
-            if conv.speaker_name:
+            if conv.speaker_name and conv.speaker_name not in parsed_names:
                 # 名前から政党情報を抽出
-                clean_name, party_info = self.speaker_service.extract_party_from_name(
-                    conv.speaker_name
+                parsed_names[conv.speaker_name] = tuple(  # type: ignore[assignment]
+                    self.speaker_service.extract_party_from_name(conv.speaker_name)
                 )
-                speaker_names.add((clean_name, party_info))
 
+        speaker_names = list(dict.fromkeys(parsed_names.values()))
         logger.info(f"Found {len(speaker_names)} unique speaker names")
 
-        # 発言者レコードを作成し、conversationsにリンク
-        new_speakers = 0
-        existing_speakers = 0
-        linked_conversations = 0
-
-        for name, party_info in speaker_names:
-            # 既存の発言者をチェック
-            existing = await self.speaker_repo.get_by_name_party_position(
-                name, party_info, None
+        # 既存の発言者を一括取得し、存在しないものだけをまとめて作成
+        speakers = await self.speaker_repo.get_by_name_party_pairs(speaker_names)
+        existing_speakers = len(speakers)
+
+        missing = [pair for pair in speaker_names if pair not in speakers]
+        if missing:
+            created = await self.speaker_repo.bulk_create(
+                [
+                    Speaker(
+                        name=name,
+                        political_party_name=party_info,
+                        is_politician=bool(party_info),  # 政党があれば政治家と仮定
+                    )
+                    for name, party_info in missing
+                ]
             )
+            speakers.update(zip(missing, created, strict=True))
+        new_speakers = len(missing)
 
-            if not existing:
-                # 新規発言者を作成
-                speaker = Speaker(
-                    name=name,
-                    political_party_name=party_info,
-                    is_politician=bool(party_info),  # 政党があれば政治家と仮定
-                )
-                created_speaker = await self.speaker_repo.create(speaker)
-                new_speakers += 1
-                logger.debug(f"Created new speaker: {name}")
-                speaker_to_link = created_speaker
-            else:
-                existing_speakers += 1
-                logger.debug(f"Speaker already exists: {name}")
-                speaker_to_link = existing
-
-            # この発言者に対応するすべてのconversationsをリンク
-            if speaker_to_link and speaker_to_link.id:
-                for conv in conversations:
-                    if conv.speaker_name:
-                        clean_conv_name, conv_party = (
-                            self.speaker_service.extract_party_from_name(
-                                conv.speaker_name
-                            )
-                        )
-                        if clean_conv_name == name and conv_party == party_info:
-                            conv.speaker_id = speaker_to_link.id
-                            if conv.id:
-                                logger.debug(
-                                    f"Updating conversation {conv.id} "
-                                    f"with speaker_id={speaker_to_link.id}"
-                                )
-                                await self.conversation_repo.update(conv)
-                                linked_conversations += 1
-                                logger.debug(
-                                    f"Updated conversation {conv.id}, "
-                                    f"speaker_id is now {conv.speaker_id}"
-                                )
+        # conversationsと発言者の対応をメモリ上で解決し、一括で更新
+        speaker_ids: dict[int, int | None] = {}
+        for conv in conversations:
+            if not conv.speaker_name:
+                continue
+            speaker = speakers.get(parsed_names[conv.speaker_name])
+            if speaker and speaker.id and conv.id:
+                speaker_ids[conv.id] = speaker.id
+
+        linked_conversations = await self.conversation_repo.update_speaker_ids(
+            speaker_ids
+        )
 
         logger.info(
             f"Speaker extraction complete - "
@@ -1,5 +1,7 @@
 """Use case for matching speakers to politicians."""
 
+from collections.abc import AsyncIterator
+
 from src.application.dtos.speaker_dto import SpeakerMatchingDTO
 from src.domain.entities.speaker import Speaker
 from src.domain.repositories.conversation_repository import ConversationRepository
@@ -85,69 +87,118 @@ class MatchSpeakersUseCase:
             - matching_method: マッチング手法（existing/rule-based/llm/none）
             - matching_reason: マッチング理由の説明
         """
-        # Get speakers to process
-        speakers: list[Speaker] = []
+        return [
+            result
+            async for result in self.iter_execute(
+                use_llm=use_llm, speaker_ids=speaker_ids, limit=limit
+            )
+        ]
+
+    async def iter_execute(
+        self,
+        use_llm: bool = True,
+        speaker_ids: list[int] | None = None,
+        limit: int | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[SpeakerMatchingDTO]:
+        """発言者と政治家のマッチングを実行し、結果を1件ずつ返す
+
+        execute()と同じ処理だが、発言者をbatch_size件ずつ読み込み、
+        結果をリストに溜めずに返すため、発言者数が多くてもメモリ使用量が
+        増えない。
+
+        Args:
+            use_llm: LLMマッチングを使用するか（デフォルト: True）
+            speaker_ids: 処理対象の発言者IDリスト（Noneの場合は全件）
+            limit: 処理する発言者数の上限
+            batch_size: 一度に読み込む発言者数
+
+        Yields:
+            発言者ごとのSpeakerMatchingDTO
+        """
+        async for speaker in self._iter_speakers(speaker_ids, limit, batch_size):
+            result = await self._match_speaker(speaker, use_llm)
+            if result:
+                yield result
+
+    async def _iter_speakers(
+        self, speaker_ids: list[int] | None, limit: int | None, batch_size: int
+    ) -> AsyncIterator[Speaker]:
+        """処理対象の発言者を順に返す
+
+        Args:
+            speaker_ids: 処理対象の発言者IDリスト（Noneの場合は政治家の発言者全件）
+            limit: 政治家の発言者全件を対象とする場合の上限
+            batch_size: 一度に読み込む発言者数
+        """
         if speaker_ids:
             # Fetch speakers individually
             for speaker_id in speaker_ids:
                 speaker = await self.speaker_repo.get_by_id(speaker_id)
                 if speaker:
-                    speakers.append(speaker)
+                    yield speaker
         else:
-            # Get all politician speakers
-            speakers = await self.speaker_repo.get_politicians()
-            if limit:
-                speakers = speakers[:limit]
-
-        results: list[SpeakerMatchingDTO] = []
-
-        for speaker in speakers:
-            # Skip if already linked
-            if speaker.id is None:
-                continue
-            # Check if speaker already has politician_id linked
-            if speaker.politician_id:
-                existing_politician = await self.politician_repo.get_by_id(
-                    speaker.politician_id
+            # Stream all politician speakers
+            count = 0
+            async for speaker in self.speaker_repo.iter_politicians(
+                batch_size=batch_size
+            ):
+                if limit and count >= limit:
+                    break
+                count += 1
+                yield speaker
+
+    async def _match_speaker(
+        self, speaker: Speaker, use_llm: bool
+    ) -> SpeakerMatchingDTO | None:
+        """1人の発言者のマッチングを行う
+
+        Args:
+            speaker: マッチング対象の発言者
+            use_llm: LLMマッチングを使用するか
+
+        Returns:
+            マッチング結果DTO（IDのない発言者の場合None）
+        """
+        # Skip if already linked
+        if speaker.id is None:
+            return None
+        # Check if speaker already has politician_id linked
+        if speaker.politician_id:
+            existing_politician = await self.politician_repo.get_by_id(
+                speaker.politician_id
+            )
+            if existing_politician:
+                return SpeakerMatchingDTO(
+                    speaker_id=speaker.id if speaker.id is not None else 0,
+                    speaker_name=speaker.name,
+                    matched_politician_id=existing_politician.id,
+                    matched_politician_name=existing_politician.name,
+                    confidence_score=1.0,
+                    matching_method="existing",
+                    matching_reason="Already linked to politician",
                 )
-                if existing_politician:
-                    results.append(
-                        SpeakerMatchingDTO(
-                            speaker_id=speaker.id if speaker.id is not None else 0,
-                            speaker_name=speaker.name,
-                            matched_politician_id=existing_politician.id,
-                            matched_politician_name=existing_politician.name,
-                            confidence_score=1.0,
-                            matching_method="existing",
-                            matching_reason="Already linked to politician",
-                        )
-                    )
-                    continue
 
-            # Try rule-based matching first
-            match_result = await self._rule_based_matching(speaker)
+        # Try rule-based matching first
+        match_result = await self._rule_based_matching(speaker)
 
-            if not match_result and use_llm:
-                # Try LLM-based matching
-                match_result = await self._llm_based_matching(speaker)
+        if not match_result and use_llm:
+            # Try LLM-based matching
+            match_result = await self._llm_based_matching(speaker)
 
-            if match_result:
-                results.append(match_result)
-            else:
-                # No match found
-                results.append(
-                    SpeakerMatchingDTO(
-                        speaker_id=speaker.id if speaker.id is not None else 0,
-                        speaker_name=speaker.name,
-                        matched_politician_id=None,
-                        matched_politician_name=None,
-                        confidence_score=0.0,
-                        matching_method="none",
-                        matching_reason="No matching politician found",
-                    )
-                )
+        if match_result:
+            return match_result
 
-        return results
+        # No match found
+        return SpeakerMatchingDTO(
+            speaker_id=speaker.id if speaker.id is not None else 0,
+            speaker_name=speaker.name,
+            matched_politician_id=None,
+            matched_politician_name=None,
+            confidence_score=0.0,
+            matching_method="none",
+            matching_reason="No matching politician found",
+        )
 
     async def _rule_based_matching(self, speaker: Speaker) -> SpeakerMatchingDTO | None:
         """ルールベースの発言者マッチングを実行する
@@ -16,6 +16,9 @@ from src.domain.repositories.minutes_repository import MinutesRepository
 from src.domain.repositories.speaker_repository import SpeakerRepository
 from src.domain.services.interfaces.pdf_processor_service import IPDFProcessorService
 from src.domain.services.interfaces.text_extractor_service import ITextExtractorService
+from src.domain.services.meeting_processing_status_service import (
+    invalidate_processing_status,
+)
 from src.domain.services.minutes_domain_service import MinutesDomainService
 from src.domain.services.speaker_domain_service import SpeakerDomainService
 
@@ -164,6 +167,7 @@ class ProcessMinutesUseCase:
             if minutes.id is None:
                 raise ValueError("Minutes must have an ID")
             await self.minutes_repo.mark_processed(minutes.id)
+            invalidate_processing_status([meeting.id])
             # Calculate processing time
             end_time = datetime.now()
             processing_time = self.minutes_service.calculate_processing_duration(
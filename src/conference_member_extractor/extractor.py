@@ -5,9 +5,9 @@ from typing import Any, cast
 
 from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.prompts import PromptTemplate
-from playwright.async_api import async_playwright
 
 from src.conference_member_extractor.models import ExtractedMember
+from src.infrastructure.external.browser_pool import BrowserPool, get_browser_pool
 from src.infrastructure.persistence.extracted_conference_member_repository_impl import (
     ExtractedConferenceMemberRepositoryImpl,
 )
@@ -20,16 +20,16 @@ logger = logging.getLogger(__name__)
 class ConferenceMemberExtractor:
     """会議体メンバー情報を抽出してステージングテーブルに保存するクラス"""
 
-    def __init__(self):
+    def __init__(self, browser_pool: BrowserPool | None = None):
         self.llm_service = LLMService()
         self.repo = RepositoryAdapter(ExtractedConferenceMemberRepositoryImpl)
+        # URLごとにブラウザを起動せず、共有プールのブラウザを使う
+        self.browser_pool = browser_pool or get_browser_pool()
 
     async def fetch_html(self, url: str) -> str:
         """URLからHTMLを取得"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
+        async with self.browser_pool.page() as page:
             try:
-                page = await browser.new_page()
                 await page.goto(url, wait_until="networkidle", timeout=30000)
                 await page.wait_for_timeout(2000)  # 動的コンテンツの読み込み待機
                 content = await page.content()
@@ -37,8 +37,6 @@ class ConferenceMemberExtractor:
             except Exception as e:
                 logger.error(f"Error fetching {url}: {e}")
                 raise
-            finally:
-                await browser.close()
 
     def extract_members_with_llm(
         self, html_content: str, conference_name: str
@@ -4,7 +4,14 @@ from datetime import datetime
 
 
 class BaseEntity:
-    """Base class for all domain entities."""
+    """Base class for all domain entities.
+
+    Entities that are loaded in bulk declare ``__slots__`` for their own
+    attributes so they carry no per-instance ``__dict__``. Subclasses that do
+    not declare slots keep a ``__dict__`` as before.
+    """
+
+    __slots__ = ("id", "created_at", "updated_at")
 
     def __init__(self, id: int | None = None) -> None:
         self.id = id
@@ -6,6 +6,16 @@ from src.domain.entities.base import BaseEntity
 class Conversation(BaseEntity):
     """発言を表すエンティティ."""
 
+    __slots__ = (
+        "comment",
+        "sequence_number",
+        "minutes_id",
+        "speaker_id",
+        "speaker_name",
+        "chapter_number",
+        "sub_chapter_number",
+    )
+
     def __init__(
         self,
         comment: str,
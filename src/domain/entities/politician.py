@@ -6,6 +6,15 @@ from src.domain.entities.base import BaseEntity
 class Politician(BaseEntity):
     """政治家を表すエンティティ."""
 
+    __slots__ = (
+        "name",
+        "political_party_id",
+        "furigana",
+        "district",
+        "profile_page_url",
+        "party_position",
+    )
+
     def __init__(
         self,
         name: str,
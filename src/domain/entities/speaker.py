@@ -6,6 +6,15 @@ from src.domain.entities.base import BaseEntity
 class Speaker(BaseEntity):
     """発言者を表すエンティティ."""
 
+    __slots__ = (
+        "name",
+        "type",
+        "political_party_name",
+        "position",
+        "is_politician",
+        "politician_id",
+    )
+
     def __init__(
         self,
         name: str,
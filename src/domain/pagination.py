@@ -1,5 +1,8 @@
 """Pagination models and utilities for domain layer."""
 
+import base64
+import binascii
+import json
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
@@ -84,3 +87,72 @@ class PaginatedResult[T]:
                 "previous_page": self.previous_page,
             },
         }
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Keyset position: the sort key of the last row on a page.
+
+    The next page contains the rows that sort after ``(sort_value, id)``.
+    ``sort_value`` is None when rows are ordered by ID alone.
+    """
+
+    id: int
+    sort_value: str | None = None
+
+    def encode(self) -> str:
+        """Encode as an opaque URL-safe token."""
+        payload = json.dumps([self.id, self.sort_value], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Decode a token produced by ``encode``.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            row_id, sort_value = json.loads(base64.urlsafe_b64decode(token))
+        except (binascii.Error, ValueError, TypeError) as e:
+            raise ValueError(f"Invalid pagination cursor: {token!r}") from e
+        if not isinstance(row_id, int) or not (
+            sort_value is None or isinstance(sort_value, str)
+        ):
+            raise ValueError(f"Invalid pagination cursor: {token!r}")
+        return cls(id=row_id, sort_value=sort_value)
+
+
+@dataclass
+class CursorPage[T]:
+    """One page of a keyset-paginated query.
+
+    Unlike ``PaginatedResult`` there is no page number: ``next_cursor`` is
+    passed back to fetch the following page, so deep pages cost the same as
+    the first one. ``total_count`` is only filled in when requested and may
+    be an estimate.
+    """
+
+    items: list[T]
+    next_cursor: str | None = None
+    total_count: int | None = None
+    total_is_estimate: bool = False
+    limit: int = 50
+
+    @property
+    def has_next(self) -> bool:
+        """Check if there's a next page."""
+        return self.next_cursor is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for API responses."""
+        return {
+            "items": self.items,
+            "pagination": {
+                "limit": self.limit,
+                "next_cursor": self.next_cursor,
+                "has_next": self.has_next,
+                "total_count": self.total_count,
+                "total_is_estimate": self.total_is_estimate,
+            },
+        }
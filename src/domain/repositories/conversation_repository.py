@@ -4,7 +4,9 @@ from abc import abstractmethod
 from typing import Any
 
 from src.domain.entities.conversation import Conversation
+from src.domain.pagination import CursorPage
 from src.domain.repositories.base import BaseRepository
+from src.domain.value_objects.conversation_ref import ConversationRef
 
 
 class ConversationRepository(BaseRepository[Conversation]):
@@ -15,6 +17,26 @@ class ConversationRepository(BaseRepository[Conversation]):
         """Get all conversations for a minutes record."""
         pass
 
+    @abstractmethod
+    async def get_refs_by_minutes(self, minutes_id: int) -> list[ConversationRef]:
+        """Get all conversations for a minutes record without their comments."""
+        pass
+
+    @abstractmethod
+    async def get_conversation_counts_by_meeting(
+        self, meeting_ids: list[int]
+    ) -> dict[int, dict[str, int]]:
+        """Count conversations and distinct linked speakers per meeting.
+
+        Args:
+            meeting_ids: Meetings to count
+
+        Returns:
+            Mapping of meeting ID to ``conversation_count`` and
+            ``speaker_count``. Meetings without minutes are absent.
+        """
+        pass
+
     @abstractmethod
     async def get_by_speaker(
         self, speaker_id: int, limit: int | None = None
@@ -27,6 +49,25 @@ class ConversationRepository(BaseRepository[Conversation]):
         """Get conversations without speaker links."""
         pass
 
+    @abstractmethod
+    async def get_unlinked_refs(
+        self, limit: int | None = None
+    ) -> list[ConversationRef]:
+        """Get conversations without speaker links, without their comments."""
+        pass
+
+    @abstractmethod
+    async def get_comments(self, conversation_ids: list[int]) -> dict[int, str]:
+        """Load the comment text of the given conversations.
+
+        Args:
+            conversation_ids: IDs of the conversations
+
+        Returns:
+            Mapping of conversation ID to comment. Unknown IDs are absent.
+        """
+        pass
+
     @abstractmethod
     async def bulk_create(
         self, conversations: list[Conversation]
@@ -67,6 +108,7 @@ class ConversationRepository(BaseRepository[Conversation]):
         speaker_name: str | None = None,
         meeting_id: int | None = None,
         has_speaker_id: bool | None = None,
+        comment_keyword: str | None = None,
     ) -> dict[str, Any]:
         """Get conversations with pagination and filters.
 
@@ -76,12 +118,40 @@ class ConversationRepository(BaseRepository[Conversation]):
             speaker_name: Optional filter by speaker name
             meeting_id: Optional filter by meeting ID
             has_speaker_id: Optional filter by presence of speaker ID
+            comment_keyword: Optional keyword the comment must contain
 
         Returns:
             Dictionary with conversations and pagination info
         """
         pass
 
+    @abstractmethod
+    async def get_conversations_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        speaker_name: str | None = None,
+        meeting_id: int | None = None,
+        has_speaker_id: bool | None = None,
+        comment_keyword: str | None = None,
+        include_total: bool = False,
+    ) -> CursorPage[dict[str, Any]]:
+        """Get conversations with keyset pagination, newest first.
+
+        Args:
+            limit: Number of items per page
+            cursor: ``next_cursor`` of the previous page (None for the first)
+            speaker_name: Optional filter by speaker name
+            meeting_id: Optional filter by meeting ID
+            has_speaker_id: Optional filter by presence of speaker ID
+            comment_keyword: Optional keyword the comment must contain
+            include_total: Also return a (possibly estimated) total count
+
+        Returns:
+            Page of conversations with the cursor of the next page
+        """
+        pass
+
     @abstractmethod
     async def update_speaker_links(self) -> int:
         """Update speaker links for conversations.
@@ -90,3 +160,15 @@ class ConversationRepository(BaseRepository[Conversation]):
             Number of updated conversations
         """
         pass
+
+    @abstractmethod
+    async def update_speaker_ids(self, speaker_ids: dict[int, int | None]) -> int:
+        """Set speaker_id on many conversations at once.
+
+        Args:
+            speaker_ids: Mapping of conversation ID to speaker ID (None unlinks)
+
+        Returns:
+            Number of updated conversations
+        """
+        pass
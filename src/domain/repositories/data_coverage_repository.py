@@ -1,6 +1,7 @@
 """Repository interface for data coverage statistics."""
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from src.domain.entities.data_coverage_stats import (
     ActivityData,
@@ -59,3 +60,26 @@ class IDataCoverageRepository(ABC):
             list[ActivityData]: List of daily activity data points.
         """
         pass
+
+    @abstractmethod
+    async def refresh_statistics(self, min_interval_seconds: float = 0) -> bool:
+        """Recompute the precomputed statistics.
+
+        Args:
+            min_interval_seconds: Skip the refresh when the statistics are
+                younger than this many seconds.
+
+        Returns:
+            bool: True if the statistics were recomputed.
+        """
+        pass
+
+    @abstractmethod
+    async def get_statistics_refreshed_at(self) -> datetime | None:
+        """Get the time the statistics were last recomputed.
+
+        Returns:
+            datetime | None: Refresh time, or None when statistics are
+                computed on every request.
+        """
+        pass
@@ -14,6 +14,13 @@ from src.domain.repositories.base import BaseRepository
 class LLMProcessingHistoryRepository(BaseRepository[LLMProcessingHistory]):
     """Repository interface for LLM processing history."""
 
+    @abstractmethod
+    async def bulk_create(
+        self, histories: list[LLMProcessingHistory]
+    ) -> list[LLMProcessingHistory]:
+        """Create multiple history records in a single round trip."""
+        pass
+
     @abstractmethod
     async def get_by_processing_type(
         self,
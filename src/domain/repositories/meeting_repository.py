@@ -5,6 +5,7 @@ from datetime import date
 from typing import Any
 
 from src.domain.entities.meeting import Meeting
+from src.domain.pagination import CursorPage
 from src.domain.repositories.base import BaseRepository
 
 
@@ -55,6 +56,27 @@ class MeetingRepository(BaseRepository[Meeting]):
         """
         pass
 
+    @abstractmethod
+    async def get_meetings_page(
+        self,
+        conference_id: int | None = None,
+        governing_body_id: int | None = None,
+        limit: int = 10,
+        cursor: str | None = None,
+    ) -> CursorPage[dict[str, Any]]:
+        """Get meetings with keyset pagination ordered by (date, id) descending.
+
+        Args:
+            conference_id: Optional filter by conference
+            governing_body_id: Optional filter by governing body
+            limit: Number of items per page
+            cursor: ``next_cursor`` of the previous page (None for the first)
+
+        Returns:
+            Page of meetings with the cursor of the next page
+        """
+        pass
+
     @abstractmethod
     async def get_meeting_by_id_with_info(
         self, meeting_id: int
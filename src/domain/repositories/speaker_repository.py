@@ -1,6 +1,7 @@
 """Speaker repository interface."""
 
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 from src.domain.dtos.speaker_dto import SpeakerWithConversationCountDTO
@@ -21,11 +22,48 @@ class SpeakerRepository(BaseRepository[Speaker]):
         """Get speaker by name, party, and position."""
         pass
 
+    @abstractmethod
+    async def get_by_name_party_pairs(
+        self, pairs: list[tuple[str, str | None]]
+    ) -> dict[tuple[str, str | None], Speaker]:
+        """Get speakers for many (name, party) pairs at once.
+
+        Each pair is matched like ``get_by_name_party_position`` without a
+        position: a None party matches a speaker of any party.
+
+        Returns:
+            Mapping of the pairs that were found to their speaker
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_create(self, speakers: list[Speaker]) -> list[Speaker]:
+        """Create multiple speakers at once, returned in input order."""
+        pass
+
     @abstractmethod
     async def get_politicians(self) -> list[Speaker]:
         """Get all speakers who are politicians."""
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Speaker]:
+        """Iterate over all speakers, in ID order.
+
+        Speakers are fetched ``batch_size`` at a time, so use this instead of
+        get_all() for full-table scans.
+        """
+        pass
+
+    @abstractmethod
+    def iter_politicians(self, batch_size: int = 1000) -> AsyncIterator[Speaker]:
+        """Iterate over speakers who are politicians, in ID order.
+
+        Speakers are fetched ``batch_size`` at a time, so memory use does not
+        grow with the number of speakers.
+        """
+        pass
+
     @abstractmethod
     async def search_by_name(self, name_pattern: str) -> list[Speaker]:
         """Search speakers by name pattern."""
@@ -135,6 +135,21 @@ class ILLMService(Protocol):
         """
         ...
 
+    async def ainvoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Invoke an LLM chain asynchronously with retry logic.
+
+        Waiting for the LLM and backing off between retries never blocks the
+        event loop, so concurrent callers overlap their network waits.
+
+        Args:
+            chain: LangChain runnable to invoke
+            inputs: Input dictionary for the chain
+
+        Returns:
+            Result from the chain invocation
+        """
+        ...
+
     def invoke_llm(self, messages: list[dict[str, str]]) -> str:
         """Invoke the LLM with messages and return the response content.
 
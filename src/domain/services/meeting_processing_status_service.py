@@ -1,11 +1,17 @@
 """Meeting processing status service."""
 
+import time
+import weakref
+from collections.abc import Iterable
 from typing import TypedDict
 
 from src.domain.repositories.conversation_repository import ConversationRepository
 from src.domain.repositories.minutes_repository import MinutesRepository
 from src.domain.repositories.speaker_repository import SpeakerRepository
 
+# Seconds a cached status stays valid without an explicit invalidation
+PROCESSING_STATUS_TTL_SECONDS = 60.0
+
 
 class ProcessingStatus(TypedDict):
     """Processing status of a meeting."""
@@ -17,20 +23,55 @@ class ProcessingStatus(TypedDict):
     speaker_count: int
 
 
+_live_services: "weakref.WeakSet[MeetingProcessingStatusService]" = weakref.WeakSet()
+
+
+def invalidate_processing_status(meeting_ids: Iterable[int] | None = None) -> None:
+    """Drop cached statuses from every live MeetingProcessingStatusService.
+
+    Call this after minutes, conversations or speaker links are written so
+    status listings do not wait for the TTL to expire.
+
+    Args:
+        meeting_ids: Meetings whose status changed. If None, clears all.
+    """
+    for service in list(_live_services):
+        if meeting_ids is None:
+            service.clear_cache()
+        else:
+            for meeting_id in meeting_ids:
+                service.clear_cache(meeting_id)
+
+
 class MeetingProcessingStatusService:
-    """Service for checking meeting processing status."""
+    """Service for checking meeting processing status.
+
+    Statuses are computed from per-meeting conversation counts, fetched for
+    many meetings in one aggregate query, and cached for ``ttl_seconds``.
+    """
 
     def __init__(
         self,
         minutes_repository: MinutesRepository,
         conversation_repository: ConversationRepository,
         speaker_repository: SpeakerRepository,
+        ttl_seconds: float = PROCESSING_STATUS_TTL_SECONDS,
     ) -> None:
-        """Initialize the service with repositories."""
+        """Initialize the service with repositories.
+
+        Args:
+            minutes_repository: Minutes repository
+            conversation_repository: Conversation repository
+            speaker_repository: Speaker repository
+            ttl_seconds: Seconds a cached status stays valid
+        """
         self.minutes_repository = minutes_repository
         self.conversation_repository = conversation_repository
         self.speaker_repository = speaker_repository
+        self.ttl_seconds = ttl_seconds
         self._cache: dict[int, ProcessingStatus] = {}
+        self._cached_at: dict[int, float] = {}
+        _live_services.add(self)
 
     async def has_conversations(self, meeting_id: int) -> bool:
         """Check if a meeting has any conversations extracted.
@@ -41,20 +82,8 @@ class MeetingProcessingStatusService:
         Returns:
             True if the meeting has conversations, False otherwise
         """
-        # Check cache first
-        if meeting_id in self._cache:
-            return self._cache[meeting_id]["has_conversations"]
-
-        # Get minutes for the meeting
-        minutes = await self.minutes_repository.get_by_meeting(meeting_id)
-        if not minutes:
-            return False
-
-        # Check if minutes has conversations
-        if minutes.id is None:
-            return False
-        conversations = await self.conversation_repository.get_by_minutes(minutes.id)
-        return len(conversations) > 0
+        status = await self.get_processing_status(meeting_id)
+        return status["has_conversations"]
 
     async def has_speakers(self, meeting_id: int) -> bool:
         """Check if a meeting has any speakers extracted.
@@ -65,25 +94,8 @@ class MeetingProcessingStatusService:
         Returns:
             True if the meeting has speakers, False otherwise
         """
-        # Check cache first
-        if meeting_id in self._cache:
-            return self._cache[meeting_id]["has_speakers"]
-
-        # Get minutes for the meeting
-        minutes = await self.minutes_repository.get_by_meeting(meeting_id)
-        if not minutes:
-            return False
-
-        # Check if minutes has conversations with speakers
-        if minutes.id is None:
-            return False
-        conversations = await self.conversation_repository.get_by_minutes(minutes.id)
-        # Check if any conversation has a speaker_id
-        for conversation in conversations:
-            if conversation.speaker_id is not None:
-                return True
-
-        return False
+        status = await self.get_processing_status(meeting_id)
+        return status["has_speakers"]
 
     async def get_processing_status(self, meeting_id: int) -> ProcessingStatus:
         """Get comprehensive processing status for a meeting.
@@ -94,52 +106,51 @@ class MeetingProcessingStatusService:
         Returns:
             ProcessingStatus dictionary with status information
         """
-        # Check cache first
-        if meeting_id in self._cache:
-            return self._cache[meeting_id]
-
-        # Initialize status
-        status: ProcessingStatus = {
-            "has_minutes": False,
-            "has_conversations": False,
-            "has_speakers": False,
-            "conversation_count": 0,
-            "speaker_count": 0,
-        }
-
-        # Get minutes for the meeting
-        minutes = await self.minutes_repository.get_by_meeting(meeting_id)
-        if not minutes:
-            self._cache[meeting_id] = status
-            return status
-
-        status["has_minutes"] = True
-
-        # Collect all conversations and speaker IDs
-        if minutes.id is None:
-            self._cache[meeting_id] = status
-            return status
-        conversations = await self.conversation_repository.get_by_minutes(minutes.id)
-        speaker_ids: set[int] = set()
+        statuses = await self.get_processing_statuses([meeting_id])
+        return statuses[meeting_id]
 
-        # Collect unique speaker IDs
-        for conversation in conversations:
-            if conversation.speaker_id is not None:
-                speaker_ids.add(conversation.speaker_id)
+    async def get_processing_statuses(
+        self, meeting_ids: list[int]
+    ) -> dict[int, ProcessingStatus]:
+        """Get processing statuses for many meetings at once.
 
-        # Update status
-        if conversations:
-            status["has_conversations"] = True
-            status["conversation_count"] = len(conversations)
+        Cached statuses are reused; the rest are computed with a single
+        aggregate query.
 
-        if speaker_ids:
-            status["has_speakers"] = True
-            status["speaker_count"] = len(speaker_ids)
-
-        # Cache the result
-        self._cache[meeting_id] = status
+        Args:
+            meeting_ids: The IDs of the meetings to check
 
-        return status
+        Returns:
+            Mapping of meeting ID to ProcessingStatus
+        """
+        now = time.monotonic()
+        statuses: dict[int, ProcessingStatus] = {}
+        missing: list[int] = []
+
+        for meeting_id in dict.fromkeys(meeting_ids):
+            cached_at = self._cached_at.get(meeting_id)
+            if (
+                meeting_id in self._cache
+                and cached_at is not None
+                and now - cached_at < self.ttl_seconds
+            ):
+                statuses[meeting_id] = self._cache[meeting_id]
+            else:
+                missing.append(meeting_id)
+
+        if missing:
+            counts = (
+                await self.conversation_repository.get_conversation_counts_by_meeting(
+                    missing
+                )
+            )
+            for meeting_id in missing:
+                status = self._build_status(counts.get(meeting_id))
+                self._cache[meeting_id] = status
+                self._cached_at[meeting_id] = now
+                statuses[meeting_id] = status
+
+        return statuses
 
     def clear_cache(self, meeting_id: int | None = None) -> None:
         """Clear cached status.
@@ -150,5 +161,32 @@ class MeetingProcessingStatusService:
         """
         if meeting_id is None:
             self._cache.clear()
+            self._cached_at.clear()
         else:
             self._cache.pop(meeting_id, None)
+            self._cached_at.pop(meeting_id, None)
+
+    @staticmethod
+    def _build_status(counts: dict[str, int] | None) -> ProcessingStatus:
+        """Build a status from a meeting's conversation counts.
+
+        Args:
+            counts: Counts from the repository, or None if the meeting has
+                no minutes
+        """
+        if counts is None:
+            return {
+                "has_minutes": False,
+                "has_conversations": False,
+                "has_speakers": False,
+                "conversation_count": 0,
+                "speaker_count": 0,
+            }
+
+        return {
+            "has_minutes": True,
+            "has_conversations": counts["conversation_count"] > 0,
+            "has_speakers": counts["speaker_count"] > 0,
+            "conversation_count": counts["conversation_count"],
+            "speaker_count": counts["speaker_count"],
+        }
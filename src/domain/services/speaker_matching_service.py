@@ -1,7 +1,6 @@
 """Refactored Speaker Matching Service using shared LLM service layer"""
 
 import logging
-import re
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
@@ -9,6 +8,11 @@ from pydantic import BaseModel, Field
 from src.domain.exceptions import ExternalServiceException
 from src.domain.repositories.speaker_repository import SpeakerRepository
 from src.domain.services.interfaces.llm_service import ILLMService
+from src.domain.services.speaker_name_index import (
+    SpeakerNameIndex,
+    extract_bracket_name,
+    strip_leading_mark,
+)
 
 if TYPE_CHECKING:
     pass
@@ -35,6 +39,7 @@ class SpeakerMatchingService:
         self,
         llm_service: ILLMService,
         speaker_repository: SpeakerRepository,
+        speaker_index: SpeakerNameIndex | None = None,
     ):
         """
         Initialize speaker matching service
@@ -42,13 +47,46 @@ class SpeakerMatchingService:
         Args:
             llm_service: LLM service instance (domain interface)
             speaker_repository: Speaker repository instance (domain interface)
+            speaker_index: Prebuilt speaker name index (built lazily if None)
         """
         self.llm_service = llm_service
         self.speaker_repository = speaker_repository
+        self._speaker_index = speaker_index
+        self._affiliated_cache: dict[tuple[str, int], list[dict[str, Any]]] = {}
 
         # Create matching chain using LLM service
         self._matching_chain: Any = self.llm_service.get_structured_llm(SpeakerMatch)
 
+    async def get_speaker_index(self) -> SpeakerNameIndex:
+        """発言者名インデックスを取得する（初回のみリポジトリから構築）"""
+        if self._speaker_index is None:
+            speakers = await self.speaker_repository.get_all_for_matching()
+            self._speaker_index = SpeakerNameIndex(speakers)
+        return self._speaker_index
+
+    async def refresh_speaker_index(self) -> SpeakerNameIndex:
+        """発言者名インデックスを再構築する"""
+        self._speaker_index = None
+        self._affiliated_cache.clear()
+        return await self.get_speaker_index()
+
+    def register_speaker(self, speaker_id: int, name: str) -> None:
+        """新規作成された発言者をインデックスに差分追加する"""
+        if self._speaker_index is not None:
+            self._speaker_index.add(speaker_id, name)
+
+    async def _get_affiliated_speakers(
+        self, meeting_date: str, conference_id: int
+    ) -> list[dict[str, Any]]:
+        key = (meeting_date, conference_id)
+        if key not in self._affiliated_cache:
+            self._affiliated_cache[
+                key
+            ] = await self.speaker_repository.get_affiliated_speakers(
+                meeting_date, conference_id
+            )
+        return self._affiliated_cache[key]
+
     async def find_best_match(
         self,
         speaker_name: str,
@@ -66,10 +104,10 @@ class SpeakerMatchingService:
         Returns:
             SpeakerMatch: マッチング結果
         """
-        # 既存の発言者リストを取得
-        available_speakers = await self.speaker_repository.get_all_for_matching()
+        # 既存の発言者インデックスを取得（バッチ内で再利用）
+        available_speakers = await self.get_speaker_index()
 
-        if not available_speakers:
+        if not len(available_speakers):
             return SpeakerMatch(
                 matched=False, confidence=0.0, reason="利用可能な発言者リストが空です"
             )
@@ -78,7 +116,7 @@ class SpeakerMatchingService:
         affiliated_speakers: list[dict[str, Any]] = []
         affiliated_speaker_ids: set[int] = set()
         if meeting_date and conference_id:
-            affiliated_speakers = await self.speaker_repository.get_affiliated_speakers(
+            affiliated_speakers = await self._get_affiliated_speakers(
                 meeting_date, conference_id
             )
             affiliated_speaker_ids = {s["speaker_id"] for s in affiliated_speakers}
@@ -95,8 +133,8 @@ class SpeakerMatchingService:
                 speaker_name, available_speakers, affiliated_speaker_ids
             )
 
-            # Use LLM service with retry logic
-            result = self.llm_service.invoke_with_retry(
+            # Use LLM service with retry logic (non-blocking for concurrent callers)
+            result = await self.llm_service.ainvoke_with_retry(
                 self._matching_chain,
                 {
                     "speaker_name": speaker_name,
@@ -140,50 +178,49 @@ class SpeakerMatchingService:
             ) from e
 
     def _rule_based_matching(
-        self, speaker_name: str, available_speakers: list[dict[str, Any]]
+        self, speaker_name: str, available_speakers: SpeakerNameIndex
     ) -> SpeakerMatch:
         """従来のルールベースマッチング"""
 
         # 1. 完全一致
-        for speaker in available_speakers:
-            if speaker["name"] == speaker_name:
+        exact = available_speakers.find_exact(speaker_name)
+        if exact is not None:
+            return SpeakerMatch(
+                matched=True,
+                speaker_id=exact.id,
+                speaker_name=exact.name,
+                confidence=1.0,
+                reason="完全一致",
+            )
+
+        # 2. 括弧内の名前を抽出して検索
+        extracted_name = extract_bracket_name(speaker_name)
+        if extracted_name:
+            bracket_match = available_speakers.find_exact(extracted_name)
+            if bracket_match is not None:
                 return SpeakerMatch(
                     matched=True,
-                    speaker_id=speaker["id"],
-                    speaker_name=speaker["name"],
-                    confidence=1.0,
-                    reason="完全一致",
+                    speaker_id=bracket_match.id,
+                    speaker_name=bracket_match.name,
+                    confidence=0.95,
+                    reason=f"括弧内名前一致: {extracted_name}",
                 )
 
-        # 2. 括弧内の名前を抽出して検索
-        match = re.search(r"\(([^)]+)\)", speaker_name)
-        if match:
-            extracted_name = match.group(1)
-            for speaker in available_speakers:
-                if speaker["name"] == extracted_name:
-                    return SpeakerMatch(
-                        matched=True,
-                        speaker_id=speaker["id"],
-                        speaker_name=speaker["name"],
-                        confidence=0.95,
-                        reason=f"括弧内名前一致: {extracted_name}",
-                    )
-
         # 3. 記号除去後の一致
-        cleaned_name = re.sub(r"^[◆○◎]", "", speaker_name)
+        cleaned_name = strip_leading_mark(speaker_name)
         if cleaned_name != speaker_name:
             return self._rule_based_matching(cleaned_name, available_speakers)
 
         # 4. 部分一致
-        for speaker in available_speakers:
-            if speaker["name"] in speaker_name or speaker_name in speaker["name"]:
-                return SpeakerMatch(
-                    matched=True,
-                    speaker_id=speaker["id"],
-                    speaker_name=speaker["name"],
-                    confidence=0.8,
-                    reason=f"部分一致: {speaker['name']}",
-                )
+        speaker = available_speakers.first_partial(speaker_name)
+        if speaker is not None:
+            return SpeakerMatch(
+                matched=True,
+                speaker_id=speaker.id,
+                speaker_name=speaker.name,
+                confidence=0.8,
+                reason=f"部分一致: {speaker.name}",
+            )
 
         return SpeakerMatch(
             matched=False, confidence=0.0, reason="ルールベースマッチングでは一致なし"
@@ -192,60 +229,74 @@ class SpeakerMatchingService:
     def _filter_candidates(
         self,
         speaker_name: str,
-        available_speakers: list[dict[str, Any]],
+        available_speakers: SpeakerNameIndex,
         affiliated_speaker_ids: set[int] | None = None,
         max_candidates: int = 10,
     ) -> list[dict[str, Any]]:
-        """候補を絞り込む（LLMの処理効率向上のため、会議体所属を優先）"""
-        candidates: list[dict[str, Any]] = []
-
-        # 括弧内の名前を抽出
-        extracted_name = None
-        match = re.search(r"\(([^)]+)\)", speaker_name)
-        if match:
-            extracted_name = match.group(1)
+        """候補を絞り込む（LLMの処理効率向上のため、会議体所属を優先）
 
-        # 記号除去
-        cleaned_name = re.sub(r"^[◆○◎]", "", speaker_name)
-
-        for speaker in available_speakers:
+        n-gramインデックスで部分一致候補のみをスコアリングし、名前の長さが
+        近いだけの発言者（スコア1）は登録順に不足分を補う。
+        """
+        extracted_name = extract_bracket_name(speaker_name)
+        cleaned_name = strip_leading_mark(speaker_name)
+
+        partial = available_speakers.positions_partial(speaker_name)
+        cleaned_partial = (
+            partial
+            if cleaned_name == speaker_name
+            else available_speakers.positions_partial(cleaned_name)
+        )
+        extracted: set[int] = set()
+        if extracted_name:
+            extracted = available_speakers.positions_containing(extracted_name)
+
+        affiliated_positions: set[int] = set()
+        if affiliated_speaker_ids:
+            for speaker_id in affiliated_speaker_ids:
+                position = available_speakers.position_of(speaker_id)
+                if position is not None:
+                    affiliated_positions.add(position)
+
+        scored: list[tuple[int, int]] = []
+        for position in partial | cleaned_partial | extracted | affiliated_positions:
+            speaker = available_speakers.entry(position)
             score = 0
-
-            # 部分一致スコア
-            if speaker["name"] in speaker_name or speaker_name in speaker["name"]:
+            if position in partial:
                 score += 3
-
-            # 括弧内名前との一致
-            if extracted_name and (
-                speaker["name"] == extracted_name or extracted_name in speaker["name"]
-            ):
+            if position in extracted:
                 score += 5
-
-            # 清理された名前との一致
-            if speaker["name"] in cleaned_name or cleaned_name in speaker["name"]:
+            if position in cleaned_partial:
                 score += 2
-
-            # 文字列長の類似性
-            len_diff = abs(len(speaker["name"]) - len(speaker_name))
-            if len_diff <= 3:
+            if abs(len(speaker.name) - len(speaker_name)) <= 3:
                 score += 1
-
-            # 会議体所属ボーナス
-            if affiliated_speaker_ids and speaker["id"] in affiliated_speaker_ids:
-                score += 10  # 大きなボーナスを付与
-
-            if score > 0:
-                candidates.append({**speaker, "score": score})
-
-        # スコア順にソート
-        candidates.sort(key=lambda x: x["score"], reverse=True)
+            if position in affiliated_positions:
+                score += 10
+            scored.append((score, position))
+
+        # スコア順にソート（同点は登録順）
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        candidates: list[dict[str, Any]] = [
+            {**available_speakers.entry(position).to_dict(), "score": score}
+            for score, position in scored[:max_candidates]
+        ]
+
+        # 文字列長の類似性のみでスコア1となる候補で不足分を補う
+        if len(candidates) < max_candidates:
+            seen = {position for _, position in scored}
+            for position in available_speakers.iter_positions_by_length(
+                len(speaker_name) - 3, len(speaker_name) + 3
+            ):
+                if position in seen:
+                    continue
+                candidates.append(
+                    {**available_speakers.entry(position).to_dict(), "score": 1}
+                )
+                if len(candidates) >= max_candidates:
+                    break
 
         # 最大候補数に制限
-        return (
-            candidates[:max_candidates]
-            if candidates
-            else available_speakers[:max_candidates]
-        )
+        return candidates if candidates else available_speakers.head(max_candidates)
 
     def _format_speakers_for_llm(
         self,
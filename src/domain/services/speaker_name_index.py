@@ -0,0 +1,161 @@
+"""In-memory name index for speaker matching."""
+
+import heapq
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+BRACKET_NAME_PATTERN = re.compile(r"\(([^)]+)\)")
+LEADING_MARK_PATTERN = re.compile(r"^[◆○◎]")
+
+
+@dataclass(frozen=True)
+class IndexedSpeaker:
+    """Speaker entry stored in the index.
+
+    ``position`` preserves insertion order so that lookups return the same
+    "first match" as a linear scan over the original list.
+    """
+
+    position: int
+    id: int
+    name: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id, "name": self.name}
+
+
+def extract_bracket_name(name: str) -> str | None:
+    """括弧内の名前を抽出する（例: "議長(山田太郎)" → "山田太郎"）"""
+    match = BRACKET_NAME_PATTERN.search(name)
+    return match.group(1) if match else None
+
+
+def strip_leading_mark(name: str) -> str:
+    """先頭の記号（◆○◎）を除去する"""
+    return LEADING_MARK_PATTERN.sub("", name)
+
+
+class SpeakerNameIndex:
+    """発言者名の検索インデックス
+
+    完全一致用のハッシュマップ、文字n-gram（1-gram/2-gram）の転置インデックス、
+    名前の長さ別インデックスを保持し、発言者全件の線形走査をせずに
+    候補を生成する。バッチ処理の開始時に一度構築し、発言者の追加時には
+    ``add`` で差分更新する。
+    """
+
+    def __init__(self, speakers: Iterable[dict[str, Any]] = ()):
+        self._entries: list[IndexedSpeaker] = []
+        self._by_name: dict[str, list[int]] = defaultdict(list)
+        self._by_gram: dict[str, list[int]] = defaultdict(list)
+        self._by_length: dict[int, list[int]] = defaultdict(list)
+        self._position_by_id: dict[int, int] = {}
+        self._max_name_len = 0
+        for speaker in speakers:
+            self.add(speaker["id"], speaker["name"])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, speaker_id: object) -> bool:
+        return speaker_id in self._position_by_id
+
+    @staticmethod
+    def _grams(name: str) -> set[str]:
+        grams = set(name)
+        grams.update(name[i : i + 2] for i in range(len(name) - 1))
+        return grams
+
+    def add(self, speaker_id: int, name: str) -> None:
+        """発言者をインデックスに追加する（登録済みIDは無視）"""
+        if speaker_id in self._position_by_id:
+            return
+        position = len(self._entries)
+        self._entries.append(IndexedSpeaker(position, speaker_id, name))
+        self._position_by_id[speaker_id] = position
+        self._by_name[name].append(position)
+        self._by_length[len(name)].append(position)
+        self._max_name_len = max(self._max_name_len, len(name))
+        for gram in self._grams(name):
+            self._by_gram[gram].append(position)
+
+    def entry(self, position: int) -> IndexedSpeaker:
+        return self._entries[position]
+
+    def position_of(self, speaker_id: int) -> int | None:
+        return self._position_by_id.get(speaker_id)
+
+    def head(self, limit: int) -> list[dict[str, Any]]:
+        return [entry.to_dict() for entry in self._entries[:limit]]
+
+    def find_exact(self, name: str) -> IndexedSpeaker | None:
+        """名前が完全一致する最初の発言者"""
+        positions = self._by_name.get(name)
+        return self._entries[positions[0]] if positions else None
+
+    def _posting_for(self, query: str) -> list[int] | None:
+        """``query`` を含みうる発言者の位置リスト（最も短い転置リスト）"""
+        if len(query) == 1:
+            return self._by_gram.get(query, [])
+
+        shortest: list[int] | None = None
+        for i in range(len(query) - 1):
+            posting = self._by_gram.get(query[i : i + 2])
+            if not posting:
+                return []
+            if shortest is None or len(posting) < len(shortest):
+                shortest = posting
+        return shortest
+
+    def positions_containing(self, query: str) -> set[int]:
+        """名前に ``query`` を含む発言者の位置"""
+        if not query:
+            return set(range(len(self._entries)))
+        posting = self._posting_for(query) or []
+        entries = self._entries
+        return {p for p in posting if query in entries[p].name}
+
+    def first_containing(self, query: str) -> int | None:
+        """名前に ``query`` を含む最初の発言者の位置"""
+        if not query:
+            return 0 if self._entries else None
+        entries = self._entries
+        for position in self._posting_for(query) or []:
+            if query in entries[position].name:
+                return position
+        return None
+
+    def positions_contained_in(self, text: str) -> set[int]:
+        """名前が ``text`` の部分文字列である発言者の位置"""
+        positions: set[int] = set(self._by_name.get("", ()))
+        for start in range(len(text)):
+            stop = min(len(text), start + self._max_name_len)
+            for end in range(start + 1, stop + 1):
+                found = self._by_name.get(text[start:end])
+                if found:
+                    positions.update(found)
+        return positions
+
+    def positions_partial(self, name: str) -> set[int]:
+        """部分一致（双方向の包含関係）する発言者の位置"""
+        return self.positions_containing(name) | self.positions_contained_in(name)
+
+    def first_partial(self, name: str) -> IndexedSpeaker | None:
+        """部分一致する発言者のうち最初に登録されたもの"""
+        positions = self.positions_contained_in(name)
+        containing = self.first_containing(name)
+        if containing is not None:
+            positions.add(containing)
+        return self._entries[min(positions)] if positions else None
+
+    def iter_positions_by_length(self, min_len: int, max_len: int) -> Iterator[int]:
+        """名前の長さが範囲内の発言者の位置を追加順に返す"""
+        buckets = [
+            self._by_length[length]
+            for length in range(max(min_len, 0), max_len + 1)
+            if length in self._by_length
+        ]
+        return heapq.merge(*buckets)
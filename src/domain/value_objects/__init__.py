@@ -1,9 +1,11 @@
 """Domain value objects."""
 
+from src.domain.value_objects.conversation_ref import ConversationRef
 from src.domain.value_objects.page_classification import PageClassification, PageType
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 
 __all__ = [
+    "ConversationRef",
     "PageClassification",
     "PageType",
     "SpeakerSpeech",
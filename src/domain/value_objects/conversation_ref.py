@@ -0,0 +1,25 @@
+"""Domain value object for a conversation without its speech text."""
+
+from typing import NamedTuple
+
+
+class ConversationRef(NamedTuple):
+    """Lightweight view of a conversation for matching and status checks.
+
+    Holds only the identifying columns of a conversation. The comment text,
+    which is usually most of a conversation's size, is left out; load it
+    separately with ``ConversationRepository.get_comments`` when needed.
+
+    Attributes:
+        id: Conversation ID
+        minutes_id: ID of the minutes the conversation belongs to
+        speaker_id: ID of the linked speaker, if any
+        speaker_name: Speaker name as written in the minutes
+        sequence_number: Order of the conversation in the minutes
+    """
+
+    id: int
+    minutes_id: int | None
+    speaker_id: int | None
+    speaker_name: str | None
+    sequence_number: int
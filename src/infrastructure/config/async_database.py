@@ -3,8 +3,9 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+from src.infrastructure.config.engine_registry import get_engine_registry
 from src.infrastructure.config.settings import settings
 
 
@@ -12,19 +13,18 @@ class AsyncDatabase:
     """Async database manager."""
 
     def __init__(self):
-        """Initialize async database engine and session maker."""
-        # Convert sync database URL to async
-        database_url = settings.get_database_url()
-        # Replace postgresql:// with postgresql+asyncpg://
-        if database_url.startswith("postgresql://"):
-            async_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
-        else:
-            async_url = database_url
-
-        self.engine = create_async_engine(async_url, echo=False)
-        self.async_session_maker = async_sessionmaker(
-            self.engine, class_=AsyncSession, expire_on_commit=False
-        )
+        """Initialize async database manager."""
+        self.database_url = settings.get_database_url()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Shared async engine for the running event loop."""
+        return get_engine_registry().get_async_engine(self.database_url)
+
+    @property
+    def async_session_maker(self) -> async_sessionmaker[AsyncSession]:
+        """Session maker bound to the shared async engine."""
+        return get_engine_registry().get_async_session_factory(self.database_url)
 
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession]:
@@ -10,10 +10,11 @@ from collections.abc import Generator
 from contextlib import contextmanager
 
 from dotenv import load_dotenv
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, sessionmaker
 
+from src.infrastructure.config.engine_registry import get_engine_registry
 from src.infrastructure.exceptions import ConnectionError, DatabaseError
 
 load_dotenv()
@@ -89,12 +90,8 @@ def get_db_engine() -> Engine:
 
     if _engine is None:
         try:
-            _engine = create_engine(
-                DATABASE_URL,
-                pool_pre_ping=True,  # Verify connections before use
-                pool_size=5,
-                max_overflow=10,
-            )
+            # Pool settings come from the shared registry (DB_POOL_* env vars)
+            _engine = get_engine_registry().get_engine(DATABASE_URL)
             logger.info("Database engine created successfully")
         except SQLAlchemyError as e:
             raise ConnectionError(
@@ -180,7 +177,7 @@ def close_db_engine() -> None:
     global _engine
 
     if _engine is not None:
-        _engine.dispose()
+        get_engine_registry().dispose()
         _engine = None
         logger.info("Database engine closed")
 
@@ -0,0 +1,303 @@
+"""Process-wide registry of SQLAlchemy engines.
+
+Every adapter, presenter and dashboard loader draws its engine from here so a
+single process keeps one connection pool per database instead of one per
+caller.
+
+Async engines are keyed by URL and event loop: asyncpg connections are bound
+to the loop that opened them, so a pool must never be shared across loops.
+Sync engines are keyed by URL only.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+def to_async_url(database_url: str) -> str:
+    """Convert a sync PostgreSQL URL to its asyncpg form."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if database_url.startswith(prefix):
+            return "postgresql+asyncpg://" + database_url[len(prefix) :]
+    return database_url
+
+
+def mask_url(database_url: str) -> str:
+    """Hide credentials in a database URL for logging."""
+    if "@" not in database_url:
+        return database_url
+    scheme, _, rest = database_url.partition("://")
+    return f"{scheme}://***@{rest.rsplit('@', 1)[1]}"
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Tunable connection pool parameters."""
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    statement_cache_size: int = 100
+
+    @classmethod
+    def from_settings(cls) -> "PoolSettings":
+        """Build pool settings from the DB_* environment settings."""
+        return cls(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            statement_cache_size=settings.db_statement_cache_size,
+        )
+
+
+@dataclass
+class PoolMetrics:
+    """Snapshot of one engine's connection pool."""
+
+    url: str
+    size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Mean time spent waiting for a connection per checkout."""
+        return self.total_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+
+class _WaitTimingMixin:
+    """Measures how long each checkout waits for a pooled connection."""
+
+    checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            waited = time.perf_counter() - start
+            self.checkouts += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+
+class TimedQueuePool(_WaitTimingMixin, QueuePool):
+    """QueuePool that records checkout wait times."""
+
+
+class TimedAsyncAdaptedQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait times."""
+
+    _loop_closed = False
+
+    def dispose_after_loop_closed(self) -> None:
+        """Close pooled connections whose event loop has already closed.
+
+        A graceful close awaits the server on the connection's own loop,
+        which can no longer run, so connections are terminated instead.
+        """
+        self._loop_closed = True
+        self.dispose()
+
+    def _close_connection(self, connection: Any, *, terminate: bool = False) -> None:
+        super()._close_connection(connection, terminate=terminate or self._loop_closed)
+
+
+class EngineRegistry:
+    """Creates engines on first use and hands out the same one afterwards."""
+
+    def __init__(self, pool_settings: PoolSettings | None = None):
+        """Initialize the registry.
+
+        Args:
+            pool_settings: Pool parameters for every engine (defaults to the
+                DB_* environment settings)
+        """
+        self.pool_settings = pool_settings or PoolSettings.from_settings()
+        self._lock = threading.Lock()
+        self._sync_engines: dict[str, Engine] = {}
+        self._async_engines: dict[
+            tuple[str, int], tuple[asyncio.AbstractEventLoop, AsyncEngine]
+        ] = {}
+        self._session_factories: dict[
+            tuple[str, int], async_sessionmaker[AsyncSession]
+        ] = {}
+
+    def get_engine(self, database_url: str) -> Engine:
+        """Get the shared sync engine for a URL."""
+        with self._lock:
+            engine = self._sync_engines.get(database_url)
+            if engine is None:
+                pool_kwargs = self._pool_kwargs(database_url)
+                if pool_kwargs:
+                    pool_kwargs["poolclass"] = TimedQueuePool
+                engine = create_engine(database_url, **pool_kwargs)
+                self._sync_engines[database_url] = engine
+                logger.info(f"Created database engine for {mask_url(database_url)}")
+            return engine
+
+    def get_async_engine(self, database_url: str) -> AsyncEngine:
+        """Get the shared async engine for a URL and the running event loop.
+
+        Must be called with an event loop running, since the engine's
+        connections can only be used on the loop that created them.
+        """
+        async_url = to_async_url(database_url)
+        loop = asyncio.get_running_loop()
+        key = (async_url, id(loop))
+
+        with self._lock:
+            self._evict_closed_loops()
+            entry = self._async_engines.get(key)
+            if entry is None:
+                pool_kwargs = self._pool_kwargs(async_url)
+                if async_url.startswith("postgresql+asyncpg://"):
+                    pool_kwargs["poolclass"] = TimedAsyncAdaptedQueuePool
+                    pool_kwargs["connect_args"] = {
+                        "prepared_statement_cache_size": (
+                            self.pool_settings.statement_cache_size
+                        )
+                    }
+                engine = create_async_engine(async_url, echo=False, **pool_kwargs)
+                entry = (loop, engine)
+                self._async_engines[key] = entry
+                logger.info(f"Created async database engine for {mask_url(async_url)}")
+            return entry[1]
+
+    def get_async_session_factory(
+        self, database_url: str
+    ) -> async_sessionmaker[AsyncSession]:
+        """Get a session factory bound to the shared async engine."""
+        engine = self.get_async_engine(database_url)
+        key = (to_async_url(database_url), id(asyncio.get_running_loop()))
+        with self._lock:
+            factory = self._session_factories.get(key)
+            if factory is None:
+                factory = async_sessionmaker(engine, expire_on_commit=False)
+                self._session_factories[key] = factory
+            return factory
+
+    def pool_metrics(self) -> list[PoolMetrics]:
+        """Report pool usage for every registered engine."""
+        with self._lock:
+            pools = [
+                (mask_url(url), engine.pool)
+                for url, engine in self._sync_engines.items()
+            ] + [
+                (mask_url(url), engine.sync_engine.pool)
+                for (url, _), (_, engine) in self._async_engines.items()
+            ]
+
+        metrics = []
+        for url, pool in pools:
+            if not isinstance(pool, QueuePool):
+                continue
+            metrics.append(
+                PoolMetrics(
+                    url=url,
+                    size=pool.size(),
+                    checked_out=pool.checkedout(),
+                    checked_in=pool.checkedin(),
+                    overflow=max(pool.overflow(), 0),
+                    checkouts=getattr(pool, "checkouts", 0),
+                    total_wait_seconds=getattr(pool, "total_wait_seconds", 0.0),
+                    max_wait_seconds=getattr(pool, "max_wait_seconds", 0.0),
+                )
+            )
+        return metrics
+
+    def dispose(self) -> None:
+        """Dispose sync engines and forget every registered engine.
+
+        Async engines are only dropped: their connections belong to event
+        loops that may no longer be running. Use ``adispose()`` from the
+        owning loop to close them cleanly.
+        """
+        with self._lock:
+            for engine in self._sync_engines.values():
+                engine.dispose()
+            self._sync_engines.clear()
+            self._async_engines.clear()
+            self._session_factories.clear()
+
+    async def adispose(self) -> None:
+        """Dispose the async engines that belong to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            keys = [
+                key for key, (owner, _) in self._async_engines.items() if owner is loop
+            ]
+            engines = [self._async_engines.pop(key)[1] for key in keys]
+            for key in keys:
+                self._session_factories.pop(key, None)
+        for engine in engines:
+            await engine.dispose()
+
+    def _evict_closed_loops(self) -> None:
+        stale = [
+            key for key, (loop, _) in self._async_engines.items() if loop.is_closed()
+        ]
+        for key in stale:
+            _, engine = self._async_engines.pop(key)
+            self._session_factories.pop(key, None)
+            # The owning loop is gone, so close the pooled connections now
+            # instead of leaving them open
+            pool = engine.sync_engine.pool
+            if isinstance(pool, TimedAsyncAdaptedQueuePool):
+                pool.dispose_after_loop_closed()
+            else:
+                pool.dispose()
+            logger.info(f"Disposed async engine of closed loop for {mask_url(key[0])}")
+
+    def _pool_kwargs(self, database_url: str) -> dict[str, Any]:
+        # SQLite uses a single-connection pool that takes no sizing options
+        if database_url.startswith("sqlite"):
+            return {}
+        return {
+            "pool_size": self.pool_settings.pool_size,
+            "max_overflow": self.pool_settings.max_overflow,
+            "pool_timeout": self.pool_settings.pool_timeout,
+            "pool_recycle": self.pool_settings.pool_recycle,
+            "pool_pre_ping": self.pool_settings.pool_pre_ping,
+        }
+
+
+_registry: EngineRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_engine_registry() -> EngineRegistry:
+    """Get the process-wide engine registry."""
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = EngineRegistry()
+    return _registry
@@ -70,6 +70,35 @@ class Settings:
                 f"Invalid temperature value: {str(e)}",
             ) from e
 
+        # Persistent LLM response cache
+        self.llm_cache_enabled: bool = (
+            os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+        )
+        self.llm_cache_path: str = os.getenv(
+            "LLM_CACHE_PATH", "cache/llm/llm_cache.sqlite3"
+        )
+        self.llm_cache_max_mb: int = int(os.getenv("LLM_CACHE_MAX_MB", "256"))
+
+        # Minutes processing (section fan-out)
+        self.minutes_section_concurrency: int = int(
+            os.getenv("MINUTES_SECTION_CONCURRENCY", "1")
+        )
+        self.minutes_section_rate_per_second: float = float(
+            os.getenv("MINUTES_SECTION_RATE_PER_SECOND", "5")
+        )
+
+        # Database connection pool (shared engine registry)
+        self.db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+        self.db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+        self.db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+        self.db_pool_recycle: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+        self.db_pool_pre_ping: bool = (
+            os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+        )
+        self.db_statement_cache_size: int = int(
+            os.getenv("DB_STATEMENT_CACHE_SIZE", "100")
+        )
+
         # GCS Configuration
         self.gcs_bucket_name: str = os.getenv(
             "GCS_BUCKET_NAME", "sagebase-scraped-minutes"
@@ -85,6 +114,34 @@ class Settings:
         self.page_load_timeout: int = int(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
         self.selector_wait_timeout: int = int(os.getenv("SELECTOR_WAIT_TIMEOUT", "10"))
 
+        # Browser pool shared by the Playwright scrapers
+        self.browser_pool_size: int = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+        self.browser_pool_max_concurrent_pages: int = int(
+            os.getenv("BROWSER_POOL_MAX_CONCURRENT_PAGES", "6")
+        )
+        self.browser_pool_max_pages_per_browser: int = int(
+            os.getenv("BROWSER_POOL_MAX_PAGES_PER_BROWSER", "100")
+        )
+
+        # HTTP-first fetching of static pages (Playwright only when needed)
+        self.http_fetch_enabled: bool = (
+            os.getenv("HTTP_FETCH_ENABLED", "true").lower() == "true"
+        )
+        self.http_fetch_timeout: int = int(os.getenv("HTTP_FETCH_TIMEOUT", "30"))
+        self.http_pool_limit: int = int(os.getenv("HTTP_POOL_LIMIT", "20"))
+        self.http_pool_limit_per_host: int = int(
+            os.getenv("HTTP_POOL_LIMIT_PER_HOST", "6")
+        )
+        self.http_keepalive_timeout: int = int(
+            os.getenv("HTTP_KEEPALIVE_TIMEOUT", "30")
+        )
+
+        # Re-check cached minutes with the source after this many hours
+        # (0: cached minutes are used until --no-cache / force re-scrape)
+        self.scrape_revalidate_after_hours: int = int(
+            os.getenv("SCRAPE_REVALIDATE_AFTER_HOURS", "24")
+        )
+
         # Sentry Configuration
         self.sentry_dsn: str = os.getenv("SENTRY_DSN", "")
         self.sentry_environment: str = os.getenv("ENVIRONMENT", "development")
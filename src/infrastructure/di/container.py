@@ -5,6 +5,7 @@ This module provides the main ApplicationContainer that combines all sub-contain
 and manages the application-wide dependency injection.
 """
 
+import atexit
 import os
 from enum import Enum
 from typing import Any
@@ -332,5 +333,10 @@ def reset_container() -> None:
         _container = None
 
 
+# Shut down resources such as the LLM history sink so buffered records are
+# written before the process exits
+atexit.register(reset_container)
+
+
 # Alias for backward compatibility
 Container = ApplicationContainer
@@ -0,0 +1,365 @@
+"""Shared pool of warm Playwright browsers.
+
+Launching Chromium costs hundreds of milliseconds and a lot of memory, so
+scrapers lease pages from this pool instead of launching a browser per URL.
+The pool keeps up to ``size`` browsers running and spreads leases over them,
+caps the number of leases open at once, and gives every lease a fresh browser
+context, so cookies and storage never leak from one fetch to the next. A
+browser is replaced after it has served ``max_pages_per_browser`` leases or
+when it disconnects (e.g. after a crash).
+
+Playwright objects belong to the event loop that created them, so the pool
+must be closed (``await pool.close()``) on that loop before it ends. When the
+pool is used from a new loop, browsers of an old loop that is still running
+are shut down on it and new ones are launched on first use.
+
+The application's pools are resources of the DI container
+(``ServiceContainer.browser_pool`` / ``headed_browser_pool``) and are closed
+when container resources shut down.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    async_playwright,
+)
+
+from src.infrastructure.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Keeps close() tasks scheduled during resource shutdown from being collected
+_closing_tasks: set[asyncio.Task[None]] = set()
+
+
+@dataclass(frozen=True)
+class BrowserPoolSettings:
+    """Tunable browser pool parameters."""
+
+    size: int = 2
+    max_concurrent_pages: int = 6
+    max_pages_per_browser: int = 100
+    headless: bool = True
+    launch_args: tuple[str, ...] = (
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-dev-shm-usage",
+    )
+
+    @classmethod
+    def from_settings(cls, headless: bool = True) -> "BrowserPoolSettings":
+        """Build pool settings from the BROWSER_POOL_* environment settings."""
+        return cls(
+            size=settings.browser_pool_size,
+            max_concurrent_pages=settings.browser_pool_max_concurrent_pages,
+            max_pages_per_browser=settings.browser_pool_max_pages_per_browser,
+            headless=headless,
+        )
+
+
+@dataclass
+class BrowserPoolMetrics:
+    """Snapshot of a browser pool's usage."""
+
+    browsers: int
+    launches: int
+    leases: int
+    active_leases: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Mean time a lease waited for a free slot."""
+        return self.total_wait_seconds / self.leases if self.leases else 0.0
+
+
+class _BrowserSlot:
+    """One pooled browser and its lease counters."""
+
+    def __init__(self) -> None:
+        self.browser: Browser | None = None
+        self.active = 0
+        self.pages_served = 0
+
+    @property
+    def is_alive(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class BrowserPool:
+    """Leases browser contexts and pages from a few long-lived browsers."""
+
+    def __init__(self, pool_settings: BrowserPoolSettings | None = None):
+        """Initialize the pool. Browsers are launched on first use.
+
+        Args:
+            pool_settings: Pool parameters (defaults to the BROWSER_POOL_*
+                environment settings)
+        """
+        self.pool_settings = pool_settings or BrowserPoolSettings.from_settings()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._playwright: Playwright | None = None
+        self._slots: list[_BrowserSlot] = []
+        self._retired: set[_BrowserSlot] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        self._launch_lock: asyncio.Lock | None = None
+        self._launches = 0
+        self._leases = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator[BrowserContext]:
+        """Lease a fresh browser context from one of the pooled browsers.
+
+        Waits while ``max_concurrent_pages`` leases are already open. The
+        context is closed when the block exits.
+
+        Args:
+            **context_options: Passed to ``Browser.new_context()``
+                (e.g. ``user_agent``)
+        """
+        self._bind_to_running_loop()
+        assert self._semaphore is not None
+
+        start = time.perf_counter()
+        async with self._semaphore:
+            self._record_wait(time.perf_counter() - start)
+            slot = await self._acquire_slot()
+            slot.active += 1
+            context: BrowserContext | None = None
+            try:
+                assert slot.browser is not None
+                context = await slot.browser.new_context(**context_options)
+                yield context
+            finally:
+                slot.active -= 1
+                slot.pages_served += 1
+                if context is not None:
+                    try:
+                        await context.close()
+                    except Exception as e:
+                        logger.debug(f"Failed to close browser context: {e}")
+                await self._release_slot(slot)
+
+    @asynccontextmanager
+    async def page(self, **context_options: Any) -> AsyncIterator[Page]:
+        """Lease a page in a fresh browser context.
+
+        Args:
+            **context_options: Passed to ``Browser.new_context()``
+        """
+        async with self.context(**context_options) as context:
+            yield await context.new_page()
+
+    def metrics(self) -> BrowserPoolMetrics:
+        """Report pool usage."""
+        return BrowserPoolMetrics(
+            browsers=sum(1 for slot in self._slots if slot.is_alive),
+            launches=self._launches,
+            leases=self._leases,
+            active_leases=sum(slot.active for slot in self._slots)
+            + sum(slot.active for slot in self._retired),
+            total_wait_seconds=self._total_wait_seconds,
+            max_wait_seconds=self._max_wait_seconds,
+        )
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright.
+
+        The pool stays usable: the next lease launches new browsers.
+        """
+        if self._loop is not asyncio.get_running_loop():
+            self._shut_down_other_loop()
+            self._reset()
+            return
+
+        await self._shut_down([*self._slots, *self._retired], self._playwright)
+        self._reset()
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """Close the pool from synchronous code, on the loop that owns it.
+
+        Args:
+            timeout: Seconds to wait for a loop running in another thread
+        """
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if loop is running:
+            task = loop.create_task(self.close())
+            _closing_tasks.add(task)
+            task.add_done_callback(_closing_tasks.discard)
+            return
+        if loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.close(), loop)
+            try:
+                future.result(timeout)
+            except Exception as e:
+                logger.error(f"Failed to close browser pool: {e}")
+            return
+        if running is None and not loop.is_closed():
+            loop.run_until_complete(self.close())
+            return
+        self._shut_down_other_loop()
+        self._reset()
+
+    def _bind_to_running_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.info("Event loop changed, browser pool will relaunch browsers")
+            self._shut_down_other_loop()
+        self._reset()
+        self._loop = loop
+        self._semaphore = asyncio.Semaphore(self.pool_settings.max_concurrent_pages)
+        self._launch_lock = asyncio.Lock()
+
+    def _shut_down_other_loop(self) -> None:
+        """Stop the browsers and driver launched on the previous event loop.
+
+        Their coroutines can only run on that loop, so they are closed there
+        if it is still running (in another thread). Once it has closed they
+        can no longer be reached.
+        """
+        loop, playwright = self._loop, self._playwright
+        if loop is None or playwright is None:
+            return
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                self._shut_down([*self._slots, *self._retired], playwright), loop
+            )
+        else:
+            logger.warning(
+                "Browser pool was not closed before its event loop ended; "
+                "its browsers cannot be shut down"
+            )
+
+    async def _shut_down(
+        self, slots: list[_BrowserSlot], playwright: Playwright | None
+    ) -> None:
+        for slot in slots:
+            await self._close_browser(slot)
+        if playwright is not None:
+            await playwright.stop()
+
+    def _reset(self) -> None:
+        self._loop = None
+        self._playwright = None
+        self._slots = [_BrowserSlot() for _ in range(self.pool_settings.size)]
+        self._retired = set()
+        self._semaphore = None
+        self._launch_lock = None
+
+    async def _acquire_slot(self) -> _BrowserSlot:
+        """Pick the least busy slot, launching its browser if needed."""
+        assert self._launch_lock is not None
+        slot = self._pick_slot()
+        if slot.is_alive:
+            return slot
+
+        async with self._launch_lock:
+            slot = self._pick_slot()
+            if slot.is_alive:
+                return slot
+            if slot.browser is not None:
+                logger.warning("Pooled browser disconnected, relaunching")
+                slot = await self._retire(slot)
+            await self._launch(slot)
+        return slot
+
+    def _pick_slot(self) -> _BrowserSlot:
+        # Idle warm browsers first, then unlaunched slots before busy browsers
+        return min(self._slots, key=lambda s: (s.active, not s.is_alive))
+
+    async def _release_slot(self, slot: _BrowserSlot) -> None:
+        """Retire a slot that is worn out or dead, closing it once idle."""
+        if slot in self._slots:
+            if (
+                not slot.is_alive
+                or slot.pages_served >= self.pool_settings.max_pages_per_browser
+            ):
+                await self._retire(slot)
+        elif slot in self._retired and slot.active == 0:
+            self._retired.discard(slot)
+            await self._close_browser(slot)
+
+    async def _retire(self, slot: _BrowserSlot) -> _BrowserSlot:
+        """Swap a slot for a fresh one; its browser closes when idle."""
+        fresh = _BrowserSlot()
+        self._slots[self._slots.index(slot)] = fresh
+        if slot.active:
+            self._retired.add(slot)
+        else:
+            await self._close_browser(slot)
+        return fresh
+
+    async def _launch(self, slot: _BrowserSlot) -> None:
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        slot.browser = await self._playwright.chromium.launch(
+            headless=self.pool_settings.headless,
+            args=list(self.pool_settings.launch_args),
+        )
+        self._launches += 1
+        logger.info(f"Launched pooled browser ({self._launches} launches so far)")
+
+    async def _close_browser(self, slot: _BrowserSlot) -> None:
+        if slot.browser is None:
+            return
+        try:
+            await slot.browser.close()
+        except Exception as e:
+            logger.debug(f"Failed to close pooled browser: {e}")
+        slot.browser = None
+
+    def _record_wait(self, waited: float) -> None:
+        self._leases += 1
+        self._total_wait_seconds += waited
+        self._max_wait_seconds = max(self._max_wait_seconds, waited)
+
+
+def open_browser_pool(headless: bool = True) -> Iterator[BrowserPool]:
+    """Provide a pool as a DI resource that is closed on resource shutdown.
+
+    Args:
+        headless: Whether the pooled browsers run headless
+    """
+    pool = BrowserPool(BrowserPoolSettings.from_settings(headless=headless))
+    yield pool
+    pool.shutdown()
+
+
+def get_browser_pool(headless: bool = True) -> BrowserPool:
+    """Get the application's shared pool for headless or headed browsers.
+
+    For code not constructed by the DI container; the pools themselves are
+    container resources.
+    """
+    from src.infrastructure.di.container import get_container, init_container
+
+    try:
+        container = get_container()
+    except RuntimeError:
+        container = init_container()
+
+    if headless:
+        return container.services.browser_pool()
+    return container.services.headed_browser_pool()
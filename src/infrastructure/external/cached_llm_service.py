@@ -2,9 +2,19 @@
 
 import hashlib
 import json
+import logging
 from datetime import datetime, timedelta
 from typing import Any
 
+from langchain_core.messages import BaseMessage
+from langchain_core.prompt_values import PromptValue
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel, Field, ValidationError
+
+from src.domain.entities.llm_processing_history import LLMProcessingHistory
+from src.domain.repositories.llm_processing_history_repository import (
+    LLMProcessingHistoryRepository,
+)
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.types import PoliticianDTO
 from src.domain.types.llm import (
@@ -12,7 +22,30 @@ from src.domain.types.llm import (
     LLMMatchResult,
     LLMSpeakerMatchContext,
 )
-from src.infrastructure.external.llm_service import GeminiLLMService
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external.llm_cache_store import (
+    PersistentLLMCache,
+    get_persistent_llm_cache,
+)
+from src.infrastructure.external.prompt_loader import PromptLoader
+
+logger = logging.getLogger(__name__)
+
+
+class BatchSpeakerMatchItem(BaseModel):
+    """Match result for one speaker in a batched prompt."""
+
+    index: int = Field(description="入力リストの番号")
+    matched: bool = Field(description="マッチングが成功したかどうか")
+    matched_id: int | None = Field(description="マッチした候補のID", default=None)
+    confidence: float = Field(description="マッチングの信頼度 (0.0-1.0)", default=0.0)
+    reason: str = Field(description="マッチング判定の理由", default="")
+
+
+class BatchSpeakerMatchResponse(BaseModel):
+    """Structured output for a batched speaker matching prompt."""
+
+    results: list[BatchSpeakerMatchItem] = Field(description="入力ごとのマッチング結果")
 
 
 class LLMCache:
@@ -89,9 +122,13 @@ class CachedLLMService(ILLMService):
 
     def __init__(
         self,
-        base_service: GeminiLLMService,
+        base_service: ILLMService,
         cache_ttl_minutes: int = 60,
         enable_batching: bool = True,
+        persistent_cache: PersistentLLMCache | None = None,
+        prompt_version: str | None = None,
+        max_batch_size: int = 25,
+        max_batch_prompt_chars: int = 30000,
     ):
         """Initialize cached LLM service.
 
@@ -99,12 +136,167 @@ class CachedLLMService(ILLMService):
             base_service: The underlying LLM service
             cache_ttl_minutes: Cache TTL in minutes
             enable_batching: Whether to enable batch processing
+            persistent_cache: Optional on-disk cache shared across runs
+            prompt_version: Prompt template version included in persistent keys;
+                defaults to a fingerprint of the loaded prompts.yaml
+            max_batch_size: Maximum speakers packed into one batched prompt
+            max_batch_prompt_chars: Prompt size at which a batch is split
         """
         self._base_service = base_service
         self._cache = LLMCache(ttl_minutes=cache_ttl_minutes)
+        self._persistent_cache = persistent_cache
+        self._prompt_version = (
+            prompt_version
+            if prompt_version is not None
+            else PromptLoader.get_default_instance().get_cache_version()
+        )
         self._enable_batching = enable_batching
+        self._max_batch_size = max_batch_size
+        self._max_batch_prompt_chars = max_batch_prompt_chars
         self._pending_batch: list[tuple[str, Any, Any]] = []
 
+        # Required attributes for ILLMService protocol
+        self.model_name = base_service.model_name
+        self.temperature = base_service.temperature
+
+    @property
+    def _model_name(self) -> str:
+        model_name = getattr(self._base_service, "model_name", None)
+        return model_name if isinstance(model_name, str) else "unknown"
+
+    def _get_cached(self, operation: str, context: Any) -> Any | None:
+        """Look up the in-memory cache, then the persistent cache."""
+        cached = self._cache.get(operation, context)
+        if cached is not None or self._persistent_cache is None:
+            return cached
+
+        cached = self._persistent_cache.get(
+            self._model_name, operation, self._prompt_version, context
+        )
+        if cached is not None:
+            self._cache.set(operation, context, cached)
+        return cached
+
+    def _set_cached(self, operation: str, context: Any, result: Any) -> None:
+        """Store a result in every configured cache tier."""
+        self._cache.set(operation, context, result)
+        if self._persistent_cache is not None and result is not None:
+            self._persistent_cache.set(
+                self._model_name, operation, self._prompt_version, context, result
+            )
+
+    async def set_history_repository(
+        self, repository: LLMProcessingHistoryRepository | None
+    ) -> None:
+        """Delegate to wrapped LLM service."""
+        await self._base_service.set_history_repository(repository)
+
+    async def get_processing_history(
+        self, reference_type: str | None = None, reference_id: int | None = None
+    ) -> list[LLMProcessingHistory]:
+        """Delegate to wrapped LLM service."""
+        return await self._base_service.get_processing_history(
+            reference_type, reference_id
+        )
+
+    def get_structured_llm(self, schema: Any) -> Any:
+        """Get a structured LLM whose responses are cached.
+
+        Pydantic schemas are cached per schema definition and rendered prompt,
+        so chains such as ``prompt | structured_llm`` reuse responses across
+        runs. Other schema kinds are returned uncached.
+
+        Args:
+            schema: Pydantic model or schema definition
+
+        Returns:
+            Runnable producing instances of ``schema``
+        """
+        structured_llm = self._base_service.get_structured_llm(schema)
+        if not (isinstance(schema, type) and issubclass(schema, BaseModel)):
+            return structured_llm
+
+        operation = f"structured:{schema.__module__}.{schema.__qualname__}"
+        schema_hash = hashlib.sha256(
+            json.dumps(schema.model_json_schema(), sort_keys=True).encode()
+        ).hexdigest()
+
+        def invoke(prompt: Any) -> Any:
+            context = {"schema": schema_hash, "prompt": self._prompt_input(prompt)}
+            cached = self._get_structured_cached(schema, operation, context)
+            if cached is not None:
+                return cached
+            result = structured_llm.invoke(prompt)
+            self._set_structured_cached(schema, operation, context, result)
+            return result
+
+        async def ainvoke(prompt: Any) -> Any:
+            context = {"schema": schema_hash, "prompt": self._prompt_input(prompt)}
+            cached = self._get_structured_cached(schema, operation, context)
+            if cached is not None:
+                return cached
+            result = await structured_llm.ainvoke(prompt)
+            self._set_structured_cached(schema, operation, context, result)
+            return result
+
+        return RunnableLambda(invoke, afunc=ainvoke, name=f"cached_{schema.__name__}")
+
+    @staticmethod
+    def _prompt_input(prompt: Any) -> Any:
+        """Convert a rendered prompt into JSON-friendly cache key input."""
+        if isinstance(prompt, PromptValue):
+            prompt = prompt.to_messages()
+        if isinstance(prompt, BaseMessage):
+            prompt = [prompt]
+        if isinstance(prompt, list):
+            return [
+                {"role": m.type, "content": m.content}
+                if isinstance(m, BaseMessage)
+                else m
+                for m in prompt
+            ]
+        return prompt
+
+    def _get_structured_cached(
+        self, schema: type[BaseModel], operation: str, context: dict[str, Any]
+    ) -> BaseModel | None:
+        """Look up a structured response and rebuild a fresh model instance."""
+        cached = self._get_cached(operation, context)
+        if cached is None:
+            return None
+        try:
+            return schema.model_validate(cached)
+        except ValidationError:
+            # The schema changed in a way its JSON schema hash did not capture
+            return None
+
+    def _set_structured_cached(
+        self,
+        schema: type[BaseModel],
+        operation: str,
+        context: dict[str, Any],
+        result: Any,
+    ) -> None:
+        """Store a structured response as plain JSON data."""
+        if isinstance(result, schema):
+            self._set_cached(operation, context, result.model_dump(mode="json"))
+
+    def get_prompt(self, prompt_name: str) -> Any:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.get_prompt(prompt_name)
+
+    def invoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.invoke_with_retry(chain, inputs)
+
+    async def ainvoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Delegate to wrapped LLM service."""
+        return await self._base_service.ainvoke_with_retry(chain, inputs)
+
+    def invoke_llm(self, messages: list[dict[str, str]]) -> str:
+        """Delegate to wrapped LLM service."""
+        return self._base_service.invoke_llm(messages)
+
     async def match_speaker_to_politician(
         self, context: LLMSpeakerMatchContext
     ) -> LLMMatchResult | None:
@@ -117,7 +309,7 @@ class CachedLLMService(ILLMService):
             Match result or None if no match
         """
         # Check cache first
-        cached = self._cache.get("match_speaker", context)
+        cached = self._get_cached("match_speaker", context)
         if cached is not None:
             return cached
 
@@ -125,7 +317,7 @@ class CachedLLMService(ILLMService):
         result = await self._base_service.match_speaker_to_politician(context)
 
         # Cache the result
-        self._cache.set("match_speaker", context, result)
+        self._set_cached("match_speaker", context, result)
 
         return result
 
@@ -148,7 +340,7 @@ class CachedLLMService(ILLMService):
             ).hexdigest(),
             "party_id": party_id,
         }
-        cached = self._cache.get("extract_members", cache_context)
+        cached = self._get_cached("extract_members", cache_context)
         if cached is not None:
             return cached
 
@@ -156,7 +348,7 @@ class CachedLLMService(ILLMService):
         result = await self._base_service.extract_party_members(html_content, party_id)
 
         # Cache the result
-        self._cache.set("extract_members", cache_context, result)
+        self._set_cached("extract_members", cache_context, result)
 
         return result
 
@@ -187,7 +379,7 @@ class CachedLLMService(ILLMService):
         }
 
         # Check cache
-        cached = self._cache.get("match_conference_member", cache_context)
+        cached = self._get_cached("match_conference_member", cache_context)
         if cached is not None:
             return cached
 
@@ -197,7 +389,7 @@ class CachedLLMService(ILLMService):
         )
 
         # Cache the result
-        self._cache.set("match_conference_member", cache_context, result)
+        self._set_cached("match_conference_member", cache_context, result)
 
         return result
 
@@ -216,7 +408,7 @@ class CachedLLMService(ILLMService):
         }
 
         # Check cache
-        cached = self._cache.get("extract_speeches", cache_context)
+        cached = self._get_cached("extract_speeches", cache_context)
         if cached is not None:
             return cached
 
@@ -224,7 +416,7 @@ class CachedLLMService(ILLMService):
         result = await self._base_service.extract_speeches_from_text(text)
 
         # Cache the result
-        self._cache.set("extract_speeches", cache_context, result)
+        self._set_cached("extract_speeches", cache_context, result)
 
         return result
 
@@ -253,7 +445,7 @@ class CachedLLMService(ILLMService):
         uncached_indices = []
 
         for i, context in enumerate(contexts):
-            cached = self._cache.get("match_speaker", context)
+            cached = self._get_cached("match_speaker", context)
             if cached is not None:
                 results.append(cached)
             else:
@@ -261,27 +453,161 @@ class CachedLLMService(ILLMService):
                 uncached_contexts.append(context)
                 uncached_indices.append(i)
 
-        # Process uncached items in batch
+        # Process uncached items with multi-item prompts
         if uncached_contexts:
-            # Create a combined prompt for batch processing
-            # This is a simplified example - actual implementation would need
-            # to handle the batch response parsing
-            batch_results = []
-            for context in uncached_contexts:
-                result = await self._base_service.match_speaker_to_politician(context)
-                batch_results.append(result)
-                self._cache.set("match_speaker", context, result)
-
-            # Fill in the results
-            for i, result in zip(uncached_indices, batch_results, strict=False):
+            batch_results: list[LLMMatchResult | None] = []
+            for batch in self._split_into_batches(uncached_contexts):
+                batch_results.extend(await self._match_speaker_batch(batch))
+
+            for i, context, result in zip(
+                uncached_indices, uncached_contexts, batch_results, strict=True
+            ):
+                self._set_cached("match_speaker", context, result)
                 results[i] = result
 
         return results
 
+    @staticmethod
+    def _format_batch_item(index: int, context: LLMSpeakerMatchContext) -> str:
+        """Render one speaker context as a section of a batched prompt."""
+        candidates_text = "\n".join(
+            f"  - ID: {c.get('id')}, Name: {c.get('name')}, "
+            f"Party: {c.get('party', 'N/A')}"
+            for c in context.get("candidates", [])
+        )
+        return (
+            f"[{index}] Speaker: {context.get('speaker_name', '')}"
+            f" (normalized: {context.get('normalized_name', '')},"
+            f" party: {context.get('party_affiliation') or 'N/A'},"
+            f" position: {context.get('position') or 'N/A'},"
+            f" meeting date: {context.get('meeting_date', '')})\n"
+            f"Candidates:\n{candidates_text or '  (none)'}"
+        )
+
+    def _build_batch_prompt(self, contexts: list[LLMSpeakerMatchContext]) -> str:
+        """Build a single prompt that matches several speakers at once."""
+        sections = "\n\n".join(
+            self._format_batch_item(i, context) for i, context in enumerate(contexts)
+        )
+        return f"""Match each numbered speaker below to one of its own candidates.
+Only choose IDs from the candidate list of the same speaker.
+
+{sections}
+
+Return one result per speaker with:
+- index: int (the speaker number in brackets)
+- matched: boolean (true if match found)
+- confidence: float (0.0-1.0)
+- matched_id: int or null (candidate ID if matched)
+- reason: string (explanation)
+"""
+
+    def _split_into_batches(
+        self, contexts: list[LLMSpeakerMatchContext]
+    ) -> list[list[LLMSpeakerMatchContext]]:
+        """Pack contexts into batches bounded by item count and prompt size."""
+        batches: list[list[LLMSpeakerMatchContext]] = []
+        current: list[LLMSpeakerMatchContext] = []
+        current_chars = 0
+
+        for context in contexts:
+            item_chars = len(self._format_batch_item(len(current), context))
+            if current and (
+                len(current) >= self._max_batch_size
+                or current_chars + item_chars > self._max_batch_prompt_chars
+            ):
+                batches.append(current)
+                current, current_chars = [], 0
+            current.append(context)
+            current_chars += item_chars
+
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _match_speaker_batch(
+        self, contexts: list[LLMSpeakerMatchContext]
+    ) -> list[LLMMatchResult | None]:
+        """Match a batch with one LLM call.
+
+        Batches whose call fails (e.g. token limit exceeded or unparsable
+        output) are split in half and retried; items missing or invalid in an
+        otherwise valid response are retried individually.
+        """
+        if len(contexts) == 1:
+            return [await self._base_service.match_speaker_to_politician(contexts[0])]
+
+        try:
+            structured_llm = self._base_service.get_structured_llm(
+                BatchSpeakerMatchResponse
+            )
+            response = await structured_llm.ainvoke(self._build_batch_prompt(contexts))
+            parsed = BatchSpeakerMatchResponse.model_validate(
+                response.model_dump() if isinstance(response, BaseModel) else response
+            )
+        except Exception as e:
+            logger.warning(
+                f"Batch speaker matching failed for {len(contexts)} items, "
+                f"splitting: {e}"
+            )
+            middle = len(contexts) // 2
+            return await self._match_speaker_batch(
+                contexts[:middle]
+            ) + await self._match_speaker_batch(contexts[middle:])
+
+        items_by_index = {item.index: item for item in parsed.results}
+        results: list[LLMMatchResult | None] = []
+        for i, context in enumerate(contexts):
+            item = items_by_index.get(i)
+            candidate_ids = {str(c.get("id")) for c in context.get("candidates", [])}
+            if item is None or (
+                item.matched and str(item.matched_id) not in candidate_ids
+            ):
+                results.append(
+                    await self._base_service.match_speaker_to_politician(context)
+                )
+                continue
+
+            results.append(
+                LLMMatchResult(
+                    matched=item.matched,
+                    confidence=item.confidence,
+                    reason=item.reason,
+                    matched_id=item.matched_id if item.matched else None,
+                    metadata={
+                        "model": self._model_name,
+                        "batch_size": str(len(contexts)),
+                    },
+                )
+            )
+        return results
+
     def clear_cache(self) -> None:
-        """Clear the cache."""
+        """Clear the in-memory cache.
+
+        The persistent cache is left intact; prune it via ``llm-cache-prune``.
+        """
         self._cache.clear()
 
-    def get_cache_stats(self) -> dict[str, int]:
+    def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        return self._cache.stats()
+        stats: dict[str, Any] = dict(self._cache.stats())
+        if self._persistent_cache is not None:
+            stats["persistent"] = self._persistent_cache.stats().to_dict()
+        return stats
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate unknown attributes (e.g. ``llm``) to wrapped service."""
+        if name == "_base_service":
+            raise AttributeError(name)
+        return getattr(self._base_service, name)
+
+
+def with_persistent_cache(base_service: ILLMService) -> ILLMService:
+    """Wrap an LLM service with the cache shared across runs.
+
+    Returns the service unchanged when ``LLM_CACHE_ENABLED`` is false.
+    """
+    if not get_settings().llm_cache_enabled:
+        return base_service
+    return CachedLLMService(base_service, persistent_cache=get_persistent_llm_cache())
@@ -1,7 +1,9 @@
 """Concurrent LLM service with rate limiting and parallel processing."""
 
 import asyncio
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
 from typing import Any, TypeVar
 
 from src.domain.services.interfaces.llm_service import ILLMService
@@ -15,39 +17,212 @@ from src.domain.types.llm import (
 T = TypeVar("T")
 
 
+@dataclass
+class ModelRateLimits:
+    """Request and token budgets for a single model.
+
+    Attributes:
+        requests_per_minute: Sustained request budget (None = unlimited)
+        tokens_per_minute: Sustained token budget (None = unlimited)
+        burst_requests: Requests allowed back-to-back before throttling
+        burst_tokens: Tokens allowed back-to-back (defaults to one minute)
+    """
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+    burst_requests: int | None = None
+    burst_tokens: int | None = None
+
+
+DEFAULT_MODEL_LIMITS: dict[str, ModelRateLimits] = {
+    "gemini-2.0-flash": ModelRateLimits(
+        requests_per_minute=2000, tokens_per_minute=4_000_000, burst_requests=20
+    ),
+    "gemini-1.5-flash": ModelRateLimits(
+        requests_per_minute=2000, tokens_per_minute=4_000_000, burst_requests=20
+    ),
+    "gemini-1.5-pro": ModelRateLimits(
+        requests_per_minute=1000, tokens_per_minute=4_000_000, burst_requests=10
+    ),
+}
+
+
+def estimate_tokens(*payloads: Any) -> int:
+    """Roughly estimate the token count of request payloads.
+
+    Japanese text averages well under two characters per token on Gemini, so
+    half the character count is used as a conservative estimate.
+    """
+    return max(1, sum(len(str(p)) for p in payloads if p is not None) // 2)
+
+
+class _GCRABucket:
+    """Generic cell rate algorithm state for one budget.
+
+    Instead of tracking individual timestamps, the bucket keeps a single
+    theoretical arrival time (TAT). A request of ``cost`` units is conforming
+    once ``now >= TAT + cost * interval - burst * interval``.
+    """
+
+    def __init__(self, rate_per_second: float, burst: float):
+        self._interval = 1.0 / rate_per_second
+        self._tolerance = max(burst, 1.0) * self._interval
+        self._tat = 0.0
+
+    def earliest(self, now: float, cost: float) -> float:
+        """Earliest time at which ``cost`` units conform."""
+        new_tat = max(self._tat, now) + cost * self._interval
+        return new_tat - self._tolerance
+
+    def commit(self, start: float, cost: float) -> None:
+        """Record ``cost`` units as consumed at ``start``."""
+        self._tat = max(self._tat, start) + cost * self._interval
+
+
+@dataclass
+class RateLimiterMetrics:
+    """Snapshot of rate limiter activity."""
+
+    acquired: int = 0
+    throttled: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    in_flight: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    tokens_reserved: int = 0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Average time a caller waited for a slot."""
+        return self.total_wait_seconds / self.acquired if self.acquired else 0.0
+
+
 class RateLimiter:
-    """Rate limiter for API calls."""
+    """Non-blocking GCRA rate limiter for API calls.
+
+    Reservations are computed synchronously, so no coroutine ever sleeps while
+    holding shared state; every waiter sleeps only for its own delay and
+    concurrent callers proceed as soon as their slot arrives.
+    """
 
-    def __init__(self, max_per_second: int = 5, max_concurrent: int = 10):
+    def __init__(
+        self,
+        max_per_second: float | None = 5,
+        max_concurrent: int = 10,
+        burst: int | None = None,
+        limits: ModelRateLimits | None = None,
+    ):
         """Initialize rate limiter.
 
         Args:
-            max_per_second: Maximum requests per second
-            max_concurrent: Maximum concurrent requests
+            max_per_second: Maximum requests per second (None = unlimited)
+            max_concurrent: Maximum concurrent requests inside ``slot()``
+            burst: Requests allowed back-to-back (defaults to max_per_second)
+            limits: Optional per-minute request/token budgets for a model
         """
-        self._max_per_second = max_per_second
         self._semaphore = asyncio.Semaphore(max_concurrent)
-        self._last_call_times: list[float] = []
-        self._lock = asyncio.Lock()
+        self._request_buckets: list[_GCRABucket] = []
+        self._token_bucket: _GCRABucket | None = None
+        self._metrics = RateLimiterMetrics()
 
-    async def acquire(self) -> None:
-        """Acquire permission to make a request."""
-        async with self._semaphore:
-            async with self._lock:
-                now = asyncio.get_event_loop().time()
+        if max_per_second:
+            self._request_buckets.append(
+                _GCRABucket(max_per_second, burst or max_per_second)
+            )
+
+        if limits is not None:
+            if limits.requests_per_minute:
+                self._request_buckets.append(
+                    _GCRABucket(
+                        limits.requests_per_minute / 60,
+                        limits.burst_requests or 1,
+                    )
+                )
+            if limits.tokens_per_minute:
+                self._token_bucket = _GCRABucket(
+                    limits.tokens_per_minute / 60,
+                    limits.burst_tokens or limits.tokens_per_minute,
+                )
+
+    @classmethod
+    def for_model(
+        cls,
+        model_name: str,
+        max_concurrent: int = 10,
+        limits: ModelRateLimits | None = None,
+    ) -> "RateLimiter":
+        """Create a limiter using the known budgets of a model."""
+        return cls(
+            max_per_second=None,
+            max_concurrent=max_concurrent,
+            limits=limits or DEFAULT_MODEL_LIMITS.get(model_name),
+        )
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve capacity for one request and return the required delay.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+
+        Returns:
+            Seconds the caller must wait before issuing the request
+        """
+        now = asyncio.get_running_loop().time()
+        buckets: list[tuple[_GCRABucket, float]] = [
+            (bucket, 1.0) for bucket in self._request_buckets
+        ]
+        if self._token_bucket is not None and tokens > 0:
+            buckets.append((self._token_bucket, float(tokens)))
 
-                # Remove old timestamps
-                cutoff = now - 1.0
-                self._last_call_times = [t for t in self._last_call_times if t > cutoff]
+        start = max([now] + [bucket.earliest(now, cost) for bucket, cost in buckets])
+        for bucket, cost in buckets:
+            bucket.commit(start, cost)
 
-                # Check if we need to wait
-                if len(self._last_call_times) >= self._max_per_second:
-                    wait_time = 1.0 - (now - self._last_call_times[0])
-                    if wait_time > 0:
-                        await asyncio.sleep(wait_time)
-                        now = asyncio.get_event_loop().time()
+        self._metrics.tokens_reserved += tokens
+        return start - now
 
-                self._last_call_times.append(now)
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait until a request may be issued.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+        """
+        delay = self.reserve(tokens)
+
+        metrics = self._metrics
+        metrics.acquired += 1
+        metrics.total_wait_seconds += delay
+        metrics.max_wait_seconds = max(metrics.max_wait_seconds, delay)
+        if delay <= 0:
+            return
+
+        metrics.throttled += 1
+        metrics.queue_depth += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            metrics.queue_depth -= 1
+
+    @asynccontextmanager
+    async def slot(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the duration of a rate-limited call.
+
+        Args:
+            tokens: Estimated tokens consumed by the request
+        """
+        async with self._semaphore:
+            await self.acquire(tokens)
+            self._metrics.in_flight += 1
+            try:
+                yield
+            finally:
+                self._metrics.in_flight -= 1
+
+    def get_metrics(self) -> RateLimiterMetrics:
+        """Get a snapshot of limiter metrics."""
+        return replace(self._metrics)
 
 
 class ConcurrentLLMService(ILLMService):
@@ -57,7 +232,9 @@ class ConcurrentLLMService(ILLMService):
         self,
         base_service: ILLMService,
         max_concurrent: int = 5,
-        max_per_second: int = 10,
+        max_per_second: float | None = 10,
+        burst: int | None = None,
+        model_limits: ModelRateLimits | None = None,
     ):
         """Initialize concurrent LLM service.
 
@@ -65,19 +242,34 @@ class ConcurrentLLMService(ILLMService):
             base_service: The underlying LLM service
             max_concurrent: Maximum concurrent requests
             max_per_second: Maximum requests per second
+            burst: Requests allowed back-to-back before throttling
+            model_limits: Per-minute request/token budgets; defaults to the
+                known limits of the base service's model
         """
         self._base_service = base_service
         self._max_concurrent = max_concurrent
+        if model_limits is None:
+            model_name = getattr(base_service, "model_name", None)
+            if isinstance(model_name, str):
+                model_limits = DEFAULT_MODEL_LIMITS.get(model_name)
         self._rate_limiter = RateLimiter(
-            max_per_second=max_per_second, max_concurrent=max_concurrent
+            max_per_second=max_per_second,
+            max_concurrent=max_concurrent,
+            burst=burst,
+            limits=model_limits,
         )
 
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """Get the rate limiter shared by all calls of this service."""
+        return self._rate_limiter
+
     async def _execute_with_rate_limit(
         self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
     ) -> Any:
         """Execute function with rate limiting."""
-        await self._rate_limiter.acquire()
-        return await func(*args, **kwargs)
+        async with self._rate_limiter.slot(tokens=estimate_tokens(*args)):
+            return await func(*args, **kwargs)
 
     async def match_speaker_to_politician(
         self, context: LLMSpeakerMatchContext
@@ -0,0 +1,272 @@
+"""HTTP-first fetch strategy with a Playwright fallback.
+
+Many council and Diet pages are plain server-rendered HTML, so launching a
+browser for them only adds latency. The strategy fetches a page with the
+pooled HTTP client first and checks the HTML: if it has readable text, the
+site's content markers and no empty JavaScript app shell, it is used as is.
+Otherwise the page is rendered with a pooled browser.
+
+The decision is remembered per host and page check (one site can serve a
+JavaScript viewer and static text views). Once pages needed rendering, later
+URLs of that host and kind go straight to the browser; static ones keep being
+fetched over HTTP and are switched to the browser as soon as a page turns out
+to need rendering.
+"""
+
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.external.browser_pool import BrowserPool, get_browser_pool
+from src.infrastructure.external.http_client import (
+    HttpClient,
+    HttpResponse,
+    get_http_client,
+)
+from src.infrastructure.external.page_readiness import (
+    PageReadiness,
+    ReadinessProfile,
+    get_page_readiness,
+)
+
+logger = logging.getLogger(__name__)
+
+# Containers that client-side frameworks render into; empty in a JS shell
+_APP_MOUNT_SELECTORS = "#app, #root, #__next, #__nuxt, [ng-app], [ng-version]"
+
+RENDERED_PAGE_READINESS = ReadinessProfile(name="rendered-page", max_wait_ms=8000)
+
+
+class FetchMode(Enum):
+    """How pages of a host are fetched."""
+
+    HTTP = "http"
+    BROWSER = "browser"
+
+
+@dataclass(frozen=True)
+class StaticPageCheck:
+    """When HTML fetched without a browser can be used as is.
+
+    Attributes:
+        name: Check name used in log messages
+        content_selectors: Any of these CSS selectors must match (none:
+            only the generic checks apply)
+        min_text_length: Minimum visible text length of the body
+    """
+
+    name: str
+    content_selectors: tuple[str, ...] = ()
+    min_text_length: int = 200
+
+
+GENERIC_PAGE_CHECK = StaticPageCheck(name="generic")
+
+
+@dataclass
+class FetchedPage:
+    """HTML of a page and how it was obtained."""
+
+    url: str
+    html: str
+    mode: FetchMode
+
+
+@dataclass
+class FetchStrategyMetrics:
+    """Counts of pages fetched per mode."""
+
+    http_pages: int
+    browser_pages: int
+    escalations: int
+    http_failures: int
+
+
+def needs_rendering(html: str, check: StaticPageCheck = GENERIC_PAGE_CHECK) -> bool:
+    """Decide whether HTML fetched over HTTP still needs JavaScript rendering.
+
+    Args:
+        html: HTML as returned by the server
+        check: Site-specific expectations for a complete page
+
+    Returns:
+        True if the page should be rendered in a browser
+    """
+    soup = BeautifulSoup(html, "html.parser")
+
+    if check.content_selectors and not any(
+        _matches(soup, selector) for selector in check.content_selectors
+    ):
+        return True
+
+    for mount in soup.select(_APP_MOUNT_SELECTORS):
+        if not mount.get_text(strip=True):
+            return True
+
+    for tag in soup(["script", "style", "noscript", "template"]):
+        tag.decompose()
+    body = soup.body or soup
+    return len(body.get_text(" ", strip=True)) < check.min_text_length
+
+
+def _matches(soup: BeautifulSoup, selector: str) -> bool:
+    try:
+        return soup.select_one(selector) is not None
+    except Exception:
+        # Playwright-only selectors (e.g. :has-text) cannot be checked here
+        return False
+
+
+class FetchStrategy:
+    """Fetches pages over HTTP when possible and with a browser otherwise."""
+
+    def __init__(
+        self,
+        http_client: HttpClient | None = None,
+        browser_pool: BrowserPool | None = None,
+        page_readiness: PageReadiness | None = None,
+        http_enabled: bool | None = None,
+    ):
+        """Initialize the strategy.
+
+        Args:
+            http_client: Client for static fetches (defaults to the shared one)
+            browser_pool: Pool for rendered fetches (defaults to the shared one)
+            page_readiness: Waiter used after rendering
+            http_enabled: Try HTTP first (defaults to HTTP_FETCH_ENABLED)
+        """
+        self.http_client = http_client or get_http_client()
+        self.browser_pool = browser_pool or get_browser_pool()
+        self.page_readiness = page_readiness or get_page_readiness()
+        self.http_enabled = (
+            settings.http_fetch_enabled if http_enabled is None else http_enabled
+        )
+        self._decisions: dict[tuple[str, str], FetchMode] = {}
+        self._http_pages = 0
+        self._browser_pages = 0
+        self._escalations = 0
+        self._http_failures = 0
+
+    def mode_for(
+        self, url: str, check: StaticPageCheck = GENERIC_PAGE_CHECK
+    ) -> FetchMode:
+        """How the next page of the URL's host and kind will be fetched."""
+        if not self.http_enabled:
+            return FetchMode.BROWSER
+        return self._decisions.get(_decision_key(url, check), FetchMode.HTTP)
+
+    async def fetch_static(
+        self, url: str, check: StaticPageCheck = GENERIC_PAGE_CHECK
+    ) -> HttpResponse | None:
+        """Fetch a page over HTTP if its host serves usable static HTML.
+
+        Args:
+            url: URL to fetch
+            check: Site-specific expectations for a complete page
+
+        Returns:
+            The response, or None when the page has to be rendered in a
+            browser (the host is remembered as needing rendering)
+        """
+        if self.mode_for(url, check) is FetchMode.BROWSER:
+            return None
+
+        try:
+            response = await self.http_client.get(url)
+        except Exception as e:
+            # Transient network errors do not change the host's decision
+            self._http_failures += 1
+            logger.info(f"HTTP fetch failed for {url}, using browser: {e}")
+            return None
+
+        if not response.ok or not response.is_html:
+            self._http_failures += 1
+            logger.info(
+                f"HTTP fetch of {url} returned {response.status} "
+                f"({response.content_type}), using browser"
+            )
+            return None
+
+        if needs_rendering(response.text, check):
+            self.mark_needs_browser(url, check, "static HTML is incomplete")
+            return None
+
+        self._decisions.setdefault(_decision_key(url, check), FetchMode.HTTP)
+        self._http_pages += 1
+        return response
+
+    def mark_needs_browser(self, url: str, check: StaticPageCheck, reason: str) -> None:
+        """Remember that pages of the URL's host and kind need rendering."""
+        key = _decision_key(url, check)
+        if self._decisions.get(key) is not FetchMode.BROWSER:
+            logger.info(
+                f"Rendering {check.name} pages of {key[0]} with a browser: {reason}"
+            )
+        self._decisions[key] = FetchMode.BROWSER
+        self._escalations += 1
+
+    async def fetch_html(
+        self,
+        url: str,
+        check: StaticPageCheck = GENERIC_PAGE_CHECK,
+        readiness: ReadinessProfile = RENDERED_PAGE_READINESS,
+    ) -> FetchedPage:
+        """Fetch a page's HTML, rendering it only when needed.
+
+        Args:
+            url: URL to fetch
+            check: Site-specific expectations for a complete static page
+            readiness: How to wait for a rendered page
+
+        Returns:
+            The page HTML and the mode it was fetched with
+        """
+        response = await self.fetch_static(url, check)
+        if response is not None:
+            return FetchedPage(
+                url=response.url, html=response.text, mode=FetchMode.HTTP
+            )
+
+        async with self.browser_pool.page() as page:
+            await page.goto(
+                url,
+                wait_until="domcontentloaded",
+                timeout=settings.page_load_timeout * 1000,
+            )
+            await self.page_readiness.wait(page, readiness)
+            html = await page.content()
+            final_url = page.url
+        self._browser_pages += 1
+        return FetchedPage(url=final_url, html=html, mode=FetchMode.BROWSER)
+
+    def decisions(self) -> dict[tuple[str, str], FetchMode]:
+        """Report the fetch mode decided per (host, check name)."""
+        return dict(self._decisions)
+
+    def metrics(self) -> FetchStrategyMetrics:
+        """Report how many pages were fetched per mode."""
+        return FetchStrategyMetrics(
+            http_pages=self._http_pages,
+            browser_pages=self._browser_pages,
+            escalations=self._escalations,
+            http_failures=self._http_failures,
+        )
+
+
+def _decision_key(url: str, check: StaticPageCheck) -> tuple[str, str]:
+    return (urlparse(url).hostname or "").lower(), check.name
+
+
+_fetch_strategy: FetchStrategy | None = None
+
+
+def get_fetch_strategy() -> FetchStrategy:
+    """Get the process-wide fetch strategy (shares per-host decisions)."""
+    global _fetch_strategy
+    if _fetch_strategy is None:
+        _fetch_strategy = FetchStrategy()
+    return _fetch_strategy
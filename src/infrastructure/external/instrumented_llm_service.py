@@ -23,6 +23,7 @@ from src.domain.types import (
     LLMSpeakerMatchContext,
     PoliticianDTO,
 )
+from src.infrastructure.external.llm_history_sink import BufferedHistorySink
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,7 @@ class InstrumentedLLMService(ILLMService):
         model_version: str = "unknown",
         input_reference_type: str | None = None,
         input_reference_id: int | None = None,
+        history_sink: BufferedHistorySink | None = None,
     ):
         """Initialize instrumented LLM service.
 
@@ -48,6 +50,9 @@ class InstrumentedLLMService(ILLMService):
             prompt_repository: Repository for prompt version management
             model_name: Name of the LLM model
             model_version: Version of the LLM model
+            history_sink: Buffered sink that writes finished records in bulk.
+                When set, history is recorded once per call after it
+                finishes instead of a create before and an update after.
         """
         self._llm_service = llm_service
         self._history_repository = history_repository
@@ -56,11 +61,17 @@ class InstrumentedLLMService(ILLMService):
         self._model_version = model_version
         self._input_reference_type = input_reference_type
         self._input_reference_id = input_reference_id
+        self._history_sink = history_sink
 
         # Required attributes for ILLMService protocol
         self.temperature = self._llm_service.temperature
         self.model_name = self._model_name
 
+    @property
+    def history_sink(self) -> BufferedHistorySink | None:
+        """Buffered sink used for history writes, if any."""
+        return self._history_sink
+
     def set_input_reference(
         self, reference_type: str | None, reference_id: int | None
     ) -> None:
@@ -120,7 +131,7 @@ class InstrumentedLLMService(ILLMService):
         """
         # Create history entry
         history_entry = None
-        if self._history_repository:
+        if self._history_repository or self._history_sink:
             history_entry = LLMProcessingHistory(
                 processing_type=processing_type,
                 model_name=self._model_name,
@@ -137,6 +148,7 @@ class InstrumentedLLMService(ILLMService):
             )
             history_entry.start_processing()
 
+        if history_entry and self._history_repository and not self._history_sink:
             try:
                 # Save initial entry - handle async repository
                 history_entry = await self._history_repository.create(history_entry)  # type: ignore[attr-defined]
@@ -153,23 +165,29 @@ class InstrumentedLLMService(ILLMService):
                 result = await result
 
             # Update history with success
-            if history_entry and self._history_repository:
+            if history_entry:
                 # Extract result metadata
                 result_metadata = self._extract_result_metadata(result)
                 history_entry.complete_processing(result_metadata)
 
-                # Handle async repository update
-                await self._history_repository.update(history_entry)  # type: ignore[attr-defined]
+                if self._history_sink:
+                    self._history_sink.record(history_entry)
+                elif self._history_repository:
+                    # Handle async repository update
+                    await self._history_repository.update(history_entry)  # type: ignore[attr-defined]
 
             return result
 
         except Exception as e:
             # Update history with failure
-            if history_entry and self._history_repository:
+            if history_entry:
                 history_entry.fail_processing(str(e))
 
-                # Handle async repository update for failure
-                await self._history_repository.update(history_entry)  # type: ignore[attr-defined]
+                if self._history_sink:
+                    self._history_sink.record(history_entry)
+                elif self._history_repository:
+                    # Handle async repository update for failure
+                    await self._history_repository.update(history_entry)  # type: ignore[attr-defined]
 
             # Re-raise the exception
             raise
@@ -333,45 +351,76 @@ class InstrumentedLLMService(ILLMService):
         """Delegate to wrapped LLM service."""
         return self._llm_service.get_prompt(prompt_name)
 
+    def _build_chain_history(
+        self, chain: Any, inputs: dict[str, Any]
+    ) -> LLMProcessingHistory:
+        """Build the in-progress history record for a chain invocation."""
+        import uuid
+        from datetime import datetime
+
+        # Generate a process ID
+        process_id = str(uuid.uuid4())
+
+        # Determine processing type based on inputs
+        processing_type = ProcessingType.MINUTES_DIVISION
+        if "section_string" in inputs:
+            processing_type = ProcessingType.SPEECH_EXTRACTION
+
+        # Extract prompt info from chain if possible
+        prompt_name = "minutes_division"
+        if hasattr(chain, "first") and hasattr(chain.first, "template"):
+            # Try to extract prompt name from template
+            template_str = str(chain.first.template)
+            if "speech" in template_str.lower():
+                prompt_name = "speech_extraction"
+
+        return LLMProcessingHistory(
+            processing_type=processing_type,
+            model_name=self._model_name,
+            model_version=self._model_version,
+            prompt_template=prompt_name,
+            prompt_variables=inputs,
+            input_reference_type=self._input_reference_type or "meeting",
+            input_reference_id=self._input_reference_id or 0,
+            status=ProcessingStatus.IN_PROGRESS,
+            started_at=datetime.now(UTC),
+            processing_metadata={
+                "process_id": process_id,
+                "chain_type": type(chain).__name__,
+            },
+        )
+
+    def _record_chain_success(self, history: LLMProcessingHistory, result: Any) -> None:
+        """Hand a completed chain invocation record to the history sink."""
+        history.complete_processing(self._extract_result_metadata(result))
+        if self._history_sink:
+            self._history_sink.record(history)
+
+    def _record_chain_failure(
+        self, history: LLMProcessingHistory, error: Exception
+    ) -> None:
+        """Hand a failed chain invocation record to the history sink."""
+        history.fail_processing(str(error))
+        if self._history_sink:
+            self._history_sink.record(history)
+
     def invoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
         """Invoke chain with retry and history recording for minutes processing."""
+        if self._history_sink and self._input_reference_type == "meeting":
+            history = self._build_chain_history(chain, inputs)
+            try:
+                result = self._llm_service.invoke_with_retry(chain, inputs)
+            except Exception as e:
+                self._record_chain_failure(history, e)
+                raise
+            self._record_chain_success(history, result)
+            return result
+
         # If we have a history repository and this looks like minutes processing
         if self._history_repository and self._input_reference_type == "meeting":
-            import uuid
             from datetime import datetime
 
-            # Generate a process ID
-            process_id = str(uuid.uuid4())
-
-            # Determine processing type based on inputs
-            processing_type = ProcessingType.MINUTES_DIVISION
-            if "section_string" in inputs:
-                processing_type = ProcessingType.SPEECH_EXTRACTION
-
-            # Extract prompt info from chain if possible
-            prompt_name = "minutes_division"
-            if hasattr(chain, "first") and hasattr(chain.first, "template"):
-                # Try to extract prompt name from template
-                template_str = str(chain.first.template)
-                if "speech" in template_str.lower():
-                    prompt_name = "speech_extraction"
-
-            # Create history record
-            history = LLMProcessingHistory(
-                processing_type=processing_type,
-                model_name=self._model_name,
-                model_version=self._model_version,
-                prompt_template=prompt_name,
-                prompt_variables=inputs,
-                input_reference_type=self._input_reference_type or "meeting",
-                input_reference_id=self._input_reference_id or 0,
-                status=ProcessingStatus.IN_PROGRESS,
-                started_at=datetime.now(UTC),
-                processing_metadata={
-                    "process_id": process_id,
-                    "chain_type": type(chain).__name__,
-                },
-            )
+            history = self._build_chain_history(chain, inputs)
 
             # Create history record - handle async repository
             create_result = self._history_repository.create(history)  # type: ignore[attr-defined]
@@ -433,6 +482,52 @@ class InstrumentedLLMService(ILLMService):
         # Fallback to simple delegation
         return self._llm_service.invoke_with_retry(chain, inputs)
 
+    async def ainvoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Invoke chain asynchronously with retry and history recording."""
+        if self._history_sink and self._input_reference_type == "meeting":
+            history = self._build_chain_history(chain, inputs)
+            try:
+                result = await self._llm_service.ainvoke_with_retry(chain, inputs)
+            except Exception as e:
+                self._record_chain_failure(history, e)
+                raise
+            self._record_chain_success(history, result)
+            return result
+
+        if self._history_repository and self._input_reference_type == "meeting":
+            from datetime import datetime
+
+            history = self._build_chain_history(chain, inputs)
+
+            create_result = self._history_repository.create(history)  # type: ignore[attr-defined]
+            if inspect.iscoroutine(create_result):
+                create_result = await create_result
+            history = create_result
+
+            try:
+                result = await self._llm_service.ainvoke_with_retry(chain, inputs)
+
+                history.status = ProcessingStatus.COMPLETED
+                history.completed_at = datetime.now(UTC)
+                history.result = self._extract_result_metadata(result)
+                update_result = self._history_repository.update(history)  # type: ignore[attr-defined]
+                if inspect.iscoroutine(update_result):
+                    await update_result
+
+                return result
+
+            except Exception as e:
+                history.status = ProcessingStatus.FAILED
+                history.completed_at = datetime.now(UTC)
+                history.error_message = str(e)
+                update_result = self._history_repository.update(history)  # type: ignore[attr-defined]
+                if inspect.iscoroutine(update_result):
+                    await update_result
+
+                raise
+
+        return await self._llm_service.ainvoke_with_retry(chain, inputs)
+
     def invoke_llm(self, messages: list[dict[str, str]]) -> str:
         """Delegate to wrapped LLM service."""
         return self._llm_service.invoke_llm(messages)
@@ -0,0 +1,383 @@
+"""Persistent, content-addressed storage for LLM responses.
+
+The in-memory ``LLMCache`` only lives as long as a single process, so every CLI
+run pays for the same Gemini calls again. ``PersistentLLMCache`` keeps responses
+in a local SQLite file keyed by model name, prompt template version and the
+normalized inputs, and evicts least recently used entries once the configured
+size budget is exceeded.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "cache/llm/llm_cache.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    model_name TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed
+    ON llm_cache (last_accessed_at);
+"""
+
+
+def normalize_inputs(inputs: Any) -> str:
+    """Serialize inputs into a canonical string for hashing.
+
+    Pydantic models are dumped to JSON, mappings are sorted by key and
+    surrounding whitespace of strings is stripped so that semantically
+    identical requests map to the same cache entry.
+    """
+
+    def _normalize(value: Any) -> Any:
+        if isinstance(value, BaseModel):
+            return _normalize(value.model_dump())
+        if isinstance(value, dict):
+            return {str(k): _normalize(v) for k, v in value.items()}
+        if isinstance(value, list | tuple):
+            return [_normalize(v) for v in value]
+        if isinstance(value, str):
+            return value.strip()
+        return value
+
+    return json.dumps(
+        _normalize(inputs), sort_keys=True, ensure_ascii=False, default=str
+    )
+
+
+@dataclass
+class CacheStats:
+    """Counters and size information for a persistent cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    total_entries: int = 0
+    total_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Ratio of hits to lookups in this process."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to a plain dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "total_entries": self.total_entries,
+            "total_bytes": self.total_bytes,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class PersistentLLMCache:
+    """SQLite-backed LLM response cache with LRU size-bounded eviction."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: int | None = None,
+        ttl_seconds: float | None = None,
+    ):
+        """Initialize the persistent cache.
+
+        Args:
+            path: SQLite file path (``":memory:"`` for a throwaway cache)
+            max_bytes: Upper bound for the total size of stored values
+            max_entries: Optional upper bound for the number of entries
+            ttl_seconds: Optional entry lifetime; ``None`` keeps entries forever
+        """
+        self._path = str(path)
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+        if self._path != ":memory:":
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self._path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_settings(cls) -> "PersistentLLMCache":
+        """Create a cache using ``LLM_CACHE_PATH`` and ``LLM_CACHE_MAX_MB``."""
+        from src.infrastructure.config.settings import get_settings
+
+        settings = get_settings()
+        return cls(
+            path=settings.llm_cache_path,
+            max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+        )
+
+    @property
+    def path(self) -> str:
+        """Location of the SQLite file."""
+        return self._path
+
+    @staticmethod
+    def make_key(
+        model_name: str, operation: str, prompt_version: str, inputs: Any
+    ) -> str:
+        """Build the content address for a request."""
+        content = "\x1f".join(
+            [model_name, operation, prompt_version, normalize_inputs(inputs)]
+        )
+        return hashlib.sha256(content.encode()).hexdigest()
+
+    def get(
+        self,
+        model_name: str,
+        operation: str,
+        prompt_version: str,
+        inputs: Any,
+    ) -> Any | None:
+        """Look up a cached response.
+
+        Returns:
+            The decoded response or None on a miss
+        """
+        key = self.make_key(model_name, operation, prompt_version, inputs)
+        now = time.time()
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size_bytes, created_at FROM llm_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            value, size_bytes, created_at = row
+            if self._ttl_seconds is not None and now - created_at > self._ttl_seconds:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._stats.misses += 1
+                self._stats.evictions += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET last_accessed_at = ?, hit_count = hit_count + 1 "
+                "WHERE key = ?",
+                (now, key),
+            )
+            self._stats.hits += 1
+            self._stats.bytes_read += size_bytes
+
+        return json.loads(value)
+
+    def set(
+        self,
+        model_name: str,
+        operation: str,
+        prompt_version: str,
+        inputs: Any,
+        result: Any,
+    ) -> None:
+        """Store a response, evicting old entries when over budget."""
+        try:
+            value = json.dumps(result, ensure_ascii=False)
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Skipping persistent cache for {operation}: {e}")
+            return
+
+        key = self.make_key(model_name, operation, prompt_version, inputs)
+        size_bytes = len(value.encode())
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache "
+                "(key, model_name, operation, prompt_version, value, size_bytes, "
+                "created_at, last_accessed_at, hit_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    key,
+                    model_name,
+                    operation,
+                    prompt_version,
+                    value,
+                    size_bytes,
+                    now,
+                    now,
+                ),
+            )
+            self._stats.writes += 1
+            self._stats.bytes_written += size_bytes
+            self._evict_locked(self._max_bytes, self._max_entries)
+
+    def prune(
+        self,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        older_than_seconds: float | None = None,
+        model_name: str | None = None,
+    ) -> int:
+        """Remove entries by age, model and/or LRU size budget.
+
+        Args:
+            max_bytes: Shrink the cache to at most this many bytes
+            max_entries: Shrink the cache to at most this many entries
+            older_than_seconds: Drop entries not accessed within this window
+            model_name: Drop every entry of this model
+
+        Returns:
+            Number of removed entries
+        """
+        removed = 0
+        with self._lock:
+            if model_name is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM llm_cache WHERE model_name = ?", (model_name,)
+                )
+                removed += cursor.rowcount
+            if older_than_seconds is not None:
+                cursor = self._conn.execute(
+                    "DELETE FROM llm_cache WHERE last_accessed_at < ?",
+                    (time.time() - older_than_seconds,),
+                )
+                removed += cursor.rowcount
+            self._stats.evictions += removed
+            removed += self._evict_locked(max_bytes, max_entries)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+        self.vacuum()
+
+    def vacuum(self) -> None:
+        """Reclaim disk space after large prunes."""
+        with self._lock:
+            self._conn.execute("VACUUM")
+
+    def stats(self) -> CacheStats:
+        """Get counters for this process plus current size of the store."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM llm_cache"
+            ).fetchone()
+            self._stats.total_entries = count
+            self._stats.total_bytes = total
+            return CacheStats(**vars(self._stats))
+
+    def breakdown(self) -> list[dict[str, Any]]:
+        """Summarize entries per model, operation and prompt version."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT model_name, operation, prompt_version, COUNT(*), "
+                "SUM(size_bytes), SUM(hit_count), MAX(last_accessed_at) "
+                "FROM llm_cache GROUP BY model_name, operation, prompt_version "
+                "ORDER BY SUM(size_bytes) DESC"
+            ).fetchall()
+        return [
+            {
+                "model_name": row[0],
+                "operation": row[1],
+                "prompt_version": row[2],
+                "entries": row[3],
+                "bytes": row[4],
+                "hits": row[5],
+                "last_accessed_at": row[6],
+            }
+            for row in rows
+        ]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict_locked(self, max_bytes: int | None, max_entries: int | None) -> int:
+        """Evict least recently used entries until within budget.
+
+        Caller must hold ``self._lock``.
+        """
+        removed = 0
+
+        if max_entries is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY last_accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (max_entries,),
+            )
+            removed += max(cursor.rowcount, 0)
+
+        if max_bytes is not None:
+            (total,) = self._conn.execute(
+                "SELECT COALESCE(SUM(size_bytes), 0) FROM llm_cache"
+            ).fetchone()
+            if total > max_bytes:
+                excess = total - max_bytes
+                victims: list[str] = []
+                freed = 0
+                for key, size_bytes in self._conn.execute(
+                    "SELECT key, size_bytes FROM llm_cache ORDER BY last_accessed_at"
+                ):
+                    victims.append(key)
+                    freed += size_bytes
+                    if freed >= excess:
+                        break
+                self._conn.executemany(
+                    "DELETE FROM llm_cache WHERE key = ?", [(k,) for k in victims]
+                )
+                removed += len(victims)
+
+        if removed:
+            self._stats.evictions += removed
+        return removed
+
+
+_default_cache: PersistentLLMCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def get_persistent_llm_cache() -> PersistentLLMCache:
+    """Get the process-wide persistent cache configured from settings.
+
+    Every LLM service created in a process shares one SQLite connection
+    instead of opening the file per service instance.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = PersistentLLMCache.from_settings()
+        return _default_cache
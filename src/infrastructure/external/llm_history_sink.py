@@ -0,0 +1,250 @@
+"""Buffered, deferred writer for LLM processing history."""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.entities.llm_processing_history import LLMProcessingHistory
+from src.domain.repositories.llm_processing_history_repository import (
+    LLMProcessingHistoryRepository,
+)
+from src.infrastructure.config.engine_registry import get_engine_registry
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.persistence.llm_processing_history_repository_impl import (
+    LLMProcessingHistoryRepositoryImpl,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def prompt_payload_hash(history: LLMProcessingHistory) -> str:
+    """Content hash of a record's prompt template and variables."""
+    payload = json.dumps(
+        [history.prompt_template, history.prompt_variables],
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def create_history_session() -> AsyncSession:
+    """Open a session on the shared async engine of the running event loop."""
+    factory = get_engine_registry().get_async_session_factory(
+        get_settings().get_database_url()
+    )
+    return factory()
+
+
+@dataclass
+class HistorySinkMetrics:
+    """Snapshot of history sink activity."""
+
+    recorded: int = 0
+    written: int = 0
+    flushes: int = 0
+    failed_flushes: int = 0
+    deduplicated_payloads: int = 0
+    pending: int = 0
+
+
+class BufferedHistorySink:
+    """Buffers finished history records and writes them in bulk.
+
+    Records are handed over once processing has completed or failed, so each
+    LLM call costs no database round trip on the request path. The buffer is
+    flushed when it reaches ``max_batch_size`` or every ``flush_interval``
+    seconds, whichever comes first. Every flush opens and commits its own
+    session, so background flushes never touch a session the caller is using.
+
+    Delivery is at-least-once: a failed flush puts the batch back in front of
+    the buffer, and ``close()`` keeps flushing until the buffer is empty or a
+    flush fails.
+
+    With ``deduplicate_prompts`` enabled, the prompt variables of a record are
+    only written the first time their content hash is seen; later records
+    keep the hash in ``processing_metadata["prompt_hash"]`` and an empty
+    ``prompt_variables``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = create_history_session,
+        repository_factory: Callable[
+            [AsyncSession], LLMProcessingHistoryRepository
+        ] = LLMProcessingHistoryRepositoryImpl,
+        max_batch_size: int = 100,
+        flush_interval: float = 5.0,
+        deduplicate_prompts: bool = False,
+    ):
+        """Initialize history sink.
+
+        Args:
+            session_factory: Opens the session a flush writes through
+            repository_factory: Builds the repository providing ``bulk_create``
+            max_batch_size: Buffered records that trigger a flush
+            flush_interval: Seconds between periodic flushes
+            deduplicate_prompts: Store identical prompt payloads only once
+        """
+        self._session_factory = session_factory
+        self._repository_factory = repository_factory
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._deduplicate_prompts = deduplicate_prompts
+
+        # record() may be called from worker threads; the lock only guards
+        # the buffer swap and is never held across an await
+        self._lock = threading.Lock()
+        self._buffer: list[LLMProcessingHistory] = []
+        self._seen_hashes: set[str] = set()
+        self._flush_lock: tuple[asyncio.AbstractEventLoop, asyncio.Lock] | None = None
+        self._timer_task: asyncio.Task[None] | None = None
+        self._pending_flushes: set[asyncio.Task[int]] = set()
+        self._metrics = HistorySinkMetrics()
+
+    @property
+    def metrics(self) -> HistorySinkMetrics:
+        """Current sink metrics."""
+        with self._lock:
+            self._metrics.pending = len(self._buffer)
+            return HistorySinkMetrics(**vars(self._metrics))
+
+    def record(self, history: LLMProcessingHistory) -> None:
+        """Queue a finished history record for writing.
+
+        Never blocks on the database. When called inside a running event loop
+        the periodic flush is started and a full buffer is flushed in the
+        background; otherwise records wait for the next ``flush()``.
+        """
+        if self._deduplicate_prompts:
+            self._deduplicate(history)
+
+        with self._lock:
+            self._buffer.append(history)
+            self._metrics.recorded += 1
+            full = len(self._buffer) >= self._max_batch_size
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = loop.create_task(self._flush_periodically())
+        if full:
+            task = loop.create_task(self.flush())
+            self._pending_flushes.add(task)
+            task.add_done_callback(self._pending_flushes.discard)
+
+    async def flush(self) -> int:
+        """Write all buffered records in one bulk insert.
+
+        Returns:
+            Number of records written
+        """
+        loop = asyncio.get_running_loop()
+        if self._flush_lock is None or self._flush_lock[0] is not loop:
+            self._flush_lock = (loop, asyncio.Lock())
+
+        async with self._flush_lock[1]:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+            if not batch:
+                return 0
+
+            try:
+                async with self._session_factory() as session:
+                    await self._repository_factory(session).bulk_create(batch)
+                    await session.commit()
+            except Exception as e:
+                logger.error(f"Failed to flush {len(batch)} history records: {e}")
+                with self._lock:
+                    self._buffer[:0] = batch
+                    self._metrics.failed_flushes += 1
+                return 0
+            except BaseException:
+                # Cancelled mid-write: keep the batch for the next flush
+                with self._lock:
+                    self._buffer[:0] = batch
+                raise
+
+            with self._lock:
+                self._metrics.written += len(batch)
+                self._metrics.flushes += 1
+            return len(batch)
+
+    async def close(self) -> None:
+        """Stop the periodic flush and write everything still buffered.
+
+        May be called from a different event loop than the one records were
+        made on (e.g. at process exit); tasks of other loops are only
+        cancelled, not awaited.
+        """
+        loop = asyncio.get_running_loop()
+        timer, self._timer_task = self._timer_task, None
+        if timer is not None:
+            if timer.get_loop() is loop:
+                timer.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await timer
+            elif not timer.get_loop().is_closed():
+                timer.get_loop().call_soon_threadsafe(timer.cancel)
+
+        pending = [t for t in self._pending_flushes if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        while self._buffer:
+            if not await self.flush() and self._buffer:
+                logger.warning(
+                    f"{len(self._buffer)} history records could not be written"
+                )
+                return
+
+    async def _flush_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    def _deduplicate(self, history: LLMProcessingHistory) -> None:
+        payload_hash = prompt_payload_hash(history)
+        history.processing_metadata["prompt_hash"] = payload_hash
+        with self._lock:
+            if payload_hash not in self._seen_hashes:
+                self._seen_hashes.add(payload_hash)
+                return
+            self._metrics.deduplicated_payloads += 1
+        history.prompt_variables = {}
+
+
+# Keeps close() tasks started from inside a running loop alive until done
+_closing_tasks: set[asyncio.Task[None]] = set()
+
+
+def open_history_sink(**kwargs: Any) -> Iterator[BufferedHistorySink]:
+    """Provide a sink as a DI resource that is drained on resource shutdown.
+
+    Shutdown normally runs outside any event loop, so the remaining records
+    are written on a short-lived loop of their own.
+    """
+    sink = BufferedHistorySink(**kwargs)
+    yield sink
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        try:
+            asyncio.run(sink.close())
+        except Exception as e:
+            logger.error(f"Failed to close LLM history sink: {e}")
+    else:
+        task = loop.create_task(sink.close())
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
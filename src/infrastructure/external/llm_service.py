@@ -9,6 +9,12 @@ from langchain_core.messages import BaseMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableSerializable
 from langchain_google_genai import ChatGoogleGenerativeAI
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+)
 
 from src.domain.entities.llm_processing_history import LLMProcessingHistory
 from src.domain.repositories.llm_processing_history_repository import (
@@ -27,10 +33,36 @@ from src.infrastructure.external.versioned_prompt_manager import (
 
 logger = logging.getLogger(__name__)
 
+# Substrings of error messages that indicate a transient failure worth retrying
+_RETRYABLE_ERROR_MARKERS = (
+    "rate limit",
+    "resource exhausted",
+    "resource_exhausted",
+    "429",
+    "503",
+    "unavailable",
+    "timeout",
+    "timed out",
+    "deadline exceeded",
+)
+
+
+def _is_retryable_error(error: BaseException) -> bool:
+    """Check whether an LLM error is transient (rate limit, timeout, etc.)."""
+    if isinstance(error, TimeoutError):
+        return True
+    message = f"{type(error).__name__}: {error}".lower()
+    return any(marker in message for marker in _RETRYABLE_ERROR_MARKERS)
+
 
 class GeminiLLMService(ILLMService):
     """Gemini-based implementation of LLM service."""
 
+    # Retry policy for ainvoke_with_retry
+    max_retries: int = 3
+    retry_min_wait: float = 1.0
+    retry_max_wait: float = 30.0
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -427,6 +459,34 @@ Format: [{"speaker": "Name", "content": "Speech text"}, ...]"""
             logger.error(f"Chain invocation failed: {e}")
             raise
 
+    async def ainvoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Invoke an LLM chain asynchronously with retry logic.
+
+        Transient errors (rate limits, timeouts, unavailability) are retried
+        with exponential backoff; backoff waits use ``asyncio.sleep``.
+
+        Args:
+            chain: LangChain runnable to invoke
+            inputs: Input dictionary for the chain
+
+        Returns:
+            Result from the chain invocation
+        """
+        try:
+            async for attempt in AsyncRetrying(
+                stop=stop_after_attempt(self.max_retries),
+                wait=wait_exponential(
+                    multiplier=1, min=self.retry_min_wait, max=self.retry_max_wait
+                ),
+                retry=retry_if_exception(_is_retryable_error),
+                reraise=True,
+            ):
+                with attempt:
+                    return await chain.ainvoke(inputs)
+        except Exception as e:
+            logger.error(f"Chain invocation failed: {e}")
+            raise
+
     def invoke_llm(self, messages: list[dict[str, str]]) -> str:
         """Invoke the LLM with messages and return the response content.
 
@@ -8,6 +8,7 @@ from src.domain.repositories.llm_processing_history_repository import (
 from src.domain.repositories.prompt_version_repository import PromptVersionRepository
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
+from src.infrastructure.external.llm_history_sink import BufferedHistorySink
 from src.infrastructure.external.llm_service import GeminiLLMService
 from src.infrastructure.external.versioned_prompt_manager import (
     VersionedPromptManager,
@@ -31,6 +32,7 @@ class LLMServiceFactory:
         with_history: bool = True,
         history_repository: LLMProcessingHistoryRepository | None = None,
         prompt_repository: PromptVersionRepository | None = None,
+        history_sink: BufferedHistorySink | None = None,
     ) -> ILLMService:
         """Create a Gemini LLM service with optional instrumentation.
 
@@ -41,6 +43,7 @@ class LLMServiceFactory:
             with_history: Whether to enable history recording
             history_repository: Optional custom history repository
             prompt_repository: Optional custom prompt repository
+            history_sink: Optional buffered sink for deferred bulk history writes
 
         Returns:
             LLM service instance (instrumented if with_history=True)
@@ -81,19 +84,26 @@ class LLMServiceFactory:
                 prompt_repository=prompt_repository,
                 model_name=model_name,
                 model_version="2.0",  # Could be extracted from model_name
+                history_sink=history_sink,
             )
 
         return base_service
 
     @staticmethod
     def create_default_service(
-        session: AsyncSession | None = None, with_history: bool = True
+        session: AsyncSession | None = None,
+        with_history: bool = True,
+        buffered_history: bool = False,
     ) -> ILLMService:
         """Create default LLM service with database repositories.
 
         Args:
             session: Database session for repositories
             with_history: Whether to enable history recording
+            buffered_history: Write history through a BufferedHistorySink.
+                The sink flushes through sessions of its own, so it also
+                works without ``session``; call ``close()`` on the service's
+                ``history_sink`` at shutdown to write the remaining records.
 
         Returns:
             Configured LLM service
@@ -109,15 +119,19 @@ class LLMServiceFactory:
         # Create repositories if session provided
         history_repo = None
         prompt_repo = None
+        history_sink = None
 
         if session and with_history:
             history_repo = LLMProcessingHistoryRepositoryImpl(session)
             prompt_repo = PromptVersionRepositoryImpl(session)
+        if with_history and buffered_history:
+            history_sink = BufferedHistorySink()
 
         return LLMServiceFactory.create_gemini_service(
             with_history=with_history,
             history_repository=history_repo,
             prompt_repository=prompt_repo,
+            history_sink=history_sink,
         )
 
 
@@ -9,6 +9,7 @@ from src.domain.services.interfaces.minutes_processing_service import (
     IMinutesProcessingService,
 )
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
+from src.infrastructure.config.settings import get_settings
 from src.minutes_divide_processor.minutes_process_agent import MinutesProcessAgent
 
 logger = structlog.get_logger(__name__)
@@ -23,14 +24,30 @@ class MinutesProcessAgentService(IMinutesProcessingService):
     infrastructure code.
     """
 
-    def __init__(self, llm_service: ILLMService):
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        max_concurrency: int | None = None,
+        max_sections_per_second: float | None = None,
+    ):
         """Initialize the minutes processing service.
 
         Args:
             llm_service: LLM service instance to use for processing
+            max_concurrency: Sections divided in parallel
+                (defaults to MINUTES_SECTION_CONCURRENCY)
+            max_sections_per_second: Section start rate in parallel mode
+                (defaults to MINUTES_SECTION_RATE_PER_SECOND)
         """
+        settings = get_settings()
         self.llm_service = llm_service
-        self.agent = MinutesProcessAgent(llm_service=llm_service)
+        self.agent = MinutesProcessAgent(
+            llm_service=llm_service,
+            max_concurrency=max_concurrency or settings.minutes_section_concurrency,
+            max_sections_per_second=(
+                max_sections_per_second or settings.minutes_section_rate_per_second
+            ),
+        )
 
     async def process_minutes(self, original_minutes: str) -> list[SpeakerSpeech]:
         """Process meeting minutes text and extract speeches.
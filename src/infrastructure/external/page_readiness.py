@@ -0,0 +1,195 @@
+"""Event-driven page readiness detection for the Playwright scrapers.
+
+Instead of sleeping for a fixed time after navigation, scrapers wait until
+the page is actually ready: one of the profile's selectors is attached and
+the DOM has stopped changing for a short quiet period (observed with a
+MutationObserver inside the page). Profiles that need lazy-loaded content
+also scroll to the bottom until the page stops growing. Every wait is
+bounded by the profile's hard cap, and the time spent waiting is recorded
+per profile.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from playwright.async_api import Frame, Page
+
+logger = logging.getLogger(__name__)
+
+# Resolves once no DOM mutation happened for quietMs (or maxMs elapsed),
+# optionally after scrolling to the bottom to trigger lazy loading.
+_SETTLE_SCRIPT = """
+async ({ quietMs, maxMs, scroll }) => {
+    const root = document.documentElement;
+    const heightBefore = root.scrollHeight;
+    if (scroll) {
+        window.scrollTo(0, root.scrollHeight);
+    }
+    const settled = await new Promise((resolve) => {
+        let quietTimer = null;
+        let capTimer = null;
+        let observer = null;
+        const finish = (value) => {
+            observer.disconnect();
+            clearTimeout(quietTimer);
+            clearTimeout(capTimer);
+            resolve(value);
+        };
+        observer = new MutationObserver(() => {
+            clearTimeout(quietTimer);
+            quietTimer = setTimeout(() => finish(true), quietMs);
+        });
+        observer.observe(root, {
+            childList: true,
+            subtree: true,
+            characterData: true,
+        });
+        quietTimer = setTimeout(() => finish(true), quietMs);
+        capTimer = setTimeout(() => finish(false), maxMs);
+    });
+    return { settled, grew: root.scrollHeight > heightBefore };
+}
+"""
+
+
+@dataclass(frozen=True)
+class ReadinessProfile:
+    """How to decide that pages of one site are ready to be read.
+
+    Attributes:
+        name: Profile name used as the metrics key
+        ready_selectors: Any of these selectors being attached marks the
+            content as rendered (none: only wait for the DOM to settle)
+        quiet_period_ms: How long the DOM must stay unchanged
+        max_wait_ms: Hard cap for the whole wait
+        scroll_rounds: Scroll to the bottom up to this many times while
+            the page keeps growing (for lazy-loaded lists)
+    """
+
+    name: str
+    ready_selectors: tuple[str, ...] = ()
+    quiet_period_ms: int = 500
+    max_wait_ms: int = 8000
+    scroll_rounds: int = 0
+
+
+@dataclass
+class ReadinessMetrics:
+    """Time spent waiting for pages of one readiness profile."""
+
+    waits: int = 0
+    not_ready: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """Mean time a page took to become ready."""
+        return self.total_wait_seconds / self.waits if self.waits else 0.0
+
+
+class PageReadiness:
+    """Waits for pages to become ready and records how long that took."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, ReadinessMetrics] = {}
+
+    async def wait(self, target: Page | Frame, profile: ReadinessProfile) -> bool:
+        """Wait until the page or frame is ready according to the profile.
+
+        Args:
+            target: Page or frame to watch
+            profile: Readiness profile of the site
+
+        Returns:
+            True if the page became ready, False if it did not within the
+            hard cap or could not be observed (the caller should continue
+            with whatever has rendered)
+        """
+        start = time.perf_counter()
+        deadline = start + profile.max_wait_ms / 1000
+
+        def remaining_ms() -> int:
+            return max(0, int((deadline - time.perf_counter()) * 1000))
+
+        ready = True
+        if profile.ready_selectors:
+            try:
+                await target.wait_for_selector(
+                    ", ".join(profile.ready_selectors),
+                    state="attached",
+                    # Playwright treats 0 as "no timeout"
+                    timeout=max(1, remaining_ms()),
+                )
+            except Exception as e:
+                logger.debug(f"[{profile.name}] Ready selectors not found: {e}")
+                ready = False
+
+        settled, _ = await self._wait_for_quiet_dom(
+            target, profile, scroll=False, budget_ms=remaining_ms()
+        )
+        ready = ready and settled
+        for _ in range(profile.scroll_rounds):
+            settled, grew = await self._wait_for_quiet_dom(
+                target, profile, scroll=True, budget_ms=remaining_ms()
+            )
+            ready = ready and settled
+            if not grew:
+                break
+
+        self._record(profile, time.perf_counter() - start, ready)
+        return ready
+
+    def metrics(self) -> dict[str, ReadinessMetrics]:
+        """Report wait times per profile name."""
+        return dict(self._metrics)
+
+    async def _wait_for_quiet_dom(
+        self,
+        target: Page | Frame,
+        profile: ReadinessProfile,
+        scroll: bool,
+        budget_ms: int,
+    ) -> tuple[bool, bool]:
+        """Wait for the DOM to go quiet; returns (settled, page grew)."""
+        if budget_ms == 0:
+            return False, False
+        try:
+            outcome: dict[str, Any] = await target.evaluate(
+                _SETTLE_SCRIPT,
+                {
+                    "quietMs": profile.quiet_period_ms,
+                    "maxMs": budget_ms,
+                    "scroll": scroll,
+                },
+            )
+            return bool(outcome["settled"]), bool(outcome["grew"])
+        except Exception as e:
+            # e.g. the page navigated away while the observer was running
+            logger.debug(f"[{profile.name}] Could not observe DOM: {e}")
+            return False, False
+
+    def _record(self, profile: ReadinessProfile, waited: float, ready: bool) -> None:
+        metrics = self._metrics.setdefault(profile.name, ReadinessMetrics())
+        metrics.waits += 1
+        metrics.total_wait_seconds += waited
+        metrics.max_wait_seconds = max(metrics.max_wait_seconds, waited)
+        if not ready:
+            metrics.not_ready += 1
+        logger.debug(
+            f"[{profile.name}] Page {'ready' if ready else 'not ready'} "
+            f"after {waited:.2f}s"
+        )
+
+
+_page_readiness: PageReadiness | None = None
+
+
+def get_page_readiness() -> PageReadiness:
+    """Get the process-wide page readiness waiter."""
+    global _page_readiness
+    if _page_readiness is None:
+        _page_readiness = PageReadiness()
+    return _page_readiness
@@ -1,5 +1,7 @@
 """Prompt template loader from YAML files"""
 
+import hashlib
+import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -128,6 +130,19 @@ class PromptLoader:
         version = self._prompts.get("_version", "unknown")
         return str(version) if version else "unknown"
 
+    def get_cache_version(self) -> str:
+        """Get a version string that changes whenever any prompt changes
+
+        The declared version is only bumped by hand, so a fingerprint of the
+        loaded prompts is appended to keep cached LLM responses from outliving
+        an edited template.
+        """
+        content = json.dumps(
+            self._prompts, sort_keys=True, ensure_ascii=False, default=str
+        )
+        digest = hashlib.sha256(content.encode()).hexdigest()[:12]
+        return f"{self.get_version()}-{digest}"
+
     def reload(self):
         """Reload prompts from files"""
         self._prompts.clear()
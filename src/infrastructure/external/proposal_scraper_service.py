@@ -5,7 +5,6 @@ import json
 from typing import Any
 
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
 
 from src.domain.services.interfaces.llm_service import ILLMService
 from src.domain.services.interfaces.proposal_scraper_service import (
@@ -16,20 +15,28 @@ from src.infrastructure.constants.scraper_prompts import (
     PROPOSAL_EXTRACTION_PROMPT,
     PROPOSAL_EXTRACTION_SYSTEM_PROMPT,
 )
+from src.infrastructure.external.browser_pool import BrowserPool, get_browser_pool
 
 
 class ProposalScraperService(IProposalScraperService):
     """Service for scraping proposal from Japanese government websites using LLM."""
 
-    def __init__(self, llm_service: ILLMService, headless: bool = True):
+    def __init__(
+        self,
+        llm_service: ILLMService,
+        headless: bool = True,
+        browser_pool: BrowserPool | None = None,
+    ):
         """Initialize the scraper service.
 
         Args:
             llm_service: LLM service for content extraction
             headless: Whether to run browser in headless mode
+            browser_pool: Pool to lease pages from (defaults to the shared pool)
         """
         self.llm_service = llm_service
         self.headless = headless
+        self.browser_pool = browser_pool or get_browser_pool(headless)
 
     def is_supported_url(self, url: str) -> bool:
         """Check if the given URL is supported by this scraper.
@@ -70,82 +77,76 @@ class ProposalScraperService(IProposalScraperService):
         Returns:
             Dictionary containing scraped proposal information
         """
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            page = await browser.new_page()
-
-            try:
+        try:
+            async with self.browser_pool.page() as page:
                 await page.goto(url, wait_until="networkidle")
                 await asyncio.sleep(1)  # Wait for dynamic content
 
                 # Get the page content
                 content = await page.content()
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Get text content from the page
-                # Remove script and style elements
-                for script in soup(["script", "style"]):
-                    script.decompose()
-
-                # Get text content
-                text_content = soup.get_text(separator="\n", strip=True)
-
-                # Limit text content to avoid token limits
-                max_chars = 10000
-                if len(text_content) > max_chars:
-                    text_content = text_content[:max_chars] + "..."
-
-                # Use LLM to extract proposal information
-                extraction_prompt = PROPOSAL_EXTRACTION_PROMPT.format(
-                    url=url, text_content=text_content
-                )
-
-                # Call LLM to extract information
-                messages = [
-                    {"role": "system", "content": PROPOSAL_EXTRACTION_SYSTEM_PROMPT},
-                    {"role": "user", "content": extraction_prompt},
-                ]
-
-                llm_response = self.llm_service.invoke_llm(messages)
-
-                # Parse the LLM response
-                extracted_data: dict[str, Any]
-                try:
-                    # Try to parse as JSON
-                    extracted_data = json.loads(llm_response)
-                except json.JSONDecodeError:
-                    # If not valid JSON, try to extract from the text response
-                    extracted_data = {
-                        "content": "",
-                        "proposal_number": None,
-                        "submission_date": None,
-                        "summary": None,
-                    }
-                    # Simple fallback extraction from LLM text response
-                    if "content:" in llm_response:
-                        content_match = (
-                            llm_response.split("content:")[1].split("\n")[0].strip()
-                        )
-                        extracted_data["content"] = content_match.strip('"').strip()
-
-                # Build the proposal data
-                return ScrapedProposal(
-                    url=url,
-                    content=str(extracted_data.get("content", "")),
-                    proposal_number=extracted_data.get("proposal_number")
-                    if extracted_data.get("proposal_number")
-                    else None,
-                    submission_date=extracted_data.get("submission_date")
-                    if extracted_data.get("submission_date")
-                    else None,
-                    summary=extracted_data.get("summary")
-                    if extracted_data.get("summary")
-                    else None,
-                )
-
-            except Exception as e:
-                raise RuntimeError(
-                    f"Failed to scrape proposal from {url}: {str(e)}"
-                ) from e
-            finally:
-                await browser.close()
+
+            soup = BeautifulSoup(content, "html.parser")
+
+            # Get text content from the page
+            # Remove script and style elements
+            for script in soup(["script", "style"]):
+                script.decompose()
+
+            # Get text content
+            text_content = soup.get_text(separator="\n", strip=True)
+
+            # Limit text content to avoid token limits
+            max_chars = 10000
+            if len(text_content) > max_chars:
+                text_content = text_content[:max_chars] + "..."
+
+            # Use LLM to extract proposal information
+            extraction_prompt = PROPOSAL_EXTRACTION_PROMPT.format(
+                url=url, text_content=text_content
+            )
+
+            # Call LLM to extract information
+            messages = [
+                {"role": "system", "content": PROPOSAL_EXTRACTION_SYSTEM_PROMPT},
+                {"role": "user", "content": extraction_prompt},
+            ]
+
+            llm_response = self.llm_service.invoke_llm(messages)
+
+            # Parse the LLM response
+            extracted_data: dict[str, Any]
+            try:
+                # Try to parse as JSON
+                extracted_data = json.loads(llm_response)
+            except json.JSONDecodeError:
+                # If not valid JSON, try to extract from the text response
+                extracted_data = {
+                    "content": "",
+                    "proposal_number": None,
+                    "submission_date": None,
+                    "summary": None,
+                }
+                # Simple fallback extraction from LLM text response
+                if "content:" in llm_response:
+                    content_match = (
+                        llm_response.split("content:")[1].split("\n")[0].strip()
+                    )
+                    extracted_data["content"] = content_match.strip('"').strip()
+
+            # Build the proposal data
+            return ScrapedProposal(
+                url=url,
+                content=str(extracted_data.get("content", "")),
+                proposal_number=extracted_data.get("proposal_number")
+                if extracted_data.get("proposal_number")
+                else None,
+                submission_date=extracted_data.get("submission_date")
+                if extracted_data.get("submission_date")
+                else None,
+                summary=extracted_data.get("summary")
+                if extracted_data.get("summary")
+                else None,
+            )
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to scrape proposal from {url}: {str(e)}") from e
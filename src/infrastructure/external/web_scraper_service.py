@@ -1,24 +1,66 @@
 """Web scraper service implementation using Playwright."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.domain.services.interfaces.web_scraper_service import IWebScraperService
 
+if TYPE_CHECKING:
+    from src.infrastructure.external.browser_pool import BrowserPool
+    from src.infrastructure.external.fetch_strategy import FetchStrategy
+
 
 class PlaywrightScraperService(IWebScraperService):
     """Playwright-based implementation of web scraper."""
 
-    def __init__(self, headless: bool = True, llm_service: Any | None = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        llm_service: Any | None = None,
+        browser_pool: "BrowserPool | None" = None,
+        fetch_strategy: "FetchStrategy | None" = None,
+    ):
         """Initialize the PlaywrightScraperService.
 
         Args:
             headless: Whether to run the browser in headless mode
             llm_service: Optional LLM service for content extraction.
                         If not provided, a default GeminiLLMService will be created.
+            browser_pool: Pool to lease pages from. If not provided, the
+                        application's shared pool is used.
+            fetch_strategy: Strategy deciding between plain HTTP and
+                        browser rendering in fetch_html. If not provided,
+                        one using this service's browser pool is used.
         """
         self.headless = headless
         self._llm_service = llm_service
-        # Initialize Playwright here
+        self._browser_pool = browser_pool
+        self._fetch_strategy = fetch_strategy
+
+    @property
+    def browser_pool(self) -> "BrowserPool":
+        """Browser pool that pages are leased from."""
+        if self._browser_pool is None:
+            from src.infrastructure.external.browser_pool import get_browser_pool
+
+            self._browser_pool = get_browser_pool(self.headless)
+        return self._browser_pool
+
+    @property
+    def fetch_strategy(self) -> "FetchStrategy":
+        """Strategy that fetches static pages without a browser."""
+        if self._fetch_strategy is None:
+            from src.infrastructure.external.fetch_strategy import (
+                FetchStrategy,
+                get_fetch_strategy,
+            )
+
+            shared = get_fetch_strategy()
+            # Share per-host decisions unless this service uses its own pool
+            if shared.browser_pool is self.browser_pool:
+                self._fetch_strategy = shared
+            else:
+                self._fetch_strategy = FetchStrategy(browser_pool=self.browser_pool)
+        return self._fetch_strategy
 
     def is_supported_url(self, url: str) -> bool:
         """Check if the URL is supported for scraping.
@@ -44,7 +86,10 @@ class PlaywrightScraperService(IWebScraperService):
         return any(domain in url for domain in supported_domains)
 
     async def fetch_html(self, url: str) -> str:
-        """Fetch raw HTML content from a URL using Playwright.
+        """Fetch raw HTML content from a URL.
+
+        Static pages are fetched over HTTP; pages that need JavaScript
+        rendering are loaded with Playwright.
 
         Args:
             url: URL to fetch
@@ -57,28 +102,17 @@ class PlaywrightScraperService(IWebScraperService):
         """
         import logging
 
-        from playwright.async_api import async_playwright
-
         logger = logging.getLogger(__name__)
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=self.headless)
-                page = await browser.new_page()
-
-                # Navigate to the URL
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-
-                # Wait for content to load
-                await page.wait_for_load_state("domcontentloaded")
-
-                # Get the HTML content
-                html_content = await page.content()
-
-                await browser.close()
+            fetched = await self.fetch_strategy.fetch_html(url)
+            html_content = fetched.html
 
-                logger.debug(f"Fetched HTML from {url} ({len(html_content)} bytes)")
-                return html_content
+            logger.debug(
+                f"Fetched HTML from {url} ({len(html_content)} bytes, "
+                f"{fetched.mode.value})"
+            )
+            return html_content
 
         except Exception as e:
             logger.error(f"Failed to fetch HTML from {url}: {e}")
@@ -135,7 +169,9 @@ class PlaywrightScraperService(IWebScraperService):
             fetcher = None
             try:
                 fetcher = PartyMemberPageFetcher(
-                    party_id=party_id, proc_logger=proc_logger
+                    party_id=party_id,
+                    proc_logger=proc_logger,
+                    browser_pool=self.browser_pool,
                 )
                 await fetcher.__aenter__()
 
@@ -259,8 +295,6 @@ class PlaywrightScraperService(IWebScraperService):
         """
         import logging
 
-        from playwright.async_api import async_playwright
-
         from src.domain.services.proposal_judge_extraction_service import (
             ProposalJudgeExtractionService,
         )
@@ -268,10 +302,7 @@ class PlaywrightScraperService(IWebScraperService):
         logger = logging.getLogger(__name__)
 
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=self.headless)
-                page = await browser.new_page()
-
+            async with self.browser_pool.page() as page:
                 # Navigate to the URL
                 await page.goto(url, wait_until="networkidle")
 
@@ -281,23 +312,21 @@ class PlaywrightScraperService(IWebScraperService):
                 # Get the page content
                 text_content = await page.inner_text("body")
 
-                await browser.close()
-
-                # Use LLM to extract voting information
-                # Use injected service or create default
-                if self._llm_service:
-                    llm_service = self._llm_service
-                else:
-                    from src.infrastructure.external.llm_service import GeminiLLMService
+            # Use LLM to extract voting information
+            # Use injected service or create default
+            if self._llm_service:
+                llm_service = self._llm_service
+            else:
+                from src.infrastructure.external.llm_service import GeminiLLMService
 
-                    llm_service = GeminiLLMService()
+                llm_service = GeminiLLMService()
 
-                # Extract voting information using LLM
-                import json
+            # Extract voting information using LLM
+            import json
 
-                from langchain_core.prompts import ChatPromptTemplate
+            from langchain_core.prompts import ChatPromptTemplate
 
-                prompt = f"""
+            prompt = f"""
 以下のウェブページから議案の賛否情報を抽出してください。
 
 ページのURL: {url}
@@ -319,97 +348,91 @@ class PlaywrightScraperService(IWebScraperService):
 - JSONのみを返し、他の説明文は含めない
 """
 
-                try:
-                    # Use the LLM directly for extraction
-                    if hasattr(llm_service, "get_llm"):
-                        llm = llm_service.get_llm()  # type: ignore
-                    elif hasattr(llm_service, "_llm"):
-                        llm = llm_service._llm  # type: ignore
-                    else:
-                        llm = llm_service.get_structured_llm(dict)
-
-                    # Create prompt template
-                    prompt_template = ChatPromptTemplate.from_template("{text}")
-                    chain = prompt_template | llm
-
-                    # Get response
-                    response = await chain.ainvoke({"text": prompt})
-
-                    # Parse response
-                    if hasattr(response, "content"):
-                        response_text = response.content
-                    else:
-                        response_text = str(response)
-
-                    # Ensure response_text is a string
-                    if not isinstance(response_text, str):
-                        response_text = str(response_text)
-
-                    # Try to extract JSON from the response
-                    # Remove markdown code blocks if present
-                    response_text = response_text.strip()
-                    if response_text.startswith("```json"):
-                        response_text = response_text[7:]
-                    if response_text.startswith("```"):
-                        response_text = response_text[3:]
-                    if response_text.endswith("```"):
-                        response_text = response_text[:-3]
-
-                    response_text = response_text.strip()
-
-                    # Parse JSON
-                    judges_data = json.loads(response_text)
-
-                    count = len(judges_data) if isinstance(judges_data, list) else 0
-                    logger.info(f"Successfully extracted {count} judges from {url}")
-
-                except Exception as parse_error:
-                    logger.warning(
-                        f"Failed to parse LLM response as JSON: {parse_error}"
-                    )
-                    # Fallback: try to parse text content
-                    judges_data = (
-                        ProposalJudgeExtractionService.parse_voting_result_text(
-                            text_content
+            try:
+                # Use the LLM directly for extraction
+                if hasattr(llm_service, "get_llm"):
+                    llm = llm_service.get_llm()  # type: ignore
+                elif hasattr(llm_service, "_llm"):
+                    llm = llm_service._llm  # type: ignore
+                else:
+                    llm = llm_service.get_structured_llm(dict)
+
+                # Create prompt template
+                prompt_template = ChatPromptTemplate.from_template("{text}")
+                chain = prompt_template | llm
+
+                # Get response
+                response = await chain.ainvoke({"text": prompt})
+
+                # Parse response
+                if hasattr(response, "content"):
+                    response_text = response.content
+                else:
+                    response_text = str(response)
+
+                # Ensure response_text is a string
+                if not isinstance(response_text, str):
+                    response_text = str(response_text)
+
+                # Try to extract JSON from the response
+                # Remove markdown code blocks if present
+                response_text = response_text.strip()
+                if response_text.startswith("```json"):
+                    response_text = response_text[7:]
+                if response_text.startswith("```"):
+                    response_text = response_text[3:]
+                if response_text.endswith("```"):
+                    response_text = response_text[:-3]
+
+                response_text = response_text.strip()
+
+                # Parse JSON
+                judges_data = json.loads(response_text)
+
+                count = len(judges_data) if isinstance(judges_data, list) else 0
+                logger.info(f"Successfully extracted {count} judges from {url}")
+
+            except Exception as parse_error:
+                logger.warning(f"Failed to parse LLM response as JSON: {parse_error}")
+                # Fallback: try to parse text content
+                judges_data = ProposalJudgeExtractionService.parse_voting_result_text(
+                    text_content
+                )
+
+            # Process the extracted data
+            if isinstance(judges_data, list):
+                # Normalize the data using domain service
+                normalized_judges = []
+                for judge in judges_data:
+                    judgment_text = judge.get("judgment", "")
+                    normalized_judgment, is_known = (
+                        ProposalJudgeExtractionService.normalize_judgment_type(
+                            judgment_text
                         )
                     )
 
-                # Process the extracted data
-                if isinstance(judges_data, list):
-                    # Normalize the data using domain service
-                    normalized_judges = []
-                    for judge in judges_data:
-                        judgment_text = judge.get("judgment", "")
-                        normalized_judgment, is_known = (
-                            ProposalJudgeExtractionService.normalize_judgment_type(
-                                judgment_text
-                            )
+                    # Log unknown judgment types
+                    if not is_known:
+                        logger.warning(
+                            f"Unknown judgment type: {judgment_text}, "
+                            f"defaulting to APPROVE"
                         )
 
-                        # Log unknown judgment types
-                        if not is_known:
-                            logger.warning(
-                                f"Unknown judgment type: {judgment_text}, "
-                                f"defaulting to APPROVE"
-                            )
-
-                        normalized_judges.append(
-                            {
-                                "name": (
-                                    ProposalJudgeExtractionService.normalize_politician_name(
-                                        judge.get("name", "")
-                                    )
-                                ),
-                                "party": judge.get("party"),
-                                "judgment": normalized_judgment,
-                            }
-                        )
-                    return normalized_judges
+                    normalized_judges.append(
+                        {
+                            "name": (
+                                ProposalJudgeExtractionService.normalize_politician_name(
+                                    judge.get("name", "")
+                                )
+                            ),
+                            "party": judge.get("party"),
+                            "judgment": normalized_judgment,
+                        }
+                    )
+                return normalized_judges
 
-                # If not a list, try text parsing
-                return ProposalJudgeExtractionService.parse_voting_result_text(
-                    text_content
-                )
+            # If not a list, try text parsing
+            return ProposalJudgeExtractionService.parse_voting_result_text(text_content)
 
         except Exception as e:
             logger.error(f"Failed to scrape proposal judges from {url}: {e}")
@@ -0,0 +1,162 @@
+"""Persistent event loop for calling async code from sync code.
+
+Legacy CLI commands and Streamlit presenters are synchronous but call async
+repositories and use cases. Instead of patching the caller's loop with
+nest_asyncio on every call, coroutines are submitted to one long-lived
+event loop running in a background thread. Because the loop never changes,
+the engine registry hands out the same connection pool for every call and
+asyncpg connections stay valid across Streamlit reruns.
+
+Coroutines that run blocking sync-session calls hold their loop until the
+call returns. ``AsyncLoopBridgePool`` spreads such callers over a few loops
+so one slow query does not stall every other caller.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+logger = logging.getLogger(__name__)
+
+
+class AsyncLoopBridge:
+    """Runs coroutines on a dedicated background event loop."""
+
+    def __init__(self, name: str = "async-bridge"):
+        """Initialize the bridge. The loop thread starts on first use.
+
+        Args:
+            name: Name of the loop thread
+        """
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The bridge's event loop, started if necessary."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._start()
+            assert self._loop is not None
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the bridge loop and wait for its result.
+
+        Safe to call from any thread, including one that is itself running an
+        event loop (that loop is blocked until the result arrives).
+
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The result of the coroutine
+
+        Raises:
+            RuntimeError: If called from the bridge loop itself
+        """
+        loop = self.loop
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError(
+                "AsyncLoopBridge.run() called from its own loop; await instead"
+            )
+
+        future = asyncio.run_coroutine_threadsafe(coro, loop)
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the loop thread. A later ``run()`` starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        loop.close()
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run_loop() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run_loop, name=self._name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop = loop
+        self._thread = thread
+        logger.debug(f"Started event loop thread {self._name}")
+
+
+class AsyncLoopBridgePool:
+    """A fixed set of bridge loops; each call goes to the least busy one."""
+
+    def __init__(self, size: int, name: str = "async-bridge-pool"):
+        """Initialize the pool. Loop threads start on first use.
+
+        Args:
+            size: Number of bridge loops
+            name: Prefix for the loop thread names
+        """
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self._lock = threading.Lock()
+        self._bridges = [AsyncLoopBridge(name=f"{name}-{i}") for i in range(size)]
+        self._pending = [0] * size
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run a coroutine on the loop with the fewest calls in flight.
+
+        Args:
+            coro: The coroutine to run
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The result of the coroutine
+        """
+        with self._lock:
+            index = min(range(len(self._bridges)), key=self._pending.__getitem__)
+            self._pending[index] += 1
+        try:
+            return self._bridges[index].run(coro, timeout)
+        finally:
+            with self._lock:
+                self._pending[index] -= 1
+
+    def shutdown(self) -> None:
+        """Stop every loop thread."""
+        for bridge in self._bridges:
+            bridge.shutdown()
+
+
+_bridge = AsyncLoopBridge()
+atexit.register(_bridge.shutdown)
+
+
+def get_async_bridge() -> AsyncLoopBridge:
+    """Get the process-wide event loop bridge."""
+    return _bridge
+
+
+def run_sync[T](coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """Run a coroutine on the process-wide bridge loop and return its result."""
+    return _bridge.run(coro, timeout)
@@ -1,18 +1,34 @@
 """Conversation repository implementation."""
 
+import inspect
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Any, TypedDict
 
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Table, Text, text
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Table,
+    Text,
+    insert,
+    text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, registry
 
 from src.domain.entities.conversation import Conversation
+from src.domain.pagination import Cursor, CursorPage
 from src.domain.repositories.conversation_repository import ConversationRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
 from src.domain.services.speaker_matching_service import SpeakerMatchingService
+from src.domain.value_objects.conversation_ref import ConversationRef
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
+from src.infrastructure.persistence.row_mapper import make_row_mapper
 from src.minutes_divide_processor.models import SpeakerAndSpeechContent
 
 logger = logging.getLogger(__name__)
@@ -20,6 +36,153 @@ logger = logging.getLogger(__name__)
 # Create a mapper registry for this table
 mapper_registry = registry()
 
+# Maximum number of distinct speaker names resolved per lookup query
+SPEAKER_LOOKUP_CHUNK_SIZE = 1000
+
+# Maximum number of rows sent per multi-row INSERT statement
+BULK_INSERT_CHUNK_SIZE = 1000
+
+# Seconds a filtered listing count is reused before it is recounted
+LISTING_COUNT_TTL_SECONDS = 60.0
+
+# Maximum number of filtered listing counts kept, least recently used evicted
+LISTING_COUNT_CACHE_MAX_SIZE = 256
+
+# (where clause, params) -> (count, time counted), least recently used first
+_listing_count_cache: OrderedDict[tuple[str, tuple[Any, ...]], tuple[int, float]] = (
+    OrderedDict()
+)
+
+
+def _get_cached_listing_count(key: tuple[str, tuple[Any, ...]]) -> int | None:
+    """Return a fresh cached listing count, dropping it if it has expired."""
+    cached = _listing_count_cache.get(key)
+    if cached is None:
+        return None
+    if time.monotonic() - cached[1] >= LISTING_COUNT_TTL_SECONDS:
+        del _listing_count_cache[key]
+        return None
+    _listing_count_cache.move_to_end(key)
+    return cached[0]
+
+
+def _cache_listing_count(key: tuple[str, tuple[Any, ...]], count: int) -> None:
+    """Cache a listing count, evicting expired and least recently used ones."""
+    now = time.monotonic()
+    expired = [
+        k
+        for k, (_, counted_at) in _listing_count_cache.items()
+        if now - counted_at >= LISTING_COUNT_TTL_SECONDS
+    ]
+    for k in expired:
+        del _listing_count_cache[k]
+
+    _listing_count_cache[key] = (count, now)
+    _listing_count_cache.move_to_end(key)
+    while len(_listing_count_cache) > LISTING_COUNT_CACHE_MAX_SIZE:
+        _listing_count_cache.popitem(last=False)
+
+
+# Columns read into Conversation entities by the bulk read queries, in
+# constructor argument order
+CONVERSATION_ENTITY_COLUMNS = (
+    "comment",
+    "sequence_number",
+    "minutes_id",
+    "speaker_id",
+    "speaker_name",
+    "chapter_number",
+    "sub_chapter_number",
+    "id",
+)
+CONVERSATION_ENTITY_SELECT = ", ".join(CONVERSATION_ENTITY_COLUMNS)
+_conversation_from_row = make_row_mapper(Conversation, CONVERSATION_ENTITY_COLUMNS)
+
+# Columns read into ConversationRef, in field order
+CONVERSATION_REF_COLUMNS = "id, minutes_id, speaker_id, speaker_name, sequence_number"
+
+# Columns and joins shared by the conversation listing queries
+CONVERSATION_LIST_SELECT = """
+SELECT
+    c.id,
+    c.speaker_name,
+    c.comment,
+    c.sequence_number,
+    c.chapter_number,
+    c.sub_chapter_number,
+    c.speaker_id,
+    c.minutes_id,
+    m.name as meeting_title,
+    m.date as meeting_date,
+    s.name as linked_speaker_name,
+    s.type as speaker_type,
+    s.political_party_name as speaker_party_name,
+    gb.name as governing_body_name,
+    gb.organization_type as governing_body_type,
+    conf.name as conference_name,
+    p.id as politician_id,
+    p.name as politician_name,
+    pp.name as politician_party_name,
+    p.position as politician_position,
+    CASE WHEN p.id IS NOT NULL THEN TRUE ELSE FALSE END
+        as speaker_is_politician
+FROM conversations c
+LEFT JOIN minutes mi ON c.minutes_id = mi.id
+LEFT JOIN meetings m ON mi.meeting_id = m.id
+LEFT JOIN speakers s ON c.speaker_id = s.id
+LEFT JOIN conferences conf ON m.conference_id = conf.id
+LEFT JOIN governing_bodies gb ON conf.governing_body_id = gb.id
+LEFT JOIN politicians p ON s.id = p.speaker_id
+LEFT JOIN political_parties pp ON p.political_party_id = pp.id
+"""
+
+# Link each unlinked conversation to the speaker whose name it contains,
+# preferring the most similar name (an exact match has similarity 1). A single
+# ILIKE predicate, unlike the former "= OR ILIKE", can use the trigram index on
+# speaker_name.
+SPEAKER_LINK_UPDATE_QUERY = """
+UPDATE conversations c
+SET speaker_id = m.speaker_id
+FROM (
+    SELECT DISTINCT ON (uc.id) uc.id AS conversation_id,
+        s.id AS speaker_id
+    FROM conversations uc
+    JOIN speakers s ON uc.speaker_name ILIKE '%' || s.name || '%'
+    WHERE uc.speaker_id IS NULL
+    ORDER BY uc.id, similarity(uc.speaker_name, s.name) DESC, s.id
+) m
+WHERE c.id = m.conversation_id
+"""
+
+
+def conversation_list_count_query(where_clause: str) -> str:
+    """Count query for a conversation listing filtered by ``where_clause``."""
+    return f"""
+        SELECT COUNT(*)
+        FROM conversations c
+        LEFT JOIN minutes mi ON c.minutes_id = mi.id
+        LEFT JOIN meetings m ON mi.meeting_id = m.id
+        WHERE {where_clause}
+    """
+
+
+def speaker_ids_lookup_query(name_count: int) -> str:
+    """Speaker ID lookup for ``name_count`` names bound as ``:name_0``, ...
+
+    Each name matches a speaker with the same name or one containing it
+    (served by the trigram index on speakers.name), preferring an exact
+    match, then the most similar name, then the lowest ID.
+    """
+    values = ", ".join(f"(:name_{i})" for i in range(name_count))
+    return f"""
+        SELECT DISTINCT ON (v.name) v.name AS speaker_name, s.id
+        FROM (VALUES {values}) AS v(name)
+        JOIN speakers s
+            ON s.name = v.name OR s.name LIKE '%' || v.name || '%'
+        ORDER BY v.name, (s.name = v.name) DESC,
+            similarity(s.name, v.name) DESC, s.id
+    """
+
 
 class ConversationModelDict(TypedDict, total=False):
     """Type definition for conversation model attributes."""
@@ -137,145 +300,186 @@ class ConversationRepositoryImpl(
 
     async def get_by_minutes(self, minutes_id: int) -> list[Conversation]:
         """Get all conversations for a minutes record."""
-        if self.async_session is not None:
-            query = text("""
-                SELECT * FROM conversations
-                WHERE minutes_id = :minutes_id
-                ORDER BY sequence_number
-            """)
-            result = await self.async_session.execute(query, {"minutes_id": minutes_id})
-            rows = result.fetchall()
-            return [self._row_to_entity(row) for row in rows]
-        elif self.sync_session is not None:
-            # ISessionAdapter implementation - execute is always async
-            query = text("""
-                SELECT * FROM conversations
-                WHERE minutes_id = :minutes_id
-                ORDER BY sequence_number
-            """)
-            result = await self.sync_session.execute(query, {"minutes_id": minutes_id})
-            rows = result.fetchall()
-            return [self._row_to_entity(row) for row in rows]
-        else:
-            # This should never happen as one session must exist
-            return []
+        query = text(f"""
+            SELECT {CONVERSATION_ENTITY_SELECT} FROM conversations
+            WHERE minutes_id = :minutes_id
+            ORDER BY sequence_number
+        """)
+        return await self._fetch_entities(query, {"minutes_id": minutes_id})
+
+    async def get_refs_by_minutes(self, minutes_id: int) -> list[ConversationRef]:
+        """Get all conversations for a minutes record without their comments."""
+        query = text(f"""
+            SELECT {CONVERSATION_REF_COLUMNS} FROM conversations
+            WHERE minutes_id = :minutes_id
+            ORDER BY sequence_number
+        """)
+        return await self._fetch_refs(query, {"minutes_id": minutes_id})
+
+    async def get_conversation_counts_by_meeting(
+        self, meeting_ids: list[int]
+    ) -> dict[int, dict[str, int]]:
+        """Count conversations and distinct linked speakers per meeting.
+
+        One aggregate query for all meetings; no conversation text is read.
+        The (minutes_id, speaker_id) index from migration 041 lets PostgreSQL
+        answer it with an index-only scan.
+
+        Args:
+            meeting_ids: Meetings to count
+
+        Returns:
+            Mapping of meeting ID to ``conversation_count`` and
+            ``speaker_count``. Meetings without minutes are absent.
+        """
+        session = self.async_session or self.sync_session
+        if not meeting_ids or session is None:
+            return {}
+
+        query = text("""
+            SELECT
+                mi.meeting_id,
+                COUNT(c.id) AS conversation_count,
+                COUNT(DISTINCT c.speaker_id) AS speaker_count
+            FROM minutes mi
+            LEFT JOIN conversations c ON c.minutes_id = mi.id
+            WHERE mi.meeting_id = ANY(:meeting_ids)
+            GROUP BY mi.meeting_id
+        """)
+
+        result = session.execute(query, {"meeting_ids": list(meeting_ids)})
+        if inspect.isawaitable(result):
+            result = await result
+
+        return {
+            row.meeting_id: {
+                "conversation_count": row.conversation_count,
+                "speaker_count": row.speaker_count,
+            }
+            for row in result.fetchall()
+        }
 
     async def get_by_speaker(
         self, speaker_id: int, limit: int | None = None
     ) -> list[Conversation]:
         """Get all conversations by a speaker."""
-        if self.async_session is not None:
-            query = text("""
-                SELECT * FROM conversations
-                WHERE speaker_id = :speaker_id
-                ORDER BY sequence_number
-                LIMIT :limit
-            """)
-            params = {"speaker_id": speaker_id, "limit": limit or 999999}
-            result = await self.async_session.execute(query, params)
-            rows = result.fetchall()
-            return [self._row_to_entity(row) for row in rows]
-        elif self.sync_session is not None:
-            # ISessionAdapter implementation - execute is always async
-            query = text("""
-                SELECT * FROM conversations
-                WHERE speaker_id = :speaker_id
-                ORDER BY sequence_number
-                LIMIT :limit
-            """)
-            params = {"speaker_id": speaker_id, "limit": limit or 999999}
-            result = await self.sync_session.execute(query, params)
-            rows = result.fetchall()
-            return [self._row_to_entity(row) for row in rows]
-        else:
-            # This should never happen as one session must exist
-            return []
+        query = text(f"""
+            SELECT {CONVERSATION_ENTITY_SELECT} FROM conversations
+            WHERE speaker_id = :speaker_id
+            ORDER BY sequence_number
+            LIMIT :limit
+        """)
+        params = {"speaker_id": speaker_id, "limit": limit or 999999}
+        return await self._fetch_entities(query, params)
 
     async def get_unlinked(self, limit: int | None = None) -> list[Conversation]:
         """Get conversations without speaker links."""
-        if self.async_session is not None:
-            query = text("""
-                SELECT * FROM conversations
-                WHERE speaker_id IS NULL
-                ORDER BY id
-                LIMIT :limit
-            """)
-            params = {"limit": limit or 999999}
-            result = await self.async_session.execute(query, params)
-            rows = result.fetchall()
-            return [self._row_to_entity(row) for row in rows]
-        elif self.sync_session is not None:
-            # ISessionAdapter implementation - execute is always async
-            query = text("""
-                SELECT * FROM conversations
-                WHERE speaker_id IS NULL
-                ORDER BY id
-                LIMIT :limit
-            """)
-            params = {"limit": limit or 999999}
-            result = await self.sync_session.execute(query, params)
-            rows = result.fetchall()
-            return [self._row_to_entity(row) for row in rows]
-        else:
-            # This should never happen as one session must exist
+        query = text(f"""
+            SELECT {CONVERSATION_ENTITY_SELECT} FROM conversations
+            WHERE speaker_id IS NULL
+            ORDER BY id
+            LIMIT :limit
+        """)
+        return await self._fetch_entities(query, {"limit": limit or 999999})
+
+    async def get_unlinked_refs(
+        self, limit: int | None = None
+    ) -> list[ConversationRef]:
+        """Get conversations without speaker links, without their comments."""
+        query = text(f"""
+            SELECT {CONVERSATION_REF_COLUMNS} FROM conversations
+            WHERE speaker_id IS NULL
+            ORDER BY id
+            LIMIT :limit
+        """)
+        return await self._fetch_refs(query, {"limit": limit or 999999})
+
+    async def get_comments(self, conversation_ids: list[int]) -> dict[int, str]:
+        """Load the comment text of the given conversations."""
+        session = self.async_session or self.sync_session
+        if not conversation_ids or session is None:
+            return {}
+
+        query = text("""
+            SELECT id, comment FROM conversations
+            WHERE id = ANY(:ids)
+        """)
+        result = session.execute(query, {"ids": list(conversation_ids)})
+        if inspect.isawaitable(result):
+            result = await result
+        return {row.id: row.comment for row in result.fetchall()}
+
+    async def _fetch_entities(
+        self, query: Any, params: dict[str, Any]
+    ) -> list[Conversation]:
+        session = self.async_session or self.sync_session
+        if session is None:
             return []
 
+        result = session.execute(query, params)
+        if inspect.isawaitable(result):
+            result = await result
+        # Rows are in CONVERSATION_ENTITY_COLUMNS order
+        return list(map(_conversation_from_row, result.fetchall()))
+
+    async def _fetch_refs(
+        self, query: Any, params: dict[str, Any]
+    ) -> list[ConversationRef]:
+        session = self.async_session or self.sync_session
+        if session is None:
+            return []
+
+        result = session.execute(query, params)
+        if inspect.isawaitable(result):
+            result = await result
+        # Rows are plain tuples in ConversationRef field order
+        make = ConversationRef._make
+        return [make(row) for row in result.fetchall()]
+
     async def bulk_create(
         self, conversations: list[Conversation]
     ) -> list[Conversation]:
-        """Create multiple conversations at once using ORM."""
+        """Create multiple conversations at once.
+
+        Rows are inserted with one multi-row ``INSERT ... RETURNING id`` per
+        ``BULK_INSERT_CHUNK_SIZE`` conversations. The returned IDs are in input
+        order and are set on the given entities, so no per-row refresh is
+        needed.
+        """
         if not conversations:
             return []
 
-        if self.async_session is not None:
-            # Use ORM add_all for proper transaction handling
-            models = [self._to_model(conv) for conv in conversations]
-            self.async_session.add_all(models)
-
-            # Flush to assign IDs without committing
-            await self.async_session.flush()
+        session = self.async_session or self.sync_session
+        if session is None:
+            # This should never happen
+            return []
 
-            # Refresh to get assigned IDs
-            for model in models:
-                await self.async_session.refresh(model)
+        statement = insert(conversations_table).returning(
+            conversations_table.c.id, sort_by_parameter_order=True
+        )
+        for start in range(0, len(conversations), BULK_INSERT_CHUNK_SIZE):
+            chunk = conversations[start : start + BULK_INSERT_CHUNK_SIZE]
+            params = [
+                {
+                    "minutes_id": conv.minutes_id,
+                    "speaker_id": conv.speaker_id,
+                    "speaker_name": conv.speaker_name,
+                    "comment": conv.comment,
+                    "sequence_number": conv.sequence_number,
+                    "chapter_number": conv.chapter_number,
+                    "sub_chapter_number": conv.sub_chapter_number,
+                }
+                for conv in chunk
+            ]
 
-            # Convert back to entities with IDs
-            created = [self._to_entity(model) for model in models]
-            return created
-        elif self.sync_session is not None:
-            # Sync implementation (may be wrapped by AsyncSessionAdapter)
-            created: list[Conversation] = []
-            for conv in conversations:
-                query = text("""
-                    INSERT INTO conversations
-                    (minutes_id, speaker_id, speaker_name, comment, sequence_number,
-                     chapter_number, sub_chapter_number)
-                    VALUES
-                    (:minutes_id, :speaker_id, :speaker_name, :comment,
-                     :sequence_number, :chapter_number, :sub_chapter_number)
-                    RETURNING id
-                """)
-                result = await self.sync_session.execute(
-                    query,
-                    {
-                        "minutes_id": conv.minutes_id,
-                        "speaker_id": conv.speaker_id,
-                        "speaker_name": conv.speaker_name,
-                        "comment": conv.comment,
-                        "sequence_number": conv.sequence_number,
-                        "chapter_number": conv.chapter_number,
-                        "sub_chapter_number": conv.sub_chapter_number,
-                    },
-                )
-                conv_id = result.scalar()
+            result = session.execute(statement, params)  # type: ignore[arg-type]
+            if inspect.isawaitable(result):
+                result = await result
+            for conv, conv_id in zip(chunk, result.scalars().all(), strict=True):
                 conv.id = conv_id
-                created.append(conv)
 
-            # Do not commit here - let UseCase manage transaction
-            return created
-        else:
-            # This should never happen
-            return []
+        # Do not commit here - let UseCase manage transaction
+        return conversations
 
     async def save_speaker_and_speech_content_list(
         self, speaker_and_speech_content_list: list[Any], minutes_id: int | None = None
@@ -290,15 +494,17 @@ class ConversationRepositoryImpl(
             logger.warning("No conversations to save")
             return []
 
+        # Resolve all distinct speaker names at once instead of per utterance
+        speaker_ids = await self._find_speaker_ids(
+            [item.speaker for item in speaker_and_speech_content_list]
+        )
+
         # Convert SpeakerAndSpeechContent to Conversation entities
         conversations: list[Conversation] = []
         for item in speaker_and_speech_content_list:
-            # Find speaker_id if speaker matching service is available
-            speaker_id = await self._find_speaker_id(item.speaker)
-
             conv = Conversation(
                 minutes_id=minutes_id,
-                speaker_id=speaker_id,
+                speaker_id=speaker_ids.get(item.speaker),
                 speaker_name=item.speaker,
                 comment=item.speech_content,
                 sequence_number=item.speech_order,
@@ -404,6 +610,7 @@ class ConversationRepositoryImpl(
             query = text("""
                 SELECT id FROM speakers
                 WHERE name = :name OR name LIKE :name_pattern
+                ORDER BY similarity(name, :name) DESC, id
                 LIMIT 1
             """)
             result = await self.async_session.execute(
@@ -415,6 +622,47 @@ class ConversationRepositoryImpl(
         else:
             return self._legacy_find_speaker_id(speaker_name)
 
+    async def _find_speaker_ids(
+        self, speaker_names: list[str]
+    ) -> dict[str, int | None]:
+        """Find speaker IDs for many names with one query per chunk.
+
+        Each distinct name is matched like ``_find_speaker_id`` (exact name or
+        ``LIKE '%name%'``), preferring the most similar speaker name (an exact
+        match first) and then the lowest ID.
+
+        Returns:
+            Mapping of speaker name to speaker ID (None if not found)
+        """
+        unique_names = list(dict.fromkeys(name for name in speaker_names if name))
+        speaker_ids: dict[str, int | None] = dict.fromkeys(unique_names)
+        if not unique_names:
+            return speaker_ids
+
+        if self.speaker_matching_service and hasattr(
+            self.speaker_matching_service, "find_speaker_id"
+        ):
+            for name in unique_names:
+                speaker_ids[name] = self.speaker_matching_service.find_speaker_id(name)  # type: ignore
+            return speaker_ids
+
+        session = self.async_session or self.sync_session
+        if session is None:
+            return speaker_ids
+
+        for start in range(0, len(unique_names), SPEAKER_LOOKUP_CHUNK_SIZE):
+            chunk = unique_names[start : start + SPEAKER_LOOKUP_CHUNK_SIZE]
+            query = text(speaker_ids_lookup_query(len(chunk)))
+            params = {f"name_{i}": name for i, name in enumerate(chunk)}
+
+            result = session.execute(query, params)
+            if inspect.isawaitable(result):
+                result = await result
+            for row in result.fetchall():
+                speaker_ids[row.speaker_name] = row.id
+
+        return speaker_ids
+
     def _legacy_find_speaker_id(self, speaker_name: str) -> int | None:
         """Legacy synchronous find speaker ID."""
         if self.sync_session is None:
@@ -423,6 +671,7 @@ class ConversationRepositoryImpl(
         query = text("""
             SELECT id FROM speakers
             WHERE name = :name OR name LIKE :name_pattern
+            ORDER BY similarity(name, :name) DESC, id
             LIMIT 1
         """)
         result = self.sync_session.execute(
@@ -510,70 +759,24 @@ class ConversationRepositoryImpl(
         speaker_name: str | None = None,
         meeting_id: int | None = None,
         has_speaker_id: bool | None = None,
+        comment_keyword: str | None = None,
     ) -> dict[str, Any]:
-        """Get conversations with pagination and filters."""
-        # Build WHERE conditions
-        conditions: list[str] = []
-        params: dict[str, Any] = {"limit": page_size, "offset": (page - 1) * page_size}
-
-        if speaker_name:
-            conditions.append("c.speaker_name ILIKE :speaker_name")
-            params["speaker_name"] = f"%{speaker_name}%"
+        """Get conversations with pagination and filters.
 
-        if meeting_id:
-            conditions.append("m.id = :meeting_id")
-            params["meeting_id"] = meeting_id
-
-        if has_speaker_id is not None:
-            if has_speaker_id:
-                conditions.append("c.speaker_id IS NOT NULL")
-            else:
-                conditions.append("c.speaker_id IS NULL")
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        The speaker_name and comment_keyword filters are substring matches
+        served by the pg_trgm indexes on conversations.
+        """
+        where_clause, params = self._conversation_list_filters(
+            speaker_name, meeting_id, has_speaker_id, comment_keyword
+        )
+        params.update({"limit": page_size, "offset": (page - 1) * page_size})
 
         # Count query
-        count_query = text(f"""
-            SELECT COUNT(*)
-            FROM conversations c
-            LEFT JOIN minutes mi ON c.minutes_id = mi.id
-            LEFT JOIN meetings m ON mi.meeting_id = m.id
-            WHERE {where_clause}
-        """)
+        count_query = text(conversation_list_count_query(where_clause))
 
         # Data query
         data_query = text(f"""
-            SELECT
-                c.id,
-                c.speaker_name,
-                c.comment,
-                c.sequence_number,
-                c.chapter_number,
-                c.sub_chapter_number,
-                c.speaker_id,
-                c.minutes_id,
-                m.name as meeting_title,
-                m.date as meeting_date,
-                s.name as linked_speaker_name,
-                s.type as speaker_type,
-                s.political_party_name as speaker_party_name,
-                gb.name as governing_body_name,
-                gb.organization_type as governing_body_type,
-                conf.name as conference_name,
-                p.id as politician_id,
-                p.name as politician_name,
-                pp.name as politician_party_name,
-                p.position as politician_position,
-                CASE WHEN p.id IS NOT NULL THEN TRUE ELSE FALSE END
-                    as speaker_is_politician
-            FROM conversations c
-            LEFT JOIN minutes mi ON c.minutes_id = mi.id
-            LEFT JOIN meetings m ON mi.meeting_id = m.id
-            LEFT JOIN speakers s ON c.speaker_id = s.id
-            LEFT JOIN conferences conf ON m.conference_id = conf.id
-            LEFT JOIN governing_bodies gb ON conf.governing_body_id = gb.id
-            LEFT JOIN politicians p ON s.id = p.speaker_id
-            LEFT JOIN political_parties pp ON p.political_party_id = pp.id
+            {CONVERSATION_LIST_SELECT}
             WHERE {where_clause}
             ORDER BY c.id DESC
             LIMIT :limit OFFSET :offset
@@ -604,37 +807,7 @@ class ConversationRepositoryImpl(
                 "page_size": page_size,
             }
 
-        # Format results
-        conversations = []
-        for row in rows:
-            conversations.append(
-                {
-                    "id": row.id,
-                    "speaker_name": row.speaker_name,
-                    "comment": row.comment[:100] + "..."
-                    if len(row.comment) > 100
-                    else row.comment,
-                    "sequence_number": row.sequence_number,
-                    "chapter_number": row.chapter_number,
-                    "sub_chapter_number": row.sub_chapter_number,
-                    "speaker_id": row.speaker_id,
-                    "minutes_id": row.minutes_id,
-                    "meeting_title": row.meeting_title,
-                    "meeting_date": row.meeting_date,
-                    "linked_speaker_name": row.linked_speaker_name,
-                    "speaker_type": row.speaker_type,
-                    "speaker_party_name": row.speaker_party_name,
-                    "governing_body_name": row.governing_body_name,
-                    "governing_body_type": row.governing_body_type,
-                    "conference_name": row.conference_name,
-                    "politician_id": row.politician_id,
-                    "politician_name": row.politician_name,
-                    "politician_party_name": row.politician_party_name,
-                    "politician_position": row.politician_position,
-                    "speaker_is_politician": row.speaker_is_politician,
-                }
-            )
-
+        conversations = [self._format_conversation_list_row(row) for row in rows]
         total_pages = (total_count + page_size - 1) // page_size
 
         return {
@@ -645,6 +818,168 @@ class ConversationRepositoryImpl(
             "page_size": page_size,
         }
 
+    async def get_conversations_page(
+        self,
+        limit: int = 50,
+        cursor: str | None = None,
+        speaker_name: str | None = None,
+        meeting_id: int | None = None,
+        has_speaker_id: bool | None = None,
+        comment_keyword: str | None = None,
+        include_total: bool = False,
+    ) -> CursorPage[dict[str, Any]]:
+        """Get one keyset-paginated page of conversations, newest first.
+
+        Rows are ordered by ``id DESC`` and the page starts after the cursor's
+        ID, so the cost does not grow with the page depth.
+        """
+        session = self.async_session or self.sync_session
+        if session is None:
+            return CursorPage(items=[], limit=limit)
+
+        where_clause, params = self._conversation_list_filters(
+            speaker_name, meeting_id, has_speaker_id, comment_keyword
+        )
+        filter_clause = where_clause
+        if cursor:
+            where_clause += " AND c.id < :cursor_id"
+            params["cursor_id"] = Cursor.decode(cursor).id
+        # Fetch one extra row to learn whether another page follows
+        params["limit"] = limit + 1
+
+        data_query = text(f"""
+            {CONVERSATION_LIST_SELECT}
+            WHERE {where_clause}
+            ORDER BY c.id DESC
+            LIMIT :limit
+        """)
+        result = session.execute(data_query, params)
+        if inspect.isawaitable(result):
+            result = await result
+        rows = result.fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = Cursor(id=rows[-1].id).encode()
+
+        page: CursorPage[dict[str, Any]] = CursorPage(
+            items=[self._format_conversation_list_row(row) for row in rows],
+            next_cursor=next_cursor,
+            limit=limit,
+        )
+        if include_total:
+            page.total_count, page.total_is_estimate = await self._count_for_listing(
+                session, filter_clause, params
+            )
+        return page
+
+    async def _count_for_listing(
+        self,
+        session: AsyncSession | Session | ISessionAdapter,
+        where_clause: str,
+        params: dict[str, Any],
+    ) -> tuple[int, bool]:
+        """Count conversations for a listing, estimating when unfiltered.
+
+        Without filters the planner statistics in ``pg_class.reltuples`` are
+        used instead of scanning the whole table. Filtered counts are exact
+        and cached for ``LISTING_COUNT_TTL_SECONDS``.
+
+        Returns:
+            Tuple of (count, whether the count is an estimate)
+        """
+        if where_clause == "1=1":
+            result = session.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = 'conversations'::regclass"
+                )
+            )
+            if inspect.isawaitable(result):
+                result = await result
+            estimate = result.scalar()
+            # reltuples is -1 (or 0) until the table has been analyzed
+            if estimate is not None and estimate > 0:
+                return int(estimate), True
+
+        filter_params = {
+            k: v for k, v in params.items() if k not in ("limit", "cursor_id")
+        }
+        cache_key = (where_clause, tuple(sorted(filter_params.items())))
+        cached = _get_cached_listing_count(cache_key)
+        if cached is not None:
+            return cached, False
+
+        count_query = text(conversation_list_count_query(where_clause))
+        result = session.execute(count_query, filter_params)
+        if inspect.isawaitable(result):
+            result = await result
+        count = result.scalar() or 0
+        _cache_listing_count(cache_key, count)
+        return count, False
+
+    @staticmethod
+    def _conversation_list_filters(
+        speaker_name: str | None,
+        meeting_id: int | None,
+        has_speaker_id: bool | None,
+        comment_keyword: str | None,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the WHERE clause and parameters shared by listing queries."""
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+
+        if speaker_name:
+            conditions.append("c.speaker_name ILIKE :speaker_name")
+            params["speaker_name"] = f"%{speaker_name}%"
+
+        if comment_keyword:
+            conditions.append("c.comment ILIKE :comment_keyword")
+            params["comment_keyword"] = f"%{comment_keyword}%"
+
+        if meeting_id:
+            conditions.append("m.id = :meeting_id")
+            params["meeting_id"] = meeting_id
+
+        if has_speaker_id is not None:
+            if has_speaker_id:
+                conditions.append("c.speaker_id IS NOT NULL")
+            else:
+                conditions.append("c.speaker_id IS NULL")
+
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        return where_clause, params
+
+    @staticmethod
+    def _format_conversation_list_row(row: Any) -> dict[str, Any]:
+        """Format a listing row for display."""
+        return {
+            "id": row.id,
+            "speaker_name": row.speaker_name,
+            "comment": row.comment[:100] + "..."
+            if len(row.comment) > 100
+            else row.comment,
+            "sequence_number": row.sequence_number,
+            "chapter_number": row.chapter_number,
+            "sub_chapter_number": row.sub_chapter_number,
+            "speaker_id": row.speaker_id,
+            "minutes_id": row.minutes_id,
+            "meeting_title": row.meeting_title,
+            "meeting_date": row.meeting_date,
+            "linked_speaker_name": row.linked_speaker_name,
+            "speaker_type": row.speaker_type,
+            "speaker_party_name": row.speaker_party_name,
+            "governing_body_name": row.governing_body_name,
+            "governing_body_type": row.governing_body_type,
+            "conference_name": row.conference_name,
+            "politician_id": row.politician_id,
+            "politician_name": row.politician_name,
+            "politician_party_name": row.politician_party_name,
+            "politician_position": row.politician_position,
+            "speaker_is_politician": row.speaker_is_politician,
+        }
+
     async def update_speaker_links(self) -> int:
         """Update speaker links for conversations."""
         if self.speaker_matching_service and hasattr(
@@ -654,13 +989,7 @@ class ConversationRepositoryImpl(
             return self.speaker_matching_service.update_all_conversations()  # type: ignore
 
         # Fallback to basic implementation
-        update_query = text("""
-            UPDATE conversations c
-            SET speaker_id = s.id
-            FROM speakers s
-            WHERE c.speaker_id IS NULL
-            AND (c.speaker_name = s.name OR c.speaker_name ILIKE '%' || s.name || '%')
-        """)
+        update_query = text(SPEAKER_LINK_UPDATE_QUERY)
 
         if self.async_session is not None:
             result = await self.async_session.execute(update_query)
@@ -674,6 +1003,44 @@ class ConversationRepositoryImpl(
             # This should never happen
             return 0
 
+    async def update_speaker_ids(self, speaker_ids: dict[int, int | None]) -> int:
+        """Set speaker_id on many conversations at once.
+
+        Sends one ``UPDATE ... FROM (VALUES ...)`` per ``BULK_INSERT_CHUNK_SIZE``
+        conversations instead of one UPDATE per row.
+        """
+        session = self.async_session or self.sync_session
+        if not speaker_ids or session is None:
+            return 0
+
+        items = list(speaker_ids.items())
+        updated = 0
+        for start in range(0, len(items), BULK_INSERT_CHUNK_SIZE):
+            chunk = items[start : start + BULK_INSERT_CHUNK_SIZE]
+            values = ", ".join(
+                f"(CAST(:id_{i} AS INTEGER), CAST(:speaker_id_{i} AS INTEGER))"
+                for i in range(len(chunk))
+            )
+            query = text(f"""
+                UPDATE conversations AS c
+                SET speaker_id = v.speaker_id,
+                    updated_at = CURRENT_TIMESTAMP
+                FROM (VALUES {values}) AS v(id, speaker_id)
+                WHERE c.id = v.id
+            """)
+            params: dict[str, int | None] = {}
+            for i, (conversation_id, speaker_id) in enumerate(chunk):
+                params[f"id_{i}"] = conversation_id
+                params[f"speaker_id_{i}"] = speaker_id
+
+            result = session.execute(query, params)
+            if inspect.isawaitable(result):
+                result = await result
+            updated += result.rowcount  # type: ignore[union-attr]
+
+        # Do not commit here - let UseCase manage transaction
+        return updated
+
     async def count(self) -> int:
         """Count total number of conversations."""
         query = text("SELECT COUNT(*) FROM conversations")
@@ -1,5 +1,7 @@
 """Implementation of data coverage repository using SQLAlchemy."""
 
+from datetime import datetime
+
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -16,17 +18,26 @@ from src.domain.repositories.session_adapter import ISessionAdapter
 class DataCoverageRepositoryImpl(IDataCoverageRepository):
     """Implementation of IDataCoverageRepository using SQLAlchemy.
 
-    This repository provides optimized aggregation queries for
-    data coverage statistics using database indexes.
+    By default the statistics are read from the materialized views created
+    in migration 040, which are recomputed by ``refresh_statistics()``.
+    With ``use_summary_views=False`` they are aggregated from the base
+    tables on every call.
     """
 
-    def __init__(self, session: AsyncSession | ISessionAdapter):
+    def __init__(
+        self,
+        session: AsyncSession | ISessionAdapter,
+        use_summary_views: bool = True,
+    ):
         """Initialize repository with database session.
 
         Args:
             session: Database session (AsyncSession or ISessionAdapter)
+            use_summary_views: Read precomputed statistics instead of
+                aggregating the base tables
         """
         self.session = session
+        self.use_summary_views = use_summary_views
 
     def _empty_governing_body_stats(self) -> GoverningBodyStats:
         """Return empty governing body stats with proper structure.
@@ -80,31 +91,48 @@ class DataCoverageRepositoryImpl(IDataCoverageRepository):
         Returns:
             GoverningBodyStats: Statistics about governing body coverage
         """
-        query = text("""
-            WITH stats AS (
+        if self.use_summary_views:
+            query = text("""
                 SELECT
-                    COUNT(DISTINCT gb.id) as total,
-                    COUNT(DISTINCT c.governing_body_id) as with_conferences,
-                    COUNT(DISTINCT m_gb.governing_body_id) as with_meetings
-                FROM governing_bodies gb
-                LEFT JOIN conferences c ON gb.id = c.governing_body_id
-                LEFT JOIN (
-                    SELECT DISTINCT c2.governing_body_id
-                    FROM conferences c2
-                    JOIN meetings m ON c2.id = m.conference_id
-                ) m_gb ON gb.id = m_gb.governing_body_id
-            )
-            SELECT
-                total,
-                with_conferences,
-                with_meetings,
-                CASE
-                    WHEN total > 0
-                    THEN ROUND(CAST(with_meetings AS REAL) / total * 100, 2)
-                    ELSE 0.0
-                END as coverage_percentage
-            FROM stats
-        """)
+                    total_governing_bodies AS total,
+                    governing_bodies_with_conferences AS with_conferences,
+                    governing_bodies_with_meetings AS with_meetings,
+                    CASE
+                        WHEN total_governing_bodies > 0
+                        THEN ROUND(
+                            CAST(governing_bodies_with_meetings AS NUMERIC)
+                            / total_governing_bodies * 100, 2
+                        )
+                        ELSE 0.0
+                    END AS coverage_percentage
+                FROM mv_coverage_summary
+            """)
+        else:
+            query = text("""
+                WITH stats AS (
+                    SELECT
+                        COUNT(DISTINCT gb.id) as total,
+                        COUNT(DISTINCT c.governing_body_id) as with_conferences,
+                        COUNT(DISTINCT m_gb.governing_body_id) as with_meetings
+                    FROM governing_bodies gb
+                    LEFT JOIN conferences c ON gb.id = c.governing_body_id
+                    LEFT JOIN (
+                        SELECT DISTINCT c2.governing_body_id
+                        FROM conferences c2
+                        JOIN meetings m ON c2.id = m.conference_id
+                    ) m_gb ON gb.id = m_gb.governing_body_id
+                )
+                SELECT
+                    total,
+                    with_conferences,
+                    with_meetings,
+                    CASE
+                        WHEN total > 0
+                        THEN ROUND(CAST(with_meetings AS REAL) / total * 100, 2)
+                        ELSE 0.0
+                    END as coverage_percentage
+                FROM stats
+            """)
 
         result = await self.session.execute(query)
         row = result.fetchone()
@@ -128,36 +156,58 @@ class DataCoverageRepositoryImpl(IDataCoverageRepository):
         Returns:
             MeetingStats: Statistics about meetings
         """
-        # Main statistics query
-        stats_query = text("""
-            SELECT
-                COUNT(DISTINCT m.id) as total_meetings,
-                COUNT(DISTINCT mi.meeting_id) as with_minutes,
-                COUNT(DISTINCT mi.id) FILTER (
-                    WHERE c.id IS NOT NULL
-                ) as with_conversations,
-                CASE
-                    WHEN COUNT(DISTINCT m.id) > 0
-                    THEN ROUND(
-                        CAST(COUNT(c.id) AS REAL) / COUNT(DISTINCT m.id), 2
-                    )
-                    ELSE 0.0
-                END as avg_conversations
-            FROM meetings m
-            LEFT JOIN minutes mi ON m.id = mi.meeting_id
-            LEFT JOIN conversations c ON mi.id = c.minutes_id
-        """)
-
-        # Conference breakdown query
-        conference_query = text("""
-            SELECT
-                conf.name,
-                COUNT(DISTINCT m.id) as meeting_count
-            FROM conferences conf
-            LEFT JOIN meetings m ON conf.id = m.conference_id
-            GROUP BY conf.id, conf.name
-            ORDER BY meeting_count DESC
-        """)
+        if self.use_summary_views:
+            stats_query = text("""
+                SELECT
+                    total_meetings,
+                    meetings_with_minutes AS with_minutes,
+                    meetings_with_conversations AS with_conversations,
+                    CASE
+                        WHEN total_meetings > 0
+                        THEN ROUND(
+                            CAST(conversations_with_minutes AS NUMERIC)
+                            / total_meetings, 2
+                        )
+                        ELSE 0.0
+                    END AS avg_conversations
+                FROM mv_coverage_summary
+            """)
+            conference_query = text("""
+                SELECT conference_name AS name, meeting_count
+                FROM mv_conference_coverage
+                ORDER BY meeting_count DESC
+            """)
+        else:
+            # Main statistics query
+            stats_query = text("""
+                SELECT
+                    COUNT(DISTINCT m.id) as total_meetings,
+                    COUNT(DISTINCT mi.meeting_id) as with_minutes,
+                    COUNT(DISTINCT mi.id) FILTER (
+                        WHERE c.id IS NOT NULL
+                    ) as with_conversations,
+                    CASE
+                        WHEN COUNT(DISTINCT m.id) > 0
+                        THEN ROUND(
+                            CAST(COUNT(c.id) AS REAL) / COUNT(DISTINCT m.id), 2
+                        )
+                        ELSE 0.0
+                    END as avg_conversations
+                FROM meetings m
+                LEFT JOIN minutes mi ON m.id = mi.meeting_id
+                LEFT JOIN conversations c ON mi.id = c.minutes_id
+            """)
+
+            # Conference breakdown query
+            conference_query = text("""
+                SELECT
+                    conf.name,
+                    COUNT(DISTINCT m.id) as meeting_count
+                FROM conferences conf
+                LEFT JOIN meetings m ON conf.id = m.conference_id
+                GROUP BY conf.id, conf.name
+                ORDER BY meeting_count DESC
+            """)
 
         # Execute both queries
         stats_result = await self.session.execute(stats_query)
@@ -191,49 +241,76 @@ class DataCoverageRepositoryImpl(IDataCoverageRepository):
         Returns:
             SpeakerMatchingStats: Statistics about speaker-politician matching
         """
-        query = text("""
-            WITH speaker_stats AS (
+        if self.use_summary_views:
+            query = text("""
                 SELECT
-                    COUNT(DISTINCT s.id) as total_speakers,
-                    COUNT(DISTINCT CASE
-                        WHEN s.type IN ('politician', '政治家')
-                        THEN s.id
-                    END) as matched_speakers
-                FROM speakers s
-            ),
-            conversation_stats AS (
+                    total_speakers,
+                    matched_speakers,
+                    total_speakers - matched_speakers AS unmatched_speakers,
+                    CASE
+                        WHEN total_speakers > 0
+                        THEN ROUND(
+                            CAST(matched_speakers AS NUMERIC)
+                            / total_speakers * 100, 2
+                        )
+                        ELSE 0.0
+                    END AS matching_rate,
+                    total_conversations,
+                    linked_conversations,
+                    CASE
+                        WHEN total_conversations > 0
+                        THEN ROUND(
+                            CAST(linked_conversations AS NUMERIC)
+                            / total_conversations * 100, 2
+                        )
+                        ELSE 0.0
+                    END AS linkage_rate
+                FROM mv_coverage_summary
+            """)
+        else:
+            query = text("""
+                WITH speaker_stats AS (
+                    SELECT
+                        COUNT(DISTINCT s.id) as total_speakers,
+                        COUNT(DISTINCT CASE
+                            WHEN s.type IN ('politician', '政治家')
+                            THEN s.id
+                        END) as matched_speakers
+                    FROM speakers s
+                ),
+                conversation_stats AS (
+                    SELECT
+                        COUNT(DISTINCT c.id) as total_conversations,
+                        COUNT(DISTINCT CASE
+                            WHEN c.speaker_id IS NOT NULL
+                            THEN c.id
+                        END) as linked_conversations
+                    FROM conversations c
+                )
                 SELECT
-                    COUNT(DISTINCT c.id) as total_conversations,
-                    COUNT(DISTINCT CASE
-                        WHEN c.speaker_id IS NOT NULL
-                        THEN c.id
-                    END) as linked_conversations
-                FROM conversations c
-            )
-            SELECT
-                ss.total_speakers,
-                ss.matched_speakers,
-                ss.total_speakers - ss.matched_speakers as unmatched_speakers,
-                CASE
-                    WHEN ss.total_speakers > 0
-                    THEN ROUND(
-                        CAST(ss.matched_speakers AS REAL)
-                        / ss.total_speakers * 100, 2
-                    )
-                    ELSE 0.0
-                END as matching_rate,
-                cs.total_conversations,
-                cs.linked_conversations,
-                CASE
-                    WHEN cs.total_conversations > 0
-                    THEN ROUND(
-                        CAST(cs.linked_conversations AS REAL)
-                        / cs.total_conversations * 100, 2
-                    )
-                    ELSE 0.0
-                END as linkage_rate
-            FROM speaker_stats ss, conversation_stats cs
-        """)
+                    ss.total_speakers,
+                    ss.matched_speakers,
+                    ss.total_speakers - ss.matched_speakers as unmatched_speakers,
+                    CASE
+                        WHEN ss.total_speakers > 0
+                        THEN ROUND(
+                            CAST(ss.matched_speakers AS REAL)
+                            / ss.total_speakers * 100, 2
+                        )
+                        ELSE 0.0
+                    END as matching_rate,
+                    cs.total_conversations,
+                    cs.linked_conversations,
+                    CASE
+                        WHEN cs.total_conversations > 0
+                        THEN ROUND(
+                            CAST(cs.linked_conversations AS REAL)
+                            / cs.total_conversations * 100, 2
+                        )
+                        ELSE 0.0
+                    END as linkage_rate
+                FROM speaker_stats ss, conversation_stats cs
+            """)
 
         result = await self.session.execute(query)
         row = result.fetchone()
@@ -280,67 +357,84 @@ class DataCoverageRepositoryImpl(IDataCoverageRepository):
         if days <= 0 or days > 365:
             raise ValueError("Period must be between 1 and 365 days")
 
-        # Query with optimized date series and aggregations
-        # Use parameterized query to prevent SQL injection
-        query = text("""
-            WITH date_series AS (
-                SELECT generate_series(
+        if self.use_summary_views:
+            query = text("""
+                SELECT
+                    ds.day::date AS date,
+                    COALESCE(a.meetings_count, 0) AS meetings_count,
+                    COALESCE(a.conversations_count, 0) AS conversations_count,
+                    COALESCE(a.speakers_count, 0) AS speakers_count,
+                    COALESCE(a.politicians_count, 0) AS politicians_count
+                FROM generate_series(
                     CURRENT_DATE - :days * INTERVAL '1 day',
                     CURRENT_DATE,
                     '1 day'::interval
-                )::date as date
-            ),
-            daily_meetings AS (
-                SELECT
-                    DATE(date) as date,
-                    COUNT(*) as count
-                FROM meetings
-                WHERE date >= CURRENT_DATE - :days * INTERVAL '1 day'
-                    AND date <= CURRENT_DATE
-                GROUP BY DATE(date)
-            ),
-            daily_conversations AS (
-                SELECT
-                    DATE(m.date) as date,
-                    COUNT(c.id) as count
-                FROM conversations c
-                JOIN minutes mi ON c.minutes_id = mi.id
-                JOIN meetings m ON mi.meeting_id = m.id
-                WHERE m.date >= CURRENT_DATE - :days * INTERVAL '1 day'
-                    AND m.date <= CURRENT_DATE
-                GROUP BY DATE(m.date)
-            ),
-            daily_speakers AS (
-                SELECT
-                    DATE(created_at) as date,
-                    COUNT(*) as count
-                FROM speakers
-                WHERE created_at >= CURRENT_DATE - :days * INTERVAL '1 day'
-                    AND created_at <= CURRENT_DATE
-                GROUP BY DATE(created_at)
-            ),
-            daily_politicians AS (
+                ) AS ds(day)
+                LEFT JOIN mv_daily_activity a ON a.activity_date = ds.day::date
+                ORDER BY ds.day
+            """)
+        else:
+            # Query with optimized date series and aggregations
+            # Use parameterized query to prevent SQL injection
+            query = text("""
+                WITH date_series AS (
+                    SELECT generate_series(
+                        CURRENT_DATE - :days * INTERVAL '1 day',
+                        CURRENT_DATE,
+                        '1 day'::interval
+                    )::date as date
+                ),
+                daily_meetings AS (
+                    SELECT
+                        DATE(date) as date,
+                        COUNT(*) as count
+                    FROM meetings
+                    WHERE date >= CURRENT_DATE - :days * INTERVAL '1 day'
+                        AND date <= CURRENT_DATE
+                    GROUP BY DATE(date)
+                ),
+                daily_conversations AS (
+                    SELECT
+                        DATE(m.date) as date,
+                        COUNT(c.id) as count
+                    FROM conversations c
+                    JOIN minutes mi ON c.minutes_id = mi.id
+                    JOIN meetings m ON mi.meeting_id = m.id
+                    WHERE m.date >= CURRENT_DATE - :days * INTERVAL '1 day'
+                        AND m.date <= CURRENT_DATE
+                    GROUP BY DATE(m.date)
+                ),
+                daily_speakers AS (
+                    SELECT
+                        DATE(created_at) as date,
+                        COUNT(*) as count
+                    FROM speakers
+                    WHERE created_at >= CURRENT_DATE - :days * INTERVAL '1 day'
+                        AND created_at <= CURRENT_DATE
+                    GROUP BY DATE(created_at)
+                ),
+                daily_politicians AS (
+                    SELECT
+                        DATE(created_at) as date,
+                        COUNT(*) as count
+                    FROM politicians
+                    WHERE created_at >= CURRENT_DATE - :days * INTERVAL '1 day'
+                        AND created_at <= CURRENT_DATE
+                    GROUP BY DATE(created_at)
+                )
                 SELECT
-                    DATE(created_at) as date,
-                    COUNT(*) as count
-                FROM politicians
-                WHERE created_at >= CURRENT_DATE - :days * INTERVAL '1 day'
-                    AND created_at <= CURRENT_DATE
-                GROUP BY DATE(created_at)
-            )
-            SELECT
-                ds.date,
-                COALESCE(dm.count, 0) as meetings_count,
-                COALESCE(dc.count, 0) as conversations_count,
-                COALESCE(dsp.count, 0) as speakers_count,
-                COALESCE(dp.count, 0) as politicians_count
-            FROM date_series ds
-            LEFT JOIN daily_meetings dm ON ds.date = dm.date
-            LEFT JOIN daily_conversations dc ON ds.date = dc.date
-            LEFT JOIN daily_speakers dsp ON ds.date = dsp.date
-            LEFT JOIN daily_politicians dp ON ds.date = dp.date
-            ORDER BY ds.date
-        """)
+                    ds.date,
+                    COALESCE(dm.count, 0) as meetings_count,
+                    COALESCE(dc.count, 0) as conversations_count,
+                    COALESCE(dsp.count, 0) as speakers_count,
+                    COALESCE(dp.count, 0) as politicians_count
+                FROM date_series ds
+                LEFT JOIN daily_meetings dm ON ds.date = dm.date
+                LEFT JOIN daily_conversations dc ON ds.date = dc.date
+                LEFT JOIN daily_speakers dsp ON ds.date = dsp.date
+                LEFT JOIN daily_politicians dp ON ds.date = dp.date
+                ORDER BY ds.date
+            """)
 
         result = await self.session.execute(query, {"days": days})
         rows = result.fetchall()
@@ -358,3 +452,46 @@ class DataCoverageRepositoryImpl(IDataCoverageRepository):
             )
 
         return activity_data
+
+    async def refresh_statistics(self, min_interval_seconds: float = 0) -> bool:
+        """Recompute the statistics materialized views.
+
+        The views are refreshed concurrently, so dashboards keep reading the
+        previous numbers while the refresh runs. A refresh already running
+        in another session makes this call a no-op.
+
+        Args:
+            min_interval_seconds: Skip the refresh when the views are younger
+                than this many seconds
+
+        Returns:
+            bool: True if the views were refreshed
+        """
+        if not self.use_summary_views:
+            return False
+
+        result = await self.session.execute(
+            text(
+                "SELECT refresh_statistics_views("
+                "make_interval(secs => :min_interval_seconds))"
+            ),
+            {"min_interval_seconds": min_interval_seconds},
+        )
+        refreshed = bool(result.scalar())
+        await self.session.commit()
+        return refreshed
+
+    async def get_statistics_refreshed_at(self) -> datetime | None:
+        """Get the time the statistics materialized views were refreshed.
+
+        Returns:
+            datetime | None: Refresh time, or None when the statistics are
+                aggregated on every call
+        """
+        if not self.use_summary_views:
+            return None
+
+        result = await self.session.execute(
+            text("SELECT refreshed_at FROM mv_coverage_summary")
+        )
+        return result.scalar()
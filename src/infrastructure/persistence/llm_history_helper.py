@@ -4,9 +4,10 @@ import json
 import logging
 from datetime import UTC, datetime
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
+from src.infrastructure.config.engine_registry import get_engine_registry
 from src.infrastructure.config.settings import settings
 
 logger = logging.getLogger(__name__)
@@ -17,9 +18,9 @@ class SyncLLMHistoryHelper:
 
     def __init__(self):
         """Initialize helper with sync database engine."""
-        # Create sync engine for history recording
+        # Use the shared sync engine for history recording
         database_url = settings.get_database_url()
-        self.engine = create_engine(database_url, echo=False)
+        self.engine = get_engine_registry().get_engine(database_url)
         self.session_maker = sessionmaker(self.engine, expire_on_commit=False)
 
     def record_speaker_matching(
@@ -192,8 +193,11 @@ class SyncLLMHistoryHelper:
             session.close()
 
     def close(self) -> None:
-        """Close the sync engine."""
-        self.engine.dispose()
+        """Release helper resources.
+
+        The engine is shared through the registry and outlives the helper,
+        so there is nothing to dispose here.
+        """
 
     def __enter__(self) -> "SyncLLMHistoryHelper":
         """Context manager entry."""
@@ -56,6 +56,25 @@ class LLMProcessingHistoryRepositoryImpl(
     def __init__(self, session: AsyncSession | ISessionAdapter):
         super().__init__(session, LLMProcessingHistory, LLMProcessingHistoryModel)
 
+    async def bulk_create(
+        self, histories: list[LLMProcessingHistory]
+    ) -> list[LLMProcessingHistory]:
+        """Create multiple history records in a single round trip.
+
+        IDs assigned on flush are copied back onto the given entities instead
+        of refreshing each row.
+        """
+        if not histories:
+            return []
+
+        models = [self._to_model(history) for history in histories]
+        self.session.add_all(models)
+        await self.session.flush()
+
+        for history, model in zip(histories, models, strict=True):
+            history.id = model.id
+        return histories
+
     async def get_by_processing_type(
         self,
         processing_type: ProcessingType,
@@ -210,6 +210,18 @@ class LLMServiceAdapter:
         """
         return self._llm_service.invoke_with_retry(chain, inputs)
 
+    async def ainvoke_with_retry(self, chain: Any, inputs: dict[str, Any]) -> Any:
+        """Invoke an LLM chain asynchronously with retry logic.
+
+        Args:
+            chain: LangChain runnable to invoke
+            inputs: Input dictionary for the chain
+
+        Returns:
+            Result from the chain invocation
+        """
+        return await self._llm_service.ainvoke_with_retry(chain, inputs)
+
     def invoke_llm(self, messages: list[dict[str, str]]) -> str:
         """Invoke the LLM with messages and return the response content.
 
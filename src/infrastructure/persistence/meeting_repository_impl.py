@@ -10,12 +10,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.domain.entities.meeting import Meeting
+from src.domain.pagination import Cursor, CursorPage
 from src.domain.repositories.meeting_repository import MeetingRepository
 from src.domain.repositories.session_adapter import ISessionAdapter
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 
 logger = logging.getLogger(__name__)
 
+# Sort key of keyset-paginated meeting listings; undated meetings sort last
+MEETING_SORT_DATE = "COALESCE(m.date, '-infinity'::date)"
+
 
 class MeetingRepositoryImpl(BaseRepositoryImpl[Meeting], MeetingRepository):
     """Meeting repository implementation.
@@ -395,6 +399,76 @@ class MeetingRepositoryImpl(BaseRepositoryImpl[Meeting], MeetingRepository):
                 return meetings, total_count
             return [], 0
 
+    async def get_meetings_page(
+        self,
+        conference_id: int | None = None,
+        governing_body_id: int | None = None,
+        limit: int = 10,
+        cursor: str | None = None,
+    ) -> CursorPage[dict[str, Any]]:
+        """Get meetings with keyset pagination ordered by (date, id) descending.
+
+        Meetings without a date sort last (as '-infinity') so the row
+        comparison against the cursor never meets a NULL. The ordering matches
+        the expression indexes from migration 039.
+        """
+        sql = """
+        SELECT
+            m.id,
+            m.conference_id,
+            m.date,
+            m.url,
+            m.name,
+            m.gcs_pdf_uri,
+            m.gcs_text_uri,
+            m.created_at,
+            m.updated_at,
+            c.name AS conference_name,
+            gb.name AS governing_body_name,
+            gb.type AS governing_body_type
+        FROM meetings m
+        JOIN conferences c ON m.conference_id = c.id
+        JOIN governing_bodies gb ON c.governing_body_id = gb.id
+        WHERE 1=1
+        """
+        params: dict[str, Any] = {"limit": limit + 1}
+
+        if conference_id:
+            sql += " AND m.conference_id = :conference_id"
+            params["conference_id"] = conference_id
+        if governing_body_id:
+            sql += " AND gb.id = :governing_body_id"
+            params["governing_body_id"] = governing_body_id
+        if cursor:
+            position = Cursor.decode(cursor)
+            sql += (
+                f" AND ({MEETING_SORT_DATE}, m.id)"
+                " < (CAST(:cursor_date AS DATE), :cursor_id)"
+            )
+            params["cursor_date"] = position.sort_value
+            params["cursor_id"] = position.id
+
+        # Fetch one extra row to learn whether another page follows
+        sql += f" ORDER BY {MEETING_SORT_DATE} DESC, m.id DESC LIMIT :limit"
+
+        async_executor = self._get_async_executor()
+        if async_executor:
+            result = await async_executor.execute(text(sql), params)
+        elif self.sync_session:
+            result = self.sync_session.execute(text(sql), params)
+        else:
+            return CursorPage(items=[], limit=limit)
+        meetings = [dict(row._mapping) for row in result]  # type: ignore
+
+        next_cursor = None
+        if len(meetings) > limit:
+            meetings = meetings[:limit]
+            last = meetings[-1]
+            sort_value = last["date"].isoformat() if last["date"] else "-infinity"
+            next_cursor = Cursor(id=last["id"], sort_value=sort_value).encode()
+
+        return CursorPage(items=meetings, next_cursor=next_cursor, limit=limit)
+
     async def get_meeting_by_id_with_info(
         self, meeting_id: int
     ) -> dict[str, Any] | None:
@@ -90,41 +90,72 @@ class CommitteeType(TypedDict):
 
 
 class MonitoringRepositoryImpl:
-    """Implementation of monitoring repository using AsyncSession."""
-
-    def __init__(self, session: AsyncSession | ISessionAdapter):
+    """Implementation of monitoring repository using AsyncSession.
+
+    Overall metrics, conference, prefecture and timeline statistics are read
+    from the materialized views created in migration 040 unless
+    ``use_summary_views`` is False.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession | ISessionAdapter,
+        use_summary_views: bool = True,
+    ):
         self.session = session
+        self.use_summary_views = use_summary_views
 
     async def get_overall_metrics(self) -> dict[str, Any]:
         """Get overall system metrics."""
-        query = text("""
-            WITH metrics AS (
+        if self.use_summary_views:
+            query = text("""
                 SELECT
-                    (SELECT COUNT(*) FROM governing_bodies) as total_governing_bodies,
-                    (SELECT COUNT(DISTINCT governing_body_id) FROM conferences)
-                        as active_governing_bodies,
-                    (SELECT COUNT(*) FROM conferences) as total_conferences,
-                    (SELECT COUNT(DISTINCT conference_id) FROM meetings)
-                        as active_conferences,
-                    (SELECT COUNT(*) FROM meetings) as total_meetings,
-                    (SELECT COUNT(*) FROM politicians) as total_politicians,
-                    (SELECT COUNT(DISTINCT p.id)
-                     FROM politicians p
-                     JOIN politician_affiliations pa ON p.id = pa.politician_id)
-                        as active_politicians,
-                    (SELECT COUNT(*) FROM political_parties) as total_parties,
-                    (SELECT COUNT(DISTINCT political_party_id) FROM politicians
-                     WHERE political_party_id IS NOT NULL) as active_parties,
-                    (SELECT COUNT(*) FROM conversations) as total_conversations,
-                    (SELECT COUNT(DISTINCT speaker_id) FROM conversations
-                     WHERE speaker_id IS NOT NULL) as linked_conversations,
-                    (SELECT COUNT(*) FROM speakers) as total_speakers,
-                    (SELECT COUNT(*) FROM speakers
-                     WHERE type = 'politician' OR type = '政治家')
-                        as linked_speakers
-            )
-            SELECT * FROM metrics
-        """)
+                    total_governing_bodies,
+                    governing_bodies_with_conferences AS active_governing_bodies,
+                    total_conferences,
+                    active_conferences,
+                    total_meetings,
+                    total_politicians,
+                    active_politicians,
+                    total_parties,
+                    active_parties,
+                    total_conversations,
+                    linked_conversations,
+                    total_speakers,
+                    matched_speakers AS linked_speakers,
+                    refreshed_at
+                FROM mv_coverage_summary
+            """)
+        else:
+            query = text("""
+                WITH metrics AS (
+                    SELECT
+                        (SELECT COUNT(*) FROM governing_bodies)
+                            as total_governing_bodies,
+                        (SELECT COUNT(DISTINCT governing_body_id) FROM conferences)
+                            as active_governing_bodies,
+                        (SELECT COUNT(*) FROM conferences) as total_conferences,
+                        (SELECT COUNT(DISTINCT conference_id) FROM meetings)
+                            as active_conferences,
+                        (SELECT COUNT(*) FROM meetings) as total_meetings,
+                        (SELECT COUNT(*) FROM politicians) as total_politicians,
+                        (SELECT COUNT(DISTINCT p.id)
+                         FROM politicians p
+                         JOIN politician_affiliations pa ON p.id = pa.politician_id)
+                            as active_politicians,
+                        (SELECT COUNT(*) FROM political_parties) as total_parties,
+                        (SELECT COUNT(DISTINCT political_party_id) FROM politicians
+                         WHERE political_party_id IS NOT NULL) as active_parties,
+                        (SELECT COUNT(*) FROM conversations) as total_conversations,
+                        (SELECT COUNT(*) FROM conversations
+                         WHERE speaker_id IS NOT NULL) as linked_conversations,
+                        (SELECT COUNT(*) FROM speakers) as total_speakers,
+                        (SELECT COUNT(*) FROM speakers
+                         WHERE type = 'politician' OR type = '政治家')
+                            as linked_speakers
+                )
+                SELECT * FROM metrics
+            """)
 
         result = await self.session.execute(query)
         row = result.fetchone()
@@ -138,8 +169,10 @@ class MonitoringRepositoryImpl:
                 "parties": {"total": 0, "active": 0, "coverage": 0.0},
                 "conversations": {"total": 0, "linked": 0, "linkage_rate": 0.0},
                 "speakers": {"total": 0, "linked": 0, "linkage_rate": 0.0},
+                "refreshed_at": None,
             }
 
+        refreshed_at = getattr(row, "refreshed_at", None)
         return {
             "governing_bodies": {
                 "total": row.total_governing_bodies,
@@ -196,6 +229,7 @@ class MonitoringRepositoryImpl:
                     else 0.0
                 ),
             },
+            "refreshed_at": refreshed_at.isoformat() if refreshed_at else None,
         }
 
     async def get_recent_activities(self, limit: int = 10) -> list[Activity]:
@@ -272,24 +306,39 @@ class MonitoringRepositoryImpl:
 
     async def get_conference_coverage(self) -> list[ConferenceCoverage]:
         """Get coverage statistics by conference."""
-        query = text("""
-            SELECT
-                c.id,
-                c.name,
-                gb.name as governing_body_name,
-                COUNT(DISTINCT m.id) as meeting_count,
-                COUNT(DISTINCT pa.politician_id) as politician_count,
-                COUNT(DISTINCT conv.id) as conversation_count,
-                MIN(m.date) as first_meeting_date,
-                MAX(m.date) as last_meeting_date
-            FROM conferences c
-            JOIN governing_bodies gb ON c.governing_body_id = gb.id
-            LEFT JOIN meetings m ON c.id = m.conference_id
-            LEFT JOIN politician_affiliations pa ON c.id = pa.conference_id
-            LEFT JOIN conversations conv ON m.id = conv.meeting_id
-            GROUP BY c.id, c.name, gb.name
-            ORDER BY meeting_count DESC
-        """)
+        if self.use_summary_views:
+            query = text("""
+                SELECT
+                    conference_id AS id,
+                    conference_name AS name,
+                    governing_body_name,
+                    meeting_count,
+                    politician_count,
+                    conversation_count,
+                    first_meeting_date,
+                    last_meeting_date
+                FROM mv_conference_coverage
+                ORDER BY meeting_count DESC
+            """)
+        else:
+            query = text("""
+                SELECT
+                    c.id,
+                    c.name,
+                    gb.name as governing_body_name,
+                    COUNT(DISTINCT m.id) as meeting_count,
+                    COUNT(DISTINCT pa.politician_id) as politician_count,
+                    COUNT(DISTINCT conv.id) as conversation_count,
+                    MIN(m.date) as first_meeting_date,
+                    MAX(m.date) as last_meeting_date
+                FROM conferences c
+                JOIN governing_bodies gb ON c.governing_body_id = gb.id
+                LEFT JOIN meetings m ON c.id = m.conference_id
+                LEFT JOIN politician_affiliations pa ON c.id = pa.conference_id
+                LEFT JOIN conversations conv ON m.id = conv.meeting_id
+                GROUP BY c.id, c.name, gb.name
+                ORDER BY meeting_count DESC
+            """)
 
         result = await self.session.execute(query)
         coverage_data: list[ConferenceCoverage] = []
@@ -324,99 +373,70 @@ class MonitoringRepositoryImpl:
         self, period_days: int = 30
     ) -> dict[str, list[TimelineEntry]]:
         """Get timeline data for various metrics."""
-        query = text("""
-            WITH date_series AS (
-                SELECT generate_series(
-                    CURRENT_DATE - INTERVAL ':days days',
-                    CURRENT_DATE,
-                    '1 day'::interval
-                )::date as date
-            ),
-            daily_meetings AS (
-                SELECT
-                    DATE(date) as date,
-                    COUNT(*) as count
-                FROM meetings
-                WHERE date >= CURRENT_DATE - INTERVAL ':days days'
-                GROUP BY DATE(date)
-            ),
-            daily_conversations AS (
+        if self.use_summary_views:
+            query = text("""
                 SELECT
-                    DATE(m.date) as date,
-                    COUNT(c.id) as count
-                FROM conversations c
-                JOIN meetings m ON c.meeting_id = m.id
-                WHERE m.date >= CURRENT_DATE - INTERVAL ':days days'
-                GROUP BY DATE(m.date)
-            ),
-            daily_politicians AS (
-                SELECT
-                    DATE(created_at) as date,
-                    COUNT(*) as count
-                FROM politicians
-                WHERE created_at >= CURRENT_DATE - INTERVAL ':days days'
-                GROUP BY DATE(created_at)
-            )
-            SELECT
-                ds.date,
-                COALESCE(dm.count, 0) as meeting_count,
-                COALESCE(dc.count, 0) as conversation_count,
-                COALESCE(dp.count, 0) as politician_count
-            FROM date_series ds
-            LEFT JOIN daily_meetings dm ON ds.date = dm.date
-            LEFT JOIN daily_conversations dc ON ds.date = dc.date
-            LEFT JOIN daily_politicians dp ON ds.date = dp.date
-            ORDER BY ds.date
-        """)
-
-        # Note: PostgreSQL doesn't support named parameters in INTERVAL expressions
-        # We need to use a different approach
-        query = text(f"""
-            WITH date_series AS (
-                SELECT generate_series(
-                    CURRENT_DATE - INTERVAL '{period_days} days',
+                    ds.day::date AS date,
+                    COALESCE(a.meetings_count, 0) AS meeting_count,
+                    COALESCE(a.conversations_count, 0) AS conversation_count,
+                    COALESCE(a.politicians_count, 0) AS politician_count
+                FROM generate_series(
+                    CURRENT_DATE - :days * INTERVAL '1 day',
                     CURRENT_DATE,
                     '1 day'::interval
-                )::date as date
-            ),
-            daily_meetings AS (
-                SELECT
-                    DATE(date) as date,
-                    COUNT(*) as count
-                FROM meetings
-                WHERE date >= CURRENT_DATE - INTERVAL '{period_days} days'
-                GROUP BY DATE(date)
-            ),
-            daily_conversations AS (
-                SELECT
-                    DATE(m.date) as date,
-                    COUNT(c.id) as count
-                FROM conversations c
-                JOIN meetings m ON c.meeting_id = m.id
-                WHERE m.date >= CURRENT_DATE - INTERVAL '{period_days} days'
-                GROUP BY DATE(m.date)
-            ),
-            daily_politicians AS (
+                ) AS ds(day)
+                LEFT JOIN mv_daily_activity a ON a.activity_date = ds.day::date
+                ORDER BY ds.day
+            """)
+        else:
+            # Note: PostgreSQL doesn't support named parameters in INTERVAL
+            # expressions. We need to use a different approach
+            query = text(f"""
+                WITH date_series AS (
+                    SELECT generate_series(
+                        CURRENT_DATE - INTERVAL '{period_days} days',
+                        CURRENT_DATE,
+                        '1 day'::interval
+                    )::date as date
+                ),
+                daily_meetings AS (
+                    SELECT
+                        DATE(date) as date,
+                        COUNT(*) as count
+                    FROM meetings
+                    WHERE date >= CURRENT_DATE - INTERVAL '{period_days} days'
+                    GROUP BY DATE(date)
+                ),
+                daily_conversations AS (
+                    SELECT
+                        DATE(m.date) as date,
+                        COUNT(c.id) as count
+                    FROM conversations c
+                    JOIN meetings m ON c.meeting_id = m.id
+                    WHERE m.date >= CURRENT_DATE - INTERVAL '{period_days} days'
+                    GROUP BY DATE(m.date)
+                ),
+                daily_politicians AS (
+                    SELECT
+                        DATE(created_at) as date,
+                        COUNT(*) as count
+                    FROM politicians
+                    WHERE created_at >= CURRENT_DATE - INTERVAL '{period_days} days'
+                    GROUP BY DATE(created_at)
+                )
                 SELECT
-                    DATE(created_at) as date,
-                    COUNT(*) as count
-                FROM politicians
-                WHERE created_at >= CURRENT_DATE - INTERVAL '{period_days} days'
-                GROUP BY DATE(created_at)
-            )
-            SELECT
-                ds.date,
-                COALESCE(dm.count, 0) as meeting_count,
-                COALESCE(dc.count, 0) as conversation_count,
-                COALESCE(dp.count, 0) as politician_count
-            FROM date_series ds
-            LEFT JOIN daily_meetings dm ON ds.date = dm.date
-            LEFT JOIN daily_conversations dc ON ds.date = dc.date
-            LEFT JOIN daily_politicians dp ON ds.date = dp.date
-            ORDER BY ds.date
-        """)
-
-        result = await self.session.execute(query)
+                    ds.date,
+                    COALESCE(dm.count, 0) as meeting_count,
+                    COALESCE(dc.count, 0) as conversation_count,
+                    COALESCE(dp.count, 0) as politician_count
+                FROM date_series ds
+                LEFT JOIN daily_meetings dm ON ds.date = dm.date
+                LEFT JOIN daily_conversations dc ON ds.date = dc.date
+                LEFT JOIN daily_politicians dp ON ds.date = dp.date
+                ORDER BY ds.date
+            """)
+
+        result = await self.session.execute(query, {"days": period_days})
 
         meetings_timeline: list[TimelineEntry] = []
         conversations_timeline: list[TimelineEntry] = []
@@ -473,39 +493,63 @@ class MonitoringRepositoryImpl:
 
     async def get_prefecture_detailed_coverage(self) -> list[PrefectureCoverage]:
         """Get detailed coverage statistics by prefecture."""
-        query = text("""
-            WITH prefecture_stats AS (
+        if self.use_summary_views:
+            query = text("""
                 SELECT
-                    gb.id,
-                    gb.name,
-                    gb.type,
-                    gb.organization_code,
-                    gb.organization_type,
-                    COUNT(DISTINCT c.id) as conference_count,
-                    COUNT(DISTINCT m.id) as meeting_count,
-                    COUNT(DISTINCT pa.politician_id) as politician_count,
-                    COUNT(DISTINCT conv.id) as conversation_count,
-                    MIN(m.date) as first_meeting_date,
-                    MAX(m.date) as last_meeting_date
-                FROM governing_bodies gb
-                LEFT JOIN conferences c ON gb.id = c.governing_body_id
-                LEFT JOIN meetings m ON c.id = m.conference_id
-                LEFT JOIN politician_affiliations pa ON c.id = pa.conference_id
-                LEFT JOIN conversations conv ON m.id = conv.meeting_id
-                WHERE gb.type IN ('都道府県', '市町村')
-                GROUP BY gb.id, gb.name, gb.type,
-                    gb.organization_code, gb.organization_type
-            )
-            SELECT
-                ps.*,
-                CASE
-                    WHEN ps.meeting_count > 0 THEN 'active'
-                    WHEN ps.conference_count > 0 THEN 'partial'
-                    ELSE 'inactive'
-                END as status
-            FROM prefecture_stats ps
-            ORDER BY ps.type, ps.name
-        """)
+                    governing_body_id AS id,
+                    name,
+                    type,
+                    organization_code,
+                    organization_type,
+                    conference_count,
+                    meeting_count,
+                    politician_count,
+                    conversation_count,
+                    first_meeting_date,
+                    last_meeting_date,
+                    CASE
+                        WHEN meeting_count > 0 THEN 'active'
+                        WHEN conference_count > 0 THEN 'partial'
+                        ELSE 'inactive'
+                    END as status
+                FROM mv_governing_body_coverage
+                WHERE type IN ('都道府県', '市町村')
+                ORDER BY type, name
+            """)
+        else:
+            query = text("""
+                WITH prefecture_stats AS (
+                    SELECT
+                        gb.id,
+                        gb.name,
+                        gb.type,
+                        gb.organization_code,
+                        gb.organization_type,
+                        COUNT(DISTINCT c.id) as conference_count,
+                        COUNT(DISTINCT m.id) as meeting_count,
+                        COUNT(DISTINCT pa.politician_id) as politician_count,
+                        COUNT(DISTINCT conv.id) as conversation_count,
+                        MIN(m.date) as first_meeting_date,
+                        MAX(m.date) as last_meeting_date
+                    FROM governing_bodies gb
+                    LEFT JOIN conferences c ON gb.id = c.governing_body_id
+                    LEFT JOIN meetings m ON c.id = m.conference_id
+                    LEFT JOIN politician_affiliations pa ON c.id = pa.conference_id
+                    LEFT JOIN conversations conv ON m.id = conv.meeting_id
+                    WHERE gb.type IN ('都道府県', '市町村')
+                    GROUP BY gb.id, gb.name, gb.type,
+                        gb.organization_code, gb.organization_type
+                )
+                SELECT
+                    ps.*,
+                    CASE
+                        WHEN ps.meeting_count > 0 THEN 'active'
+                        WHEN ps.conference_count > 0 THEN 'partial'
+                        ELSE 'inactive'
+                    END as status
+                FROM prefecture_stats ps
+                ORDER BY ps.type, ps.name
+            """)
 
         result = await self.session.execute(query)
         coverage_data: list[PrefectureCoverage] = []
@@ -542,27 +586,42 @@ class MonitoringRepositoryImpl:
 
     async def get_prefecture_coverage(self) -> dict[str, Any]:
         """Get summary of prefecture coverage."""
-        query = text("""
-            WITH coverage AS (
+        if self.use_summary_views:
+            query = text("""
                 SELECT
-                    gb.type,
-                    COUNT(DISTINCT gb.id) as total,
-                    COUNT(DISTINCT CASE
-                        WHEN m.id IS NOT NULL THEN gb.id END) as with_data
-                FROM governing_bodies gb
-                LEFT JOIN conferences c ON gb.id = c.governing_body_id
-                LEFT JOIN meetings m ON c.id = m.conference_id
-                WHERE gb.type IN ('都道府県', '市町村')
-                GROUP BY gb.type
-            )
-            SELECT
-                type,
-                total,
-                with_data,
-                ROUND(CAST(with_data AS REAL) / total * 100, 2)
-                    as coverage_percentage
-            FROM coverage
-        """)
+                    type,
+                    COUNT(*) as total,
+                    COUNT(*) FILTER (WHERE meeting_count > 0) as with_data,
+                    ROUND(
+                        CAST(COUNT(*) FILTER (WHERE meeting_count > 0) AS NUMERIC)
+                        / COUNT(*) * 100, 2
+                    ) as coverage_percentage
+                FROM mv_governing_body_coverage
+                WHERE type IN ('都道府県', '市町村')
+                GROUP BY type
+            """)
+        else:
+            query = text("""
+                WITH coverage AS (
+                    SELECT
+                        gb.type,
+                        COUNT(DISTINCT gb.id) as total,
+                        COUNT(DISTINCT CASE
+                            WHEN m.id IS NOT NULL THEN gb.id END) as with_data
+                    FROM governing_bodies gb
+                    LEFT JOIN conferences c ON gb.id = c.governing_body_id
+                    LEFT JOIN meetings m ON c.id = m.conference_id
+                    WHERE gb.type IN ('都道府県', '市町村')
+                    GROUP BY gb.type
+                )
+                SELECT
+                    type,
+                    total,
+                    with_data,
+                    ROUND(CAST(with_data AS REAL) / total * 100, 2)
+                        as coverage_percentage
+                FROM coverage
+            """)
 
         result = await self.session.execute(query)
         summary: dict[str, Any] = {"prefectures": {}, "municipalities": {}}
@@ -15,6 +15,18 @@ from src.infrastructure.persistence.base_repository_impl import BaseRepositoryIm
 
 logger = logging.getLogger(__name__)
 
+# Columns read by _row_to_entity; lookups used for matching select only these
+POLITICIAN_ENTITY_COLUMNS = (
+    "id, name, political_party_id, furigana, electoral_district, profile_url"
+)
+
+# Substring name search used by search_by_name
+POLITICIAN_NAME_SEARCH_QUERY = f"""
+SELECT {POLITICIAN_ENTITY_COLUMNS} FROM politicians
+WHERE name ILIKE :pattern
+ORDER BY similarity(name, :name) DESC, name
+"""
+
 
 class PoliticianModel:
     """Politician database model (dynamic)."""
@@ -56,7 +68,7 @@ class PoliticianRepositoryImpl(BaseRepositoryImpl[Politician], PoliticianReposit
             params["party_id"] = political_party_id
 
         query = text(f"""
-            SELECT * FROM politicians
+            SELECT {POLITICIAN_ENTITY_COLUMNS} FROM politicians
             WHERE {" AND ".join(conditions)}
             LIMIT 1
         """)
@@ -76,13 +88,14 @@ class PoliticianRepositoryImpl(BaseRepositoryImpl[Politician], PoliticianReposit
         return [self._row_to_entity(row) for row in rows]
 
     async def search_by_name(self, name_pattern: str) -> list[Politician]:
-        """Search politicians by name pattern."""
-        query = text("""
-            SELECT * FROM politicians
-            WHERE name ILIKE :pattern
-            ORDER BY name
-        """)
-        result = await self.session.execute(query, {"pattern": f"%{name_pattern}%"})
+        """Search politicians by name pattern, most similar names first.
+
+        The ILIKE filter is served by the pg_trgm index on name.
+        """
+        result = await self.session.execute(
+            text(POLITICIAN_NAME_SEARCH_QUERY),
+            {"pattern": f"%{name_pattern}%", "name": name_pattern},
+        )
         rows = result.fetchall()
         return [self._row_to_entity(row) for row in rows]
 
@@ -124,16 +137,13 @@ class PoliticianRepositoryImpl(BaseRepositoryImpl[Politician], PoliticianReposit
                 if existing:
                     # Update if needed
                     needs_update = False
-                    for field in [
-                        "prefecture",
-                        "electoral_district",
-                        "profile_url",
-                        "party_position",
+                    for column, field in [
+                        ("electoral_district", "district"),
+                        ("profile_url", "profile_page_url"),
+                        ("party_position", "party_position"),
                     ]:
-                        if field in data and data[field] != getattr(
-                            existing, field, None
-                        ):
-                            setattr(existing, field, data[field])
+                        if column in data and data[column] != getattr(existing, field):
+                            setattr(existing, field, data[column])
                             needs_update = True
 
                     if needs_update:
@@ -16,17 +16,18 @@ Usage Examples:
         # Both commit together, or rollback on error
 """
 
-import asyncio
 import logging
 import types
 from collections.abc import Coroutine
 from contextlib import asynccontextmanager
 from typing import Any, TypeVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
 from src.infrastructure.config.database import DATABASE_URL
+from src.infrastructure.config.engine_registry import get_engine_registry
+from src.infrastructure.persistence.async_bridge import run_sync
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
@@ -51,56 +52,24 @@ class RepositoryAdapter:
             sync_session: Optional sync session (for context)
         """
         self.async_repository_class = async_repository_class
-        self._async_engine = None
-        self._async_session_factory = None
         self._shared_session: AsyncSession | None = None
 
-    def get_async_session_factory(self):
-        """Get or create an async session factory."""
-        if self._async_session_factory is None:
-            # Convert sync database URL to async
-            db_url = DATABASE_URL
-            if db_url.startswith("postgresql://"):
-                async_db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-            elif db_url.startswith("postgresql+psycopg2://"):
-                async_db_url = db_url.replace(
-                    "postgresql+psycopg2://", "postgresql+asyncpg://"
-                )
-            else:
-                async_db_url = db_url
+    def get_async_session_factory(self) -> async_sessionmaker[AsyncSession]:
+        """Get the session factory of the shared engine for the running loop.
 
-            self._async_engine = create_async_engine(async_db_url, echo=False)
-            self._async_session_factory = async_sessionmaker(
-                self._async_engine, expire_on_commit=False
-            )
-        return self._async_session_factory
+        Engines come from the process-wide registry, so every adapter shares
+        one connection pool per event loop.
+        """
+        return get_engine_registry().get_async_session_factory(DATABASE_URL)
 
     def _run_async(self, coro: Coroutine[Any, Any, T]) -> T:
-        """Run an async coroutine from sync context."""
-        import nest_asyncio
-
-        nest_asyncio.apply()
+        """Run an async coroutine from sync context.
 
+        The coroutine runs on the process-wide bridge loop, so every call
+        reuses the same loop and therefore the same connection pool.
+        """
         try:
-            # Get or create event loop
-            try:
-                loop = asyncio.get_event_loop()
-                # Check if the loop is closed and create a new one if needed
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Run the coroutine in the current loop
-            if loop.is_running():
-                # If loop is already running, create a task and wait for it
-                task = loop.create_task(coro)
-                return loop.run_until_complete(task)
-            else:
-                # If loop is not running, run normally
-                return loop.run_until_complete(coro)
+            return run_sync(coro)
         except Exception as e:
             logger.error(f"Failed to run async operation: {e}")
             raise
@@ -210,11 +179,12 @@ class RepositoryAdapter:
         return sync_or_async_wrapper
 
     def close(self):
-        """Close the async engine if it exists."""
-        if self._async_engine:
-            asyncio.run(self._async_engine.dispose())
-            self._async_engine = None
-            self._async_session_factory = None
+        """Release adapter resources.
+
+        The engine is shared through the registry and outlives the adapter,
+        so there is nothing to dispose here.
+        """
+        self._shared_session = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -0,0 +1,48 @@
+"""Positional row-to-entity mappers.
+
+Bulk read queries select a fixed column list in the entity constructor's
+parameter order, so ``make_row_mapper`` builds a function that passes a
+row's values straight through as positional arguments instead of looking
+every column up by name on every row.
+
+The query must select exactly the given columns in the given order.
+"""
+
+import inspect
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+
+def make_row_mapper[T](
+    entity_class: type[T],
+    columns: Sequence[str],
+    field_names: Mapping[str, str] | None = None,
+) -> Callable[[Sequence[Any]], T]:
+    """Build a function that turns a result row into an entity.
+
+    Args:
+        entity_class: Entity to construct
+        columns: Selected columns, in select-list order
+        field_names: Constructor argument for columns whose name differs
+
+    Returns:
+        Function taking a row (any sequence) and returning an entity
+
+    Raises:
+        ValueError: If the columns are not the leading constructor arguments
+            in constructor order
+    """
+    field_names = field_names or {}
+    fields = [field_names.get(column, column) for column in columns]
+    parameters = list(inspect.signature(entity_class).parameters)
+    if fields != parameters[: len(fields)]:
+        raise ValueError(
+            f"Columns {list(columns)} must map to the leading constructor "
+            f"arguments of {entity_class.__name__} in order: "
+            f"{parameters[: len(fields)]}"
+        )
+
+    def map_row(row: Sequence[Any]) -> T:
+        return entity_class(*row)
+
+    return map_row
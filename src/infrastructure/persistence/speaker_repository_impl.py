@@ -1,5 +1,6 @@
 """Speaker repository implementation."""
 
+from collections.abc import AsyncIterator
 from typing import Any
 
 from sqlalchemy import text
@@ -11,6 +12,16 @@ from src.domain.repositories.session_adapter import ISessionAdapter
 from src.domain.repositories.speaker_repository import SpeakerRepository
 from src.infrastructure.persistence.base_repository_impl import BaseRepositoryImpl
 
+# Maximum number of speakers sent per multi-row statement
+BULK_CHUNK_SIZE = 1000
+
+# Substring name search used by search_by_name
+SPEAKER_NAME_SEARCH_QUERY = """
+SELECT * FROM speakers
+WHERE name ILIKE :pattern
+ORDER BY similarity(name, :name) DESC, name
+"""
+
 
 class SpeakerModel:
     """Speaker database model (dynamic)."""
@@ -63,6 +74,117 @@ class SpeakerRepositoryImpl(BaseRepositoryImpl[Speaker], SpeakerRepository):
             return self._row_to_entity(row)
         return None
 
+    async def get_by_name_party_pairs(
+        self, pairs: list[tuple[str, str | None]]
+    ) -> dict[tuple[str, str | None], Speaker]:
+        """Get speakers for many (name, party) pairs with one query per chunk."""
+        unique_pairs = list(dict.fromkeys(pairs))
+        found: dict[tuple[str, str | None], Speaker] = {}
+
+        for start in range(0, len(unique_pairs), BULK_CHUNK_SIZE):
+            chunk = unique_pairs[start : start + BULK_CHUNK_SIZE]
+            values = ", ".join(
+                f"(CAST(:ord_{i} AS INTEGER), CAST(:name_{i} AS VARCHAR), "
+                f"CAST(:party_{i} AS VARCHAR))"
+                for i in range(len(chunk))
+            )
+            query = text(f"""
+                SELECT DISTINCT ON (v.ord) v.ord, s.*
+                FROM (VALUES {values}) AS v(ord, name, party)
+                JOIN speakers s
+                    ON s.name = v.name
+                    AND (v.party IS NULL OR s.political_party_name = v.party)
+                ORDER BY v.ord, s.id
+            """)
+            params: dict[str, Any] = {}
+            for i, (name, party) in enumerate(chunk):
+                params[f"ord_{i}"] = i
+                params[f"name_{i}"] = name
+                params[f"party_{i}"] = party
+
+            result = await self.session.execute(query, params)
+            for row in result.fetchall():
+                found[chunk[row.ord]] = self._row_to_entity(row)
+
+        return found
+
+    async def bulk_create(self, speakers: list[Speaker]) -> list[Speaker]:
+        """Create multiple speakers with one multi-row INSERT per chunk.
+
+        Speakers that already exist under the unique key
+        (name, political_party_name, position) are skipped by the INSERT and
+        the existing rows are returned in their place, so one duplicate does
+        not fail the whole batch.
+        """
+        created: list[Speaker] = []
+
+        for start in range(0, len(speakers), BULK_CHUNK_SIZE):
+            chunk = speakers[start : start + BULK_CHUNK_SIZE]
+            values = ", ".join(
+                f"(:name_{i}, :type_{i}, :political_party_name_{i}, "
+                f":position_{i}, :is_politician_{i})"
+                for i in range(len(chunk))
+            )
+            query = text(f"""
+                INSERT INTO speakers (
+                    name, type, political_party_name, position, is_politician
+                )
+                VALUES {values}
+                ON CONFLICT (name, political_party_name, position) DO NOTHING
+                RETURNING *
+            """)
+            params: dict[str, Any] = {}
+            for i, speaker in enumerate(chunk):
+                params[f"name_{i}"] = speaker.name
+                params[f"type_{i}"] = speaker.type
+                params[f"political_party_name_{i}"] = speaker.political_party_name
+                params[f"position_{i}"] = speaker.position
+                params[f"is_politician_{i}"] = speaker.is_politician
+
+            result = await self.session.execute(query, params)
+            # RETURNING order is not guaranteed; match rows back by unique key
+            by_key = {
+                (row.name, row.political_party_name, row.position): row
+                for row in result.fetchall()
+            }
+            keys = [(s.name, s.political_party_name, s.position) for s in chunk]
+            conflicting = [key for key in dict.fromkeys(keys) if key not in by_key]
+            if conflicting:
+                by_key.update(await self._get_rows_by_unique_keys(conflicting))
+
+            created.extend(self._row_to_entity(by_key[key]) for key in keys)
+
+        # Do not commit here - let UseCase manage transaction
+        return created
+
+    async def _get_rows_by_unique_keys(
+        self, keys: list[tuple[str, str | None, str | None]]
+    ) -> dict[tuple[str, str | None, str | None], Any]:
+        """Select existing rows for (name, political_party_name, position) keys."""
+        values = ", ".join(
+            f"(CAST(:ord_{i} AS INTEGER), CAST(:name_{i} AS VARCHAR), "
+            f"CAST(:party_{i} AS VARCHAR), CAST(:position_{i} AS VARCHAR))"
+            for i in range(len(keys))
+        )
+        query = text(f"""
+            SELECT DISTINCT ON (v.ord) v.ord, s.*
+            FROM (VALUES {values}) AS v(ord, name, party, position)
+            JOIN speakers s
+                ON s.name = v.name
+                AND s.political_party_name IS NOT DISTINCT FROM v.party
+                AND s.position IS NOT DISTINCT FROM v.position
+            ORDER BY v.ord, s.id
+        """)
+        params: dict[str, Any] = {}
+        for i, (name, party, position) in enumerate(keys):
+            params[f"ord_{i}"] = i
+            params[f"name_{i}"] = name
+            params[f"party_{i}"] = party
+            params[f"position_{i}"] = position
+
+        result = await self.session.execute(query, params)
+        return {keys[row.ord]: row for row in result.fetchall()}
+
     async def get_politicians(self) -> list[Speaker]:
         """Get all speakers who are politicians."""
         query = text("""
@@ -75,14 +197,49 @@ class SpeakerRepositoryImpl(BaseRepositoryImpl[Speaker], SpeakerRepository):
 
         return [self._row_to_entity(row) for row in rows]
 
-    async def search_by_name(self, name_pattern: str) -> list[Speaker]:
-        """Search speakers by name pattern."""
-        query = text("""
+    def iter_politicians(self, batch_size: int = 1000) -> AsyncIterator[Speaker]:
+        """Iterate over speakers who are politicians, in ID order."""
+        return self._iter_speakers("is_politician = true", batch_size)
+
+    def iter_all(self, batch_size: int = 1000) -> AsyncIterator[Speaker]:
+        """Iterate over all speakers, in ID order."""
+        return self._iter_speakers("true", batch_size)
+
+    async def _iter_speakers(
+        self, condition: str, batch_size: int
+    ) -> AsyncIterator[Speaker]:
+        """Yield speakers matching ``condition`` one keyset batch at a time.
+
+        Each batch is its own query (``id > last id``), so no cursor stays
+        open between batches and callers may commit while iterating.
+        """
+        query = text(f"""
             SELECT * FROM speakers
-            WHERE name ILIKE :pattern
-            ORDER BY name
+            WHERE {condition} AND id > :last_id
+            ORDER BY id
+            LIMIT :limit
         """)
-        result = await self.session.execute(query, {"pattern": f"%{name_pattern}%"})
+        last_id = 0
+        while True:
+            result = await self.session.execute(
+                query, {"last_id": last_id, "limit": batch_size}
+            )
+            rows = result.fetchall()
+            for row in rows:
+                yield self._row_to_entity(row)
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1].id
+
+    async def search_by_name(self, name_pattern: str) -> list[Speaker]:
+        """Search speakers by name pattern, most similar names first.
+
+        The ILIKE filter is served by the pg_trgm index on name.
+        """
+        result = await self.session.execute(
+            text(SPEAKER_NAME_SEARCH_QUERY),
+            {"pattern": f"%{name_pattern}%", "name": name_pattern},
+        )
         rows = result.fetchall()
 
         return [self._row_to_entity(row) for row in rows]
@@ -8,8 +8,9 @@ import os
 from typing import Any
 
 import pandas as pd
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 
+from src.infrastructure.config.engine_registry import get_engine_registry
 from src.infrastructure.di.container import get_container, init_container
 
 
@@ -35,28 +36,23 @@ def load_governing_bodies_coverage() -> pd.DataFrame:
             - prefecture: Prefecture name (extracted from name)
             - has_data: Whether we have data for this body
     """
-    engine = create_engine(get_database_url())
+    engine = get_engine_registry().get_engine(get_database_url())
 
+    # 集計済みのマテリアライズドビューから読み込む（migration 040）
     query = text("""
         SELECT
-            gb.id,
-            gb.name,
-            gb.organization_type,
+            governing_body_id AS id,
+            name,
+            organization_type,
             CASE
-                WHEN gb.name ~ '^(北海道|.*[都道府県])' THEN
-                    SUBSTRING(gb.name FROM '^(北海道|.*?[都道府県])')
+                WHEN name ~ '^(北海道|.*[都道府県])' THEN
+                    SUBSTRING(name FROM '^(北海道|.*?[都道府県])')
                 ELSE
                     '不明'
             END as prefecture,
-            CASE
-                WHEN COUNT(m.id) > 0 THEN true
-                ELSE false
-            END as has_data
-        FROM governing_bodies gb
-        LEFT JOIN conferences c ON gb.id = c.governing_body_id
-        LEFT JOIN meetings m ON c.id = m.conference_id
-        GROUP BY gb.id, gb.name, gb.organization_type
-        ORDER BY gb.organization_type, prefecture, gb.name
+            meeting_count > 0 as has_data
+        FROM mv_governing_body_coverage
+        ORDER BY organization_type, prefecture, name
     """)
 
     with engine.connect() as conn:
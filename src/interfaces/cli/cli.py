@@ -15,6 +15,7 @@ from src.interfaces.cli.commands.conference_member_commands import (
 from src.interfaces.cli.commands.coverage_commands import get_coverage_commands
 from src.interfaces.cli.commands.di_example_commands import get_di_example_commands
 from src.interfaces.cli.commands.evaluation_commands import get_evaluation_commands
+from src.interfaces.cli.commands.llm_cache_commands import get_llm_cache_commands
 from src.interfaces.cli.commands.parliamentary_group_commands import (
     get_parliamentary_group_commands,
 )
@@ -101,6 +102,7 @@ def register_legacy_commands(cli_group: click.Group) -> None:
         get_coverage_commands,
         get_evaluation_commands,
         get_prompt_commands,
+        get_llm_cache_commands,
         get_di_example_commands,
     ]
 
@@ -113,62 +113,69 @@ class ConferenceMemberCommands(BaseCommand):
         total_extracted = 0
         total_saved = 0
 
-        with ProgressTracker(
-            total_steps=len(conferences), description="抽出中"
-        ) as progress:
-            for conf in conferences:
-                progress.set_description(f"抽出中: {conf['name']}")
-
-                # 既存データの処理
-                if force:
-                    deleted = extracted_repo.delete_extracted_members(conf["id"])
-                    if deleted > 0:
-                        ConferenceMemberCommands.echo_warning(
-                            f"  既存の抽出データ{deleted}件を削除しました"
+        # 全会議体で同じイベントループを使い、プールのブラウザを使い回す
+        runner = asyncio.Runner()
+        try:
+            with ProgressTracker(
+                total_steps=len(conferences), description="抽出中"
+            ) as progress:
+                for conf in conferences:
+                    progress.set_description(f"抽出中: {conf['name']}")
+
+                    # 既存データの処理
+                    if force:
+                        deleted = extracted_repo.delete_extracted_members(conf["id"])
+                        if deleted > 0:
+                            ConferenceMemberCommands.echo_warning(
+                                f"  既存の抽出データ{deleted}件を削除しました"
+                            )
+
+                    try:
+                        # 抽出実行
+                        result: dict[str, Any] = runner.run(
+                            extractor.extract_and_save_members(
+                                conference_id=conf["id"],
+                                conference_name=conf["name"],
+                                url=conf["members_introduction_url"],
+                            )
                         )
 
-                try:
-                    # 抽出実行
-                    result: dict[str, Any] = asyncio.run(
-                        extractor.extract_and_save_members(
-                            conference_id=conf["id"],
-                            conference_name=conf["name"],
-                            url=conf["members_introduction_url"],
+                        if result.get("error"):
+                            ConferenceMemberCommands.echo_error(
+                                f"  ❌ エラー: {conf['name']} - {result['error']}"
+                            )
+                        else:
+                            total_extracted += int(result["extracted_count"])
+                            total_saved += int(result["saved_count"])
+
+                            ConferenceMemberCommands.echo_success(
+                                f"  ✓ {conf['name']}: "
+                                f"{result['extracted_count']}人を抽出、"
+                                f"{result['saved_count']}人を保存"
+                            )
+
+                    except (ScrapingError, DatabaseError) as e:
+                        ConferenceMemberCommands.echo_error(
+                            f"  ❌ エラー: {conf['name']} - {str(e)}"
                         )
-                    )
-
-                    if result.get("error"):
+                        logger.error(f"Error processing conference {conf['id']}: {e}")
+                    except Exception as e:
                         ConferenceMemberCommands.echo_error(
-                            f"  ❌ エラー: {conf['name']} - {result['error']}"
+                            f"  ❌ 予期しないエラー: {conf['name']} - {str(e)}"
                         )
-                    else:
-                        total_extracted += int(result["extracted_count"])
-                        total_saved += int(result["saved_count"])
-
-                        ConferenceMemberCommands.echo_success(
-                            f"  ✓ {conf['name']}: {result['extracted_count']}人を抽出、"
-                            f"{result['saved_count']}人を保存"
+                        logger.exception(
+                            f"Unexpected error processing conference {conf['id']}"
                         )
-
-                except (ScrapingError, DatabaseError) as e:
-                    ConferenceMemberCommands.echo_error(
-                        f"  ❌ エラー: {conf['name']} - {str(e)}"
-                    )
-                    logger.error(f"Error processing conference {conf['id']}: {e}")
-                except Exception as e:
-                    ConferenceMemberCommands.echo_error(
-                        f"  ❌ 予期しないエラー: {conf['name']} - {str(e)}"
-                    )
-                    logger.exception(
-                        f"Unexpected error processing conference {conf['id']}"
-                    )
-                    # Wrap in ScrapingError for proper handling
-                    raise ScrapingError(
-                        f"Failed to extract members from conference {conf['id']}",
-                        {"conference_id": conf["id"], "error": str(e)},
-                    ) from e
-
-                progress.update(1)
+                        # Wrap in ScrapingError for proper handling
+                        raise ScrapingError(
+                            f"Failed to extract members from conference {conf['id']}",
+                            {"conference_id": conf["id"], "error": str(e)},
+                        ) from e
+
+                    progress.update(1)
+        finally:
+            runner.run(extractor.browser_pool.close())
+            runner.close()
 
         # 最終結果
         ConferenceMemberCommands.echo_info("\n=== 抽出完了 ===")
@@ -1,6 +1,7 @@
 """Coverage reporting commands for Polibase"""
 
 import asyncio
+from datetime import datetime
 
 import click
 from sqlalchemy import text
@@ -15,7 +16,7 @@ def get_coverage_commands() -> list[click.Command]:
     Returns:
         List of Click commands
     """
-    return [coverage, coverage_stats]
+    return [coverage, coverage_stats, refresh_stats]
 
 
 @click.command()
@@ -223,3 +224,40 @@ def coverage_stats():
         click.echo("\n" + "=" * 70)
 
     asyncio.run(run_stats())
+
+
+@click.command("refresh-stats")
+@click.option(
+    "--min-interval",
+    type=float,
+    default=0,
+    show_default=True,
+    help="Skip the refresh if the statistics are newer than this many seconds",
+)
+def refresh_stats(min_interval: float):
+    """Recompute the precomputed dashboard statistics.
+
+    Intended to be run on a schedule (e.g. cron). The statistics views are
+    refreshed concurrently, so dashboards stay readable during the refresh.
+    """
+    try:
+        container = get_container()
+    except RuntimeError:
+        container = init_container()
+
+    data_coverage_repo = container.repositories.data_coverage_repository()
+
+    async def run_refresh() -> tuple[bool, datetime | None]:
+        refreshed = await data_coverage_repo.refresh_statistics(
+            min_interval_seconds=min_interval
+        )
+        refreshed_at = await data_coverage_repo.get_statistics_refreshed_at()
+        return refreshed, refreshed_at
+
+    refreshed, refreshed_at = asyncio.run(run_refresh())
+    if refreshed:
+        click.echo(f"✅ 統計を再集計しました ({refreshed_at})")
+    else:
+        click.echo(
+            f"統計の再集計をスキップしました（最新または再集計中） ({refreshed_at})"
+        )
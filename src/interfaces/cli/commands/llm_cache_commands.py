@@ -0,0 +1,139 @@
+"""CLI commands for inspecting and pruning the persistent LLM cache"""
+
+from datetime import datetime
+
+import click
+
+from ..base import BaseCommand, with_error_handling
+
+
+def _open_cache(path: str | None):
+    from src.infrastructure.external.llm_cache_store import PersistentLLMCache
+
+    if path:
+        return PersistentLLMCache(path=path)
+    return PersistentLLMCache.from_settings()
+
+
+def _format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KB", "MB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
+
+
+class LLMCacheCommands(BaseCommand):
+    """Commands for the persistent LLM response cache"""
+
+    @staticmethod
+    @click.command()
+    @click.option("--path", type=str, help="キャッシュファイルのパス（省略時は設定値）")
+    @with_error_handling
+    def llm_cache_stats(path: str | None):
+        """Show persistent LLM cache statistics (LLMキャッシュ統計)
+
+        Examples:
+        - sagebase llm-cache-stats
+        - sagebase llm-cache-stats --path cache/llm/llm_cache.sqlite3
+        """
+        cache = _open_cache(path)
+        try:
+            stats = cache.stats()
+            click.echo(f"\nCache file: {cache.path}")
+            click.echo(f"Entries: {stats.total_entries}")
+            click.echo(f"Size: {_format_bytes(stats.total_bytes)}")
+
+            breakdown = cache.breakdown()
+            if not breakdown:
+                click.echo("\n⚠ Cache is empty")
+                return
+
+            click.echo("\nBy model / operation / prompt version:")
+            click.echo("-" * 80)
+            for row in breakdown:
+                last_used = datetime.fromtimestamp(row["last_accessed_at"]).strftime(
+                    "%Y-%m-%d %H:%M"
+                )
+                click.echo(
+                    f"{row['model_name']} {row['operation']} "
+                    f"(v{row['prompt_version']}): {row['entries']} entries, "
+                    f"{_format_bytes(row['bytes'])}, {row['hits']} hits, "
+                    f"last used {last_used}"
+                )
+        finally:
+            cache.close()
+
+    @staticmethod
+    @click.command()
+    @click.option("--path", type=str, help="キャッシュファイルのパス（省略時は設定値）")
+    @click.option("--max-mb", type=int, help="このサイズ(MB)までLRUで削減")
+    @click.option("--max-entries", type=int, help="このエントリ数までLRUで削減")
+    @click.option(
+        "--older-than-days", type=float, help="指定日数以上使われていないエントリを削除"
+    )
+    @click.option("--model", type=str, help="指定モデルのエントリを削除")
+    @click.option("--all", "clear_all", is_flag=True, help="すべてのエントリを削除")
+    @with_error_handling
+    def llm_cache_prune(
+        path: str | None,
+        max_mb: int | None,
+        max_entries: int | None,
+        older_than_days: float | None,
+        model: str | None,
+        clear_all: bool,
+    ):
+        """Prune the persistent LLM cache (LLMキャッシュの削減)
+
+        Examples:
+        - sagebase llm-cache-prune --older-than-days 30
+        - sagebase llm-cache-prune --max-mb 100
+        - sagebase llm-cache-prune --model gemini-1.5-flash
+        - sagebase llm-cache-prune --all
+        """
+        if (
+            not any(
+                option is not None
+                for option in (max_mb, max_entries, older_than_days, model)
+            )
+            and not clear_all
+        ):
+            LLMCacheCommands.error(
+                "Specify --max-mb, --max-entries, --older-than-days, --model or --all"
+            )
+            return
+
+        cache = _open_cache(path)
+        try:
+            before = cache.stats()
+            if clear_all:
+                cache.clear()
+            else:
+                cache.prune(
+                    max_bytes=max_mb * 1024 * 1024 if max_mb is not None else None,
+                    max_entries=max_entries,
+                    older_than_seconds=(
+                        older_than_days * 86400 if older_than_days is not None else None
+                    ),
+                    model_name=model,
+                )
+                cache.vacuum()
+            after = cache.stats()
+        finally:
+            cache.close()
+
+        LLMCacheCommands.success(
+            f"Removed {before.total_entries - after.total_entries} entries "
+            f"({_format_bytes(before.total_bytes - after.total_bytes)} freed)"
+        )
+
+
+def get_llm_cache_commands():
+    """Get all persistent LLM cache commands"""
+    return [
+        LLMCacheCommands.llm_cache_stats,
+        LLMCacheCommands.llm_cache_prune,
+    ]
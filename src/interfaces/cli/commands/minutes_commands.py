@@ -1,5 +1,7 @@
 """CLI commands for processing meeting minutes"""
 
+import asyncio
+
 import click
 
 from ..base import BaseCommand, with_error_handling
@@ -76,12 +78,21 @@ class MinutesCommands(BaseCommand):
 
         match_speakers_usecase = container.use_cases.match_speakers_usecase()
 
-        # Execute matching
-        results = match_speakers_usecase.execute(use_llm=use_llm, limit=limit)
+        # Execute matching, counting results as they stream in
+        async def run_matching() -> tuple[int, int]:
+            matched = 0
+            total = 0
+            async for result in match_speakers_usecase.iter_execute(
+                use_llm=use_llm, limit=limit
+            ):
+                total += 1
+                if result.matched_politician_id is not None:
+                    matched += 1
+            return matched, total
+
+        matched, total = asyncio.run(run_matching())
 
         # Report results
-        matched = sum(1 for r in results if r.matched_politician_id is not None)
-        total = len(results)
         success_rate = (matched / total * 100) if total > 0 else 0
 
         MinutesCommands.show_progress(
@@ -103,6 +103,7 @@ class ScrapingCommands(BaseCommand):
         """Async implementation of scrape_minutes"""
         import os
 
+        from src.infrastructure.external.http_client import get_http_client
         from src.infrastructure.persistence.meeting_repository_impl import (
             MeetingRepositoryImpl,
         )
@@ -117,26 +118,30 @@ class ScrapingCommands(BaseCommand):
         with spinner("Initializing scraper service"):
             service = ScraperService(enable_gcs=upload_to_gcs)
 
-        # スクレイピング実行
-        if url:
-            with spinner(f"Fetching minutes from: {url}") as spin:
-                minutes = await service.fetch_from_url(url, use_cache=not no_cache)
-                spin.stop(
-                    "✓ Minutes fetched successfully"
-                    if minutes
-                    else "✗ Failed to fetch minutes"
-                )
-        else:  # meeting_id が指定されている場合
-            assert meeting_id is not None  # Type narrowing for pyright
-            with spinner(f"Fetching minutes for meeting ID: {meeting_id}") as spin:
-                minutes = await service.fetch_from_meeting_id(
-                    meeting_id, use_cache=not no_cache
-                )
-                spin.stop(
-                    "✓ Minutes fetched successfully"
-                    if minutes
-                    else "✗ Failed to fetch minutes"
-                )
+        # スクレイピング実行（終了後にプールのブラウザとHTTP接続を閉じる）
+        try:
+            if url:
+                with spinner(f"Fetching minutes from: {url}") as spin:
+                    minutes = await service.fetch_from_url(url, use_cache=not no_cache)
+                    spin.stop(
+                        "✓ Minutes fetched successfully"
+                        if minutes
+                        else "✗ Failed to fetch minutes"
+                    )
+            else:  # meeting_id が指定されている場合
+                assert meeting_id is not None  # Type narrowing for pyright
+                with spinner(f"Fetching minutes for meeting ID: {meeting_id}") as spin:
+                    minutes = await service.fetch_from_meeting_id(
+                        meeting_id, use_cache=not no_cache
+                    )
+                    spin.stop(
+                        "✓ Minutes fetched successfully"
+                        if minutes
+                        else "✗ Failed to fetch minutes"
+                    )
+        finally:
+            await service.browser_pool.close()
+            await get_http_client().close()
 
         if not minutes:
             ScrapingCommands.error("Failed to scrape minutes", exit_code=0)
@@ -371,6 +376,7 @@ class ScrapingCommands(BaseCommand):
         """Async implementation of batch_scrape"""
         import os
 
+        from src.infrastructure.external.http_client import get_http_client
         from src.infrastructure.persistence.meeting_repository_impl import (
             MeetingRepositoryImpl,
         )
@@ -388,19 +394,30 @@ class ScrapingCommands(BaseCommand):
 
         # バッチ処理実行
         success_count = 0
+        unchanged_count = 0
         gcs_update_count = 0
 
         with ProgressTracker(len(urls), "Scraping minutes") as tracker:
-            results = await service.fetch_multiple(urls, max_concurrent=concurrent)
+            try:
+                results = await service.scrape_multiple(urls, max_concurrent=concurrent)
+            finally:
+                await service.browser_pool.close()
+                await get_http_client().close()
 
-            for i, (url, minutes) in enumerate(zip(urls, results, strict=False)):
+            for i, (url, result) in enumerate(zip(urls, results, strict=False)):
                 tracker.update(1, f"Processing {i + 1}/{len(urls)}")
+                minutes = result.minutes
                 if minutes:
                     # テキストとJSONで保存
                     base_name = f"{minutes.council_id}_{minutes.schedule_id}"
                     txt_path = output_path / f"{base_name}.txt"
                     json_path = output_path / f"{base_name}.json"
 
+                    # 前回から変わっていない議事録は保存・アップロードを省略
+                    if not result.changed and txt_path.exists() and json_path.exists():
+                        unchanged_count += 1
+                        continue
+
                     # テキスト形式で保存（GCS対応）
                     txt_success, txt_gcs_url = service.export_to_text(
                         minutes, str(txt_path), upload_to_gcs=upload_to_gcs
@@ -464,9 +481,16 @@ class ScrapingCommands(BaseCommand):
                                     f"  Note: Could not update meeting record: {e}"
                                 )
 
+        # 変更なしでスキップしたURLも取得には成功している
+        scraped_count = success_count + unchanged_count
         ScrapingCommands.show_progress(
-            f"\nCompleted: {success_count}/{len(urls)} URLs successfully scraped"
+            f"\nCompleted: {scraped_count}/{len(urls)} URLs successfully scraped"
         )
+        if unchanged_count > 0:
+            ScrapingCommands.show_progress(
+                f"Skipped saving {unchanged_count} minutes unchanged since the "
+                "last scrape"
+            )
         if gcs_update_count > 0:
             ScrapingCommands.show_progress(
                 f"Updated {gcs_update_count} meeting records with GCS URIs"
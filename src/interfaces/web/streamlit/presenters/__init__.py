@@ -1,6 +1,7 @@
 """Streamlit presenters for web interface."""
 
 from .conference_presenter import ConferencePresenter
+from .conversation_presenter import ConversationPresenter
 from .governing_body_presenter import GoverningBodyPresenter
 from .llm_history_presenter import LLMHistoryPresenter
 from .meeting_presenter import MeetingPresenter
@@ -11,6 +12,7 @@ from .process_presenter import ProcessPresenter
 
 __all__ = [
     "ConferencePresenter",
+    "ConversationPresenter",
     "GoverningBodyPresenter",
     "LLMHistoryPresenter",
     "MeetingPresenter",
@@ -5,19 +5,25 @@ should inherit from. It handles dependency injection, error handling, and
 common presenter functionality.
 """
 
-import asyncio
+import atexit
 from abc import ABC, abstractmethod
 from collections.abc import Coroutine
 from typing import Any, Generic, TypeVar
 
-import nest_asyncio
-
 from src.common.logging import get_logger
 from src.infrastructure.di.container import Container
+from src.infrastructure.persistence.async_bridge import AsyncLoopBridgePool
 
 T = TypeVar("T")
 R = TypeVar("R")
 
+# Container repositories run sync SQL inline on the loop, so every Streamlit
+# session sharing one loop would wait behind the slowest query.
+PRESENTER_LOOP_COUNT = 4
+
+_presenter_bridges = AsyncLoopBridgePool(PRESENTER_LOOP_COUNT, name="presenter-bridge")
+atexit.register(_presenter_bridges.shutdown)
+
 
 class BasePresenter(ABC, Generic[T]):  # noqa: UP046
     """Base presenter class for Streamlit interface layer.
@@ -42,8 +48,9 @@ class BasePresenter(ABC, Generic[T]):  # noqa: UP046
         """Run an async coroutine from sync context.
 
         This helper method allows presenters to call async use cases from
-        synchronous Streamlit code. It handles event loop management and
-        nested asyncio scenarios.
+        synchronous Streamlit code. Coroutines run on the least busy of a
+        few persistent background event loops that are reused across
+        Streamlit reruns.
 
         Args:
             coro: The async coroutine to run
@@ -54,28 +61,8 @@ class BasePresenter(ABC, Generic[T]):  # noqa: UP046
         Raises:
             Exception: If the async operation fails
         """
-        nest_asyncio.apply()
-
         try:
-            # Get or create event loop
-            try:
-                loop = asyncio.get_event_loop()
-                # Check if the loop is closed and create a new one if needed
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-
-            # Run the coroutine in the current loop
-            if loop.is_running():
-                # If loop is already running, create a task and wait for it
-                task = loop.create_task(coro)
-                return loop.run_until_complete(task)
-            else:
-                # If loop is not running, run normally
-                return loop.run_until_complete(coro)
+            return _presenter_bridges.run(coro)
         except Exception as e:
             self.logger.error(f"Failed to run async operation: {e}")
             raise
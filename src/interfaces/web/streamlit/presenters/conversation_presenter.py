@@ -0,0 +1,119 @@
+"""Conversation list presenter for Streamlit web interface."""
+
+from typing import Any
+
+import pandas as pd
+
+from src.common.logging import get_logger
+from src.domain.pagination import CursorPage
+from src.infrastructure.persistence.conversation_repository_impl import (
+    ConversationRepositoryImpl,
+)
+from src.infrastructure.persistence.repository_adapter import RepositoryAdapter
+from src.interfaces.web.streamlit.presenters.base import BasePresenter
+from src.interfaces.web.streamlit.utils.session_manager import SessionManager
+
+
+class ConversationPresenter(BasePresenter[CursorPage[dict[str, Any]]]):
+    """Presenter for the conversation list.
+
+    Pages are fetched with keyset pagination. The cursors of the pages
+    already visited are kept in session state so the view can step back
+    without recounting or re-scanning earlier rows.
+    """
+
+    def __init__(self, container: Any = None, page_size: int = 50):
+        """Initialize the presenter.
+
+        Args:
+            container: Dependency injection container
+            page_size: Number of conversations per page
+        """
+        super().__init__(container)
+        self.conversation_repo = RepositoryAdapter(ConversationRepositoryImpl)
+        self.session = SessionManager(namespace="conversations")
+        self.page_size = page_size
+        self.logger = get_logger(self.__class__.__name__)
+
+    def load_data(self) -> CursorPage[dict[str, Any]]:
+        """Load the current page with the current filters."""
+        return self.conversation_repo.get_conversations_page(
+            limit=self.page_size,
+            cursor=self._cursor_stack()[-1],
+            include_total=True,
+            **self.get_filters(),
+        )
+
+    def handle_action(self, action: str, **kwargs: Any) -> Any:
+        """Handle user actions from the view.
+
+        Args:
+            action: The action to perform
+            **kwargs: Additional parameters for the action
+
+        Returns:
+            Result of the action
+        """
+        if action == "set_filters":
+            return self.set_filters(**kwargs)
+        elif action == "next_page":
+            return self.next_page(**kwargs)
+        elif action == "previous_page":
+            return self.previous_page()
+        else:
+            raise ValueError(f"Unknown action: {action}")
+
+    def get_filters(self) -> dict[str, Any]:
+        """Get the active listing filters."""
+        return self.session.get("filters", {}) or {}
+
+    def set_filters(
+        self,
+        speaker_name: str | None = None,
+        comment_keyword: str | None = None,
+        has_speaker_id: bool | None = None,
+    ) -> None:
+        """Apply new filters and go back to the first page."""
+        filters = {
+            "speaker_name": speaker_name or None,
+            "comment_keyword": comment_keyword or None,
+            "has_speaker_id": has_speaker_id,
+        }
+        if filters != self.get_filters():
+            self.session.set("filters", filters)
+            self.session.set("cursors", [None])
+
+    def next_page(self, next_cursor: str) -> None:
+        """Move to the page that starts after ``next_cursor``."""
+        self.session.set("cursors", [*self._cursor_stack(), next_cursor])
+
+    def previous_page(self) -> None:
+        """Move back to the previously visited page."""
+        cursors = self._cursor_stack()
+        if len(cursors) > 1:
+            self.session.set("cursors", cursors[:-1])
+
+    @property
+    def page_number(self) -> int:
+        """1-based number of the current page."""
+        return len(self._cursor_stack())
+
+    def to_dataframe(self, page: CursorPage[dict[str, Any]]) -> pd.DataFrame:
+        """Convert a page of conversations to a display DataFrame."""
+        return pd.DataFrame(
+            [
+                {
+                    "ID": item["id"],
+                    "会議": item["meeting_title"],
+                    "開催日": item["meeting_date"],
+                    "発言者": item["speaker_name"],
+                    "紐付け発言者": item["linked_speaker_name"],
+                    "発言内容": item["comment"],
+                }
+                for item in page.items
+            ]
+        )
+
+    def _cursor_stack(self) -> list[str | None]:
+        first_page: list[str | None] = [None]
+        return self.session.get("cursors", first_page) or first_page
@@ -28,6 +28,9 @@ from src.domain.services.interfaces.minutes_processing_service import (
 )
 from src.domain.services.interfaces.storage_service import IStorageService
 from src.domain.services.interfaces.unit_of_work import IUnitOfWork
+from src.domain.services.meeting_processing_status_service import (
+    MeetingProcessingStatusService,
+)
 from src.domain.services.speaker_domain_service import SpeakerDomainService
 from src.infrastructure.di.container import Container
 from src.infrastructure.external.gcs_storage_service import GCSStorageService
@@ -40,6 +43,9 @@ from src.infrastructure.persistence.conference_repository_impl import (
 from src.infrastructure.persistence.conversation_repository_impl import (
     ConversationRepositoryImpl,
 )
+from src.infrastructure.persistence.data_coverage_repository_impl import (
+    DataCoverageRepositoryImpl,
+)
 from src.infrastructure.persistence.governing_body_repository_impl import (
     GoverningBodyRepositoryImpl,
 )
@@ -59,6 +65,21 @@ from src.interfaces.web.streamlit.presenters.base import CRUDPresenter
 from src.interfaces.web.streamlit.utils.session_manager import SessionManager
 from src.seed_generator import SeedGenerator
 
+_processing_status_service: MeetingProcessingStatusService | None = None
+
+
+def get_processing_status_service() -> MeetingProcessingStatusService:
+    """Get the status service shared across presenters and Streamlit reruns."""
+    global _processing_status_service
+
+    if _processing_status_service is None:
+        _processing_status_service = MeetingProcessingStatusService(
+            minutes_repository=RepositoryAdapter(MinutesRepositoryImpl),  # type: ignore[arg-type]
+            conversation_repository=RepositoryAdapter(ConversationRepositoryImpl),  # type: ignore[arg-type]
+            speaker_repository=RepositoryAdapter(SpeakerRepositoryImpl),  # type: ignore[arg-type]
+        )
+    return _processing_status_service
+
 
 class MeetingPresenter(CRUDPresenter[list[Meeting]]):
     """Presenter for meeting management."""
@@ -73,6 +94,7 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
         self.meeting_repo = RepositoryAdapter(MeetingRepositoryImpl)
         self.governing_body_repo = RepositoryAdapter(GoverningBodyRepositoryImpl)
         self.conference_repo = RepositoryAdapter(ConferenceRepositoryImpl)
+        self.status_service = get_processing_status_service()
         self.session = SessionManager(namespace="meeting")
         self.form_state = self._get_or_create_form_state()
         self.logger = get_logger(self.__class__.__name__)
@@ -114,19 +136,20 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
         Returns:
             List of meeting dictionaries with additional info
         """
-        from src.infrastructure.persistence.conversation_repository_impl import (
-            ConversationRepositoryImpl,
-        )
-        from src.infrastructure.persistence.minutes_repository_impl import (
-            MinutesRepositoryImpl,
-        )
-        from src.infrastructure.persistence.repository_adapter import (
-            RepositoryAdapter,
-        )
-
         # Get all meetings
         meetings = self.meeting_repo.get_all()
 
+        # Get conversation and speaker counts for every meeting at once
+        try:
+            statuses = self._run_async(
+                self.status_service.get_processing_statuses(
+                    [meeting.id for meeting in meetings if meeting.id is not None]
+                )
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to get meeting processing statuses: {e}")
+            statuses = {}
+
         # Convert to dictionaries with additional info
         result = []
         for meeting in meetings:
@@ -146,27 +169,9 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
                 if conference_id and meeting.conference_id != conference_id:
                     continue
 
-                # Get conversation and speaker counts
-                conversation_count = 0
-                speaker_count = 0
-                try:
-                    minutes_repo = RepositoryAdapter(MinutesRepositoryImpl)
-                    minutes = minutes_repo.get_by_meeting(meeting.id)
-                    if minutes and minutes.id:
-                        conversation_repo = RepositoryAdapter(
-                            ConversationRepositoryImpl
-                        )
-                        conversations = conversation_repo.get_by_minutes(minutes.id)
-                        conversation_count = len(conversations)
-                        # Count unique speakers
-                        speaker_ids = {
-                            c.speaker_id for c in conversations if c.speaker_id
-                        }
-                        speaker_count = len(speaker_ids)
-                except Exception as e:
-                    self.logger.debug(
-                        f"Failed to get counts for meeting {meeting.id}: {e}"
-                    )
+                status = statuses.get(meeting.id) if meeting.id else None
+                conversation_count = status["conversation_count"] if status else 0
+                speaker_count = status["speaker_count"] if status else 0
 
                 result.append(
                     {
@@ -498,6 +503,13 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
             )
             result = await scrape_usecase.execute(request)
 
+            message = f"会議 {meeting_id} のスクレイピングが完了しました"
+            if not result.content_changed:
+                message = (
+                    f"会議 {meeting_id} の議事録は前回から変更がありません"
+                    "（発言抽出の再実行は不要です）"
+                )
+
             return WebResponseDTO.success_response(
                 {
                     "title": result.title,
@@ -505,8 +517,9 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
                     "content_length": result.content_length,
                     "gcs_text_uri": result.gcs_text_uri,
                     "processing_time": result.processing_time_seconds,
+                    "content_changed": result.content_changed,
                 },
-                f"会議 {meeting_id} のスクレイピングが完了しました",
+                message,
             )
 
         except Exception as e:
@@ -558,6 +571,7 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
                     minutes_processing_service=minutes_processing_service,
                     storage_service=storage_service,
                     unit_of_work=uow,
+                    data_coverage_repository=DataCoverageRepositoryImpl(session),
                 )
 
                 # Execute processing
@@ -670,27 +684,13 @@ class MeetingPresenter(CRUDPresenter[list[Meeting]]):
             # Check if scraped (has GCS URIs)
             is_scraped = bool(meeting.gcs_text_uri or meeting.gcs_pdf_uri)
 
-            # Check if conversations exist
-            minutes_repo = RepositoryAdapter(MinutesRepositoryImpl)
-            minutes = await minutes_repo.get_by_meeting(meeting_id)
-            has_conversations = False
-            has_speakers_linked = False
-
-            if minutes and minutes.id:
-                conversation_repo = RepositoryAdapter(ConversationRepositoryImpl)
-                conversations = await conversation_repo.get_by_minutes(minutes.id)
-                has_conversations = len(conversations) > 0
-
-                # Check if any conversation has speaker_id linked
-                if conversations:
-                    has_speakers_linked = any(
-                        conv.speaker_id is not None for conv in conversations
-                    )
+            # Check if conversations exist and have speakers linked
+            status = await self.status_service.get_processing_status(meeting_id)
 
             return {
                 "is_scraped": is_scraped,
-                "has_conversations": has_conversations,
-                "has_speakers_linked": has_speakers_linked,
+                "has_conversations": status["has_conversations"],
+                "has_speakers_linked": status["has_speakers"],
             }
 
         except Exception as e:
@@ -2,6 +2,11 @@
 
 import streamlit as st
 
+from src.interfaces.web.streamlit.presenters.conversation_presenter import (
+    ConversationPresenter,
+)
+from src.interfaces.web.streamlit.utils.error_handler import handle_ui_error
+
 
 def render_conversations_page():
     """Render the conversations list page."""
@@ -25,31 +30,56 @@ def render_conversations_list_tab():
     """Render the conversations list tab."""
     st.subheader("発言一覧")
 
+    presenter = ConversationPresenter()
+
     # Filters
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        st.selectbox("会議選択", ["すべて"], key="conv_meeting_filter")
+        speaker_name = st.text_input("発言者名", key="conv_speaker_filter")
 
     with col2:
-        st.selectbox("発言者選択", ["すべて"], key="conv_speaker_filter")
+        comment_keyword = st.text_input("発言内容", key="conv_comment_filter")
 
     with col3:
-        st.date_input("日付範囲", key="conv_date_filter")
+        link_status = st.selectbox(
+            "紐付け状態", ["すべて", "紐付け済み", "未紐付け"], key="conv_link_filter"
+        )
+
+    presenter.set_filters(
+        speaker_name=speaker_name,
+        comment_keyword=comment_keyword,
+        has_speaker_id={"紐付け済み": True, "未紐付け": False}.get(link_status),
+    )
 
-    # Placeholder for conversation list
-    st.info("発言レコードの表示機能は実装中です")
+    try:
+        page = presenter.load_data()
+    except Exception as e:
+        handle_ui_error(e, "発言レコードの読み込み")
+        return
 
-    # Sample display
-    st.markdown("""
-    ### 表示項目
-    - 発言ID
-    - 会議名
-    - 発言者
-    - 発言内容（要約）
-    - 発言時刻
-    - タグ
-    """)
+    if page.total_count is not None:
+        prefix = "約" if page.total_is_estimate else ""
+        st.caption(f"{prefix}{page.total_count:,}件 / {presenter.page_number}ページ目")
+
+    if not page.items:
+        st.info("該当する発言レコードがありません")
+        return
+
+    st.dataframe(
+        presenter.to_dataframe(page), use_container_width=True, hide_index=True
+    )
+
+    # Keyset pagination: only previous/next, no jumping to arbitrary pages
+    prev_col, _, next_col = st.columns([1, 4, 1])
+    with prev_col:
+        if st.button("← 前へ", disabled=presenter.page_number == 1):
+            presenter.previous_page()
+            st.rerun()
+    with next_col:
+        if st.button("次へ →", disabled=not page.has_next) and page.next_cursor:
+            presenter.next_page(page.next_cursor)
+            st.rerun()
 
 
 def render_search_filter_tab():
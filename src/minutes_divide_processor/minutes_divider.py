@@ -326,6 +326,52 @@ class MinutesDivider:
         Returns:
             MinutesBoundary: 境界検出結果
         """
+        chain = self._build_boundary_chain(minutes_text)
+        if chain is None:
+            return self._boundary_not_found("境界検出プロンプトが見つかりません")
+
+        try:
+            # LLMで境界を検出
+            logger.info("Invoking LLM for boundary detection...")
+            result = self.llm_service.invoke_with_retry(
+                chain,
+                {"minutes_text": minutes_text},
+            )
+        except Exception as e:
+            logger.error(f"Error in boundary detection: {e}")
+            return self._boundary_not_found(
+                f"境界検出中にエラーが発生しました: {str(e)}"
+            )
+        return self._parse_boundary_result(result)
+
+    async def adetect_attendee_boundary(self, minutes_text: str) -> MinutesBoundary:
+        """detect_attendee_boundaryの非同期版（イベントループをブロックしない）
+
+        Args:
+            minutes_text: 議事録の全文
+
+        Returns:
+            MinutesBoundary: 境界検出結果
+        """
+        chain = self._build_boundary_chain(minutes_text)
+        if chain is None:
+            return self._boundary_not_found("境界検出プロンプトが見つかりません")
+
+        try:
+            logger.info("Invoking LLM for boundary detection...")
+            result = await self.llm_service.ainvoke_with_retry(
+                chain,
+                {"minutes_text": minutes_text},
+            )
+        except Exception as e:
+            logger.error(f"Error in boundary detection: {e}")
+            return self._boundary_not_found(
+                f"境界検出中にエラーが発生しました: {str(e)}"
+            )
+        return self._parse_boundary_result(result)
+
+    def _build_boundary_chain(self, minutes_text: str) -> Any | None:
+        """境界検出用のチェーンを構築する（プロンプトがなければNone）"""
         logger.info("=== detect_attendee_boundary started ===")
         logger.info(f"Input text length: {len(minutes_text)}")
 
@@ -337,13 +383,7 @@ class MinutesDivider:
         except KeyError as e:
             logger.error(f"Prompt template not found: {e}")
             logger.warning("Falling back to treating entire text as speech")
-            return MinutesBoundary(
-                boundary_found=False,
-                boundary_text=None,
-                boundary_type="none",
-                confidence=0.0,
-                reason="境界検出プロンプトが見つかりません",
-            )
+            return None
 
         # 構造化LLMを取得
         logger.info("Getting structured LLM...")
@@ -351,55 +391,42 @@ class MinutesDivider:
 
         # チェーンを構築
         logger.info("Building chain...")
-        chain = prompt_template | structured_llm
+        return prompt_template | structured_llm
+
+    def _boundary_not_found(self, reason: str) -> MinutesBoundary:
+        """境界が検出できなかった場合の結果を作成する"""
+        return MinutesBoundary(
+            boundary_found=False,
+            boundary_text=None,
+            boundary_type="none",
+            confidence=0.0,
+            reason=reason,
+        )
 
-        try:
-            # LLMで境界を検出
-            logger.info("Invoking LLM for boundary detection...")
-            result = self.llm_service.invoke_with_retry(
-                chain,
-                {"minutes_text": minutes_text},
+    def _parse_boundary_result(self, result: Any) -> MinutesBoundary:
+        """境界検出のLLM結果を検証する"""
+        logger.info(f"LLM invocation completed, result type: {type(result)}")
+
+        if not isinstance(result, MinutesBoundary):
+            logger.warning("Unexpected result type from boundary detection")
+            return self._boundary_not_found("LLMからの結果が予期しない形式でした")
+
+        # 結果の詳細をログ出力
+        logger.info("Boundary detection result details:")
+        logger.info(f"  - boundary_found: {result.boundary_found}")
+        logger.info(f"  - boundary_type: {result.boundary_type}")
+        logger.info(f"  - confidence: {result.confidence}")
+        logger.info(f"  - reason: {result.reason}")
+        logger.info(f"  - boundary_text: {result.boundary_text}")
+
+        if result.boundary_text:
+            # boundary_textの詳細を確認
+            logger.info(f"  - boundary_text length: {len(result.boundary_text)}")
+            logger.info(
+                f"  - Contains '｜境界｜': {'｜境界｜' in result.boundary_text}"
             )
-            logger.info(f"LLM invocation completed, result type: {type(result)}")
-
-            if isinstance(result, MinutesBoundary):
-                # 結果の詳細をログ出力
-                logger.info("Boundary detection result details:")
-                logger.info(f"  - boundary_found: {result.boundary_found}")
-                logger.info(f"  - boundary_type: {result.boundary_type}")
-                logger.info(f"  - confidence: {result.confidence}")
-                logger.info(f"  - reason: {result.reason}")
-                logger.info(f"  - boundary_text: {result.boundary_text}")
-
-                if result.boundary_text:
-                    # boundary_textの詳細を確認
-                    logger.info(
-                        f"  - boundary_text length: {len(result.boundary_text)}"
-                    )
-                    logger.info(
-                        f"  - Contains '｜境界｜': {'｜境界｜' in result.boundary_text}"
-                    )
-
-                return result
-            else:
-                logger.warning("Unexpected result type from boundary detection")
-                return MinutesBoundary(
-                    boundary_found=False,
-                    boundary_text=None,
-                    boundary_type="none",
-                    confidence=0.0,
-                    reason="LLMからの結果が予期しない形式でした",
-                )
 
-        except Exception as e:
-            logger.error(f"Error in boundary detection: {e}")
-            return MinutesBoundary(
-                boundary_found=False,
-                boundary_text=None,
-                boundary_type="none",
-                confidence=0.0,
-                reason=f"境界検出中にエラーが発生しました: {str(e)}",
-            )
+        return result
 
     def split_minutes_by_boundary(
         self, minutes_text: str, boundary: MinutesBoundary
@@ -666,6 +693,50 @@ class MinutesDivider:
     def speech_divide_run(
         self, section_string: SectionString
     ) -> SpeakerAndSpeechContentList:
+        section_text = self._log_speech_divide_start(section_string)
+
+        # LLMベースの境界検出を実行
+        logger.info("Calling detect_attendee_boundary...")
+        boundary = self.detect_attendee_boundary(section_text)
+
+        speech_text = self._extract_speech_part(section_text, boundary)
+        if speech_text is None:
+            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
+
+        result = self.llm_service.invoke_with_retry(
+            self._build_speech_divide_chain(),
+            {
+                "section_string": speech_text,  # 文字列を抽出
+            },
+        )
+        return self._normalize_speech_divide_result(result)
+
+    async def aspeech_divide_run(
+        self, section_string: SectionString
+    ) -> SpeakerAndSpeechContentList:
+        """speech_divide_runの非同期版
+
+        境界検出と発言分割の2回のLLM呼び出しを待つ間もイベントループを
+        ブロックしないため、複数セクションを同時に処理できる。
+        """
+        section_text = self._log_speech_divide_start(section_string)
+
+        logger.info("Calling adetect_attendee_boundary...")
+        boundary = await self.adetect_attendee_boundary(section_text)
+
+        speech_text = self._extract_speech_part(section_text, boundary)
+        if speech_text is None:
+            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
+
+        result = await self.llm_service.ainvoke_with_retry(
+            self._build_speech_divide_chain(),
+            {
+                "section_string": speech_text,
+            },
+        )
+        return self._normalize_speech_divide_result(result)
+
+    def _log_speech_divide_start(self, section_string: SectionString) -> str:
         # セクション全体のテキストを取得
         section_text = section_string.section_string
 
@@ -673,10 +744,12 @@ class MinutesDivider:
         logger.info("=== speech_divide_run started ===")
         logger.info(f"Section text length: {len(section_text)}")
         logger.info(f"Section text preview: {section_text[:200]}...")
+        return section_text
 
-        # LLMベースの境界検出を実行
-        logger.info("Calling detect_attendee_boundary...")
-        boundary = self.detect_attendee_boundary(section_text)
+    def _extract_speech_part(
+        self, section_text: str, boundary: MinutesBoundary
+    ) -> str | None:
+        """境界検出結果から発言部分を取り出す（処理対象がなければNone）"""
         logger.info(
             f"Boundary detection result: found={boundary.boundary_found}, "
             f"type={boundary.boundary_type}, confidence={boundary.confidence}"
@@ -707,34 +780,31 @@ class MinutesDivider:
         # 発言部分がない場合はスキップ
         if not speech_part:
             logger.info("No speech content found in section")
-            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
-
-        # 発言部分のみを処理対象とする
-        section_text = speech_part
+            return None
 
         # 発言部分が短すぎる場合でも、明らかに発言パターンが含まれている場合は処理を続行
         # ○や◆で始まる行がある場合は発言として扱う
-        import re
+        has_speech_pattern = bool(re.search(r"^[○◆]", speech_part, re.MULTILINE))
 
-        has_speech_pattern = bool(re.search(r"^[○◆]", section_text, re.MULTILINE))
-
-        if len(section_text) < 30 and not has_speech_pattern:
+        if len(speech_part) < 30 and not has_speech_pattern:
             logger.info("Speech part too short and no speech pattern found, skipping")
-            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
+            return None
+
+        # 発言部分のみを処理対象とする
+        return speech_part
 
+    def _build_speech_divide_chain(self) -> Any:
         # 国会議事録向けのプロンプトを使用
         prompt_template = self.llm_service.get_prompt("speech_divide_kokkai")
 
         runnable_prompt = (
             prompt_template | self.speaker_and_speech_content_formatted_llm
         )
-        chain = {"section_string": RunnablePassthrough()} | runnable_prompt
-        result = self.llm_service.invoke_with_retry(
-            chain,
-            {
-                "section_string": section_text,  # 文字列を抽出
-            },
-        )
+        return {"section_string": RunnablePassthrough()} | runnable_prompt
+
+    def _normalize_speech_divide_result(
+        self, result: Any
+    ) -> SpeakerAndSpeechContentList:
         if result is None:
             print("Error: result is None")
             return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
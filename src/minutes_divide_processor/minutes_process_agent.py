@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import uuid
 from typing import Any
 
@@ -6,23 +8,33 @@ from langgraph.graph import END, StateGraph
 from langgraph.store.memory import InMemoryStore
 
 from src.domain.services.interfaces.llm_service import ILLMService
+from src.infrastructure.external.concurrent_llm_service import (
+    RateLimiter,
+    estimate_tokens,
+)
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
+from src.infrastructure.persistence.async_bridge import run_sync
 
 from .minutes_divider import MinutesDivider
 
 # Use relative import for modules within the same package
 from .models import (
     MinutesProcessState,
+    SectionString,
     SectionStringList,
     SpeakerAndSpeechContent,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class MinutesProcessAgent:
     def __init__(
         self,
         llm_service: ILLMService | InstrumentedLLMService | None = None,
         k: int | None = None,
+        max_concurrency: int = 1,
+        max_sections_per_second: float | None = None,
     ):
         """
         Initialize MinutesProcessAgent
@@ -31,9 +43,17 @@ class MinutesProcessAgent:
             llm_service: LLMService instance (creates default if not provided)
                 Can be ILLMService or InstrumentedLLMService
             k: Number of sections
+            max_concurrency: Number of sections divided in parallel
+                (1 keeps the sequential divide_speech loop)
+            max_sections_per_second: Rate limit for starting sections in
+                parallel mode (None = unlimited)
         """
         # 各種ジェネレータの初期化
         self.minutes_divider = MinutesDivider(llm_service=llm_service, k=k or 5)
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_sections_per_second = max_sections_per_second
+        # 並列モードで処理に失敗したセクション番号（1始まり）
+        self.failed_sections: list[int] = []
         self.in_memory_store = InMemoryStore()
         self.graph = self._create_graph()
 
@@ -46,18 +66,24 @@ class MinutesProcessAgent:
         workflow.add_node("divide_minutes_to_keyword", self._divide_minutes_to_keyword)  # type: ignore[arg-type]
         workflow.add_node("divide_minutes_to_string", self._divide_minutes_to_string)  # type: ignore[arg-type]
         workflow.add_node("check_length", self._check_length)  # type: ignore[arg-type]
-        workflow.add_node("divide_speech", self._divide_speech)  # type: ignore[arg-type]
         workflow.set_entry_point("process_minutes")
         workflow.add_edge("process_minutes", "divide_minutes_to_keyword")
         workflow.add_edge("divide_minutes_to_keyword", "divide_minutes_to_string")
         workflow.add_edge("divide_minutes_to_string", "check_length")
-        workflow.add_edge("check_length", "divide_speech")
-        workflow.add_conditional_edges(
-            "divide_speech",
-            # indexは1から始まるので、<= で比較する必要がある
-            lambda state: state.index <= state.section_list_length,  # type: ignore[arg-type, no-any-return]
-            {True: "divide_speech", False: END},
-        )
+        if self.max_concurrency > 1:
+            # 全セクションを一度に並列で発言分割する
+            workflow.add_node("divide_speech", self._divide_speech_parallel)  # type: ignore[arg-type]
+            workflow.add_edge("check_length", "divide_speech")
+            workflow.add_edge("divide_speech", END)
+        else:
+            workflow.add_node("divide_speech", self._divide_speech)  # type: ignore[arg-type]
+            workflow.add_edge("check_length", "divide_speech")
+            workflow.add_conditional_edges(
+                "divide_speech",
+                # indexは1から始まるので、<= で比較する必要がある
+                lambda state: state.index <= state.section_list_length,  # type: ignore[arg-type, no-any-return]
+                {True: "divide_speech", False: END},
+            )
 
         return workflow.compile(checkpointer=checkpointer, store=self.in_memory_store)  # type: ignore[return-value]  # type: ignore[return-value]
 
@@ -77,6 +103,10 @@ class MinutesProcessAgent:
         self.in_memory_store.put(namespace_for_memory, memory_id, memory)
         return memory_id
 
+    def _delete_from_memory(self, namespace: str, memory_id: str) -> None:
+        if memory_id:
+            self.in_memory_store.delete(("1", namespace), memory_id)
+
     def _process_minutes(self, state: MinutesProcessState) -> dict[str, str]:
         # 議事録の文字列に対する前処理を行う
         processed_minutes = self.minutes_divider.pre_process(state.original_minutes)
@@ -153,7 +183,7 @@ class MinutesProcessAgent:
         print("check_length_done")
         return {"redivide_section_string_list_memory_id": memory_id}
 
-    def _divide_speech(self, state: MinutesProcessState) -> dict[str, Any]:
+    def _get_section_string_list(self, state: MinutesProcessState) -> SectionStringList:
         memory_id = state.section_string_list_memory_id
         memory_data = self._get_from_memory("section_string_list", memory_id)
         if memory_data is None or "section_string_list" not in memory_data:
@@ -162,6 +192,10 @@ class MinutesProcessAgent:
         section_string_list = memory_data["section_string_list"]
         if not isinstance(section_string_list, SectionStringList):
             raise TypeError("section_string_list must be a SectionStringList instance")
+        return section_string_list
+
+    def _divide_speech(self, state: MinutesProcessState) -> dict[str, Any]:
+        section_string_list = self._get_section_string_list(state)
 
         if state.index - 1 < len(section_string_list.section_string_list):
             # すべてのセクションを処理する（0, 1, 2, 3の制限を削除）
@@ -180,49 +214,89 @@ class MinutesProcessAgent:
             + f"all_length: {state.section_list_length}"
         )
         # 現在のdivide_speech_listを取得
+        # 初回はメモリを作成し、以降は同じメモリIDのリストに追記する
+        # （セクションごとにリスト全体をコピーして保存し直さない）
         memory_id = state.divided_speech_list_memory_id
         memory_data = self._get_from_memory("divided_speech_list", memory_id)
-
-        # 初回はNULLなのでその場合は空配列を作成
         if memory_data is None or "divided_speech_list" not in memory_data:
-            divided_speech_list: list[SpeakerAndSpeechContent] = []
-        else:
-            divided_speech_list = memory_data["divided_speech_list"]
-            if not isinstance(divided_speech_list, list):
-                raise TypeError("divided_speech_list must be a list")
-            # Cast to proper type after type check
-            divided_speech_list = divided_speech_list
-
-        # もしspeaker_and_speech_content_listがNoneの場合は、
-        # 現在のリストを更新用リストとして返す
+            memory_data = {"divided_speech_list": []}
+            memory_id = self._put_to_memory(
+                namespace="divided_speech_list", memory=memory_data
+            )
+
+        divided_speech_list = memory_data["divided_speech_list"]
+        if not isinstance(divided_speech_list, list):
+            raise TypeError("divided_speech_list must be a list")
+
         if speaker_and_speech_content_list is None:
             print(
                 "Warning: speaker_and_speech_content_list is None. "
                 + "Skipping this section."
             )
-            updated_speaker_and_speech_content_list = divided_speech_list
-            memory: dict[str, list[SpeakerAndSpeechContent]] = {
-                "divided_speech_list": updated_speaker_and_speech_content_list
-            }
-            memory_id = self._put_to_memory(
-                namespace="divided_speech_list", memory=memory
-            )
         else:
             # すべてのセクションの結果を追加
-            updated_speaker_and_speech_content_list: list[SpeakerAndSpeechContent] = (
-                divided_speech_list
-                + speaker_and_speech_content_list.speaker_and_speech_content_list
-            )
-            memory: dict[str, list[SpeakerAndSpeechContent]] = {
-                "divided_speech_list": updated_speaker_and_speech_content_list
-            }
-            memory_id = self._put_to_memory(
-                namespace="divided_speech_list", memory=memory
+            divided_speech_list.extend(
+                speaker_and_speech_content_list.speaker_and_speech_content_list
             )
         incremented_index = state.index + 1
         print(f"incremented_speech_divide_index: {incremented_index}")
         return {"divided_speech_list_memory_id": memory_id, "index": incremented_index}
 
+    def _divide_speech_parallel(self, state: MinutesProcessState) -> dict[str, Any]:
+        """全セクションの発言分割を並列に実行する
+
+        各セクションの結果はセクション順に連結するため、逐次処理と同じ
+        章・発言順で結果が得られる。失敗したセクションはログに記録して
+        スキップし、他のセクションの結果は保持する。
+        """
+        sections = self._get_section_string_list(state).section_string_list
+        # 共有のブリッジループで実行し、呼び出しごとにループを作らない
+        results = run_sync(self._divide_sections_concurrently(sections))
+
+        divided_speech_list = [item for result in results for item in result]
+        print(
+            f"divide_speech_done on {len(sections)} sections "
+            + f"(concurrency: {self.max_concurrency}, "
+            + f"failed: {len(self.failed_sections)})"
+        )
+        memory_id = self._put_to_memory(
+            namespace="divided_speech_list",
+            memory={"divided_speech_list": divided_speech_list},
+        )
+        return {"divided_speech_list_memory_id": memory_id, "index": len(sections) + 1}
+
+    async def _divide_sections_concurrently(
+        self, sections: list[SectionString]
+    ) -> list[list[SpeakerAndSpeechContent]]:
+        """セクションごとの発言分割を同時実行数とレートを制限して実行する"""
+        rate_limiter = RateLimiter(
+            max_per_second=self.max_sections_per_second,
+            max_concurrent=self.max_concurrency,
+        )
+        failed_sections: list[int] = []
+
+        async def divide(
+            number: int, section: SectionString
+        ) -> list[SpeakerAndSpeechContent]:
+            tokens = estimate_tokens(section.section_string)
+            async with rate_limiter.slot(tokens=tokens):
+                try:
+                    result = await self.minutes_divider.aspeech_divide_run(section)
+                except Exception:
+                    logger.exception(
+                        f"Failed to divide speech in section {number}, skipping"
+                    )
+                    failed_sections.append(number)
+                    return []
+            return result.speaker_and_speech_content_list
+
+        results = await asyncio.gather(
+            *(divide(i, section) for i, section in enumerate(sections, start=1))
+        )
+
+        self.failed_sections = sorted(failed_sections)
+        return results
+
     def run(self, original_minutes: str) -> list[SpeakerAndSpeechContent]:
         # 初期状態の設定
         initial_state = MinutesProcessState(original_minutes=original_minutes)
@@ -240,4 +314,14 @@ class MinutesProcessAgent:
         if not isinstance(divided_speech_list, list):
             raise TypeError("divided_speech_list must be a list")
 
+        # エージェントは複数の議事録で使い回されるため、
+        # 処理が終わった中間データはストアから削除する
+        for namespace, state_key in (
+            ("processed_minutes", "processed_minutes_memory_id"),
+            ("section_string_list", "section_string_list_memory_id"),
+            ("redivide_section_string_list", "redivide_section_string_list_memory_id"),
+            ("divided_speech_list", "divided_speech_list_memory_id"),
+        ):
+            self._delete_from_memory(namespace, final_state.get(state_key, ""))
+
         return divided_speech_list  # type: ignore[return-value]
@@ -126,6 +126,9 @@ class MinutesProcessState(BaseModel):
     redivide_section_string_list: Annotated[
         list[RedivideSectionString], operator.add
     ] = Field(default_factory=lambda: [], description="再分割対象の文字列リスト")
+    redivide_section_string_list_memory_id: str = Field(
+        default="", description="再分割対象の文字列リストを保存したメモリID"
+    )
     divided_speech_list_memory_id: str = Field(
         default="", description="分割された各発言者と発言内容のリストを保存したメモリID"
     )
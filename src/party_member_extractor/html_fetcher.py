@@ -1,26 +1,45 @@
 """HTML fetcher for party member pages with pagination support"""
 
-import asyncio
 import logging
+from contextlib import AbstractAsyncContextManager
 from types import TracebackType
 from typing import Any
 
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import BrowserContext, Page
 
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external.browser_pool import BrowserPool, get_browser_pool
+from src.infrastructure.external.page_readiness import (
+    PageReadiness,
+    ReadinessProfile,
+    get_page_readiness,
+)
 
 from .models import WebPageContent
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)  # Ensure INFO level logs are output
 
+# 議員一覧ページはDOMの変化が止まるまで待ち、遅延読み込み分はスクロールで読み込む
+MEMBER_LIST_READINESS = ReadinessProfile(
+    name="party-member-list", scroll_rounds=3, max_wait_ms=8000
+)
+
 
 class PartyMemberPageFetcher:
     """政党の議員一覧ページを取得（ページネーション対応）"""
 
-    def __init__(self, party_id: int | None = None, proc_logger: Any = None):
-        self.browser: Browser | None = None
+    def __init__(
+        self,
+        party_id: int | None = None,
+        proc_logger: Any = None,
+        browser_pool: BrowserPool | None = None,
+        page_readiness: PageReadiness | None = None,
+    ):
+        self.browser_pool = browser_pool or get_browser_pool()
+        self.page_readiness = page_readiness or get_page_readiness()
         self.context: BrowserContext | None = None
+        self._context_lease: AbstractAsyncContextManager[BrowserContext] | None = None
         self.settings = get_settings()
         self.party_id = party_id
         self.proc_logger = proc_logger
@@ -31,22 +50,14 @@ class PartyMemberPageFetcher:
 
     async def __aenter__(self):
         try:
-            playwright = await async_playwright().start()
-            self.browser = await playwright.chromium.launch(
-                headless=True,
-                args=[
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox",
-                    "--disable-dev-shm-usage",
-                ],
-            )
-            self.context = await self.browser.new_context(
+            self._context_lease = self.browser_pool.context(
                 user_agent=(
                     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
                     "AppleWebKit/537.36 (KHTML, like Gecko) "
                     "Chrome/120.0.0.0 Safari/537.36"
                 )
             )
+            self.context = await self._context_lease.__aenter__()
             return self
         except Exception as e:
             logger.error(f"Failed to initialize browser: {e}")
@@ -58,11 +69,12 @@ class PartyMemberPageFetcher:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
+        lease, self._context_lease = self._context_lease, None
+        self.context = None
         try:
-            if self.context:
-                await self.context.close()
-            if self.browser:
-                await self.browser.close()
+            if lease:
+                # コンテキストを閉じてブラウザをプールに返す
+                await lease.__aexit__(exc_type, exc_val, exc_tb)
         except Exception:
             # 終了時のエラーは無視
             pass
@@ -114,29 +126,6 @@ class PartyMemberPageFetcher:
                     self.proc_logger.add_log(
                         self.log_key, "✅ page.goto完了 (domcontentloaded)", "success"
                     )
-                # その後、networkidleを短いタイムアウトで試す
-                try:
-                    if self.proc_logger:
-                        self.proc_logger.add_log(
-                            self.log_key, "⏳ networkidle待機中 (5秒)", "info"
-                        )
-                    await page.wait_for_load_state(
-                        "networkidle",
-                        timeout=5000,  # 5秒のみ待つ
-                    )
-                    if self.proc_logger:
-                        self.proc_logger.add_log(
-                            self.log_key, "✅ networkidle完了", "success"
-                        )
-                except Exception:
-                    # networkidleがタイムアウトしても続行
-                    logger.debug("Network idle timeout, but continuing")
-                    if self.proc_logger:
-                        self.proc_logger.add_log(
-                            self.log_key,
-                            "ℹ️ networkidleタイムアウト (続行します)",
-                            "info",
-                        )
             except Exception as e:
                 logger.warning(f"Initial page load with domcontentloaded failed: {e}")
                 if self.proc_logger:
@@ -162,26 +151,16 @@ class PartyMemberPageFetcher:
                         self.log_key, "✅ page.goto完了 (loadイベント)", "success"
                     )
 
-            if self.proc_logger:
-                self.proc_logger.add_log(
-                    self.log_key, "⏳ 動的コンテンツの読み込み待機 (2秒)", "info"
-                )
-            await asyncio.sleep(2)  # 動的コンテンツの読み込み待機
-
-            # スクロールして遅延読み込みコンテンツをロード
+            # 動的コンテンツの描画とスクロールによる遅延読み込みを待つ
             if self.proc_logger:
                 self.proc_logger.add_log(
                     self.log_key,
                     "📜 ページをスクロールして全コンテンツを読み込み中...",
                     "info",
                 )
-            for i in range(3):
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
-                if self.proc_logger and i == 2:
-                    self.proc_logger.add_log(
-                        self.log_key, "✅ スクロール完了", "success"
-                    )
+            await self._wait_until_ready(page)
+            if self.proc_logger:
+                self.proc_logger.add_log(self.log_key, "✅ スクロール完了", "success")
 
             if self.proc_logger:
                 self.proc_logger.add_log(
@@ -248,12 +227,7 @@ class PartyMemberPageFetcher:
                         "domcontentloaded",
                         timeout=self.settings.page_load_timeout * 1000,
                     )
-                    # networkidleは短いタイムアウトで試す
-                    try:
-                        await page.wait_for_load_state("networkidle", timeout=3000)
-                    except Exception:
-                        logger.debug("Network idle timeout on pagination, continuing")
-                    await asyncio.sleep(2)
+                    await self._wait_until_ready(page)
                 except Exception as e:
                     logger.warning(f"Failed to navigate to next page: {e}")
                     if self.proc_logger:
@@ -305,6 +279,11 @@ class PartyMemberPageFetcher:
         finally:
             await page.close()
 
+    async def _wait_until_ready(self, page: Page) -> None:
+        """ページの描画完了を待つ（固定時間ではなくDOMの変化で判定）"""
+        if not await self.page_readiness.wait(page, MEMBER_LIST_READINESS):
+            logger.debug(f"Page not settled within cap, continuing: {page.url}")
+
     async def _find_next_page_link(self, page: Page):
         """次のページへのリンクを探す"""
         # 一般的なページネーションパターン
@@ -373,11 +352,6 @@ class PartyMemberPageFetcher:
                     wait_until="domcontentloaded",
                     timeout=self.settings.page_load_timeout * 1000,
                 )
-                # networkidleは短いタイムアウトで試す
-                try:
-                    await page.wait_for_load_state("networkidle", timeout=5000)
-                except Exception:
-                    logger.debug("Network idle timeout, but continuing")
             except Exception as e:
                 logger.warning(f"Page load with domcontentloaded failed: {e}")
                 # フォールバック: loadイベントまで待つ
@@ -386,12 +360,8 @@ class PartyMemberPageFetcher:
                     wait_until="load",
                     timeout=self.settings.page_load_timeout * 1000,
                 )
-            await asyncio.sleep(2)
-
-            # スクロールして遅延読み込みコンテンツをロード
-            for _ in range(3):
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await asyncio.sleep(1)
+            # 動的コンテンツの描画とスクロールによる遅延読み込みを待つ
+            await self._wait_until_ready(page)
 
             content = await page.content()
             return WebPageContent(url=url, html_content=content, page_number=1)
@@ -3,6 +3,8 @@
 from typing import Any, TypedDict
 
 from src.common.logging import get_logger
+from src.domain.services.interfaces.llm_service import ILLMService
+from src.infrastructure.external.cached_llm_service import with_persistent_cache
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
 from src.infrastructure.external.llm_service import GeminiLLMService
 from src.infrastructure.external.prompt_loader import PromptLoader
@@ -55,7 +57,7 @@ class LLMServiceFactory:
             prompt_loader: Shared prompt loader instance
         """
         self.prompt_loader = prompt_loader or PromptLoader.get_default_instance()
-        self._instances: dict[str, InstrumentedLLMService | GeminiLLMService] = {}
+        self._instances: dict[str, InstrumentedLLMService | ILLMService] = {}
 
     def create(
         self,
@@ -66,7 +68,7 @@ class LLMServiceFactory:
         api_key: str | None = None,
         use_cache: bool = True,
         enable_metrics: bool = True,
-    ) -> InstrumentedLLMService | GeminiLLMService:
+    ) -> InstrumentedLLMService | ILLMService:
         """
         Create LLMService instance
 
@@ -115,8 +117,8 @@ class LLMServiceFactory:
             if k in {"api_key", "model_name", "temperature"}
         }
 
-        # Create new instance
-        instance = GeminiLLMService(**gemini_config)
+        # Create new instance, reusing responses cached by earlier runs
+        instance = with_persistent_cache(GeminiLLMService(**gemini_config))
 
         # Wrap with instrumentation if enabled
         if enable_metrics:
@@ -138,29 +140,23 @@ class LLMServiceFactory:
 
         return instance
 
-    def create_fast(self, **kwargs: Any) -> InstrumentedLLMService | GeminiLLMService:
+    def create_fast(self, **kwargs: Any) -> InstrumentedLLMService | ILLMService:
         """Create fast model instance"""
         return self.create(preset="fast", **kwargs)
 
-    def create_advanced(
-        self, **kwargs: Any
-    ) -> InstrumentedLLMService | GeminiLLMService:
+    def create_advanced(self, **kwargs: Any) -> InstrumentedLLMService | ILLMService:
         """Create advanced model instance"""
         return self.create(preset="advanced", **kwargs)
 
-    def create_creative(
-        self, **kwargs: Any
-    ) -> InstrumentedLLMService | GeminiLLMService:
+    def create_creative(self, **kwargs: Any) -> InstrumentedLLMService | ILLMService:
         """Create creative model instance"""
         return self.create(preset="creative", **kwargs)
 
-    def create_precise(
-        self, **kwargs: Any
-    ) -> InstrumentedLLMService | GeminiLLMService:
+    def create_precise(self, **kwargs: Any) -> InstrumentedLLMService | ILLMService:
         """Create precise model instance"""
         return self.create(preset="precise", **kwargs)
 
-    def create_legacy(self, **kwargs: Any) -> InstrumentedLLMService | GeminiLLMService:
+    def create_legacy(self, **kwargs: Any) -> InstrumentedLLMService | ILLMService:
         """Create legacy model instance"""
         return self.create(preset="legacy", **kwargs)
 
@@ -188,7 +184,7 @@ class LLMServiceFactory:
         return cls()
 
     @classmethod
-    def create_gemini_service(cls) -> InstrumentedLLMService | GeminiLLMService:
+    def create_gemini_service(cls) -> InstrumentedLLMService | ILLMService:
         """Create default Gemini service (for backward compatibility)"""
         factory = cls()
         return factory.create_fast()
@@ -1,5 +1,6 @@
 """Centralized LLM Service for managing LLM operations"""
 
+import asyncio
 import logging
 import os
 import time
@@ -139,6 +140,24 @@ class LLMService:
         self._last_request_time = time.time()
         self._request_count += 1
 
+    async def _ahandle_rate_limit(self) -> None:
+        """Handle rate limiting without blocking the event loop
+
+        The next request slot is reserved before sleeping, so concurrent
+        callers are spaced out instead of all waking up at once.
+        """
+        current_time = time.time()
+        scheduled_time = max(
+            current_time, self._last_request_time + self._rate_limit_delay
+        )
+        self._last_request_time = scheduled_time
+        self._request_count += 1
+
+        sleep_time = scheduled_time - current_time
+        if sleep_time > 0:
+            logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
+
     def _convert_exception(self, e: Exception) -> LLMError:
         """Convert exceptions to LLMError types"""
         error_str = str(e).lower()
@@ -188,6 +207,37 @@ class LLMService:
             logger.error(f"Error invoking chain: {llm_error}")
             raise llm_error from e
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=60),
+        retry=retry_if_exception_type((LLMRateLimitError, LLMTimeoutError)),
+    )
+    async def ainvoke_with_retry(
+        self,
+        chain: Runnable[dict[str, Any], Any],
+        input_data: dict[str, Any],
+        max_retries: int = 3,
+    ) -> Any:
+        """
+        Invoke a chain asynchronously with retry logic and rate limiting
+
+        Args:
+            chain: The chain to invoke
+            input_data: Input data for the chain
+            max_retries: Maximum number of retries
+
+        Returns:
+            Result from the chain
+        """
+        await self._ahandle_rate_limit()
+
+        try:
+            return await chain.ainvoke(input_data)
+        except Exception as e:
+            llm_error = self._convert_exception(e)
+            logger.error(f"Error invoking chain: {llm_error}")
+            raise llm_error from e
+
     def get_prompt(self, prompt_key: str) -> ChatPromptTemplate:
         """
         Get prompt template by key
@@ -2,6 +2,7 @@
 
 from .content_extractor import ContentExtractor
 from .date_parser import DateParser
+from .kokkai_page_extractor import KokkaiPageSnapshot
 from .speaker_extractor import SpeakerExtractor
 
-__all__ = ["ContentExtractor", "DateParser", "SpeakerExtractor"]
+__all__ = ["ContentExtractor", "DateParser", "KokkaiPageSnapshot", "SpeakerExtractor"]
@@ -0,0 +1,97 @@
+"""Single-roundtrip extraction of Kokkai minutes pages
+
+国会会議録検索システムのページから、見出し・本文テーブル・発言者の情報を
+まとめて取り出す。ブラウザ上では1回のpage.evaluateでJSONとして受け取り、
+保存済みHTMLなどブラウザがない場合はPython側でHTMLをパースする。
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from bs4 import BeautifulSoup
+from bs4.element import NavigableString
+
+# これより短いセルは本文とみなさない
+MIN_CONTENT_LENGTH = 20
+
+# テーブル・発言者・見出しを1回のラウンドトリップで取得するスクリプト
+KOKKAI_SNAPSHOT_SCRIPT = """
+(minContentLength) => {
+    const contentCells = [];
+    for (const table of document.querySelectorAll("table")) {
+        for (const row of table.querySelectorAll("tr")) {
+            const cells = row.querySelectorAll("td");
+            if (cells.length >= 2) {
+                contentCells.push(cells[1].innerText);
+            }
+        }
+    }
+    const hasContent = contentCells.some(
+        (text) => text.trim().length > minContentLength
+    );
+    const heading = document.querySelector("h2");
+    return {
+        heading: heading ? heading.innerText : null,
+        title: document.title,
+        contentCells,
+        speakerTexts: Array.from(
+            document.querySelectorAll('div[class*="speaker"]'),
+            (div) => div.innerText
+        ),
+        bodyText: hasContent ? null : document.body.innerText,
+    };
+}
+"""
+
+
+@dataclass
+class KokkaiPageSnapshot:
+    """議事録ページから抽出に必要な部分だけを写し取ったもの"""
+
+    heading: str | None = None
+    title: str = ""
+    content_cells: list[str] = field(default_factory=list)
+    speaker_texts: list[str] = field(default_factory=list)
+    # 本文テーブルが見つからない場合のみ設定される
+    body_text: str | None = None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "KokkaiPageSnapshot":
+        """KOKKAI_SNAPSHOT_SCRIPTの戻り値から生成"""
+        return cls(
+            heading=payload.get("heading"),
+            title=payload.get("title") or "",
+            content_cells=list(payload.get("contentCells") or []),
+            speaker_texts=list(payload.get("speakerTexts") or []),
+            body_text=payload.get("bodyText"),
+        )
+
+    @classmethod
+    def from_html(cls, html: str) -> "KokkaiPageSnapshot":
+        """HTMLをパースして生成（KOKKAI_SNAPSHOT_SCRIPTと同じ規則）"""
+        soup = BeautifulSoup(html, "html.parser")
+        # innerTextと同様に<br>を改行として扱う
+        for br in soup.find_all("br"):
+            br.replace_with(NavigableString("\n"))
+
+        content_cells: list[str] = []
+        for table in soup.find_all("table"):
+            for row in table.find_all("tr"):
+                cells = row.find_all("td")
+                if len(cells) >= 2:
+                    content_cells.append(cells[1].get_text())
+
+        has_content = any(
+            len(text.strip()) > MIN_CONTENT_LENGTH for text in content_cells
+        )
+        heading = soup.find("h2")
+        body = soup.body or soup
+        return cls(
+            heading=heading.get_text() if heading else None,
+            title=soup.title.get_text() if soup.title else "",
+            content_cells=content_cells,
+            speaker_texts=[
+                div.get_text(" ") for div in soup.select('div[class*="speaker"]')
+            ],
+            body_text=None if has_content else body.get_text("\n"),
+        )
@@ -1,18 +1,72 @@
 """kaigiroku.net議事録システムスクレーパー"""
 
-import asyncio
+import re
 from datetime import datetime
-from urllib.parse import parse_qs, urlparse
+from urllib.parse import parse_qs, urljoin, urlparse
 
 from bs4 import BeautifulSoup
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Page
 
 from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external.browser_pool import BrowserPool, get_browser_pool
+from src.infrastructure.external.fetch_strategy import (
+    FetchMode,
+    FetchStrategy,
+    StaticPageCheck,
+    get_fetch_strategy,
+)
+from src.infrastructure.external.page_readiness import (
+    PageReadiness,
+    ReadinessProfile,
+    get_page_readiness,
+)
 
 from .base_scraper import BaseScraper
 from .extractors import ContentExtractor, SpeakerExtractor
 from .handlers import FileHandler, PDFHandler
 from .models import MinutesData, SpeakerData
+from .scrape_index import record_validators
+
+# 議事録ビューの描画完了の判定条件（いずれかのセレクタ出現後、DOMの変化が止まるまで）
+MINUTE_VIEW_READINESS = ReadinessProfile(
+    name="kaigiroku.net",
+    ready_selectors=(
+        "#minuteFrame",  # iframe要素
+        'iframe[name="minuteFrame"]',
+        "#plain-minute",
+        ".minute-content",
+        ".meeting-content",
+        "#meeting-text",
+        'div[id*="minute"]',
+        'div[class*="minute"]',
+        'a[href*=".pdf"]',
+    ),
+    max_wait_ms=10000,
+)
+
+# iframe内やテキスト表示ページはDOMの変化が止まるまで待つ
+MINUTE_TEXT_READINESS = ReadinessProfile(name="kaigiroku.net-text", max_wait_ms=5000)
+
+# HTTPで取得したHTMLをそのまま使える条件（本文またはPDFリンクがあること）
+# iframe内の本文は静的HTMLに含まれないため、iframeのセレクタは含めない
+MINUTE_VIEW_STATIC_CHECK = StaticPageCheck(
+    name="kaigiroku.net",
+    content_selectors=(
+        "#plain-minute",
+        ".minute-content",
+        ".meeting-content",
+        "#meeting-text",
+        'div[id*="minute"]',
+        'div[class*="minute"]',
+        'a[href*=".pdf"]',
+    ),
+)
+
+# テキスト表示ページは本文が十分な長さであればよい
+MINUTE_TEXT_STATIC_CHECK = StaticPageCheck(name="kaigiroku.net-text")
+
+# 本文とみなす最小の文字数
+MIN_CONTENT_LENGTH = 100
 
 
 class KaigirokuNetScraper(BaseScraper):
@@ -27,9 +81,20 @@ class KaigirokuNetScraper(BaseScraper):
     tenant名が異なっても同じ構造で議事録を取得可能です。
     """
 
-    def __init__(self, headless: bool = True, download_dir: str = "data/scraped"):
+    def __init__(
+        self,
+        headless: bool = True,
+        download_dir: str = "data/scraped",
+        browser_pool: BrowserPool | None = None,
+        page_readiness: PageReadiness | None = None,
+        fetch_strategy: FetchStrategy | None = None,
+    ):
         super().__init__()
         self.headless = headless
+        self.browser_pool = browser_pool or get_browser_pool(headless)
+        self.page_readiness = page_readiness or get_page_readiness()
+        # 静的HTMLで取得できるページはブラウザを使わない
+        self.fetch_strategy = fetch_strategy or get_fetch_strategy()
         self.settings = get_settings()
 
         # コンポーネントの初期化
@@ -40,18 +105,18 @@ class KaigirokuNetScraper(BaseScraper):
 
     async def fetch_minutes(self, url: str) -> MinutesData | None:
         """指定されたURLから議事録を取得"""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            try:
-                context = await browser.new_context(
-                    user_agent=(
-                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                        "AppleWebKit/537.36 (KHTML, like Gecko) "
-                        "Chrome/120.0.0.0 Safari/537.36"
-                    )
+        try:
+            minutes = await self._fetch_minutes_over_http(url)
+            if minutes:
+                return minutes
+
+            async with self.browser_pool.page(
+                user_agent=(
+                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                    "AppleWebKit/537.36 (KHTML, like Gecko) "
+                    "Chrome/120.0.0.0 Safari/537.36"
                 )
-                page = await context.new_page()
-
+            ) as page:
                 self.logger.info(f"Loading URL: {url}")
 
                 # ページを読み込み
@@ -66,9 +131,8 @@ class KaigirokuNetScraper(BaseScraper):
 
                 self.logger.info(f"Response status: {response.status}")
 
-                # JavaScriptの実行を待つ
-                await page.wait_for_load_state("networkidle")
-                await asyncio.sleep(5)  # 追加の待機時間
+                # JavaScriptレンダリング待機
+                await self._wait_for_content(page)
 
                 # URLパラメータを抽出
                 council_id, schedule_id = self._extract_url_params(url)
@@ -82,9 +146,6 @@ class KaigirokuNetScraper(BaseScraper):
                         pdf_url, url, council_id, schedule_id
                     )
 
-                # JavaScriptレンダリング待機
-                await self._wait_for_content(page)
-
                 # iframeコンテンツの処理
                 iframe_content = await self._extract_iframe_content(page)
 
@@ -106,7 +167,7 @@ class KaigirokuNetScraper(BaseScraper):
                 speakers = self.speaker_extractor.extract_speakers_with_context(soup)
 
                 # コンテンツが空の場合は、ページ全体のテキストを取得
-                if not content or len(content.strip()) < 100:
+                if not content or len(content.strip()) < MIN_CONTENT_LENGTH:
                     self.logger.warning(
                         "Content is too short, trying to extract all text"
                     )
@@ -114,13 +175,11 @@ class KaigirokuNetScraper(BaseScraper):
 
                 # それでも空の場合は、テキスト表示用のURLを試す
                 text_view_url = None
-                if not content or len(content.strip()) < 100:
+                if not content or len(content.strip()) < MIN_CONTENT_LENGTH:
                     text_view_url = await self._find_text_view_url(page)
                     if text_view_url:
                         self.logger.info(f"Trying text view URL: {text_view_url}")
-                        await page.goto(text_view_url, wait_until="networkidle")
-                        await asyncio.sleep(3)
-                        content = await page.evaluate('document.body.innerText || ""')
+                        content = await self._fetch_text_view(page, text_view_url)
 
                 # メタデータを抽出
                 metadata = self.content_extractor.extract_metadata(soup)
@@ -138,15 +197,91 @@ class KaigirokuNetScraper(BaseScraper):
                     text_view_url=text_view_url,
                     metadata=metadata,
                 )
+        except Exception as e:
+            self.logger.error(f"Error fetching minutes from {url}: {e}")
+            import traceback
+
+            self.logger.error(traceback.format_exc())
+            return None
 
-            except Exception as e:
-                self.logger.error(f"Error fetching minutes from {url}: {e}")
-                import traceback
+    async def _fetch_minutes_over_http(self, url: str) -> MinutesData | None:
+        """ブラウザを使わずにHTTPで取得したHTMLから議事録を抽出
 
-                self.logger.error(traceback.format_exc())
-                return None
-            finally:
-                await browser.close()
+        本文やPDFリンクが静的HTMLに含まれない場合はNoneを返し、
+        ドメイン単位でブラウザでの取得に切り替える
+        """
+        response = await self.fetch_strategy.fetch_static(url, MINUTE_VIEW_STATIC_CHECK)
+        if response is None:
+            return None
+
+        council_id, schedule_id = self._extract_url_params(url)
+        soup = BeautifulSoup(response.text, "html.parser")
+
+        pdf_url = self._find_pdf_link(soup, response.url)
+        if pdf_url:
+            self.logger.info(f"Found PDF URL: {pdf_url}")
+            minutes = await self._download_pdf_as_minutes(
+                pdf_url, url, council_id, schedule_id
+            )
+            if minutes:
+                # 再スクレイピング時に条件付きリクエストで変更を確認できる
+                minutes.metadata["fetch_mode"] = FetchMode.HTTP.value
+                record_validators(minutes, response)
+            return minutes
+
+        content = self.content_extractor.extract_content(response.text)
+        if not content or len(content.strip()) < MIN_CONTENT_LENGTH:
+            self.fetch_strategy.mark_needs_browser(
+                url, MINUTE_VIEW_STATIC_CHECK, "minutes text is not in the HTML"
+            )
+            return None
+
+        self.logger.info(f"Fetched minutes without a browser: {url}")
+        metadata = self.content_extractor.extract_metadata(soup)
+        metadata["fetch_mode"] = FetchMode.HTTP.value
+        minutes = MinutesData(
+            council_id=council_id,
+            schedule_id=schedule_id,
+            title=self.content_extractor.extract_title(soup),
+            date=self.date_parser.extract_from_text(response.text),
+            content=content,
+            speakers=self.speaker_extractor.extract_speakers_with_context(soup),
+            url=url,
+            scraped_at=datetime.now(),
+            metadata=metadata,
+        )
+        record_validators(minutes, response)
+        return minutes
+
+    async def _fetch_text_view(self, page: Page, text_view_url: str) -> str:
+        """テキスト表示ページの本文を取得（静的なページはHTTPで取得）"""
+        response = await self.fetch_strategy.fetch_static(
+            text_view_url, MINUTE_TEXT_STATIC_CHECK
+        )
+        if response is not None:
+            soup = BeautifulSoup(response.text, "html.parser")
+            for tag in soup(["script", "style"]):
+                tag.decompose()
+            body = soup.body or soup
+            return body.get_text("\n", strip=True)
+
+        await page.goto(text_view_url, wait_until="domcontentloaded")
+        await self.page_readiness.wait(page, MINUTE_TEXT_READINESS)
+        return await page.evaluate('document.body.innerText || ""')
+
+    def _find_pdf_link(self, soup: BeautifulSoup, base_url: str) -> str | None:
+        """静的HTMLからPDFのリンクを探す"""
+        for element in soup.select("a[href], a[onclick], button[onclick]"):
+            href = element.get("href")
+            if isinstance(href, str) and ".pdf" in href:
+                return urljoin(base_url, href)
+
+            onclick = element.get("onclick")
+            if isinstance(onclick, str) and "download" in onclick:
+                pdf_match = re.search(r'["\']([^"\']*\.pdf[^"\']*)["\']', onclick)
+                if pdf_match:
+                    return urljoin(base_url, pdf_match.group(1))
+        return None
 
     def _extract_url_params(self, url: str) -> tuple[str, str]:
         """URLからパラメータを抽出"""
@@ -157,51 +292,26 @@ class KaigirokuNetScraper(BaseScraper):
         return council_id, schedule_id
 
     async def _wait_for_content(self, page: Page):
-        """議事録コンテンツの読み込みを待機"""
-        # kaigiroku.netの動的コンテンツ読み込みを待機
+        """議事録コンテンツの読み込みを待機
+
+        固定時間は待たず、コンテンツのセレクタが現れてDOMの変化が
+        止まった時点で抜ける（上限はMINUTE_VIEW_READINESS.max_wait_ms）
+        """
         self.logger.info("Waiting for content to load...")
 
-        # まず基本的なページ読み込みを待つ
-        await asyncio.sleep(3)
-
-        # 複数の可能なセレクタを試す
-        content_selectors = [
-            "#minuteFrame",  # iframe要素
-            'iframe[name="minuteFrame"]',
-            "#plain-minute",
-            ".minute-content",
-            ".meeting-content",
-            "#meeting-text",
-            'div[id*="minute"]',
-            'div[class*="minute"]',
-        ]
-
-        content_found = False
-        for selector in content_selectors:
-            try:
-                await page.wait_for_selector(
-                    selector, timeout=self.settings.selector_wait_timeout * 1000
-                )
-                self.logger.info(f"Found content selector: {selector}")
-                content_found = True
-                break
-            except Exception:
-                continue
-
-        if not content_found:
-            self.logger.warning(
-                "No standard content selectors found, checking for iframes..."
-            )
+        if await self.page_readiness.wait(page, MINUTE_VIEW_READINESS):
+            return
 
-            # iframeをチェック
-            iframes = await page.query_selector_all("iframe")
-            if iframes:
-                self.logger.info(
-                    f"Found {len(iframes)} iframes, may need to handle iframe content"
-                )
+        self.logger.warning(
+            "No standard content selectors found, checking for iframes..."
+        )
 
-        # 最終的な待機時間
-        await asyncio.sleep(2)
+        # iframeをチェック
+        iframes = await page.query_selector_all("iframe")
+        if iframes:
+            self.logger.info(
+                f"Found {len(iframes)} iframes, may need to handle iframe content"
+            )
 
     async def _extract_iframe_content(self, page: Page) -> str | None:
         """iframeからコンテンツを抽出"""
@@ -215,7 +325,7 @@ class KaigirokuNetScraper(BaseScraper):
                 if frame:
                     self.logger.info("Found minuteFrame iframe, extracting content...")
                     # iframe内のコンテンツを待つ
-                    await asyncio.sleep(2)
+                    await self.page_readiness.wait(frame, MINUTE_TEXT_READINESS)
                     return await frame.content()
 
             # 他のiframeも試す
@@ -229,7 +339,7 @@ class KaigirokuNetScraper(BaseScraper):
                             "minute" in frame_url.lower()
                             or "content" in frame_url.lower()
                         ):
-                            await asyncio.sleep(1)
+                            await self.page_readiness.wait(frame, MINUTE_TEXT_READINESS)
                             return await frame.content()
                     except Exception:
                         continue
@@ -292,8 +402,6 @@ class KaigirokuNetScraper(BaseScraper):
                     onclick = await element.get_attribute("onclick")
                     if onclick:
                         # JavaScript関数からURLを抽出
-                        import re
-
                         pdf_match = re.search(
                             r'["\']([^"\']*\.pdf[^"\']*)["\']', onclick
                         )
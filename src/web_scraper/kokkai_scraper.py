@@ -9,32 +9,49 @@ import re
 from datetime import datetime
 from typing import Any
 
-from playwright.async_api import Page, async_playwright
+from playwright.async_api import Page
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.infrastructure.config.settings import settings
+from src.infrastructure.external.browser_pool import BrowserPool, get_browser_pool
+from src.infrastructure.external.fetch_strategy import (
+    FetchMode,
+    FetchStrategy,
+    StaticPageCheck,
+    get_fetch_strategy,
+)
 
 from .base_scraper import BaseScraper
 from .exceptions import ScraperConnectionError, ScraperParseError
+from .extractors.kokkai_page_extractor import (
+    KOKKAI_SNAPSHOT_SCRIPT,
+    MIN_CONTENT_LENGTH,
+    KokkaiPageSnapshot,
+)
 from .models import MinutesData, SpeakerData
+from .scrape_index import record_validators
 
 logger = logging.getLogger(__name__)
 
+# 静的HTMLのままで会議録として読める条件（会議情報の見出しと本文テーブル）
+KOKKAI_STATIC_CHECK = StaticPageCheck(
+    name="kokkai", content_selectors=("h2", "table td")
+)
+
 
 class KokkaiScraper(BaseScraper):
     """国会会議録検索システム用スクレイパー"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        browser_pool: BrowserPool | None = None,
+        fetch_strategy: FetchStrategy | None = None,
+    ):
         super().__init__()
         self.base_url = "https://kokkai.ndl.go.jp"
-
-    async def _create_browser(self):
-        """Playwrightブラウザを作成"""
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True, args=["--no-sandbox", "--disable-setuid-sandbox"]
-        )
-        return browser
+        self.browser_pool = browser_pool or get_browser_pool()
+        # 静的HTMLで取得できるページはブラウザを使わない
+        self.fetch_strategy = fetch_strategy or get_fetch_strategy()
 
     async def _load_page_with_retry(
         self, page: Page, url: str, retry_count: int = 3
@@ -80,16 +97,17 @@ class KokkaiScraper(BaseScraper):
 
     async def fetch_minutes(self, url: str) -> MinutesData | None:
         """議事録を取得"""
-        browser = None
         try:
-            browser = await self._create_browser()
-            page = await browser.new_page()
+            minutes_data = await self._fetch_minutes_over_http(url)
+            if minutes_data:
+                return minutes_data
 
-            # ページを読み込み
-            await self._load_page_with_retry(page, url)
+            async with self.browser_pool.page() as page:
+                # ページを読み込み
+                await self._load_page_with_retry(page, url)
 
-            # 議事録データを抽出
-            minutes_data = await self._extract_minutes_data(page, url)
+                # 議事録データを抽出
+                minutes_data = await self._extract_minutes_data(page, url)
 
             if not minutes_data:
                 logger.warning(f"No minutes data found for URL: {url}")
@@ -102,210 +120,201 @@ class KokkaiScraper(BaseScraper):
             raise ScraperParseError(
                 f"Failed to fetch minutes from kokkai.ndl.go.jp: {url} - {str(e)}"
             ) from e
-        finally:
-            if browser:
-                await browser.close()
 
-    async def _extract_minutes_data(self, page: Page, url: str) -> MinutesData | None:
-        """議事録データを抽出"""
-        try:
-            # 会議情報を取得
-            meeting_info = await self._extract_meeting_info(page)
-
-            # タイトルを取得
-            title = await self._extract_title(page)
-            if not title:
-                title = meeting_info.get("title", "国会議事録")
-
-            # 日付を取得
-            date = self._parse_date(meeting_info.get("date", ""))
-
-            # 本文を取得
-            content = await self._extract_content(page)
-            if not content:
-                logger.warning("No content found")
-                return None
+    async def _fetch_minutes_over_http(self, url: str) -> MinutesData | None:
+        """ブラウザを使わずにHTTPで取得したHTMLから議事録を抽出
 
-            # 発言者情報を抽出
-            speakers = await self._extract_speakers(page)
-
-            # MinId から council_id と schedule_id を生成
-            council_id, schedule_id = self._extract_ids_from_url(url)
+        JavaScriptでの描画が必要なページの場合はNoneを返し、
+        ドメイン単位でブラウザでの取得に切り替える
+        """
+        response = await self.fetch_strategy.fetch_static(url, KOKKAI_STATIC_CHECK)
+        if response is None:
+            return None
 
-            return MinutesData(
-                url=url,
-                title=title,
-                date=date,
-                content=content,
-                speakers=speakers,
-                council_id=council_id,
-                schedule_id=schedule_id,
-                scraped_at=datetime.now(),
-                metadata=meeting_info,
-            )
+        snapshot = KokkaiPageSnapshot.from_html(response.text)
+        if snapshot.body_text is None:
+            minutes_data = self._minutes_from_snapshot(snapshot, url)
+            if minutes_data:
+                logger.info(f"Fetched minutes without a browser: {url}")
+                # 再スクレイピング時に条件付きリクエストで変更を確認できる
+                minutes_data.metadata["fetch_mode"] = FetchMode.HTTP.value
+                record_validators(minutes_data, response)
+                return minutes_data
+
+        # 本文テーブルが見つからない場合はブラウザで描画する
+        self.fetch_strategy.mark_needs_browser(
+            url, KOKKAI_STATIC_CHECK, "no minutes table in HTML"
+        )
+        return None
 
+    async def _extract_minutes_data(self, page: Page, url: str) -> MinutesData | None:
+        """議事録データを抽出"""
+        try:
+            snapshot = await self._snapshot_page(page)
+            return self._minutes_from_snapshot(snapshot, url)
         except Exception as e:
             logger.error(f"Error extracting minutes data: {e}")
             raise
 
-    async def _extract_meeting_info(self, page: Page) -> dict[str, Any]:
-        """会議情報を抽出"""
-        meeting_info: dict[str, Any] = {}
+    async def _snapshot_page(self, page: Page) -> KokkaiPageSnapshot:
+        """ページの必要な情報を1回のラウンドトリップで取得
 
+        要素ごとにquery_selector/inner_textを呼ぶと長い会議では数千回の
+        通信になるため、ページ内のスクリプトでまとめてJSONとして受け取る
+        """
         try:
-            # h2タグから会議情報を取得
-            h2_element = await page.query_selector("h2")
-
-            if h2_element:
-                # h2タグのテキストから会議情報を抽出
-                h2_text = await h2_element.inner_text()
-                meeting_info["title"] = h2_text.strip()
-
-                # テキストから情報をパース
-                # 例: "第217回国会　衆議院　北朝鮮による拉致問題等に関する特別委員会
-                # 第3号　令和7年4月23日"
-                parts = h2_text.split("　")
-                for part in parts:
-                    if "国会" in part:
-                        meeting_info["国会"] = part
-                    elif "院" in part:
-                        meeting_info["院"] = part
-                    elif "委員会" in part:
-                        meeting_info["委員会"] = part
-                    elif "第" in part and "号" in part:
-                        meeting_info["号数"] = part
-                    elif "年" in part and "月" in part and "日" in part:
-                        meeting_info["date"] = part
-
-            logger.info(f"Extracted meeting info: {meeting_info}")
-
+            payload = await page.evaluate(KOKKAI_SNAPSHOT_SCRIPT, MIN_CONTENT_LENGTH)
+            return KokkaiPageSnapshot.from_payload(payload)
         except Exception as e:
-            logger.warning(f"Error extracting meeting info: {e}")
+            # スクリプトが使えない場合はHTMLを取得してPython側でパース
+            logger.warning(f"Snapshot script failed, parsing page HTML: {e}")
+            return KokkaiPageSnapshot.from_html(await page.content())
+
+    def _minutes_from_snapshot(
+        self, snapshot: KokkaiPageSnapshot, url: str
+    ) -> MinutesData | None:
+        """スナップショットから議事録データを組み立てる"""
+        # 会議情報を取得
+        meeting_info = self._extract_meeting_info(snapshot)
+
+        # タイトルを取得
+        title = self._extract_title(snapshot)
+        if not title:
+            title = meeting_info.get("title", "国会議事録")
+
+        # 日付を取得
+        date = self._parse_date(meeting_info.get("date", ""))
+
+        # 本文を取得
+        content = self._extract_content(snapshot)
+        if not content:
+            logger.warning("No content found")
+            return None
+
+        # 発言者情報を抽出
+        speakers = self._extract_speakers(snapshot)
+
+        # MinId から council_id と schedule_id を生成
+        council_id, schedule_id = self._extract_ids_from_url(url)
+
+        return MinutesData(
+            url=url,
+            title=title,
+            date=date,
+            content=content,
+            speakers=speakers,
+            council_id=council_id,
+            schedule_id=schedule_id,
+            scraped_at=datetime.now(),
+            metadata=meeting_info,
+        )
+
+    def _extract_meeting_info(self, snapshot: KokkaiPageSnapshot) -> dict[str, Any]:
+        """会議情報を抽出"""
+        meeting_info: dict[str, Any] = {}
 
+        # h2タグから会議情報を取得
+        h2_text = snapshot.heading
+        if h2_text:
+            meeting_info["title"] = h2_text.strip()
+
+            # テキストから情報をパース
+            # 例: "第217回国会　衆議院　北朝鮮による拉致問題等に関する特別委員会
+            # 第3号　令和7年4月23日"
+            parts = h2_text.split("　")
+            for part in parts:
+                if "国会" in part:
+                    meeting_info["国会"] = part
+                elif "院" in part:
+                    meeting_info["院"] = part
+                elif "委員会" in part:
+                    meeting_info["委員会"] = part
+                elif "第" in part and "号" in part:
+                    meeting_info["号数"] = part
+                elif "年" in part and "月" in part and "日" in part:
+                    meeting_info["date"] = part
+
+        logger.info(f"Extracted meeting info: {meeting_info}")
         return meeting_info
 
-    async def _extract_title(self, page: Page) -> str:
+    def _extract_title(self, snapshot: KokkaiPageSnapshot) -> str:
         """タイトルを抽出"""
-        try:
-            # h2タグからタイトルを取得
-            h2_element = await page.query_selector("h2")
-            if h2_element:
-                title = await h2_element.inner_text()
-                if title and title.strip():
-                    return title.strip()
-
-            # ページタイトルから取得
-            page_title = await page.title()
-            if page_title:
-                # " | テキスト表示 | 国会会議録検索システム" を削除
-                if " | " in page_title:
-                    return page_title.split(" | ")[0].strip()
-                return page_title
-
-        except Exception as e:
-            logger.warning(f"Error extracting title: {e}")
+        # h2タグからタイトルを取得
+        if snapshot.heading and snapshot.heading.strip():
+            return snapshot.heading.strip()
+
+        # ページタイトルから取得
+        page_title = snapshot.title
+        if page_title:
+            # " | テキスト表示 | 国会会議録検索システム" を削除
+            if " | " in page_title:
+                return page_title.split(" | ")[0].strip()
+            return page_title
 
         return ""
 
-    async def _extract_content(self, page: Page) -> str:
+    def _extract_content(self, snapshot: KokkaiPageSnapshot) -> str:
         """本文を抽出"""
-        content_parts: list[str] = []
-
-        try:
-            # テーブル内の発言データを取得
-            tables = await page.query_selector_all("table")
-
-            for table in tables:
-                # テーブル内の行を取得
-                rows = await table.query_selector_all("tr")
-                for row in rows:
-                    # 発言者情報と発言内容を含む行を探す
-                    cells = await row.query_selector_all("td")
-                    if len(cells) >= 2:
-                        # 最初のセルが発言者、二番目が内容の可能性
-                        content_cell = cells[1] if len(cells) > 1 else None
-
-                        if content_cell:
-                            content_text = await content_cell.inner_text()
-                            if (
-                                content_text
-                                and content_text.strip()
-                                and len(content_text.strip()) > 20
-                            ):
-                                content_parts.append(content_text.strip())
-
-            # テーブルからコンテンツが取得できない場合
-            if not content_parts:
-                logger.warning(
-                    "No content found in tables, trying alternative approach"
-                )
-                # 全体のテキストを取得
-                body_text = await page.inner_text("body")
-                if body_text:
-                    # 不要な部分を除去
-                    lines = body_text.split("\n")
-                    for line in lines:
-                        line = line.strip()
-                        # 長いテキストで、ナビゲーションやヘッダーでないもの
-                        skip_words = [
-                            "シンプル表示",
-                            "ヘルプ",
-                            "検索",
-                            "ダウンロード",
-                        ]
-                        if len(line) > 50 and not any(
-                            skip in line for skip in skip_words
-                        ):
-                            content_parts.append(line)
+        # テーブル内の発言データ（二番目のセルが内容）
+        content_parts: list[str] = [
+            text.strip()
+            for text in snapshot.content_cells
+            if text and len(text.strip()) > MIN_CONTENT_LENGTH
+        ]
 
-        except Exception as e:
-            logger.error(f"Error extracting content: {e}")
+        # テーブルからコンテンツが取得できない場合
+        if not content_parts:
+            logger.warning("No content found in tables, trying alternative approach")
+            # 全体のテキストを取得
+            if snapshot.body_text:
+                # 不要な部分を除去
+                skip_words = ["シンプル表示", "ヘルプ", "検索", "ダウンロード"]
+                for line in snapshot.body_text.split("\n"):
+                    line = line.strip()
+                    # 長いテキストで、ナビゲーションやヘッダーでないもの
+                    if len(line) > 50 and not any(skip in line for skip in skip_words):
+                        content_parts.append(line)
 
         return "\n\n".join(content_parts)
 
-    async def _extract_speakers(self, page: Page) -> list[SpeakerData]:
+    def _extract_speakers(self, snapshot: KokkaiPageSnapshot) -> list[SpeakerData]:
         """発言者情報を抽出"""
         speakers: list[SpeakerData] = []
         seen_speakers: set[str] = set()
 
-        try:
-            # div[class*="speaker"] 要素から発言者情報を取得
-            speaker_divs = await page.query_selector_all('div[class*="speaker"]')
-
-            if speaker_divs:
-                logger.info(f"Found {len(speaker_divs)} speaker divs")
-                for div in speaker_divs:
-                    # 発言者名を取得
-                    text = await div.inner_text()
-                    if text and text.strip():
-                        # 発言番号と発言者名を分離
-                        # 例: "001　牧義夫　発言者情報"
-                        parts = text.split()
-                        if len(parts) >= 2:
-                            # 数字で始まる部分をスキップ
-                            name_parts: list[str] = []
-                            skip_terms = ["発言者情報", "会議録情報"]
-                            for part in parts:
-                                if not part[0].isdigit() and part not in skip_terms:
-                                    name_parts.append(part)
-
-                            if name_parts:
-                                name = " ".join(name_parts)
-                                if name not in seen_speakers and name != "会議録情報":
-                                    seen_speakers.add(name)
-                                    speakers.append(
-                                        SpeakerData(
-                                            name=self._normalize_speaker_name(name),
-                                            role=self._extract_role(name),
-                                            content="",
-                                        )
-                                    )
-
-            logger.info(f"Extracted {len(speakers)} speakers")
+        # div[class*="speaker"] 要素から発言者情報を取得
+        if snapshot.speaker_texts:
+            logger.info(f"Found {len(snapshot.speaker_texts)} speaker divs")
+        for text in snapshot.speaker_texts:
+            if not text or not text.strip():
+                continue
+            # 発言番号と発言者名を分離
+            # 例: "001　牧義夫　発言者情報"
+            parts = text.split()
+            if len(parts) < 2:
+                continue
+            # 数字で始まる部分をスキップ
+            skip_terms = ["発言者情報", "会議録情報"]
+            name_parts = [
+                part
+                for part in parts
+                if not part[0].isdigit() and part not in skip_terms
+            ]
+            if not name_parts:
+                continue
 
-        except Exception as e:
-            logger.warning(f"Error extracting speakers: {e}")
+            name = " ".join(name_parts)
+            if name not in seen_speakers and name != "会議録情報":
+                seen_speakers.add(name)
+                speakers.append(
+                    SpeakerData(
+                        name=self._normalize_speaker_name(name),
+                        role=self._extract_role(name),
+                        content="",
+                    )
+                )
 
+        logger.info(f"Extracted {len(speakers)} speakers")
         return speakers
 
     def _normalize_speaker_name(self, name: str) -> str:
@@ -397,10 +406,8 @@ class KokkaiScraper(BaseScraper):
 
     async def extract_minutes_text(self, html_content: str) -> str:
         """HTMLから議事録テキストを抽出（BaseScraper abstract method）"""
-        # この実装はPlaywrightを使用するため、fetch_minutesメソッド内で処理
-        return ""
+        return self._extract_content(KokkaiPageSnapshot.from_html(html_content))
 
     async def extract_speakers(self, html_content: str) -> list[SpeakerData]:
         """HTMLから発言者情報を抽出（BaseScraper abstract method）"""
-        # この実装はPlaywrightを使用するため、fetch_minutesメソッド内で処理
-        return []
+        return self._extract_speakers(KokkaiPageSnapshot.from_html(html_content))
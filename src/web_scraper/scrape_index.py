@@ -0,0 +1,182 @@
+"""スクレイピング済みURLの変更検出インデックス
+
+URLごとにHTTPの検証子（ETag / Last-Modified）、レスポンス本文のハッシュ、
+議事録本文のハッシュを小さなJSONファイルに記録する。再スクレイピング時は
+これを使って条件付きリクエストを送り、議事録本文が変わったかを判定する。
+
+ブラウザなしで取得したスクレーパーは、取得時のレスポンスの検証子を
+record_validators()で議事録のメタデータに残す。初回取得時からそれを
+インデックスに保存できるため、2回目の確認から取得を省略できる。
+"""
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from src.infrastructure.external.http_client import HttpResponse
+
+from .models import MinutesData
+
+logger = logging.getLogger(__name__)
+
+# 取得時のレスポンスの検証子を記録する議事録メタデータのキー
+HTTP_VALIDATORS_KEY = "http_validators"
+
+
+def hash_text(text: str) -> str:
+    """テキストのSHA-256ハッシュを返す"""
+    return hash_bytes(text.encode("utf-8"))
+
+
+def hash_bytes(body: bytes) -> str:
+    """バイト列のSHA-256ハッシュを返す"""
+    return hashlib.sha256(body).hexdigest()
+
+
+def record_validators(minutes: MinutesData, response: HttpResponse) -> None:
+    """議事録を抽出したレスポンスの検証子をメタデータに記録する"""
+    minutes.metadata[HTTP_VALIDATORS_KEY] = {
+        "etag": response.etag,
+        "last_modified": response.last_modified,
+        "body_hash": hash_bytes(response.body),
+    }
+
+
+@dataclass
+class ScrapeIndexEntry:
+    """URLごとの変更検出情報"""
+
+    url: str
+    content_hash: str  # 議事録本文のハッシュ
+    checked_at: datetime  # 最後に取得元を確認した日時
+    changed_at: datetime  # 議事録本文が最後に変わった日時
+    static: bool = False  # ブラウザを使わずに取得できるページか
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: str | None = None  # レスポンス本文のハッシュ
+
+    def set_validators(
+        self, etag: str | None, last_modified: str | None, body_hash: str | None
+    ) -> None:
+        """次回の条件付きリクエストと本文比較に使う情報を設定"""
+        self.etag = etag
+        self.last_modified = last_modified
+        self.body_hash = body_hash
+
+    @property
+    def has_validators(self) -> bool:
+        """条件付きリクエストや本文比較に使える情報があるか"""
+        return bool(self.etag or self.last_modified or self.body_hash)
+
+    def is_stale(self, max_age: timedelta | None, now: datetime) -> bool:
+        """再確認が必要か（max_ageがNoneの場合は期限なし）"""
+        if max_age is None:
+            return False
+        return now - self.checked_at >= max_age
+
+    def to_dict(self) -> dict[str, Any]:
+        """辞書形式に変換"""
+        return {
+            "url": self.url,
+            "content_hash": self.content_hash,
+            "checked_at": self.checked_at.isoformat(),
+            "changed_at": self.changed_at.isoformat(),
+            "static": self.static,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "body_hash": self.body_hash,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ScrapeIndexEntry":
+        """辞書からインスタンスを生成"""
+        return cls(
+            url=data["url"],
+            content_hash=data["content_hash"],
+            checked_at=datetime.fromisoformat(data["checked_at"]),
+            changed_at=datetime.fromisoformat(data["changed_at"]),
+            static=data.get("static", False),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            body_hash=data.get("body_hash"),
+        )
+
+
+class ScrapeIndex:
+    """URLごとの変更検出情報をJSONファイルで管理する"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries = self._load()
+        self._deferred = 0  # deferred()のネストの深さ
+        self._dirty = False
+
+    def get(self, url: str) -> ScrapeIndexEntry | None:
+        """URLのエントリを取得"""
+        return self._entries.get(url)
+
+    def put(self, entry: ScrapeIndexEntry) -> None:
+        """エントリを登録してファイルに書き込む（deferred()内では終了時に書く）"""
+        self._entries[entry.url] = entry
+        self._dirty = True
+        if not self._deferred:
+            self.flush()
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """ブロック内の書き込みをまとめ、終了時に一度だけファイルに保存する
+
+        一括スクレイピングでURLごとにインデックス全体を書き直さないために使う
+        """
+        self._deferred += 1
+        try:
+            yield
+        finally:
+            self._deferred -= 1
+            if not self._deferred:
+                self.flush()
+
+    def flush(self) -> None:
+        """未保存の変更をファイルに書き込む"""
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> dict[str, ScrapeIndexEntry]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return {
+                url: ScrapeIndexEntry.from_dict(entry) for url, entry in data.items()
+            }
+        except Exception as e:
+            # 壊れたインデックスは捨てる（次回の取得で作り直される）
+            logger.warning(f"Failed to load scrape index {self.path}: {e}")
+            return {}
+
+    def _save(self) -> None:
+        # 書き込み途中で中断されてもインデックスが壊れないように置き換える
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {url: entry.to_dict() for url, entry in self._entries.items()},
+                    f,
+                    ensure_ascii=False,
+                    indent=2,
+                )
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save scrape index {self.path}: {e}")
@@ -2,11 +2,21 @@
 
 import asyncio
 import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
 
 from src.infrastructure.config import config
+from src.infrastructure.config.settings import settings
 
 from ..common.logging import get_logger
+from ..infrastructure.external.browser_pool import BrowserPool, get_browser_pool
+from ..infrastructure.external.fetch_strategy import FetchMode
+from ..infrastructure.external.http_client import (
+    HttpClient,
+    HttpResponse,
+    get_http_client,
+)
 from ..infrastructure.persistence.meeting_repository_impl import MeetingRepositoryImpl
 from ..infrastructure.persistence.repository_adapter import RepositoryAdapter
 from ..utils.gcs_storage import GCSStorage
@@ -14,17 +24,48 @@ from .base_scraper import BaseScraper
 from .kaigiroku_net_scraper import KaigirokuNetScraper
 from .kokkai_scraper import KokkaiScraper
 from .models import MinutesData
+from .scrape_index import (
+    HTTP_VALIDATORS_KEY,
+    ScrapeIndex,
+    ScrapeIndexEntry,
+    hash_bytes,
+    hash_text,
+)
+
+
+@dataclass
+class ScrapeResult:
+    """スクレイピング結果と前回取得時からの変更有無"""
+
+    minutes: MinutesData | None
+    changed: bool = True  # 議事録本文が前回から変わったか（初回取得はTrue）
+    from_cache: bool = False  # 取得し直さずにキャッシュを返したか
 
 
 class ScraperService:
     """議事録スクレーパーの統合サービス"""
 
     def __init__(
-        self, cache_dir: str = "./cache/minutes", enable_gcs: bool | None = None
+        self,
+        cache_dir: str = "./cache/minutes",
+        enable_gcs: bool | None = None,
+        browser_pool: BrowserPool | None = None,
+        http_client: HttpClient | None = None,
+        revalidate_after: timedelta | None = None,
     ):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.logger = get_logger(__name__)
+        # スクレーパー間で共有するブラウザプール
+        self.browser_pool = browser_pool or get_browser_pool()
+        # 変更確認の条件付きリクエストに使うHTTPクライアント
+        self.http_client = http_client or get_http_client()
+        # URLごとのETag・Last-Modified・ハッシュ（変更検出用）
+        self.index = ScrapeIndex(self.cache_dir / "index.json")
+        # キャッシュを再確認せずに使う期間（Noneは期限なし）
+        if revalidate_after is None and settings.scrape_revalidate_after_hours > 0:
+            revalidate_after = timedelta(hours=settings.scrape_revalidate_after_hours)
+        self.revalidate_after = revalidate_after
 
         # GCS設定
         self.enable_gcs = (
@@ -47,31 +88,67 @@ class ScraperService:
         self, url: str, use_cache: bool = True
     ) -> MinutesData | None:
         """URLから議事録を取得"""
-        # キャッシュチェック
-        if use_cache:
-            cached = self._get_from_cache(url)
-            if cached:
+        result = await self.scrape(url, use_cache=use_cache)
+        return result.minutes
+
+    async def scrape(self, url: str, use_cache: bool = True) -> ScrapeResult:
+        """URLから議事録を取得し、前回取得時から本文が変わったかを判定する
+
+        キャッシュが再確認の期限内であればそのまま返す。期限切れまたは
+        use_cache=Falseの場合、ブラウザなしで取得できるページは条件付き
+        リクエストで変更を確認し、変わっていなければキャッシュを返す。
+        それ以外は取得し直して議事録本文のハッシュを前回と比較する。
+
+        Args:
+            url: 議事録のURL
+            use_cache: 再確認の期限内のキャッシュを使用するかどうか
+
+        Returns:
+            ScrapeResult（取得できなかった場合はminutesがNone）
+        """
+        now = datetime.now()
+        cached = self._get_from_cache(url)
+        entry = self.index.get(url)
+        if cached and entry is None:
+            # 変更検出の導入前に保存されたキャッシュ
+            entry = self._index_cached(url, cached)
+
+        if cached and entry:
+            if use_cache and not entry.is_stale(self.revalidate_after, now):
                 self.logger.info(f"Using cached data for {url}")
-                return cached
+                return ScrapeResult(cached, changed=False, from_cache=True)
+
+        response = None
+        if cached and entry and entry.static:
+            response = await self._revalidate(url, entry)
+            if response is not None and self._is_unchanged(entry, response):
+                self.logger.info(f"Minutes unchanged since last check: {url}")
+                self._record_unchanged(entry, response, now)
+                return ScrapeResult(cached, changed=False, from_cache=True)
 
         # URLから適切なスクレーパーを選択
         scraper = self._get_scraper_for_url(url)
         if not scraper:
             self.logger.error(f"No scraper available for URL: {url}")
-            return None
+            return ScrapeResult(None, changed=False)
 
         # スクレープ実行
         self.logger.info(f"Fetching minutes from {url}")
         try:
             minutes = await scraper.fetch_minutes(url)
-            if minutes:
-                # キャッシュに保存
-                self._save_to_cache(url, minutes)
-                return minutes
         except Exception as e:
             self.logger.error(f"Error fetching minutes: {e}")
+            return ScrapeResult(None, changed=False)
 
-        return None
+        if not minutes:
+            return ScrapeResult(None, changed=False)
+
+        # キャッシュに保存
+        self._save_to_cache(url, minutes)
+        changed = self._record_scraped(url, minutes, entry, response, now)
+        if not changed:
+            self.logger.info(f"Re-scraped minutes are unchanged: {url}")
+        return ScrapeResult(minutes, changed=changed)
 
     async def fetch_from_meeting_id(
         self, meeting_id: int, use_cache: bool = True
@@ -107,7 +184,11 @@ class ScraperService:
     async def fetch_multiple(
         self, urls: list[str], max_concurrent: int = 3
     ) -> list[MinutesData | None]:
-        """複数のURLから並列で議事録を取得"""
+        """複数のURLから並列で議事録を取得
+
+        ブラウザはプールで共有されるため、同時に開くページ数は
+        max_concurrentとプールの上限のうち小さい方に制限される
+        """
         semaphore = asyncio.Semaphore(max_concurrent)
 
         async def fetch_with_limit(url: str) -> MinutesData | None:
@@ -115,7 +196,119 @@ class ScraperService:
                 return await self.fetch_from_url(url)
 
         tasks = [fetch_with_limit(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        with self.index.deferred():
+            return await asyncio.gather(*tasks)
+
+    async def scrape_multiple(
+        self, urls: list[str], max_concurrent: int = 3, use_cache: bool = True
+    ) -> list[ScrapeResult]:
+        """複数のURLから並列で議事録を取得し、それぞれの変更有無を返す"""
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def scrape_with_limit(url: str) -> ScrapeResult:
+            async with semaphore:
+                return await self.scrape(url, use_cache=use_cache)
+
+        tasks = [scrape_with_limit(url) for url in urls]
+        # インデックスはURLごとではなく最後に一度だけ書き込む
+        with self.index.deferred():
+            return await asyncio.gather(*tasks)
+
+    async def _revalidate(
+        self, url: str, entry: ScrapeIndexEntry
+    ) -> HttpResponse | None:
+        """条件付きリクエストで取得元を確認（失敗した場合はNone）"""
+        try:
+            response = await self.http_client.get(
+                url, etag=entry.etag, last_modified=entry.last_modified
+            )
+        except Exception as e:
+            self.logger.info(f"Conditional request failed for {url}: {e}")
+            return None
+
+        if not (response.ok or response.not_modified):
+            self.logger.info(
+                f"Conditional request for {url} returned {response.status}"
+            )
+            return None
+        return response
+
+    def _is_unchanged(self, entry: ScrapeIndexEntry, response: HttpResponse) -> bool:
+        """レスポンスが前回取得時と同じ内容を示しているか"""
+        if response.not_modified:
+            return True
+        # 検証子を返さないサーバーでも本文のハッシュで判定できる
+        return entry.body_hash is not None and entry.body_hash == hash_bytes(
+            response.body
+        )
+
+    def _index_cached(self, url: str, cached: MinutesData) -> ScrapeIndexEntry:
+        """既存のキャッシュからインデックスのエントリを作成"""
+        entry = ScrapeIndexEntry(
+            url=url,
+            content_hash=hash_text(cached.content),
+            checked_at=cached.scraped_at,
+            changed_at=cached.scraped_at,
+            static=self._is_static(url, cached),
+        )
+        self.index.put(entry)
+        return entry
+
+    def _record_unchanged(
+        self, entry: ScrapeIndexEntry, response: HttpResponse, now: datetime
+    ) -> None:
+        """変更がなかったことを記録（サーバーが返した新しい検証子も保存）"""
+        entry.checked_at = now
+        entry.etag = response.etag or entry.etag
+        entry.last_modified = response.last_modified or entry.last_modified
+        self.index.put(entry)
+
+    def _record_scraped(
+        self,
+        url: str,
+        minutes: MinutesData,
+        previous: ScrapeIndexEntry | None,
+        response: HttpResponse | None,
+        now: datetime,
+    ) -> bool:
+        """取得した議事録をインデックスに記録し、本文が変わったかを返す"""
+        content_hash = hash_text(minutes.content)
+        changed = previous is None or previous.content_hash != content_hash
+        entry = ScrapeIndexEntry(
+            url=url,
+            content_hash=content_hash,
+            checked_at=now,
+            changed_at=previous.changed_at if previous and not changed else now,
+            static=self._is_static(url, minutes),
+        )
+        # 検証子はスクレーパーが取得したレスポンス（なければ確認時のレスポンス）
+        # から保存し、次回の条件付きリクエストに使う
+        if entry.static:
+            validators: dict[str, str | None] | None = minutes.metadata.get(
+                HTTP_VALIDATORS_KEY
+            )
+            if validators is not None:
+                entry.set_validators(
+                    validators.get("etag"),
+                    validators.get("last_modified"),
+                    validators.get("body_hash"),
+                )
+            elif response is not None and response.ok:
+                entry.set_validators(
+                    response.etag, response.last_modified, hash_bytes(response.body)
+                )
+        self.index.put(entry)
+        return changed
+
+    def _is_static(self, url: str, minutes: MinutesData) -> bool:
+        """ブラウザで描画せずに取得したページか
+
+        JavaScriptで描画するページは、HTMLが同じでも本文が変わりうるため
+        条件付きリクエストの結果を信用しない
+        """
+        if url.lower().endswith(".pdf"):
+            return True
+        return minutes.metadata.get("fetch_mode") == FetchMode.HTTP.value
 
     def _get_scraper_for_url(self, url: str) -> BaseScraper | None:
         """URLに基づいて適切なスクレーパーを選択"""
@@ -127,11 +320,11 @@ class ScraperService:
 
         # kaigiroku.netシステムの場合
         if "kaigiroku.net/tenant/" in url:
-            return KaigirokuNetScraper()
+            return KaigirokuNetScraper(browser_pool=self.browser_pool)
 
         # 国会会議録検索システムの場合
         if "kokkai.ndl.go.jp" in url:
-            return KokkaiScraper()
+            return KokkaiScraper(browser_pool=self.browser_pool)
 
         # 今後、他の議事録システムのスクレーパーをここに追加
         # 例: 独自システムを使う自治体など
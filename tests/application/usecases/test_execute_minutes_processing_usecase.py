@@ -6,12 +6,14 @@ from unittest.mock import AsyncMock, MagicMock, Mock, patch
 import pytest
 
 from src.application.usecases.execute_minutes_processing_usecase import (
+    STATISTICS_REFRESH_INTERVAL_SECONDS,
     ExecuteMinutesProcessingDTO,
     ExecuteMinutesProcessingUseCase,
 )
 from src.domain.entities.conversation import Conversation
 from src.domain.entities.meeting import Meeting
 from src.domain.entities.minutes import Minutes
+from src.domain.value_objects.conversation_ref import ConversationRef
 from src.domain.value_objects.speaker_speech import SpeakerSpeech
 from src.infrastructure.exceptions import APIKeyError
 
@@ -83,7 +85,7 @@ async def test_execute_success(
     mock_unit_of_work.meeting_repository.get_by_id.return_value = sample_meeting
     mock_unit_of_work.minutes_repository.get_by_meeting.return_value = None
     mock_unit_of_work.minutes_repository.create.return_value = sample_minutes
-    mock_unit_of_work.conversation_repository.get_by_minutes.return_value = []
+    mock_unit_of_work.conversation_repository.get_refs_by_minutes.return_value = []
 
     # Storage serviceをモック - download_file returns bytes
     mock_services[
@@ -167,12 +169,12 @@ async def test_execute_already_has_conversations(
     # モックの設定
     mock_unit_of_work.meeting_repository.get_by_id.return_value = sample_meeting
     mock_unit_of_work.minutes_repository.get_by_meeting.return_value = sample_minutes
-    mock_unit_of_work.conversation_repository.get_by_minutes.return_value = [
-        Conversation(
+    mock_unit_of_work.conversation_repository.get_refs_by_minutes.return_value = [
+        ConversationRef(
             id=1,
             minutes_id=1,
+            speaker_id=None,
             speaker_name="既存の発言者",
-            comment="既存の発言",
             sequence_number=1,
         )
     ]
@@ -191,12 +193,12 @@ async def test_execute_force_reprocess(
     # モックの設定
     mock_unit_of_work.meeting_repository.get_by_id.return_value = sample_meeting
     mock_unit_of_work.minutes_repository.get_by_meeting.return_value = sample_minutes
-    mock_unit_of_work.conversation_repository.get_by_minutes.return_value = [
-        Conversation(
+    mock_unit_of_work.conversation_repository.get_refs_by_minutes.return_value = [
+        ConversationRef(
             id=1,
             minutes_id=1,
+            speaker_id=None,
             speaker_name="既存の発言者",
-            comment="既存の発言",
             sequence_number=1,
         )
     ]
@@ -310,3 +312,40 @@ async def test_extract_and_create_speakers(use_case, mock_unit_of_work, mock_ser
     # 検証
     assert created_count == 2  # 重複を除いた数
     assert mock_unit_of_work.speaker_repository.create.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_statistics(mock_unit_of_work, mock_services):
+    """処理後に統計の再集計が間隔付きで要求されることをテスト"""
+    data_coverage_repo = AsyncMock()
+    use_case = ExecuteMinutesProcessingUseCase(
+        speaker_domain_service=mock_services["speaker_service"],
+        minutes_processing_service=mock_services["minutes_processing_service"],
+        storage_service=mock_services["storage_service"],
+        unit_of_work=mock_unit_of_work,
+        data_coverage_repository=data_coverage_repo,
+    )
+
+    await use_case._refresh_statistics()
+
+    data_coverage_repo.refresh_statistics.assert_awaited_once_with(
+        min_interval_seconds=STATISTICS_REFRESH_INTERVAL_SECONDS
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_statistics_failure_is_ignored(mock_unit_of_work, mock_services):
+    """統計の再集計に失敗しても例外が伝播しないことをテスト"""
+    data_coverage_repo = AsyncMock()
+    data_coverage_repo.refresh_statistics.side_effect = Exception("lock timeout")
+    use_case = ExecuteMinutesProcessingUseCase(
+        speaker_domain_service=mock_services["speaker_service"],
+        minutes_processing_service=mock_services["minutes_processing_service"],
+        storage_service=mock_services["storage_service"],
+        unit_of_work=mock_unit_of_work,
+        data_coverage_repository=data_coverage_repo,
+    )
+
+    await use_case._refresh_statistics()
+
+    data_coverage_repo.refresh_statistics.assert_awaited_once()
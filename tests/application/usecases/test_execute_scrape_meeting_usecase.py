@@ -11,6 +11,7 @@ from src.application.usecases.execute_scrape_meeting_usecase import (
     ScrapeMeetingResultDTO,
 )
 from src.domain.entities.meeting import Meeting
+from src.web_scraper.scraper_service import ScrapeResult
 
 
 class TestExecuteScrapeMeetingUseCase:
@@ -53,7 +54,7 @@ class TestExecuteScrapeMeetingUseCase:
         minutes.council_id = "council_123"
         minutes.schedule_id = "schedule_456"
         # Use AsyncMock for async method
-        service.fetch_from_meeting_id = AsyncMock(return_value=minutes)
+        service.scrape = AsyncMock(return_value=ScrapeResult(minutes))
         service.export_to_text.return_value = (True, "gs://bucket/path/to/file.txt")
         return service
 
@@ -92,6 +93,7 @@ class TestExecuteScrapeMeetingUseCase:
         assert result.speakers_count == 2
         assert result.gcs_text_uri == "gs://bucket/path/to/file.txt"
         assert result.errors is None or len(result.errors) == 0
+        assert result.content_changed is True
         mock_meeting_repository.get_by_id.assert_called_once_with(1)
         mock_meeting_repository.update.assert_called_once()
 
@@ -188,6 +190,49 @@ class TestExecuteScrapeMeetingUseCase:
         assert result.gcs_text_uri == "gs://bucket/path/to/file.txt"
         mock_meeting_repository.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_execute_force_rescrape_unchanged_minutes(
+        self,
+        use_case,
+        mock_meeting_repository,
+        mock_scraper_service,
+    ):
+        """Test that unchanged minutes keep the existing GCS data."""
+        # Arrange
+        from datetime import date
+
+        meeting_with_old_gcs = Meeting(
+            id=1,
+            url="https://example.com/meeting/123",
+            name="サンプル会議",
+            date=date(2024, 1, 1),
+            conference_id=1,
+            gcs_text_uri="gs://bucket/old.txt",
+        )
+        mock_meeting_repository.get_by_id.return_value = meeting_with_old_gcs
+        minutes = mock_scraper_service.scrape.return_value.minutes
+        mock_scraper_service.scrape.return_value = ScrapeResult(
+            minutes, changed=False, from_cache=True
+        )
+
+        request = ExecuteScrapeMeetingDTO(meeting_id=1, force_rescrape=True)
+
+        # Act
+        with patch(
+            "src.application.usecases.execute_scrape_meeting_usecase.ScraperService",
+            return_value=mock_scraper_service,
+        ):
+            result = await use_case.execute(request)
+
+        # Assert
+        assert result.content_changed is False
+        assert result.gcs_text_uri == "gs://bucket/old.txt"
+        mock_scraper_service.scrape.assert_awaited_once_with(
+            "https://example.com/meeting/123", use_cache=False
+        )
+        mock_scraper_service.export_to_text.assert_not_called()
+        mock_meeting_repository.update.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_scraping_failed(
         self, use_case, mock_meeting_repository, sample_meeting
@@ -199,7 +244,7 @@ class TestExecuteScrapeMeetingUseCase:
         mock_meeting_repository.get_by_id.return_value = sample_meeting
 
         mock_scraper = MagicMock()
-        mock_scraper.fetch_from_meeting_id = AsyncMock(return_value=None)
+        mock_scraper.scrape = AsyncMock(return_value=ScrapeResult(None, changed=False))
 
         request = ExecuteScrapeMeetingDTO(meeting_id=1)
 
@@ -231,7 +276,7 @@ class TestExecuteScrapeMeetingUseCase:
         minutes.content = "内容"
         minutes.council_id = "council_123"
         minutes.schedule_id = "schedule_456"
-        mock_scraper.fetch_from_meeting_id = AsyncMock(return_value=minutes)
+        mock_scraper.scrape = AsyncMock(return_value=ScrapeResult(minutes))
         mock_scraper.export_to_text.return_value = (True, None)
 
         request = ExecuteScrapeMeetingDTO(meeting_id=1, upload_to_gcs=False)
@@ -268,7 +313,7 @@ class TestExecuteScrapeMeetingUseCase:
         minutes.content = "内容"
         minutes.council_id = "council_123"
         minutes.schedule_id = "schedule_456"
-        mock_scraper.fetch_from_meeting_id = AsyncMock(return_value=minutes)
+        mock_scraper.scrape = AsyncMock(return_value=ScrapeResult(minutes))
         mock_scraper.export_to_text.return_value = (False, None)
 
         request = ExecuteScrapeMeetingDTO(meeting_id=1, upload_to_gcs=False)
@@ -10,9 +10,9 @@ from src.application.usecases.execute_speaker_extraction_usecase import (
     ExecuteSpeakerExtractionUseCase,
     SpeakerExtractionResultDTO,
 )
-from src.domain.entities.conversation import Conversation
 from src.domain.entities.minutes import Minutes
 from src.domain.entities.speaker import Speaker
+from src.domain.value_objects.conversation_ref import ConversationRef
 
 
 class TestExecuteSpeakerExtractionUseCase:
@@ -28,12 +28,14 @@ class TestExecuteSpeakerExtractionUseCase:
     def mock_conversation_repository(self):
         """Create mock conversation repository."""
         repo = AsyncMock()
+        repo.update_speaker_ids.side_effect = lambda speaker_ids: len(speaker_ids)
         return repo
 
     @pytest.fixture
     def mock_speaker_repository(self):
         """Create mock speaker repository."""
         repo = AsyncMock()
+        repo.get_by_name_party_pairs.return_value = {}
         return repo
 
     @pytest.fixture
@@ -74,27 +76,27 @@ class TestExecuteSpeakerExtractionUseCase:
 
     @pytest.fixture
     def sample_conversations(self):
-        """Create sample conversation entities."""
+        """Create sample conversation references."""
         return [
-            Conversation(
+            ConversationRef(
                 id=1,
                 minutes_id=1,
+                speaker_id=None,
                 speaker_name="山田太郎",
-                comment="発言内容1",
                 sequence_number=1,
             ),
-            Conversation(
+            ConversationRef(
                 id=2,
                 minutes_id=1,
+                speaker_id=None,
                 speaker_name="鈴木花子",
-                comment="発言内容2",
                 sequence_number=2,
             ),
-            Conversation(
+            ConversationRef(
                 id=3,
                 minutes_id=1,
+                speaker_id=None,
                 speaker_name="山田太郎",
-                comment="発言内容3",
                 sequence_number=3,
             ),
         ]
@@ -113,8 +115,9 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test successful speaker extraction from conversations."""
         # Arrange
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = sample_conversations
-        mock_speaker_repository.get_by_name_party_position.return_value = None
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
+            sample_conversations
+        )
 
         # Mock speaker domain service to extract different speakers
         def extract_party_side_effect(name):
@@ -132,7 +135,7 @@ class TestExecuteSpeakerExtractionUseCase:
             Speaker(id=1, name="山田太郎", is_politician=False),
             Speaker(id=2, name="鈴木花子", is_politician=False),
         ]
-        mock_speaker_repository.create.side_effect = created_speakers
+        mock_speaker_repository.bulk_create.return_value = created_speakers
 
         request = ExecuteSpeakerExtractionDTO(meeting_id=1, force_reprocess=False)
 
@@ -148,8 +151,16 @@ class TestExecuteSpeakerExtractionUseCase:
         assert result.existing_speakers == 0
         assert result.errors is None or len(result.errors) == 0
         mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        assert mock_speaker_repository.create.call_count == 2
-        assert mock_conversation_repository.update.call_count == 3
+        mock_speaker_repository.get_by_name_party_pairs.assert_awaited_once_with(
+            [("山田太郎", None), ("鈴木花子", None)]
+        )
+        mock_speaker_repository.bulk_create.assert_awaited_once()
+        assert len(mock_speaker_repository.bulk_create.call_args[0][0]) == 2
+        mock_conversation_repository.update_speaker_ids.assert_awaited_once_with(
+            {1: 1, 2: 2, 3: 1}
+        )
+        mock_conversation_repository.update.assert_not_called()
+        mock_speaker_repository.create.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_execute_no_minutes_found(self, use_case, mock_minutes_repository):
@@ -176,7 +187,7 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test extraction when no conversations exist."""
         # Arrange
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = []
+        mock_conversation_repository.get_refs_by_minutes.return_value = []
 
         request = ExecuteSpeakerExtractionDTO(meeting_id=1)
 
@@ -196,17 +207,16 @@ class TestExecuteSpeakerExtractionUseCase:
         reprocess."""
         # Arrange
         conversations_with_speakers = [
-            Conversation(
+            ConversationRef(
                 id=1,
                 minutes_id=1,
                 speaker_id=10,
                 speaker_name="山田太郎",
-                comment="発言内容",
                 sequence_number=1,
             ),
         ]
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
             conversations_with_speakers
         )
 
@@ -231,23 +241,21 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test force reprocessing clears existing speaker links."""
         # Arrange
         conversations_with_speakers = [
-            Conversation(
+            ConversationRef(
                 id=1,
                 minutes_id=1,
                 speaker_id=10,
                 speaker_name="山田太郎",
-                comment="発言内容",
                 sequence_number=1,
             ),
         ]
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
             conversations_with_speakers
         )
-        mock_speaker_repository.get_by_name_party_position.return_value = None
-        mock_speaker_repository.create.return_value = Speaker(
-            id=1, name="山田太郎", is_politician=False
-        )
+        mock_speaker_repository.bulk_create.return_value = [
+            Speaker(id=1, name="山田太郎", is_politician=False)
+        ]
 
         request = ExecuteSpeakerExtractionDTO(meeting_id=1, force_reprocess=True)
 
@@ -256,9 +264,10 @@ class TestExecuteSpeakerExtractionUseCase:
 
         # Assert
         assert result.meeting_id == 1
-        # Verify that speaker_id was cleared (updated twice: once to clear, once
-        # to link)
-        assert mock_conversation_repository.update.call_count == 2
+        # Verify that speaker_id was cleared in one call and then relinked in
+        # another
+        calls = mock_conversation_repository.update_speaker_ids.await_args_list
+        assert [call.args[0] for call in calls] == [{1: None}, {1: 1}]
 
     @pytest.mark.asyncio
     async def test_execute_use_existing_speaker(
@@ -273,11 +282,13 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test using existing speaker instead of creating new one."""
         # Arrange
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = sample_conversations
-        existing_speaker = Speaker(id=5, name="山田太郎", is_politician=False)
-        mock_speaker_repository.get_by_name_party_position.return_value = (
-            existing_speaker
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
+            sample_conversations
         )
+        existing_speaker = Speaker(id=5, name="山田太郎", is_politician=False)
+        mock_speaker_repository.get_by_name_party_pairs.return_value = {
+            ("山田太郎", None): existing_speaker
+        }
 
         request = ExecuteSpeakerExtractionDTO(meeting_id=1)
 
@@ -287,7 +298,10 @@ class TestExecuteSpeakerExtractionUseCase:
         # Assert
         assert result.new_speakers == 0
         assert result.existing_speakers >= 1
-        mock_speaker_repository.create.assert_not_called()
+        mock_speaker_repository.bulk_create.assert_not_called()
+        mock_conversation_repository.update_speaker_ids.assert_awaited_once_with(
+            {1: 5, 2: 5, 3: 5}
+        )
 
     @pytest.mark.asyncio
     async def test_execute_extract_party_from_name(
@@ -302,26 +316,27 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test extracting party information from speaker names."""
         # Arrange
         conversations_with_party = [
-            Conversation(
+            ConversationRef(
                 id=1,
                 minutes_id=1,
+                speaker_id=None,
                 speaker_name="山田太郎（自民党）",
-                comment="発言内容",
                 sequence_number=1,
             ),
         ]
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
             conversations_with_party
         )
         mock_speaker_domain_service.extract_party_from_name.return_value = (
             "山田太郎",
             "自民党",
         )
-        mock_speaker_repository.get_by_name_party_position.return_value = None
-        mock_speaker_repository.create.return_value = Speaker(
-            id=1, name="山田太郎", political_party_name="自民党", is_politician=True
-        )
+        mock_speaker_repository.bulk_create.return_value = [
+            Speaker(
+                id=1, name="山田太郎", political_party_name="自民党", is_politician=True
+            )
+        ]
 
         request = ExecuteSpeakerExtractionDTO(meeting_id=1)
 
@@ -331,7 +346,7 @@ class TestExecuteSpeakerExtractionUseCase:
         # Assert
         assert result.new_speakers == 1
         # Verify that speaker was created with party info
-        create_call = mock_speaker_repository.create.call_args[0][0]
+        create_call = mock_speaker_repository.bulk_create.call_args[0][0][0]
         assert create_call.political_party_name == "自民党"
         assert create_call.is_politician is True
 
@@ -348,17 +363,17 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test extraction with multiple unique speakers."""
         # Arrange
         conversations = [
-            Conversation(
-                comment=f"発言{i}",
+            ConversationRef(
                 sequence_number=i,
                 id=i,
                 minutes_id=1,
+                speaker_id=None,
                 speaker_name=f"議員{i}",
             )
             for i in range(1, 6)
         ]
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = conversations
+        mock_conversation_repository.get_refs_by_minutes.return_value = conversations
 
         def extract_side_effect(name):
             return (name, None)
@@ -366,8 +381,7 @@ class TestExecuteSpeakerExtractionUseCase:
         mock_speaker_domain_service.extract_party_from_name.side_effect = (
             extract_side_effect
         )
-        mock_speaker_repository.get_by_name_party_position.return_value = None
-        mock_speaker_repository.create.side_effect = [
+        mock_speaker_repository.bulk_create.return_value = [
             Speaker(id=i, name=f"議員{i}", is_politician=False) for i in range(1, 6)
         ]
 
@@ -379,7 +393,9 @@ class TestExecuteSpeakerExtractionUseCase:
         # Assert
         assert result.unique_speakers == 5
         assert result.new_speakers == 5
-        assert mock_speaker_repository.create.call_count == 5
+        mock_speaker_repository.get_by_name_party_pairs.assert_awaited_once()
+        mock_speaker_repository.bulk_create.assert_awaited_once()
+        assert len(mock_speaker_repository.bulk_create.call_args[0][0]) == 5
 
     @pytest.mark.asyncio
     async def test_execute_processing_time_recorded(
@@ -394,11 +410,12 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test that processing time is properly recorded."""
         # Arrange
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = sample_conversations
-        mock_speaker_repository.get_by_name_party_position.return_value = None
-        mock_speaker_repository.create.return_value = Speaker(
-            id=1, name="山田太郎", is_politician=False
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
+            sample_conversations
         )
+        mock_speaker_repository.bulk_create.return_value = [
+            Speaker(id=1, name="山田太郎", is_politician=False)
+        ]
 
         request = ExecuteSpeakerExtractionDTO(meeting_id=1)
 
@@ -423,7 +440,9 @@ class TestExecuteSpeakerExtractionUseCase:
         """Test that conversations are properly linked to speakers."""
         # Arrange
         mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = sample_conversations
+        mock_conversation_repository.get_refs_by_minutes.return_value = (
+            sample_conversations
+        )
 
         def extract_party_side_effect(name):
             if "山田" in name:
@@ -435,8 +454,7 @@ class TestExecuteSpeakerExtractionUseCase:
         mock_speaker_domain_service.extract_party_from_name.side_effect = (
             extract_party_side_effect
         )
-        mock_speaker_repository.get_by_name_party_position.return_value = None
-        mock_speaker_repository.create.side_effect = [
+        mock_speaker_repository.bulk_create.return_value = [
             Speaker(id=1, name="山田太郎", is_politician=False),
             Speaker(id=2, name="鈴木花子", is_politician=False),
         ]
@@ -447,6 +465,53 @@ class TestExecuteSpeakerExtractionUseCase:
         result = await use_case.execute(request)
 
         # Assert
-        # All 3 conversations should be updated with speaker_id
-        assert mock_conversation_repository.update.call_count == 3
+        # All 3 conversations should be updated with speaker_id in one call
+        mock_conversation_repository.update_speaker_ids.assert_awaited_once_with(
+            {1: 1, 2: 2, 3: 1}
+        )
         assert result.total_conversations == 3
+
+    @pytest.mark.asyncio
+    async def test_execute_parses_each_speaker_name_once(
+        self,
+        use_case,
+        mock_minutes_repository,
+        mock_conversation_repository,
+        mock_speaker_repository,
+        mock_speaker_domain_service,
+        sample_minutes,
+    ):
+        """Test that repeated speaker names are parsed and queried only once."""
+        # Arrange
+        conversations = [
+            ConversationRef(
+                id=i,
+                minutes_id=1,
+                speaker_id=None,
+                speaker_name=f"議員{i % 3}",
+                sequence_number=i,
+            )
+            for i in range(1, 301)
+        ]
+        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
+        mock_conversation_repository.get_refs_by_minutes.return_value = conversations
+        mock_speaker_domain_service.extract_party_from_name.side_effect = lambda n: (
+            n,
+            None,
+        )
+        mock_speaker_repository.bulk_create.return_value = [
+            Speaker(id=i + 1, name=f"議員{i}", is_politician=False) for i in range(3)
+        ]
+
+        request = ExecuteSpeakerExtractionDTO(meeting_id=1)
+
+        # Act
+        result = await use_case.execute(request)
+
+        # Assert
+        assert result.unique_speakers == 3
+        assert mock_speaker_domain_service.extract_party_from_name.call_count == 3
+        mock_speaker_repository.get_by_name_party_pairs.assert_awaited_once()
+        mock_conversation_repository.update_speaker_ids.assert_awaited_once()
+        linked = mock_conversation_repository.update_speaker_ids.call_args[0][0]
+        assert len(linked) == 300
@@ -9,6 +9,12 @@ from src.domain.entities.politician import Politician
 from src.domain.entities.speaker import Speaker
 
 
+async def stream(items):
+    """Async iterator over items, standing in for a streaming repository."""
+    for item in items:
+        yield item
+
+
 class TestMatchSpeakersUseCase:
     """Test cases for MatchSpeakersUseCase."""
 
@@ -16,6 +22,7 @@ class TestMatchSpeakersUseCase:
     def mock_speaker_repo(self):
         """Create mock speaker repository."""
         repo = AsyncMock()
+        repo.iter_politicians = MagicMock(return_value=stream([]))
         return repo
 
     @pytest.fixture
@@ -71,7 +78,7 @@ class TestMatchSpeakersUseCase:
         speaker = Speaker(id=1, name="山田太郎", is_politician=True, politician_id=10)
         politician = Politician(id=10, name="山田太郎", political_party_id=1)
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         mock_politician_repo.get_by_id.return_value = politician
 
         # Execute
@@ -93,7 +100,7 @@ class TestMatchSpeakersUseCase:
         speaker = Speaker(id=2, name="鈴木花子", is_politician=True)
         politician = Politician(id=20, name="鈴木花子", political_party_id=1)
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = [politician]
         mock_speaker_service.calculate_name_similarity.return_value = 0.9
@@ -117,7 +124,7 @@ class TestMatchSpeakersUseCase:
         speaker = Speaker(id=3, name="田中次郎", is_politician=True)
         politician = Politician(id=30, name="田中次郎", political_party_id=2)
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []  # No rule-based match
         mock_politician_repo.get_all.return_value = [politician]
@@ -146,7 +153,7 @@ class TestMatchSpeakersUseCase:
         # Setup
         speaker = Speaker(id=4, name="佐藤三郎", is_politician=True)
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []
 
@@ -192,7 +199,7 @@ class TestMatchSpeakersUseCase:
             Speaker(id=i, name=f"議員{i}", is_politician=True) for i in range(1, 6)
         ]
 
-        mock_speaker_repo.get_politicians.return_value = speakers
+        mock_speaker_repo.iter_politicians.return_value = stream(speakers)
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []
 
@@ -202,6 +209,32 @@ class TestMatchSpeakersUseCase:
         # Verify
         assert len(results) == 3
 
+    @pytest.mark.asyncio
+    async def test_iter_execute_matches_speakers_as_they_stream(
+        self, use_case, mock_speaker_repo, mock_politician_repo
+    ):
+        """Test that iter_execute matches each speaker before reading the next."""
+        # Setup
+        pulled: list[int] = []
+
+        async def politicians(batch_size):
+            for i in range(1, 4):
+                pulled.append(i)
+                yield Speaker(id=i, name=f"議員{i}", is_politician=True)
+
+        mock_speaker_repo.iter_politicians = MagicMock(side_effect=politicians)
+        mock_politician_repo.search_by_name.return_value = []
+
+        # Execute
+        results = use_case.iter_execute(use_llm=False, batch_size=50)
+        first = await anext(results)
+
+        # Verify
+        assert first.speaker_id == 1
+        assert pulled == [1]
+        assert [r.speaker_id async for r in results] == [2, 3]
+        mock_speaker_repo.iter_politicians.assert_called_once_with(batch_size=50)
+
     @pytest.mark.asyncio
     async def test_execute_skip_speaker_without_id(self, use_case, mock_speaker_repo):
         """Test that speakers without ID are skipped."""
@@ -211,7 +244,7 @@ class TestMatchSpeakersUseCase:
             Speaker(id=1, name="有効な議員", is_politician=True),
         ]
 
-        mock_speaker_repo.get_politicians.return_value = speakers
+        mock_speaker_repo.iter_politicians.return_value = stream(speakers)
         mock_politician_repo = use_case.politician_repo
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []
@@ -241,7 +274,7 @@ class TestMatchSpeakersUseCase:
             political_party_id=1,
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = [politician]
         mock_speaker_service.calculate_name_similarity.return_value = 0.75
@@ -263,7 +296,7 @@ class TestMatchSpeakersUseCase:
         # Setup
         speaker = Speaker(id=6, name="新人議員", is_politician=True)
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []
         # Configure mock to not have get_all_cached method
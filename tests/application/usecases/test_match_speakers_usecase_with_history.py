@@ -14,13 +14,21 @@ from src.domain.entities.llm_processing_history import (
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
 
 
+async def stream(items):
+    """Async iterator over items, standing in for a streaming repository."""
+    for item in items:
+        yield item
+
+
 class TestMatchSpeakersUseCaseWithHistory:
     """Test cases for MatchSpeakersUseCase with history recording."""
 
     @pytest.fixture
     def mock_speaker_repo(self) -> AsyncMock:
         """Create mock speaker repository."""
-        return AsyncMock()
+        repo = AsyncMock()
+        repo.iter_politicians = MagicMock(return_value=stream([]))
+        return repo
 
     @pytest.fixture
     def mock_politician_repo(self) -> AsyncMock:
@@ -146,7 +154,7 @@ class TestMatchSpeakersUseCaseWithHistory:
             political_party_id=1,
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []  # No rule-based match
         mock_politician_repo.get_all.return_value = [politician]
@@ -201,7 +209,7 @@ class TestMatchSpeakersUseCaseWithHistory:
             political_party_id=1,
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = [
             politician
@@ -242,7 +250,7 @@ class TestMatchSpeakersUseCaseWithHistory:
             political_party_id=2,
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []  # No rule-based match
         mock_politician_repo.get_all.return_value = [politician]
@@ -276,7 +284,7 @@ class TestMatchSpeakersUseCaseWithHistory:
             name="新人議員",
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []
         mock_politician_repo.get_all.return_value = []  # No candidates
@@ -320,7 +328,7 @@ class TestMatchSpeakersUseCaseWithHistory:
             political_party_id=1,
         )
 
-        mock_speaker_repo.get_politicians.return_value = [speaker]
+        mock_speaker_repo.iter_politicians.return_value = stream([speaker])
         # No existing politician link
         mock_politician_repo.search_by_name.return_value = []
         mock_politician_repo.get_all.return_value = [politician]
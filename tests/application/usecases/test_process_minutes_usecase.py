@@ -1,6 +1,6 @@
 """Tests for ProcessMinutesUseCase."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -160,7 +160,11 @@ class TestProcessMinutesUseCase:
         ]
 
         # Execute
-        result = await use_case.execute(request)
+        with patch(
+            "src.application.usecases.process_minutes_usecase."
+            "invalidate_processing_status"
+        ) as invalidate:
+            result = await use_case.execute(request)
 
         # Verify
         assert result.minutes_id == 10
@@ -174,6 +178,8 @@ class TestProcessMinutesUseCase:
         mock_minutes_repo.create.assert_called_once()
         mock_conversation_repo.bulk_create.assert_called_once()
         mock_minutes_repo.mark_processed.assert_called_once_with(10)
+        # Cached processing statuses of the meeting are dropped
+        invalidate.assert_called_once_with([1])
 
     @pytest.mark.asyncio
     async def test_execute_with_existing_processed_minutes(
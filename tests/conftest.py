@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.common.metrics import setup_metrics
+from src.infrastructure.config.settings import get_settings
 from tests.fixtures.dto_factories import (
     create_extracted_speech_dto,
     create_politician_dto,
@@ -40,6 +41,12 @@ def setup_test_metrics():
     yield
 
 
+@pytest.fixture(autouse=True)
+def disable_persistent_llm_cache(monkeypatch):
+    """Keep factory-built LLM services from reading or writing cache/llm."""
+    monkeypatch.setattr(get_settings(), "llm_cache_enabled", False)
+
+
 # Entity fixtures
 @pytest.fixture
 def sample_governing_body():
@@ -178,6 +185,7 @@ def mock_conversation_repository(mock_base_repository):
     repo = mock_base_repository
     repo.bulk_create.return_value = []
     repo.get_by_minutes.return_value = []
+    repo.get_refs_by_minutes.return_value = []
     repo.update_speaker_links.return_value = 0
     return repo
 
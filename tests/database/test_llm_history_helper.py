@@ -139,14 +139,14 @@ class TestSyncLLMHistoryHelper:
         assert mock_session.rollback.called
         assert mock_session.close.called
 
-    def test_close_disposes_engine(self, helper: Any) -> None:
-        """Test that close method disposes the engine."""
+    def test_close_keeps_shared_engine(self, helper: Any) -> None:
+        """Test that close does not dispose the process-wide engine."""
         mock_dispose = MagicMock()
         helper.engine.dispose = mock_dispose
 
         helper.close()
 
-        assert mock_dispose.called
+        assert not mock_dispose.called
 
     def test_context_manager(self, mock_settings: MagicMock) -> None:
         """Test that helper works as a context manager."""
@@ -1,5 +1,7 @@
 """Tests for Speaker entity."""
 
+import pytest
+
 from src.domain.entities.speaker import Speaker
 from tests.fixtures.entity_factories import create_speaker
 
@@ -169,6 +171,14 @@ class TestSpeaker:
         speaker_no_id = Speaker(name="Test Speaker")
         assert speaker_no_id.id is None
 
+    def test_uses_slots(self) -> None:
+        """Test that Speaker stores its attributes in slots, not a __dict__."""
+        speaker = Speaker(name="Test Speaker")
+
+        assert not hasattr(speaker, "__dict__")
+        with pytest.raises(AttributeError):
+            speaker.unknown = "value"  # type: ignore[attr-defined]
+
     def test_is_politician_flag_combinations(self) -> None:
         """Test various combinations with is_politician flag."""
         # Politician with party
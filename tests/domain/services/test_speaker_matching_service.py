@@ -25,7 +25,7 @@ class TestSpeakerMatchingService:
         """Create a mock LLM service."""
         mock = MagicMock()
         mock.get_prompt.return_value = MagicMock()
-        mock.invoke_with_retry = MagicMock()
+        mock.ainvoke_with_retry = AsyncMock()
         return mock
 
     @pytest.fixture
@@ -77,7 +77,7 @@ class TestSpeakerMatchingService:
         mock_speaker_repository.get_affiliated_speakers.return_value = []
 
         # Mock LLM response
-        mock_llm_service.invoke_with_retry.return_value = {
+        mock_llm_service.ainvoke_with_retry.return_value = {
             "matched": True,
             "speaker_id": 2,
             "speaker_name": "佐藤花子",
@@ -108,7 +108,7 @@ class TestSpeakerMatchingService:
         ]
 
         # Mock LLM response
-        mock_llm_service.invoke_with_retry.return_value = {
+        mock_llm_service.ainvoke_with_retry.return_value = {
             "matched": True,
             "speaker_id": 1,
             "speaker_name": "山田太郎",
@@ -155,7 +155,7 @@ class TestSpeakerMatchingService:
         mock_speaker_repository.get_affiliated_speakers.return_value = []
 
         # Mock LLM response with low confidence
-        mock_llm_service.invoke_with_retry.return_value = {
+        mock_llm_service.ainvoke_with_retry.return_value = {
             "matched": True,
             "speaker_id": 1,
             "speaker_name": "山田太郎",
@@ -184,7 +184,7 @@ class TestSpeakerMatchingService:
         mock_speaker_repository.get_affiliated_speakers.return_value = []
 
         # Mock LLM response
-        mock_llm_service.invoke_with_retry.return_value = {
+        mock_llm_service.ainvoke_with_retry.return_value = {
             "matched": True,
             "speaker_id": 3,
             "speaker_name": "鈴木一郎",
@@ -224,7 +224,7 @@ class TestSpeakerMatchingService:
         ]
 
         # Mock LLM response selecting the affiliated one
-        mock_llm_service.invoke_with_retry.return_value = {
+        mock_llm_service.ainvoke_with_retry.return_value = {
             "matched": True,
             "speaker_id": 1,  # Should match the affiliated one
             "speaker_name": "山田太郎",
@@ -265,7 +265,7 @@ class TestSpeakerMatchingService:
         assert result.speaker_id == 1
         assert result.confidence >= 0.9
         # LLM should not be called if rule-based matching succeeds with high confidence
-        mock_llm_service.invoke_with_retry.assert_not_called()
+        mock_llm_service.ainvoke_with_retry.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_llm_error_handling(
@@ -277,7 +277,7 @@ class TestSpeakerMatchingService:
         mock_speaker_repository.get_affiliated_speakers.return_value = []
 
         # Mock LLM to raise an exception
-        mock_llm_service.invoke_with_retry.side_effect = ExternalServiceException(
+        mock_llm_service.ainvoke_with_retry.side_effect = ExternalServiceException(
             service_name="LLM",
             operation="speaker_matching",
             reason="Test error",
@@ -308,7 +308,7 @@ class TestSpeakerMatchingService:
         ]
 
         # Mock LLM responses
-        mock_llm_service.invoke_with_retry.return_value = {
+        mock_llm_service.ainvoke_with_retry.return_value = {
             "matched": True,
             "speaker_id": 2,
             "speaker_name": "佐藤花子",
@@ -0,0 +1,156 @@
+"""Tests for SpeakerNameIndex."""
+
+import random
+import re
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.services.speaker_matching_service import SpeakerMatchingService
+from src.domain.services.speaker_name_index import SpeakerNameIndex
+
+SURNAMES = "山田佐藤鈴木高橋田中伊藤渡辺中村小林加藤吉田松本井上木村林清水"
+GIVEN = "太郎花子一郎次郎美咲健一直子翔大輔真一"
+
+
+def random_name(rng: random.Random) -> str:
+    surname = SURNAMES[rng.randrange(0, len(SURNAMES), 2) :][:2]
+    given = GIVEN[rng.randrange(0, len(GIVEN) - 1) :][: rng.randint(1, 3)]
+    return surname + given
+
+
+def linear_rule_based(speaker_name: str, speakers: list[dict]) -> tuple | None:
+    """Reference implementation: the original linear scan."""
+    for speaker in speakers:
+        if speaker["name"] == speaker_name:
+            return (speaker["id"], 1.0)
+    match = re.search(r"\(([^)]+)\)", speaker_name)
+    if match:
+        for speaker in speakers:
+            if speaker["name"] == match.group(1):
+                return (speaker["id"], 0.95)
+    cleaned_name = re.sub(r"^[◆○◎]", "", speaker_name)
+    if cleaned_name != speaker_name:
+        return linear_rule_based(cleaned_name, speakers)
+    for speaker in speakers:
+        if speaker["name"] in speaker_name or speaker_name in speaker["name"]:
+            return (speaker["id"], 0.8)
+    return None
+
+
+def linear_filter(
+    speaker_name: str, speakers: list[dict], affiliated: set[int]
+) -> list[int]:
+    """Reference implementation: the original candidate scoring."""
+    match = re.search(r"\(([^)]+)\)", speaker_name)
+    extracted_name = match.group(1) if match else None
+    cleaned_name = re.sub(r"^[◆○◎]", "", speaker_name)
+    candidates = []
+    for speaker in speakers:
+        score = 0
+        if speaker["name"] in speaker_name or speaker_name in speaker["name"]:
+            score += 3
+        if extracted_name and (
+            speaker["name"] == extracted_name or extracted_name in speaker["name"]
+        ):
+            score += 5
+        if speaker["name"] in cleaned_name or cleaned_name in speaker["name"]:
+            score += 2
+        if abs(len(speaker["name"]) - len(speaker_name)) <= 3:
+            score += 1
+        if speaker["id"] in affiliated:
+            score += 10
+        if score > 0:
+            candidates.append({**speaker, "score": score})
+    candidates.sort(key=lambda x: x["score"], reverse=True)
+    return [c["id"] for c in (candidates[:10] if candidates else speakers[:10])]
+
+
+@pytest.fixture
+def service():
+    return SpeakerMatchingService(MagicMock(), AsyncMock())
+
+
+class TestSpeakerNameIndex:
+    """Test cases for SpeakerNameIndex."""
+
+    def test_exact_and_partial_lookup(self):
+        index = SpeakerNameIndex(
+            [{"id": 1, "name": "山田太郎"}, {"id": 2, "name": "山田"}]
+        )
+
+        exact = index.find_exact("山田太郎")
+        assert exact is not None and exact.id == 1
+        assert index.positions_containing("田太") == {0}
+        assert index.positions_contained_in("議員山田") == {1}
+        assert index.positions_partial("山田") == {0, 1}
+
+    def test_incremental_add(self):
+        index = SpeakerNameIndex([{"id": 1, "name": "山田太郎"}])
+        index.add(2, "佐藤花子")
+        index.add(2, "重複")
+
+        assert len(index) == 2
+        assert 2 in index
+        assert index.positions_containing("花子") == {1}
+
+    def test_rule_based_matches_linear_scan(self, service):
+        rng = random.Random(42)
+        speakers = [{"id": i, "name": random_name(rng)} for i in range(300)]
+        index = SpeakerNameIndex(speakers)
+        queries = [random_name(rng) for _ in range(200)]
+        queries += [f"○{q}" for q in queries[:20]]
+        queries += [f"議長({q})" for q in queries[:20]]
+        queries += ["山", "存在しない", ""]
+
+        for query in queries:
+            result = service._rule_based_matching(query, index)
+            expected = linear_rule_based(query, speakers)
+            actual = (result.speaker_id, result.confidence) if result.matched else None
+            assert actual == expected, query
+
+    def test_filter_candidates_matches_linear_scan(self, service):
+        rng = random.Random(7)
+        speakers = [{"id": i, "name": random_name(rng)} for i in range(300)]
+        index = SpeakerNameIndex(speakers)
+        affiliated = {3, 50, 120}
+        queries = [random_name(rng) for _ in range(100)]
+        queries += [f"◆{q}委員長" for q in queries[:10]]
+        queries += [f"議長({q})" for q in queries[:10]]
+
+        for query in queries:
+            actual = [
+                c["id"] for c in service._filter_candidates(query, index, affiliated)
+            ]
+            assert actual == linear_filter(query, speakers, affiliated), query
+
+    @pytest.mark.asyncio
+    async def test_index_built_once_per_service(self):
+        repository = AsyncMock()
+        repository.get_all_for_matching.return_value = [{"id": 1, "name": "山田太郎"}]
+        service = SpeakerMatchingService(MagicMock(), repository)
+
+        for _ in range(5):
+            result = await service.find_best_match("山田太郎")
+            assert result.speaker_id == 1
+
+        repository.get_all_for_matching.assert_awaited_once()
+
+        service.register_speaker(2, "佐藤花子")
+        result = await service.find_best_match("佐藤花子")
+        assert result.speaker_id == 2
+
+    def test_rule_based_matching_scales(self, service):
+        rng = random.Random(1)
+        speakers = [{"id": i, "name": f"{random_name(rng)}{i}"} for i in range(50000)]
+        queries = [random_name(rng) for _ in range(10000)]
+
+        start = time.perf_counter()
+        index = SpeakerNameIndex(speakers)
+        for query in queries:
+            service._rule_based_matching(query, index)
+        elapsed = time.perf_counter() - start
+
+        print(f"\n10k names against 50k speakers: {elapsed:.2f}s")
+        assert elapsed < 2.0
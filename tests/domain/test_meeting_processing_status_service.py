@@ -4,10 +4,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from src.domain.entities.conversation import Conversation
-from src.domain.entities.minutes import Minutes
 from src.domain.services.meeting_processing_status_service import (
     MeetingProcessingStatusService,
+    invalidate_processing_status,
 )
 
 
@@ -44,188 +43,115 @@ class TestMeetingProcessingStatusService:
         )
 
     @pytest.fixture
-    def sample_minutes(self):
-        """Create sample minutes."""
-        return Minutes(
-            id=1,
-            meeting_id=1,
-            url="https://example.com/minutes1.pdf",
-        )
+    def counts_query(self, mock_conversation_repository):
+        """The repository's aggregate count query."""
+        return mock_conversation_repository.get_conversation_counts_by_meeting
 
     @pytest.fixture
-    def sample_conversations_with_speakers(self):
-        """Create sample conversations with speakers."""
-        return [
-            Conversation(
-                id=1,
-                comment="これは最初の発言です。",
-                sequence_number=1,
-                minutes_id=1,
-                speaker_id=10,
-                speaker_name="山田太郎",
-                chapter_number=1,
-            ),
-            Conversation(
-                id=2,
-                comment="これは二番目の発言です。",
-                sequence_number=2,
-                minutes_id=1,
-                speaker_id=11,
-                speaker_name="鈴木花子",
-                chapter_number=1,
-            ),
-        ]
+    def counts_with_speakers(self):
+        """Counts for a meeting whose conversations are linked to speakers."""
+        return {1: {"conversation_count": 2, "speaker_count": 2}}
 
     @pytest.fixture
-    def sample_conversations_without_speakers(self):
-        """Create sample conversations without speakers."""
-        return [
-            Conversation(
-                id=1,
-                comment="これは最初の発言です。",
-                sequence_number=1,
-                minutes_id=1,
-                speaker_id=None,
-                speaker_name="山田太郎",
-                chapter_number=1,
-            ),
-            Conversation(
-                id=2,
-                comment="これは二番目の発言です。",
-                sequence_number=2,
-                minutes_id=1,
-                speaker_id=None,
-                speaker_name="鈴木花子",
-                chapter_number=1,
-            ),
-        ]
+    def counts_without_speakers(self):
+        """Counts for a meeting whose conversations have no speakers."""
+        return {1: {"conversation_count": 2, "speaker_count": 0}}
 
     @pytest.mark.asyncio
     async def test_has_conversations_true(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
-        sample_conversations_with_speakers,
+        counts_query,
+        counts_with_speakers,
     ):
         """Test has_conversations returns True when conversations exist."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
-        )
+        counts_query.return_value = counts_with_speakers
 
         result = await service.has_conversations(meeting_id=1)
 
         assert result is True
-        mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
+        counts_query.assert_called_once_with([1])
 
     @pytest.mark.asyncio
     async def test_has_conversations_false_no_minutes(
         self,
         service,
-        mock_minutes_repository,
+        counts_query,
     ):
         """Test has_conversations returns False when no minutes exist."""
-        mock_minutes_repository.get_by_meeting.return_value = None
+        counts_query.return_value = {}
 
         result = await service.has_conversations(meeting_id=1)
 
         assert result is False
-        mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
 
     @pytest.mark.asyncio
     async def test_has_conversations_false_no_conversations(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
+        counts_query,
     ):
         """Test has_conversations returns False when no conversations exist."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = []
+        counts_query.return_value = {1: {"conversation_count": 0, "speaker_count": 0}}
 
         result = await service.has_conversations(meeting_id=1)
 
         assert result is False
-        mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
 
     @pytest.mark.asyncio
     async def test_has_speakers_true(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
-        sample_conversations_with_speakers,
+        counts_query,
+        counts_with_speakers,
     ):
         """Test has_speakers returns True when speakers exist."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
-        )
+        counts_query.return_value = counts_with_speakers
 
         result = await service.has_speakers(meeting_id=1)
 
         assert result is True
-        mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
 
     @pytest.mark.asyncio
     async def test_has_speakers_false_no_speaker_ids(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
-        sample_conversations_without_speakers,
+        counts_query,
+        counts_without_speakers,
     ):
         """Test has_speakers returns False when no speaker_ids exist."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_without_speakers
-        )
+        counts_query.return_value = counts_without_speakers
 
         result = await service.has_speakers(meeting_id=1)
 
         assert result is False
-        mock_minutes_repository.get_by_meeting.assert_called_once_with(1)
-        mock_conversation_repository.get_by_minutes.assert_called()
 
     @pytest.mark.asyncio
     async def test_get_processing_status_full(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
-        sample_conversations_with_speakers,
+        counts_query,
+        counts_with_speakers,
     ):
         """Test get_processing_status with full processing."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
-        )
+        counts_query.return_value = counts_with_speakers
 
         result = await service.get_processing_status(meeting_id=1)
 
         assert result["has_minutes"] is True
         assert result["has_conversations"] is True
         assert result["has_speakers"] is True
-        assert result["conversation_count"] == 2  # 2 conversations
-        assert result["speaker_count"] == 2  # 2 unique speakers
+        assert result["conversation_count"] == 2
+        assert result["speaker_count"] == 2
 
     @pytest.mark.asyncio
     async def test_get_processing_status_no_minutes(
         self,
         service,
-        mock_minutes_repository,
+        counts_query,
     ):
         """Test get_processing_status when no minutes exist."""
-        mock_minutes_repository.get_by_meeting.return_value = None
+        counts_query.return_value = {}
 
         result = await service.get_processing_status(meeting_id=1)
 
@@ -239,47 +165,72 @@ class TestMeetingProcessingStatusService:
     async def test_get_processing_status_conversations_no_speakers(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
-        sample_conversations_without_speakers,
+        counts_query,
+        counts_without_speakers,
     ):
         """Test get_processing_status with conversations but no speakers."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_without_speakers
-        )
+        counts_query.return_value = counts_without_speakers
 
         result = await service.get_processing_status(meeting_id=1)
 
         assert result["has_minutes"] is True
         assert result["has_conversations"] is True
         assert result["has_speakers"] is False
-        assert result["conversation_count"] == 2  # 2 conversations
+        assert result["conversation_count"] == 2
         assert result["speaker_count"] == 0
 
+    @pytest.mark.asyncio
+    async def test_get_processing_statuses_single_query(
+        self,
+        service,
+        counts_query,
+    ):
+        """Test statuses for many meetings are fetched with one query."""
+        counts_query.return_value = {
+            1: {"conversation_count": 3, "speaker_count": 2},
+            2: {"conversation_count": 0, "speaker_count": 0},
+        }
+
+        result = await service.get_processing_statuses([1, 2, 3, 1])
+
+        counts_query.assert_called_once_with([1, 2, 3])
+        assert result[1]["speaker_count"] == 2
+        assert result[2]["has_minutes"] is True
+        assert result[2]["has_conversations"] is False
+        assert result[3]["has_minutes"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_processing_statuses_only_fetches_uncached(
+        self,
+        service,
+        counts_query,
+        counts_with_speakers,
+    ):
+        """Test cached meetings are not queried again."""
+        counts_query.return_value = counts_with_speakers
+        await service.get_processing_status(meeting_id=1)
+
+        await service.get_processing_statuses([1, 2])
+
+        counts_query.assert_called_with([2])
+
     @pytest.mark.asyncio
     async def test_cache_functionality(
         self,
         service,
-        mock_minutes_repository,
-        mock_conversation_repository,
-        sample_minutes,
-        sample_conversations_with_speakers,
+        counts_query,
+        counts_with_speakers,
     ):
         """Test cache functionality."""
-        mock_minutes_repository.get_by_meeting.return_value = sample_minutes
-        mock_conversation_repository.get_by_minutes.return_value = (
-            sample_conversations_with_speakers
-        )
+        counts_query.return_value = counts_with_speakers
 
         # First call - should hit repositories
         result1 = await service.get_processing_status(meeting_id=1)
-        assert mock_minutes_repository.get_by_meeting.call_count == 1
+        assert counts_query.call_count == 1
 
         # Second call - should use cache
         result2 = await service.get_processing_status(meeting_id=1)
-        assert mock_minutes_repository.get_by_meeting.call_count == 1  # Still 1
+        assert counts_query.call_count == 1  # Still 1
 
         # Results should be the same
         assert result1 == result2
@@ -289,7 +240,53 @@ class TestMeetingProcessingStatusService:
 
         # Third call - should hit repositories again
         await service.get_processing_status(meeting_id=1)
-        assert mock_minutes_repository.get_by_meeting.call_count == 2
+        assert counts_query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_expires_after_ttl(
+        self,
+        mock_minutes_repository,
+        mock_conversation_repository,
+        mock_speaker_repository,
+        counts_query,
+        counts_with_speakers,
+    ):
+        """Test cached statuses are refetched once the TTL has passed."""
+        service = MeetingProcessingStatusService(
+            minutes_repository=mock_minutes_repository,
+            conversation_repository=mock_conversation_repository,
+            speaker_repository=mock_speaker_repository,
+            ttl_seconds=0,
+        )
+        counts_query.return_value = counts_with_speakers
+
+        await service.get_processing_status(meeting_id=1)
+        await service.get_processing_status(meeting_id=1)
+
+        assert counts_query.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_processing_status(
+        self,
+        service,
+        counts_query,
+        counts_with_speakers,
+    ):
+        """Test invalidation clears the given meetings from live services."""
+        counts_query.return_value = {
+            **counts_with_speakers,
+            2: {"conversation_count": 1, "speaker_count": 1},
+        }
+        await service.get_processing_statuses([1, 2])
+
+        invalidate_processing_status([1])
+
+        assert 1 not in service._cache
+        assert 2 in service._cache
+
+        invalidate_processing_status()
+
+        assert service._cache == {}
 
     def test_clear_cache_all(self, service: MeetingProcessingStatusService) -> None:
         """Test clearing entire cache."""
@@ -2,7 +2,12 @@
 
 import pytest
 
-from src.domain.pagination import PaginatedResult, PaginationParams
+from src.domain.pagination import (
+    Cursor,
+    CursorPage,
+    PaginatedResult,
+    PaginationParams,
+)
 
 
 class TestPaginationParams:
@@ -235,3 +240,59 @@ class TestPaginatedResult:
         assert result.has_previous is True
         assert result.next_page == 4
         assert result.previous_page == 2
+
+
+class TestCursor:
+    """Test cases for Cursor."""
+
+    def test_round_trip(self) -> None:
+        """Test that a cursor survives encoding and decoding."""
+        cursor = Cursor(id=42, sort_value="2024-01-15")
+
+        assert Cursor.decode(cursor.encode()) == cursor
+
+    def test_round_trip_without_sort_value(self) -> None:
+        """Test an ID-only cursor."""
+        assert Cursor.decode(Cursor(id=7).encode()) == Cursor(id=7)
+
+    def test_token_is_url_safe(self) -> None:
+        """Test that tokens can be used in query strings."""
+        token = Cursor(id=10**9, sort_value="発言?&=/").encode()
+
+        assert all(c.isalnum() or c in "-_=" for c in token)
+
+    @pytest.mark.parametrize("token", ["not base64!", "bnVsbA==", "WyJ4IiwxXQ=="])
+    def test_invalid_token(self, token: str) -> None:
+        """Test that malformed tokens raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            Cursor.decode(token)
+
+
+class TestCursorPage:
+    """Test cases for CursorPage."""
+
+    def test_has_next(self) -> None:
+        """Test has_next follows the presence of a next cursor."""
+        assert CursorPage(items=[1], next_cursor="abc").has_next is True
+        assert CursorPage(items=[1]).has_next is False
+
+    def test_to_dict(self) -> None:
+        """Test conversion to dictionary."""
+        page = CursorPage(
+            items=["a"],
+            next_cursor="abc",
+            total_count=1000,
+            total_is_estimate=True,
+            limit=1,
+        )
+
+        assert page.to_dict() == {
+            "items": ["a"],
+            "pagination": {
+                "limit": 1,
+                "next_cursor": "abc",
+                "has_next": True,
+                "total_count": 1000,
+                "total_is_estimate": True,
+            },
+        }
@@ -0,0 +1,32 @@
+"""Factory for stand-in browser pools used by scraper tests."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+
+def create_browser_pool(
+    page: AsyncMock | None = None, context: AsyncMock | None = None
+) -> MagicMock:
+    """Create a BrowserPool stand-in whose leases yield the given mocks.
+
+    ``pool.page`` and ``pool.context`` are MagicMocks, so tests can assert
+    how many leases were taken and with which context options.
+    """
+    page = page or AsyncMock()
+    if context is None:
+        context = AsyncMock()
+        context.new_page = AsyncMock(return_value=page)
+
+    @asynccontextmanager
+    async def lease_context(**context_options):
+        yield context
+
+    @asynccontextmanager
+    async def lease_page(**context_options):
+        yield page
+
+    pool = MagicMock()
+    pool.context = MagicMock(side_effect=lease_context)
+    pool.page = MagicMock(side_effect=lease_page)
+    pool.close = AsyncMock()
+    return pool
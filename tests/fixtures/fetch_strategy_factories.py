@@ -0,0 +1,37 @@
+"""Factories for stand-in HTTP responses and fetch strategies."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.infrastructure.external.http_client import HttpResponse
+
+
+def create_http_response(
+    text: str = "",
+    url: str = "https://example.com/",
+    status: int = 200,
+    content_type: str = "text/html",
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> HttpResponse:
+    """Create an HttpResponse with the given decoded body."""
+    return HttpResponse(
+        url=url,
+        status=status,
+        body=text.encode("utf-8"),
+        text=text,
+        content_type=content_type,
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def create_fetch_strategy(static_response: HttpResponse | None = None) -> MagicMock:
+    """Create a FetchStrategy stand-in.
+
+    ``fetch_static`` returns ``static_response``; the default None sends
+    scrapers down their browser path.
+    """
+    strategy = MagicMock()
+    strategy.fetch_static = AsyncMock(return_value=static_response)
+    strategy.fetch_html = AsyncMock()
+    return strategy
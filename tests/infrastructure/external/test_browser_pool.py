@@ -0,0 +1,270 @@
+"""Tests for the shared Playwright browser pool."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.di.container import (
+    Environment,
+    init_container,
+    reset_container,
+)
+from src.infrastructure.external.browser_pool import (
+    BrowserPool,
+    BrowserPoolSettings,
+    get_browser_pool,
+)
+
+
+def make_browser() -> MagicMock:
+    """Create a connected browser mock whose contexts yield page mocks."""
+    browser = MagicMock()
+    browser.is_connected = MagicMock(return_value=True)
+    browser.close = AsyncMock()
+
+    async def new_context(**options):
+        context = MagicMock()
+        context.options = options
+        context.new_page = AsyncMock(return_value=AsyncMock())
+        context.close = AsyncMock()
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+    return browser
+
+
+class TestBrowserPool:
+    """Test cases for BrowserPool."""
+
+    @pytest.fixture
+    def launched(self):
+        """Patch Playwright so that every launch returns a new browser mock."""
+        browsers: list[MagicMock] = []
+
+        async def launch(**kwargs):
+            browser = make_browser()
+            browsers.append(browser)
+            return browser
+
+        playwright = MagicMock()
+        playwright.chromium.launch = AsyncMock(side_effect=launch)
+        playwright.stop = AsyncMock()
+
+        with patch(
+            "src.infrastructure.external.browser_pool.async_playwright"
+        ) as mock_async_playwright:
+            mock_async_playwright.return_value.start = AsyncMock(
+                return_value=playwright
+            )
+            yield browsers
+
+    @pytest.mark.asyncio
+    async def test_reuses_warm_browser_across_leases(self, launched):
+        """Test that sequential leases share one launched browser."""
+        pool = BrowserPool(BrowserPoolSettings(size=2))
+
+        async with pool.page(user_agent="test-agent"):
+            pass
+        async with pool.page():
+            pass
+
+        assert len(launched) == 1
+        assert launched[0].new_context.await_count == 2
+        launched[0].new_context.assert_any_await(user_agent="test-agent")
+        assert pool.metrics().launches == 1
+        assert pool.metrics().leases == 2
+
+    @pytest.mark.asyncio
+    async def test_closes_context_after_each_lease(self, launched):
+        """Test that leases never share a browser context."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+
+        async with pool.context() as first:
+            pass
+        async with pool.context() as second:
+            pass
+
+        assert first is not second
+        first.close.assert_awaited_once()
+        second.close.assert_awaited_once()
+        launched[0].close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_spreads_concurrent_leases_over_browsers(self, launched):
+        """Test that a busy browser makes the pool launch the next one."""
+        pool = BrowserPool(BrowserPoolSettings(size=2))
+
+        async with pool.page(), pool.page():
+            assert pool.metrics().active_leases == 2
+
+        assert len(launched) == 2
+        assert pool.metrics().active_leases == 0
+
+    @pytest.mark.asyncio
+    async def test_restarts_browser_after_max_pages(self, launched):
+        """Test that a browser is replaced once it served its page quota."""
+        pool = BrowserPool(BrowserPoolSettings(size=1, max_pages_per_browser=2))
+
+        for _ in range(3):
+            async with pool.page():
+                pass
+
+        assert len(launched) == 2
+        launched[0].close.assert_awaited_once()
+        launched[1].close.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_relaunches_disconnected_browser(self, launched):
+        """Test that a crashed browser is replaced on the next lease."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+
+        async with pool.page():
+            pass
+        launched[0].is_connected.return_value = False
+        async with pool.page():
+            pass
+
+        assert len(launched) == 2
+        assert pool.metrics().browsers == 1
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrent_pages(self, launched):
+        """Test that leases beyond max_concurrent_pages wait for a free one."""
+        pool = BrowserPool(BrowserPoolSettings(size=1, max_concurrent_pages=2))
+        active = 0
+        peak = 0
+
+        async def fetch():
+            nonlocal active, peak
+            async with pool.page():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(fetch() for _ in range(5)))
+
+        assert peak == 2
+        assert pool.metrics().leases == 5
+        assert pool.metrics().max_wait_seconds > 0
+
+    @pytest.mark.asyncio
+    async def test_close_shuts_down_browsers(self, launched):
+        """Test that close() shuts every browser and allows reuse."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+
+        async with pool.page():
+            pass
+        await pool.close()
+
+        launched[0].close.assert_awaited_once()
+        assert pool.metrics().browsers == 0
+
+        async with pool.page():
+            pass
+        assert len(launched) == 2
+
+    def test_warns_about_browsers_of_finished_loop(self, launched, caplog):
+        """Test that a pool left open on a finished loop is reported."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+
+        async def lease():
+            async with pool.page():
+                pass
+
+        asyncio.run(lease())
+        asyncio.run(lease())
+
+        assert "was not closed before its event loop ended" in caplog.text
+        assert len(launched) == 2
+
+    def test_shutdown_closes_pool_on_its_idle_loop(self, launched):
+        """Test that shutdown() runs close() on the loop that owns the pool."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+
+        async def lease():
+            async with pool.page():
+                pass
+
+        with asyncio.Runner() as runner:
+            runner.run(lease())
+            pool.shutdown()
+
+        launched[0].close.assert_awaited_once()
+        assert pool.metrics().browsers == 0
+
+    def test_closes_browsers_on_loop_still_running(self, launched):
+        """Test that browsers of a loop running elsewhere are closed on it."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(
+                pool.page().__aenter__(), other_loop
+            ).result(timeout=5)
+
+            async def lease():
+                async with pool.page():
+                    pass
+
+            asyncio.run(lease())
+            # Wait for the shutdown scheduled on the other loop
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(
+                timeout=5
+            )
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+        launched[0].close.assert_awaited_once()
+
+    def test_shutdown_closes_pool_on_loop_running_elsewhere(self, launched):
+        """Test that shutdown() waits for close() on the owning loop."""
+        pool = BrowserPool(BrowserPoolSettings(size=1))
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+
+            async def lease():
+                async with pool.page():
+                    pass
+
+            asyncio.run_coroutine_threadsafe(lease(), other_loop).result(timeout=5)
+            pool.shutdown()
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+        launched[0].close.assert_awaited_once()
+
+
+class TestGetBrowserPool:
+    """Test cases for the container-managed pools."""
+
+    @pytest.fixture(autouse=True)
+    def container(self):
+        reset_container()
+        yield init_container(environment=Environment.TESTING)
+        reset_container()
+
+    def test_get_browser_pool_is_shared_per_mode(self, container):
+        """Test that headless and headed scrapers get their own shared pool."""
+        assert get_browser_pool() is get_browser_pool(headless=True)
+        assert get_browser_pool() is container.services.browser_pool()
+        assert get_browser_pool(headless=False) is not get_browser_pool()
+        assert get_browser_pool(headless=False).pool_settings.headless is False
+
+    def test_container_shutdown_closes_pools(self, container):
+        """Test that pools are closed when container resources shut down."""
+        pool = get_browser_pool()
+
+        with patch.object(pool, "shutdown") as shutdown:
+            reset_container()
+
+        shutdown.assert_called_once_with()
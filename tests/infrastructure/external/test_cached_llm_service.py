@@ -0,0 +1,268 @@
+"""Tests for caching and batched speaker matching in CachedLLMService."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import RunnableLambda
+from pydantic import BaseModel
+
+from src.domain.types.llm import LLMMatchResult, LLMSpeakerMatchContext
+from src.infrastructure.config.settings import get_settings
+from src.infrastructure.external.cached_llm_service import (
+    BatchSpeakerMatchItem,
+    BatchSpeakerMatchResponse,
+    CachedLLMService,
+    with_persistent_cache,
+)
+from src.infrastructure.external.llm_cache_store import PersistentLLMCache
+from src.infrastructure.external.prompt_loader import PromptLoader
+
+
+class SectionList(BaseModel):
+    sections: list[str]
+
+
+def make_context(i: int) -> LLMSpeakerMatchContext:
+    return LLMSpeakerMatchContext(
+        speaker_name=f"議員{i}",
+        normalized_name=f"議員{i}",
+        party_affiliation=None,
+        position=None,
+        meeting_date="2024-01-01",
+        candidates=[{"id": str(100 + i), "name": f"議員{i}", "party": "テスト党"}],
+    )
+
+
+def make_response(indices: list[int], offset: int = 0) -> BatchSpeakerMatchResponse:
+    return BatchSpeakerMatchResponse(
+        results=[
+            BatchSpeakerMatchItem(
+                index=i,
+                matched=True,
+                matched_id=100 + offset + i,
+                confidence=0.9,
+                reason="名前が一致",
+            )
+            for i in indices
+        ]
+    )
+
+
+@pytest.fixture
+def base_service():
+    service = MagicMock()
+    service.model_name = "test-model"
+    service.match_speaker_to_politician = AsyncMock(
+        return_value=LLMMatchResult(
+            matched=False,
+            confidence=0.0,
+            reason="individual",
+            matched_id=None,
+            metadata={},
+        )
+    )
+    return service
+
+
+class TestBatchMatchSpeakers:
+    """Tests for CachedLLMService.batch_match_speakers."""
+
+    @pytest.mark.asyncio
+    async def test_packs_contexts_into_one_call(self, base_service):
+        structured_llm = MagicMock()
+        structured_llm.ainvoke = AsyncMock(return_value=make_response([0, 1, 2]))
+        base_service.get_structured_llm.return_value = structured_llm
+
+        service = CachedLLMService(base_service)
+        results = await service.batch_match_speakers(
+            [make_context(i) for i in range(3)]
+        )
+
+        assert structured_llm.ainvoke.await_count == 1
+        base_service.match_speaker_to_politician.assert_not_called()
+        assert [r["matched_id"] for r in results if r] == [100, 101, 102]
+        assert all(r and r["metadata"]["batch_size"] == "3" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_results_are_cached(self, base_service):
+        structured_llm = MagicMock()
+        structured_llm.ainvoke = AsyncMock(return_value=make_response([0, 1]))
+        base_service.get_structured_llm.return_value = structured_llm
+
+        service = CachedLLMService(base_service)
+        contexts = [make_context(i) for i in range(2)]
+        await service.batch_match_speakers(contexts)
+        results = await service.batch_match_speakers(contexts)
+
+        assert structured_llm.ainvoke.await_count == 1
+        assert [r["matched_id"] for r in results if r] == [100, 101]
+
+    @pytest.mark.asyncio
+    async def test_splits_by_batch_size(self, base_service):
+        structured_llm = MagicMock()
+        structured_llm.ainvoke = AsyncMock(
+            side_effect=[make_response([0, 1]), make_response([0, 1], offset=2)]
+        )
+        base_service.get_structured_llm.return_value = structured_llm
+
+        service = CachedLLMService(base_service, max_batch_size=2)
+        results = await service.batch_match_speakers(
+            [make_context(i) for i in range(4)]
+        )
+
+        assert structured_llm.ainvoke.await_count == 2
+        assert [r["matched_id"] for r in results if r] == [100, 101, 102, 103]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_split_in_half(self, base_service):
+        structured_llm = MagicMock()
+        structured_llm.ainvoke = AsyncMock(
+            side_effect=[
+                RuntimeError("token limit exceeded"),
+                make_response([0, 1]),
+                make_response([0, 1], offset=2),
+            ]
+        )
+        base_service.get_structured_llm.return_value = structured_llm
+
+        service = CachedLLMService(base_service)
+        results = await service.batch_match_speakers(
+            [make_context(i) for i in range(4)]
+        )
+
+        assert structured_llm.ainvoke.await_count == 3
+        assert [r["matched_id"] for r in results if r] == [100, 101, 102, 103]
+
+    @pytest.mark.asyncio
+    async def test_missing_or_invalid_items_are_retried_individually(
+        self, base_service
+    ):
+        response = make_response([0])
+        response.results.append(
+            BatchSpeakerMatchItem(
+                index=2, matched=True, matched_id=999, confidence=0.9, reason="?"
+            )
+        )
+        structured_llm = MagicMock()
+        structured_llm.ainvoke = AsyncMock(return_value=response)
+        base_service.get_structured_llm.return_value = structured_llm
+
+        service = CachedLLMService(base_service)
+        results = await service.batch_match_speakers(
+            [make_context(i) for i in range(3)]
+        )
+
+        assert base_service.match_speaker_to_politician.await_count == 2
+        assert results[0] and results[0]["matched_id"] == 100
+        assert results[1] and results[1]["reason"] == "individual"
+        assert results[2] and results[2]["reason"] == "individual"
+
+    def test_split_respects_prompt_size(self, base_service):
+        service = CachedLLMService(base_service, max_batch_prompt_chars=200)
+        item_chars = len(service._format_batch_item(0, make_context(0)))
+
+        batches = service._split_into_batches([make_context(i) for i in range(6)])
+
+        assert len(batches) > 1
+        assert all(len(batch) <= max(1, 200 // item_chars) for batch in batches)
+        assert sum(len(batch) for batch in batches) == 6
+
+
+class TestStructuredOutputCache:
+    """Tests for caching responses of get_structured_llm."""
+
+    @pytest.fixture
+    def structured_calls(self, base_service):
+        calls: list[object] = []
+
+        def respond(prompt: object) -> SectionList:
+            calls.append(prompt)
+            return SectionList(sections=["開会", "質疑"])
+
+        base_service.get_structured_llm = MagicMock(
+            return_value=RunnableLambda(respond)
+        )
+        return calls
+
+    def test_responses_are_reused_across_service_instances(
+        self, base_service, structured_calls
+    ):
+        persistent = PersistentLLMCache(":memory:")
+        prompt = ChatPromptTemplate.from_template("議事録を分割: {text}")
+
+        first = CachedLLMService(base_service, persistent_cache=persistent)
+        first_result = (prompt | first.get_structured_llm(SectionList)).invoke(
+            {"text": "本文"}
+        )
+        second = CachedLLMService(base_service, persistent_cache=persistent)
+        second_result = (prompt | second.get_structured_llm(SectionList)).invoke(
+            {"text": "本文"}
+        )
+
+        assert len(structured_calls) == 1
+        assert second_result == first_result
+        assert second_result is not first_result
+        assert persistent.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_different_prompts_are_not_shared(
+        self, base_service, structured_calls
+    ):
+        service = CachedLLMService(
+            base_service, persistent_cache=PersistentLLMCache(":memory:")
+        )
+        structured_llm = service.get_structured_llm(SectionList)
+
+        await structured_llm.ainvoke("本文A")
+        await structured_llm.ainvoke("本文B")
+        await structured_llm.ainvoke("本文A")
+
+        assert structured_calls == ["本文A", "本文B"]
+
+    def test_prompt_version_partitions_persistent_entries(
+        self, base_service, structured_calls
+    ):
+        persistent = PersistentLLMCache(":memory:")
+
+        for version in ["1.0-a", "1.0-b"]:
+            service = CachedLLMService(
+                base_service, persistent_cache=persistent, prompt_version=version
+            )
+            service.get_structured_llm(SectionList).invoke("本文")
+
+        assert len(structured_calls) == 2
+
+    def test_non_model_schema_is_not_wrapped(self, base_service):
+        service = CachedLLMService(base_service)
+
+        result = service.get_structured_llm({"type": "object"})
+
+        assert result is base_service.get_structured_llm.return_value
+
+    def test_default_prompt_version_fingerprints_prompts(self, base_service):
+        service = CachedLLMService(base_service)
+        loader = PromptLoader.get_default_instance()
+
+        assert service._prompt_version == loader.get_cache_version()
+        assert service._prompt_version.startswith(f"{loader.get_version()}-")
+
+
+class TestWithPersistentCache:
+    """Tests for wrapping production LLM services."""
+
+    def test_disabled_cache_returns_base_service(self, base_service):
+        assert with_persistent_cache(base_service) is base_service
+
+    def test_enabled_cache_wraps_base_service(self, base_service, monkeypatch):
+        monkeypatch.setattr(get_settings(), "llm_cache_enabled", True)
+        monkeypatch.setattr(
+            "src.infrastructure.external.cached_llm_service.get_persistent_llm_cache",
+            lambda: PersistentLLMCache(":memory:"),
+        )
+
+        service = with_persistent_cache(base_service)
+
+        assert isinstance(service, CachedLLMService)
+        assert service.model_name == "test-model"
+        assert service.llm is base_service.llm
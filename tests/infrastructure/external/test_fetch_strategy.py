@@ -0,0 +1,143 @@
+"""Tests for the HTTP-first fetch strategy."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.external.fetch_strategy import (
+    FetchMode,
+    FetchStrategy,
+    StaticPageCheck,
+    needs_rendering,
+)
+from tests.fixtures.browser_pool_factories import create_browser_pool
+from tests.fixtures.fetch_strategy_factories import create_http_response
+
+STATIC_PAGE = (
+    "<html><body><main>" + "市議会の会議録です。" * 30 + "</main></body></html>"
+)
+SPA_SHELL = (
+    "<html><body><noscript>JavaScriptを有効にしてください</noscript>"
+    '<div id="app"></div><script src="app.js"></script></body></html>'
+)
+URL = "https://www.example.lg.jp/gikai/minutes/1.html"
+
+
+def create_strategy(*responses, page=None) -> FetchStrategy:
+    """Create a strategy whose HTTP client returns the given responses."""
+    http_client = MagicMock()
+    http_client.get = AsyncMock(side_effect=list(responses))
+    page_readiness = MagicMock()
+    page_readiness.wait = AsyncMock(return_value=True)
+    return FetchStrategy(
+        http_client=http_client,
+        browser_pool=create_browser_pool(page),
+        page_readiness=page_readiness,
+        http_enabled=True,
+    )
+
+
+class TestNeedsRendering:
+    """Test the static HTML heuristics."""
+
+    def test_server_rendered_page_is_static(self):
+        assert needs_rendering(STATIC_PAGE) is False
+
+    def test_empty_app_shell_needs_rendering(self):
+        assert needs_rendering(SPA_SHELL) is True
+
+    def test_short_body_needs_rendering(self):
+        assert needs_rendering("<html><body><p>Loading...</p></body></html>") is True
+
+    def test_missing_content_selector_needs_rendering(self):
+        check = StaticPageCheck(name="site", content_selectors=("#minutes", "table"))
+
+        assert needs_rendering(STATIC_PAGE, check) is True
+        assert needs_rendering(STATIC_PAGE.replace("<main>", "<table>"), check) is False
+
+    def test_unsupported_selectors_do_not_match(self):
+        check = StaticPageCheck(name="site", content_selectors=('a:has-text("PDF")',))
+
+        assert needs_rendering(STATIC_PAGE, check) is True
+
+
+class TestFetchStrategy:
+    """Test per-host decisions and the browser fallback."""
+
+    @pytest.mark.asyncio
+    async def test_static_page_is_served_over_http(self):
+        strategy = create_strategy(create_http_response(STATIC_PAGE, URL))
+
+        fetched = await strategy.fetch_html(URL)
+
+        assert fetched.mode is FetchMode.HTTP
+        assert fetched.html == STATIC_PAGE
+        strategy.browser_pool.page.assert_not_called()
+        assert strategy.metrics().http_pages == 1
+
+    @pytest.mark.asyncio
+    async def test_app_shell_escalates_and_host_is_remembered(self):
+        page = AsyncMock()
+        page.content = AsyncMock(return_value=STATIC_PAGE)
+        page.url = URL
+        strategy = create_strategy(create_http_response(SPA_SHELL, URL), page=page)
+
+        first = await strategy.fetch_html(URL)
+        second = await strategy.fetch_html(URL.replace("1.html", "2.html"))
+
+        assert first.mode is FetchMode.BROWSER
+        assert second.mode is FetchMode.BROWSER
+        assert first.html == STATIC_PAGE
+        # Only the first URL of the host was tried over HTTP
+        strategy.http_client.get.assert_awaited_once()
+        assert strategy.browser_pool.page.call_count == 2
+        assert strategy.mode_for(URL) is FetchMode.BROWSER
+        metrics = strategy.metrics()
+        assert metrics.escalations == 1
+        assert metrics.browser_pages == 2
+
+    @pytest.mark.asyncio
+    async def test_decisions_are_kept_per_page_check(self):
+        viewer = StaticPageCheck(name="viewer", content_selectors=("#minutes",))
+        text = StaticPageCheck(name="text")
+        strategy = create_strategy(
+            create_http_response(STATIC_PAGE, URL),
+            create_http_response(STATIC_PAGE, URL),
+        )
+
+        assert await strategy.fetch_static(URL, viewer) is None
+        assert await strategy.fetch_static(URL, text) is not None
+        assert strategy.mode_for(URL, viewer) is FetchMode.BROWSER
+        assert strategy.mode_for(URL, text) is FetchMode.HTTP
+
+    @pytest.mark.asyncio
+    async def test_http_errors_fall_back_without_changing_decision(self):
+        strategy = create_strategy(
+            OSError("connection reset"),
+            create_http_response("", URL, status=503),
+            create_http_response("%PDF-1.4", URL, content_type="application/pdf"),
+        )
+
+        for _ in range(3):
+            assert await strategy.fetch_static(URL) is None
+
+        assert strategy.mode_for(URL) is FetchMode.HTTP
+        assert strategy.metrics().http_failures == 3
+
+    @pytest.mark.asyncio
+    async def test_http_disabled_always_uses_browser(self):
+        strategy = create_strategy()
+        strategy.http_enabled = False
+
+        assert await strategy.fetch_static(URL) is None
+        strategy.http_client.get.assert_not_awaited()
+
+    def test_mark_needs_browser(self):
+        strategy = create_strategy()
+        check = StaticPageCheck(name="kokkai")
+
+        strategy.mark_needs_browser(URL, check, "no minutes table")
+
+        assert strategy.decisions() == {
+            ("www.example.lg.jp", "kokkai"): FetchMode.BROWSER
+        }
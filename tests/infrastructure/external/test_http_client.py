@@ -0,0 +1,105 @@
+"""Tests for the pooled HTTP client against a local aiohttp server."""
+
+import aiohttp
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.infrastructure.external.http_client import HttpClient, HttpClientSettings
+
+ETAG = '"v1"'
+SHIFT_JIS_PAGE = (
+    '<html><head><meta charset="Shift_JIS"></head><body>議事録</body></html>'
+)
+
+
+async def minutes(request: web.Request) -> web.Response:
+    if request.headers.get("If-None-Match") == ETAG:
+        return web.Response(status=304)
+    response = web.Response(
+        text="<html><body>本会議</body></html>" * 50, content_type="text/html"
+    )
+    response.headers["ETag"] = ETAG
+    response.headers["Last-Modified"] = "Wed, 23 Apr 2025 00:00:00 GMT"
+    response.enable_compression()
+    return response
+
+
+async def shift_jis(request: web.Request) -> web.Response:
+    return web.Response(
+        body=SHIFT_JIS_PAGE.encode("shift_jis"), headers={"Content-Type": "text/html"}
+    )
+
+
+async def echo_headers(request: web.Request) -> web.Response:
+    return web.json_response(dict(request.headers))
+
+
+@pytest_asyncio.fixture
+async def server():
+    app = web.Application()
+    app.router.add_get("/minutes", minutes)
+    app.router.add_get("/sjis", shift_jis)
+    app.router.add_get("/headers", echo_headers)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+@pytest_asyncio.fixture
+async def client():
+    client = HttpClient(HttpClientSettings(limit=4, limit_per_host=2))
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_get_decodes_compressed_body_and_validators(server, client):
+    response = await client.get(str(server.make_url("/minutes")))
+
+    assert response.ok
+    assert response.is_html
+    assert response.text.startswith("<html><body>本会議")
+    assert response.etag == ETAG
+    assert response.last_modified == "Wed, 23 Apr 2025 00:00:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_not_modified(server, client):
+    response = await client.get(str(server.make_url("/minutes")), etag=ETAG)
+
+    assert response.not_modified
+    assert response.body == b""
+    assert client.metrics().not_modified == 1
+
+
+@pytest.mark.asyncio
+async def test_charset_from_meta_tag(server, client):
+    response = await client.get(str(server.make_url("/sjis")))
+
+    assert "議事録" in response.text
+
+
+@pytest.mark.asyncio
+async def test_sends_browser_like_headers_over_one_session(server, client):
+    first = await client.get(str(server.make_url("/headers")))
+    session = client._session
+    await client.get(str(server.make_url("/headers")))
+
+    assert client._session is session
+    assert "gzip" in first.text
+    assert "Mozilla/5.0" in first.text
+    metrics = client.metrics()
+    assert metrics.requests == 2
+    assert metrics.errors == 0
+    assert metrics.bytes_received > 0
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_counted(client):
+    with pytest.raises(aiohttp.ClientError):
+        await client.get("http://127.0.0.1:9/unreachable")
+
+    assert client.metrics().errors == 1
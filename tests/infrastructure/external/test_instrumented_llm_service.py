@@ -19,6 +19,7 @@ from src.domain.types import (
     PoliticianDTO,
 )
 from src.infrastructure.external.instrumented_llm_service import InstrumentedLLMService
+from src.infrastructure.external.llm_history_sink import BufferedHistorySink
 
 
 class MockLLMService:
@@ -259,6 +260,39 @@ class TestInstrumentedLLMService:
         assert update_call.status == ProcessingStatus.FAILED
         assert update_call.error_message == "Test error"
 
+    @pytest.mark.asyncio
+    async def test_history_sink_defers_writes(
+        self, mock_llm_service, mock_history_repository
+    ):
+        """Test that a history sink replaces per-call create/update."""
+        mock_history_repository.bulk_create = AsyncMock(side_effect=lambda x: x)
+        session = AsyncMock()
+        session.__aenter__.return_value = session
+        sink = BufferedHistorySink(
+            session_factory=lambda: session,
+            repository_factory=lambda _: mock_history_repository,
+        )
+        instrumented_service = InstrumentedLLMService(
+            llm_service=mock_llm_service,
+            history_repository=mock_history_repository,
+            model_name="test-model",
+            model_version="1.0.0",
+            history_sink=sink,
+        )
+
+        await instrumented_service.extract_speeches_from_text("Test text")
+        await instrumented_service.extract_speeches_from_text("Other text")
+
+        mock_history_repository.create.assert_not_called()
+        mock_history_repository.update.assert_not_called()
+
+        await sink.close()
+
+        mock_history_repository.bulk_create.assert_awaited_once()
+        histories = mock_history_repository.bulk_create.call_args[0][0]
+        assert [h.status for h in histories] == [ProcessingStatus.COMPLETED] * 2
+        assert all(h.completed_at is not None for h in histories)
+
     @pytest.mark.asyncio
     async def test_no_history_repository(self, mock_llm_service):
         """Test service works without history repository."""
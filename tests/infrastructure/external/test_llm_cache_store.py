@@ -0,0 +1,140 @@
+"""Tests for the persistent LLM response cache."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.external.cached_llm_service import CachedLLMService
+from src.infrastructure.external.llm_cache_store import (
+    PersistentLLMCache,
+    normalize_inputs,
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "llm_cache.sqlite3"
+
+
+class TestNormalizeInputs:
+    """Tests for input normalization."""
+
+    def test_key_order_and_whitespace_are_ignored(self):
+        assert normalize_inputs({"b": " x ", "a": 1}) == normalize_inputs(
+            {"a": 1, "b": "x"}
+        )
+
+    def test_different_values_differ(self):
+        assert normalize_inputs({"a": 1}) != normalize_inputs({"a": 2})
+
+
+class TestPersistentLLMCache:
+    """Tests for PersistentLLMCache."""
+
+    def test_miss_then_hit(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path)
+
+        assert cache.get("model", "op", "1", {"q": "x"}) is None
+        cache.set("model", "op", "1", {"q": "x"}, {"answer": 42})
+
+        assert cache.get("model", "op", "1", {"q": "x"}) == {"answer": 42}
+        stats = cache.stats()
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.writes == 1
+        assert stats.total_entries == 1
+        assert stats.bytes_read == stats.bytes_written > 0
+
+    def test_key_includes_model_and_prompt_version(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path)
+        cache.set("model-a", "op", "1", {"q": "x"}, "result")
+
+        assert cache.get("model-b", "op", "1", {"q": "x"}) is None
+        assert cache.get("model-a", "op", "2", {"q": "x"}) is None
+        assert cache.get("model-a", "op", "1", {"q": "x"}) == "result"
+
+    def test_survives_reopen(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path)
+        cache.set("model", "op", "1", "input", ["a", "b"])
+        cache.close()
+
+        reopened = PersistentLLMCache(path=cache_path)
+        assert reopened.get("model", "op", "1", "input") == ["a", "b"]
+
+    def test_lru_eviction_by_entries(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path, max_entries=2)
+        cache.set("model", "op", "1", "first", 1)
+        cache.set("model", "op", "1", "second", 2)
+        cache.get("model", "op", "1", "first")
+        cache.set("model", "op", "1", "third", 3)
+
+        assert cache.get("model", "op", "1", "first") == 1
+        assert cache.get("model", "op", "1", "second") is None
+        assert cache.get("model", "op", "1", "third") == 3
+
+    def test_eviction_by_size(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path, max_bytes=250)
+        for i in range(10):
+            cache.set("model", "op", "1", i, "x" * 100)
+
+        stats = cache.stats()
+        assert stats.total_bytes <= 250
+        assert stats.evictions > 0
+        assert cache.get("model", "op", "1", 9) == "x" * 100
+
+    def test_prune_by_model(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path)
+        cache.set("model-a", "op", "1", "x", 1)
+        cache.set("model-b", "op", "1", "x", 2)
+
+        assert cache.prune(model_name="model-a") == 1
+        assert cache.get("model-a", "op", "1", "x") is None
+        assert cache.get("model-b", "op", "1", "x") == 2
+
+    def test_unserializable_result_is_skipped(self, cache_path):
+        cache = PersistentLLMCache(path=cache_path)
+        cache.set("model", "op", "1", "x", {1, 2})
+
+        assert cache.stats().total_entries == 0
+
+
+class TestCachedLLMServiceWithPersistentCache:
+    """Tests for CachedLLMService backed by a persistent cache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_across_service_instances(self, cache_path):
+        base_service = MagicMock()
+        base_service.model_name = "gemini-2.0-flash"
+        base_service.extract_speeches_from_text = AsyncMock(
+            return_value=[{"speaker": "山田", "content": "発言"}]
+        )
+
+        first = CachedLLMService(
+            base_service, persistent_cache=PersistentLLMCache(path=cache_path)
+        )
+        await first.extract_speeches_from_text("議事録")
+
+        second = CachedLLMService(
+            base_service, persistent_cache=PersistentLLMCache(path=cache_path)
+        )
+        result = await second.extract_speeches_from_text("議事録")
+
+        assert result == [{"speaker": "山田", "content": "発言"}]
+        assert base_service.extract_speeches_from_text.call_count == 1
+        assert second.get_cache_stats()["persistent"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prompt_version_change_invalidates(self, cache_path):
+        base_service = MagicMock()
+        base_service.model_name = "gemini-2.0-flash"
+        base_service.extract_speeches_from_text = AsyncMock(return_value=[])
+
+        for version in ("1.0.0", "1.1.0"):
+            service = CachedLLMService(
+                base_service,
+                persistent_cache=PersistentLLMCache(path=cache_path),
+                prompt_version=version,
+            )
+            await service.extract_speeches_from_text("議事録")
+
+        assert base_service.extract_speeches_from_text.call_count == 2
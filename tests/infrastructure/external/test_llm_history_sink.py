@@ -0,0 +1,200 @@
+"""Tests for BufferedHistorySink."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.entities.llm_processing_history import (
+    LLMProcessingHistory,
+    ProcessingType,
+)
+from src.domain.repositories.llm_processing_history_repository import (
+    LLMProcessingHistoryRepository,
+)
+from src.infrastructure.external.llm_history_sink import (
+    BufferedHistorySink,
+    open_history_sink,
+)
+
+
+def make_history(variables: dict | None = None) -> LLMProcessingHistory:
+    return LLMProcessingHistory(
+        processing_type=ProcessingType.SPEAKER_MATCHING,
+        model_name="test-model",
+        model_version="1.0",
+        prompt_template="speaker_matching",
+        prompt_variables=variables or {"speaker_name": "山田太郎"},
+        input_reference_type="speaker",
+        input_reference_id=1,
+    )
+
+
+@pytest.fixture
+def repository():
+    repo = MagicMock(spec=LLMProcessingHistoryRepository)
+    repo.bulk_create = AsyncMock(side_effect=lambda histories: histories)
+    return repo
+
+
+@pytest.fixture
+def session():
+    session = AsyncMock()
+    session.__aenter__.return_value = session
+    return session
+
+
+@pytest.fixture
+def make_sink(repository, session):
+    def make(**kwargs) -> BufferedHistorySink:
+        return BufferedHistorySink(
+            session_factory=lambda: session,
+            repository_factory=lambda _: repository,
+            **kwargs,
+        )
+
+    return make
+
+
+class TestBufferedHistorySink:
+    """Test BufferedHistorySink behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_record_does_not_touch_repository(self, repository, make_sink):
+        sink = make_sink(max_batch_size=10)
+
+        for _ in range(5):
+            sink.record(make_history())
+
+        repository.bulk_create.assert_not_called()
+        assert sink.metrics.pending == 5
+
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_in_bulk_when_batch_is_full(self, repository, make_sink):
+        sink = make_sink(max_batch_size=3)
+
+        for _ in range(7):
+            sink.record(make_history())
+            await asyncio.sleep(0)
+
+        assert [len(c.args[0]) for c in repository.bulk_create.call_args_list] == [
+            3,
+            3,
+        ]
+
+        await sink.close()
+
+        assert repository.bulk_create.await_count == 3
+        assert sink.metrics.written == 7
+        assert sink.metrics.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_flushes_periodically(self, repository, make_sink):
+        sink = make_sink(flush_interval=0.01)
+
+        sink.record(make_history())
+        await asyncio.sleep(0.05)
+
+        repository.bulk_create.assert_awaited_once()
+        await sink.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_records_for_retry(self, repository, make_sink):
+        repository.bulk_create.side_effect = [RuntimeError("db down"), None]
+        sink = make_sink()
+        histories = [make_history() for _ in range(3)]
+        for history in histories:
+            sink.record(history)
+
+        assert await sink.flush() == 0
+        assert sink.metrics.pending == 3
+        assert sink.metrics.failed_flushes == 1
+
+        await sink.close()
+
+        assert repository.bulk_create.call_args.args[0] == histories
+        assert sink.metrics.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_keeps_records(self, repository, make_sink):
+        writing = asyncio.Event()
+
+        async def slow_bulk_create(histories):
+            writing.set()
+            await asyncio.sleep(10)
+
+        repository.bulk_create.side_effect = slow_bulk_create
+        sink = make_sink()
+        histories = [make_history() for _ in range(3)]
+        for history in histories:
+            sink.record(history)
+
+        flush = asyncio.create_task(sink.flush())
+        await writing.wait()
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await flush
+
+        assert sink.metrics.pending == 3
+
+        repository.bulk_create.side_effect = None
+        await sink.close()
+
+        assert repository.bulk_create.call_args.args[0] == histories
+        assert sink.metrics.pending == 0
+
+    def test_record_without_event_loop_waits_for_flush(self, repository, make_sink):
+        sink = make_sink(max_batch_size=1)
+
+        sink.record(make_history())
+        sink.record(make_history())
+
+        repository.bulk_create.assert_not_called()
+        asyncio.run(sink.close())
+        assert sink.metrics.written == 2
+
+    @pytest.mark.asyncio
+    async def test_deduplicates_identical_prompt_payloads(self, repository, make_sink):
+        sink = make_sink(deduplicate_prompts=True)
+        first, second = make_history(), make_history()
+        other = make_history({"speaker_name": "佐藤花子"})
+
+        for history in (first, second, other):
+            sink.record(history)
+        await sink.close()
+
+        assert first.prompt_variables == {"speaker_name": "山田太郎"}
+        assert second.prompt_variables == {}
+        assert (
+            first.processing_metadata["prompt_hash"]
+            == second.processing_metadata["prompt_hash"]
+            != other.processing_metadata["prompt_hash"]
+        )
+        assert other.prompt_variables == {"speaker_name": "佐藤花子"}
+        assert sink.metrics.deduplicated_payloads == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_through_own_session(self, make_sink, session):
+        sink = make_sink()
+        sink.record(make_history())
+
+        assert await sink.flush() == 1
+
+        session.__aenter__.assert_awaited_once()
+        session.commit.assert_awaited_once()
+        session.__aexit__.assert_awaited_once()
+
+    def test_resource_drains_buffer_on_shutdown(self, repository, session):
+        resource = open_history_sink(
+            session_factory=lambda: session, repository_factory=lambda _: repository
+        )
+        sink = next(resource)
+        sink.record(make_history())
+
+        with pytest.raises(StopIteration):
+            next(resource)
+
+        repository.bulk_create.assert_awaited_once()
+        assert sink.metrics.pending == 0
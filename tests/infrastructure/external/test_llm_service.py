@@ -173,3 +173,30 @@ class TestGeminiLLMService:
             service3 = GeminiLLMService(api_key="key3", model_name="gemini-1.5-flash")
             assert service3.api_key == "key3"
             assert service3.model_name == "gemini-1.5-flash"
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_with_retry_retries_transient_errors(self, service):
+        """Rate limit errors are retried with non-blocking backoff."""
+        service.retry_min_wait = 0
+        service.retry_max_wait = 0
+        mock_chain = MagicMock()
+        mock_chain.ainvoke = AsyncMock(
+            side_effect=[RuntimeError("429 Resource exhausted"), {"ok": True}]
+        )
+
+        result = await service.ainvoke_with_retry(mock_chain, {"param": "value"})
+
+        assert result == {"ok": True}
+        assert mock_chain.ainvoke.await_count == 2
+        mock_chain.invoke.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_with_retry_does_not_retry_other_errors(self, service):
+        """Non-transient errors are raised immediately."""
+        mock_chain = MagicMock()
+        mock_chain.ainvoke = AsyncMock(side_effect=ValueError("bad schema"))
+
+        with pytest.raises(ValueError, match="bad schema"):
+            await service.ainvoke_with_retry(mock_chain, {"param": "value"})
+
+        assert mock_chain.ainvoke.await_count == 1
@@ -0,0 +1,113 @@
+"""Tests for event-driven page readiness detection."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.infrastructure.external.page_readiness import (
+    PageReadiness,
+    ReadinessProfile,
+)
+
+
+def settled(grew: bool = False) -> dict[str, bool]:
+    """Result of the in-page DOM settle script."""
+    return {"settled": True, "grew": grew}
+
+
+class TestPageReadiness:
+    """Test cases for PageReadiness."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_any_ready_selector_then_quiet_dom(self):
+        """Test that selectors are combined into one bounded wait."""
+        profile = ReadinessProfile(
+            name="site", ready_selectors=("#a", ".b"), max_wait_ms=5000
+        )
+        page = AsyncMock()
+        page.evaluate = AsyncMock(return_value=settled())
+
+        ready = await PageReadiness().wait(page, profile)
+
+        assert ready is True
+        page.wait_for_selector.assert_awaited_once()
+        args, kwargs = page.wait_for_selector.await_args
+        assert args == ("#a, .b",)
+        assert kwargs["state"] == "attached"
+        assert 0 < kwargs["timeout"] <= 5000
+        options = page.evaluate.await_args.args[1]
+        assert options["quietMs"] == profile.quiet_period_ms
+        assert options["scroll"] is False
+        assert options["maxMs"] <= 5000
+
+    @pytest.mark.asyncio
+    async def test_not_ready_when_selectors_never_appear(self):
+        """Test that a selector timeout is reported but not raised."""
+        profile = ReadinessProfile(name="site", ready_selectors=("#missing",))
+        page = AsyncMock()
+        page.wait_for_selector = AsyncMock(side_effect=Exception("Timeout"))
+        page.evaluate = AsyncMock(return_value=settled())
+        readiness = PageReadiness()
+
+        ready = await readiness.wait(page, profile)
+
+        assert ready is False
+        assert readiness.metrics()["site"].not_ready == 1
+
+    @pytest.mark.asyncio
+    async def test_scrolls_while_page_keeps_growing(self):
+        """Test that lazy-loaded pages are scrolled until they stop growing."""
+        profile = ReadinessProfile(name="list", scroll_rounds=3)
+        page = AsyncMock()
+        page.evaluate = AsyncMock(
+            side_effect=[settled(), settled(grew=True), settled(grew=False)]
+        )
+
+        ready = await PageReadiness().wait(page, profile)
+
+        assert ready is True
+        assert page.evaluate.await_count == 3
+        scrolls = [call.args[1]["scroll"] for call in page.evaluate.await_args_list]
+        assert scrolls == [False, True, True]
+        page.wait_for_selector.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stops_when_dom_cannot_be_observed(self):
+        """Test that evaluation errors (e.g. navigation) end the wait."""
+        profile = ReadinessProfile(name="list", scroll_rounds=3)
+        page = AsyncMock()
+        page.evaluate = AsyncMock(side_effect=Exception("Context destroyed"))
+
+        ready = await PageReadiness().wait(page, profile)
+
+        assert ready is False
+        assert page.evaluate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_hard_cap_skips_dom_wait_when_exhausted(self):
+        """Test that no time budget is left once the cap is spent."""
+        profile = ReadinessProfile(name="site", ready_selectors=("#a",), max_wait_ms=0)
+        page = AsyncMock()
+
+        ready = await PageReadiness().wait(page, profile)
+
+        assert ready is False
+        page.evaluate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_records_metrics_per_profile(self):
+        """Test that wait times are aggregated per profile name."""
+        page = AsyncMock()
+        page.evaluate = AsyncMock(return_value=settled())
+        readiness = PageReadiness()
+
+        await readiness.wait(page, ReadinessProfile(name="a"))
+        await readiness.wait(page, ReadinessProfile(name="a"))
+        await readiness.wait(page, ReadinessProfile(name="b"))
+
+        metrics = readiness.metrics()
+        assert metrics["a"].waits == 2
+        assert metrics["b"].waits == 1
+        assert metrics["a"].not_ready == 0
+        assert metrics["a"].max_wait_seconds >= 0
+        assert metrics["a"].average_wait_seconds <= metrics["a"].max_wait_seconds
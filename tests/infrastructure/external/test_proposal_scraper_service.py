@@ -2,7 +2,7 @@
 
 import json
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
+from unittest.mock import AsyncMock, MagicMock, create_autospec
 
 import pytest
 
@@ -11,6 +11,7 @@ from src.domain.types.scraper_types import ScrapedProposal
 from src.infrastructure.external.proposal_scraper_service import (
     ProposalScraperService,
 )
+from tests.fixtures.browser_pool_factories import create_browser_pool
 
 
 class TestProposalScraperService:
@@ -22,9 +23,20 @@ class TestProposalScraperService:
         return create_autospec(ILLMService, spec_set=True)
 
     @pytest.fixture
-    def scraper(self, mock_llm_service: MagicMock) -> ProposalScraperService:
+    def mock_page(self) -> AsyncMock:
+        """Create a mock page leased from the browser pool."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def scraper(
+        self, mock_llm_service: MagicMock, mock_page: AsyncMock
+    ) -> ProposalScraperService:
         """Create a ProposalScraperService instance."""
-        return ProposalScraperService(llm_service=mock_llm_service, headless=True)
+        return ProposalScraperService(
+            llm_service=mock_llm_service,
+            headless=True,
+            browser_pool=create_browser_pool(mock_page),
+        )
 
     def test_is_supported_url_valid_urls(self, scraper: ProposalScraperService) -> None:
         """Test that any valid HTTP/HTTPS URLs are supported."""
@@ -61,10 +73,9 @@ class TestProposalScraperService:
             await scraper.scrape_proposal(url)
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
     async def test_scrape_proposal_with_llm(
         self,
-        mock_playwright: MagicMock,
+        mock_page: AsyncMock,
         scraper: ProposalScraperService,
         mock_llm_service: MagicMock,
     ) -> None:
@@ -82,20 +93,7 @@ class TestProposalScraperService:
         """
 
         # Set up mocks
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
         mock_page.content.return_value = html_content
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
 
         # Mock LLM response
         llm_response = json.dumps(
@@ -124,10 +122,9 @@ class TestProposalScraperService:
         mock_llm_service.invoke_llm.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
     async def test_scrape_different_council_proposal(
         self,
-        mock_playwright: MagicMock,
+        mock_page: AsyncMock,
         scraper: ProposalScraperService,
         mock_llm_service: MagicMock,
     ) -> None:
@@ -148,20 +145,7 @@ class TestProposalScraperService:
         """
 
         # Set up mocks
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
         mock_page.content.return_value = html_content
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
 
         # Mock LLM response - extracts without date format conversion
         llm_response = json.dumps(
@@ -187,26 +171,12 @@ class TestProposalScraperService:
         assert result.summary == "デジタル技術を活用した行政サービスの向上を図る条例案"
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
     async def test_scrape_proposal_runtime_error(
-        self, mock_playwright: MagicMock, scraper: ProposalScraperService
+        self, mock_page: AsyncMock, scraper: ProposalScraperService
     ) -> None:
         """Test that scraping errors are properly handled."""
         # Set up mocks to raise an exception
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
         mock_page.goto.side_effect = Exception("Network error")
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
 
         # Execute and assert
         url = "https://www.shugiin.go.jp/test"
@@ -214,10 +184,9 @@ class TestProposalScraperService:
             await scraper.scrape_proposal(url)
 
     @pytest.mark.asyncio
-    @patch("src.infrastructure.external.proposal_scraper_service.async_playwright")
     async def test_scrape_proposal_with_invalid_json_response(
         self,
-        mock_playwright: MagicMock,
+        mock_page: AsyncMock,
         scraper: ProposalScraperService,
         mock_llm_service: MagicMock,
     ) -> None:
@@ -226,20 +195,7 @@ class TestProposalScraperService:
         html_content = "<html><body><h1>Test</h1></body></html>"
 
         # Set up mocks
-        mock_browser = AsyncMock()
-        mock_page = AsyncMock()
         mock_page.content.return_value = html_content
-        mock_browser.new_page.return_value = mock_page
-
-        mock_chromium = AsyncMock()
-        mock_chromium.launch.return_value = mock_browser
-
-        mock_p = AsyncMock()
-        mock_p.chromium = mock_chromium
-        mock_p.__aenter__.return_value = mock_p
-        mock_p.__aexit__.return_value = None
-
-        mock_playwright.return_value = mock_p
 
         # Mock LLM response with invalid JSON
         mock_llm_service.invoke_llm.return_value = "This is not valid JSON"
@@ -0,0 +1,122 @@
+"""Tests for AsyncLoopBridge."""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.infrastructure.persistence.async_bridge import (
+    AsyncLoopBridge,
+    AsyncLoopBridgePool,
+)
+
+
+@pytest.fixture
+def bridge():
+    """Create a bridge and stop its loop thread afterwards."""
+    bridge = AsyncLoopBridge(name="test-bridge")
+    yield bridge
+    bridge.shutdown()
+
+
+async def running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_run_returns_result(bridge):
+    async def add(a: int, b: int) -> int:
+        await asyncio.sleep(0)
+        return a + b
+
+    assert bridge.run(add(1, 2)) == 3
+
+
+def test_every_call_uses_the_same_loop(bridge):
+    first = bridge.run(running_loop())
+    second = bridge.run(running_loop())
+
+    assert first is second
+    assert first is bridge.loop
+
+
+def test_exceptions_propagate(bridge):
+    async def fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        bridge.run(fail())
+
+
+def test_calls_from_multiple_threads(bridge):
+    results: list[asyncio.AbstractEventLoop] = []
+
+    def worker() -> None:
+        results.append(bridge.run(running_loop()))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 5
+    assert all(loop is bridge.loop for loop in results)
+
+
+@pytest.mark.asyncio
+async def test_run_from_inside_a_running_loop(bridge):
+    """Sync code called from async code must not need nest_asyncio."""
+    caller_loop = asyncio.get_running_loop()
+
+    bridged_loop = bridge.run(running_loop())
+
+    assert bridged_loop is not caller_loop
+
+
+def test_run_from_bridge_loop_raises(bridge):
+    async def nested() -> None:
+        bridge.run(running_loop())
+
+    with pytest.raises(RuntimeError, match="await instead"):
+        bridge.run(nested())
+
+
+def test_timeout_cancels_coroutine(bridge):
+    with pytest.raises(TimeoutError):
+        bridge.run(asyncio.sleep(10), timeout=0.05)
+
+
+def test_shutdown_and_restart(bridge):
+    first = bridge.run(running_loop())
+    bridge.shutdown()
+
+    assert first.is_closed()
+    second = bridge.run(running_loop())
+    assert second is not first
+
+
+def test_pool_sends_calls_to_an_idle_loop():
+    """A call blocked on one loop must not stall calls to the pool."""
+    pool = AsyncLoopBridgePool(2, name="test-pool")
+    started = threading.Event()
+    release = threading.Event()
+
+    async def blocking() -> asyncio.AbstractEventLoop:
+        started.set()
+        release.wait(timeout=5)
+        return asyncio.get_running_loop()
+
+    try:
+        results: list[asyncio.AbstractEventLoop] = []
+        worker = threading.Thread(target=lambda: results.append(pool.run(blocking())))
+        worker.start()
+        assert started.wait(timeout=5)
+
+        free_loop = pool.run(running_loop(), timeout=1)
+
+        release.set()
+        worker.join()
+        assert free_loop is not results[0]
+    finally:
+        release.set()
+        pool.shutdown()
@@ -8,7 +8,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.domain.entities.conversation import Conversation
+from src.domain.value_objects.conversation_ref import ConversationRef
 from src.infrastructure.persistence.conversation_repository_impl import (
+    CONVERSATION_ENTITY_COLUMNS,
     ConversationModel,
     ConversationRepositoryImpl,
 )
@@ -46,19 +48,25 @@ def conversation_repo_sync(mock_sync_session):
     return repo
 
 
+def make_entity_row(**values) -> tuple:
+    """Build a result row in the column order of the entity queries."""
+    return tuple(values[column] for column in CONVERSATION_ENTITY_COLUMNS)
+
+
 @pytest.mark.asyncio
 async def test_get_by_minutes_async(conversation_repo_async, mock_async_session):
     """Test get_by_minutes with async session."""
     # Setup mock data
-    mock_row = MagicMock()
-    mock_row.id = 1
-    mock_row.comment = "Test comment"
-    mock_row.sequence_number = 1
-    mock_row.minutes_id = 100
-    mock_row.speaker_id = 10
-    mock_row.speaker_name = "Test Speaker"
-    mock_row.chapter_number = 1
-    mock_row.sub_chapter_number = 1
+    mock_row = make_entity_row(
+        id=1,
+        comment="Test comment",
+        sequence_number=1,
+        minutes_id=100,
+        speaker_id=10,
+        speaker_name="Test Speaker",
+        chapter_number=1,
+        sub_chapter_number=1,
+    )
 
     mock_result = MagicMock()
     mock_result.fetchall.return_value = [mock_row]
@@ -79,15 +87,16 @@ async def test_get_by_minutes_async(conversation_repo_async, mock_async_session)
 async def test_get_by_speaker_async(conversation_repo_async, mock_async_session):
     """Test get_by_speaker with async session."""
     # Setup mock data
-    mock_row = MagicMock()
-    mock_row.id = 1
-    mock_row.comment = "Speaker comment"
-    mock_row.sequence_number = 1
-    mock_row.minutes_id = 100
-    mock_row.speaker_id = 20
-    mock_row.speaker_name = "Speaker Name"
-    mock_row.chapter_number = 1
-    mock_row.sub_chapter_number = None
+    mock_row = make_entity_row(
+        id=1,
+        comment="Speaker comment",
+        sequence_number=1,
+        minutes_id=100,
+        speaker_id=20,
+        speaker_name="Speaker Name",
+        chapter_number=1,
+        sub_chapter_number=None,
+    )
 
     mock_result = MagicMock()
     mock_result.fetchall.return_value = [mock_row]
@@ -106,15 +115,16 @@ async def test_get_by_speaker_async(conversation_repo_async, mock_async_session)
 async def test_get_unlinked_async(conversation_repo_async, mock_async_session):
     """Test get_unlinked with async session."""
     # Setup mock data
-    mock_row = MagicMock()
-    mock_row.id = 1
-    mock_row.comment = "Unlinked comment"
-    mock_row.sequence_number = 1
-    mock_row.minutes_id = 100
-    mock_row.speaker_id = None
-    mock_row.speaker_name = "Unknown Speaker"
-    mock_row.chapter_number = 1
-    mock_row.sub_chapter_number = None
+    mock_row = make_entity_row(
+        id=1,
+        comment="Unlinked comment",
+        sequence_number=1,
+        minutes_id=100,
+        speaker_id=None,
+        speaker_name="Unknown Speaker",
+        chapter_number=1,
+        sub_chapter_number=None,
+    )
 
     mock_result = MagicMock()
     mock_result.fetchall.return_value = [mock_row]
@@ -131,7 +141,7 @@ async def test_get_unlinked_async(conversation_repo_async, mock_async_session):
 
 @pytest.mark.asyncio
 async def test_bulk_create_async(conversation_repo_async, mock_async_session):
-    """Test bulk_create with async session (ORM version with flush)."""
+    """Test bulk_create with async session (multi-row INSERT ... RETURNING)."""
     # Setup
     conversations = [
         Conversation(
@@ -147,27 +157,9 @@ async def test_bulk_create_async(conversation_repo_async, mock_async_session):
             speaker_name="Speaker 2",
         ),
     ]
-
-    # Mock add_all to track added models
-    added_models = []
-
-    def mock_add_all(models):
-        added_models.extend(models)
-
-    mock_async_session.add_all.side_effect = mock_add_all
-
-    # Mock flush to assign IDs to models
-    async def mock_flush():
-        for i, model in enumerate(added_models, start=1):
-            model.id = i
-
-    mock_async_session.flush.side_effect = mock_flush
-
-    # Mock refresh to simulate database refresh (no-op in test)
-    async def mock_refresh(model):
-        pass
-
-    mock_async_session.refresh.side_effect = mock_refresh
+    mock_result = MagicMock()
+    mock_result.scalars.return_value.all.return_value = [1, 2]
+    mock_async_session.execute.return_value = mock_result
 
     # Execute
     created = await conversation_repo_async.bulk_create(conversations)
@@ -176,12 +168,63 @@ async def test_bulk_create_async(conversation_repo_async, mock_async_session):
     assert len(created) == 2
     assert created[0].id == 1
     assert created[1].id == 2
-    mock_async_session.add_all.assert_called_once()
-    mock_async_session.flush.assert_called_once()
+    mock_async_session.execute.assert_called_once()
+    params = mock_async_session.execute.call_args[0][1]
+    assert [p["comment"] for p in params] == ["Comment 1", "Comment 2"]
+    # No per-row refresh after the insert
+    mock_async_session.refresh.assert_not_called()
     # Note: commit() should NOT be called - UseCase manages transaction
     mock_async_session.commit.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_bulk_create_async_chunks_large_inserts(
+    conversation_repo_async, mock_async_session
+):
+    """Large inserts are split into chunks and keep IDs in input order."""
+    conversations = [
+        Conversation(comment=f"Comment {i}", sequence_number=i, minutes_id=100)
+        for i in range(2500)
+    ]
+
+    async def mock_execute(statement, params):
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = [
+            p["sequence_number"] + 1000 for p in params
+        ]
+        return result
+
+    mock_async_session.execute.side_effect = mock_execute
+
+    created = await conversation_repo_async.bulk_create(conversations)
+
+    assert mock_async_session.execute.call_count == 3
+    assert [c.id for c in created] == [i + 1000 for i in range(2500)]
+
+
+@pytest.mark.asyncio
+async def test_update_speaker_ids_async(conversation_repo_async, mock_async_session):
+    """Speaker links are written with one UPDATE per chunk."""
+    speaker_ids: dict[int, int | None] = {i: i % 7 or None for i in range(1, 1501)}
+
+    async def mock_execute(statement, params):
+        result = MagicMock()
+        result.rowcount = len(params) // 2
+        return result
+
+    mock_async_session.execute.side_effect = mock_execute
+
+    updated = await conversation_repo_async.update_speaker_ids(speaker_ids)
+
+    assert updated == 1500
+    assert mock_async_session.execute.call_count == 2
+    first_params = mock_async_session.execute.call_args_list[0][0][1]
+    assert first_params["id_0"] == 1
+    assert first_params["speaker_id_0"] == 1
+    assert first_params["speaker_id_6"] is None
+    mock_async_session.commit.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_save_speaker_and_speech_content_list_async(
     conversation_repo_async, mock_async_session
@@ -198,9 +241,9 @@ async def test_save_speaker_and_speech_content_list_async(
         ),
     ]
 
-    # Mock _find_speaker_id to return None (no matching speaker)
+    # Mock _find_speaker_ids to return no matching speaker
     # Mock bulk_create to return conversations with IDs
-    with patch.object(conversation_repo_async, "_find_speaker_id", return_value=None):
+    with patch.object(conversation_repo_async, "_find_speaker_ids", return_value={}):
         with patch.object(conversation_repo_async, "bulk_create") as mock_bulk_create:
             # Create mock conversations with IDs
             from src.domain.entities.conversation import Conversation
@@ -236,6 +279,38 @@ async def test_save_speaker_and_speech_content_list_async(
             assert created_conversations[0].sequence_number == 1
 
 
+@pytest.mark.asyncio
+async def test_save_speaker_and_speech_content_list_resolves_speakers_once(
+    conversation_repo_async, mock_async_session
+):
+    """Speaker IDs for all utterances are resolved with a single query."""
+    speech_list = [
+        SpeakerAndSpeechContent(
+            speaker=name, speech_content=f"Content {i}", speech_order=i
+        )
+        for i, name in enumerate(["山田太郎", "佐藤花子", "議長"] * 100, start=1)
+    ]
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [
+        Mock(speaker_name="山田太郎", id=10),
+        Mock(speaker_name="佐藤花子", id=20),
+    ]
+    mock_async_session.execute.return_value = mock_result
+
+    with patch.object(conversation_repo_async, "bulk_create") as mock_bulk_create:
+        mock_bulk_create.side_effect = lambda conversations: conversations
+        await conversation_repo_async.save_speaker_and_speech_content_list(
+            speech_list, minutes_id=100
+        )
+
+    mock_async_session.execute.assert_called_once()
+    params = mock_async_session.execute.call_args[0][1]
+    assert sorted(params.values()) == sorted(["山田太郎", "佐藤花子", "議長"])
+    created = mock_bulk_create.call_args[0][0]
+    assert [c.speaker_id for c in created[:3]] == [10, 20, None]
+    assert len(created) == 300
+
+
 @pytest.mark.asyncio
 async def test_get_conversations_count_async(
     conversation_repo_async, mock_async_session
@@ -321,6 +396,209 @@ async def test_get_conversations_with_pagination_async(
     assert mock_async_session.execute.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_get_conversations_with_pagination_comment_keyword(
+    conversation_repo_async, mock_async_session
+):
+    """The comment keyword becomes a substring ILIKE filter."""
+    mock_count_result = MagicMock()
+    mock_count_result.scalar.return_value = 0
+    mock_data_result = MagicMock()
+    mock_data_result.fetchall.return_value = []
+    mock_async_session.execute.side_effect = [mock_count_result, mock_data_result]
+
+    await conversation_repo_async.get_conversations_with_pagination(
+        comment_keyword="予算"
+    )
+
+    count_query, params = mock_async_session.execute.call_args_list[0][0]
+    assert "c.comment ILIKE :comment_keyword" in str(count_query)
+    assert params["comment_keyword"] == "%予算%"
+
+
+def make_listing_row(conversation_id: int) -> MagicMock:
+    row = MagicMock()
+    row.id = conversation_id
+    row.comment = f"Comment {conversation_id}"
+    return row
+
+
+@pytest.mark.asyncio
+async def test_get_conversations_page_keyset(
+    conversation_repo_async, mock_async_session
+):
+    """Pages continue after the cursor ID instead of using OFFSET."""
+    first_result = MagicMock()
+    first_result.fetchall.return_value = [make_listing_row(i) for i in (9, 8, 7)]
+    second_result = MagicMock()
+    second_result.fetchall.return_value = [make_listing_row(i) for i in (7, 6)]
+    mock_async_session.execute.side_effect = [first_result, second_result]
+
+    first = await conversation_repo_async.get_conversations_page(limit=2)
+    second = await conversation_repo_async.get_conversations_page(
+        limit=2, cursor=first.next_cursor
+    )
+
+    assert [item["id"] for item in first.items] == [9, 8]
+    assert first.has_next
+    assert [item["id"] for item in second.items] == [7, 6]
+    assert not second.has_next
+
+    query, params = mock_async_session.execute.call_args_list[1][0]
+    assert "c.id < :cursor_id" in str(query)
+    assert "OFFSET" not in str(query)
+    assert params["cursor_id"] == 8
+    assert params["limit"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_conversations_page_estimates_unfiltered_total(
+    conversation_repo_async, mock_async_session
+):
+    """Without filters the total comes from pg_class.reltuples."""
+    data_result = MagicMock()
+    data_result.fetchall.return_value = [make_listing_row(1)]
+    estimate_result = MagicMock()
+    estimate_result.scalar.return_value = 1_234_567.0
+    mock_async_session.execute.side_effect = [data_result, estimate_result]
+
+    page = await conversation_repo_async.get_conversations_page(include_total=True)
+
+    assert page.total_count == 1_234_567
+    assert page.total_is_estimate is True
+    assert "reltuples" in str(mock_async_session.execute.call_args_list[1][0][0])
+
+
+@pytest.mark.asyncio
+async def test_get_conversations_page_caches_filtered_total(
+    conversation_repo_async, mock_async_session
+):
+    """Filtered totals are exact and reused while the cache is fresh."""
+    from src.infrastructure.persistence import conversation_repository_impl
+
+    conversation_repo_impl_cache = conversation_repository_impl._listing_count_cache
+    conversation_repo_impl_cache.clear()
+
+    def data_result() -> MagicMock:
+        result = MagicMock()
+        result.fetchall.return_value = [make_listing_row(1)]
+        return result
+
+    count_result = MagicMock()
+    count_result.scalar.return_value = 42
+    mock_async_session.execute.side_effect = [
+        data_result(),
+        count_result,
+        data_result(),
+    ]
+
+    for _ in range(2):
+        page = await conversation_repo_async.get_conversations_page(
+            speaker_name="山田", include_total=True
+        )
+        assert page.total_count == 42
+        assert page.total_is_estimate is False
+
+    assert mock_async_session.execute.call_count == 3
+    conversation_repo_impl_cache.clear()
+
+
+def test_listing_count_cache_is_bounded(monkeypatch):
+    """Expired counts are dropped and the least recently used is evicted."""
+    from src.infrastructure.persistence import conversation_repository_impl as impl
+
+    now = [1000.0]
+    monkeypatch.setattr(impl.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(impl, "LISTING_COUNT_CACHE_MAX_SIZE", 2)
+    monkeypatch.setattr(impl, "_listing_count_cache", impl.OrderedDict())
+
+    impl._cache_listing_count(("a", ()), 1)
+    impl._cache_listing_count(("b", ()), 2)
+    assert impl._get_cached_listing_count(("a", ())) == 1
+    impl._cache_listing_count(("c", ()), 3)
+
+    assert list(impl._listing_count_cache) == [("a", ()), ("c", ())]
+
+    now[0] += impl.LISTING_COUNT_TTL_SECONDS
+    impl._cache_listing_count(("d", ()), 4)
+
+    assert list(impl._listing_count_cache) == [("d", ())]
+    assert impl._get_cached_listing_count(("a", ())) is None
+
+
+@pytest.mark.asyncio
+async def test_get_refs_by_minutes_skips_comment(
+    conversation_repo_async, mock_async_session
+):
+    """Refs are read without the comment column."""
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [(1, 100, None, "山田太郎", 1)]
+    mock_async_session.execute.return_value = mock_result
+
+    refs = await conversation_repo_async.get_refs_by_minutes(100)
+
+    assert refs == [
+        ConversationRef(
+            id=1,
+            minutes_id=100,
+            speaker_id=None,
+            speaker_name="山田太郎",
+            sequence_number=1,
+        )
+    ]
+    query = str(mock_async_session.execute.call_args[0][0])
+    assert "comment" not in query
+    assert "SELECT *" not in query
+
+
+@pytest.mark.asyncio
+async def test_get_comments(conversation_repo_async, mock_async_session):
+    """Comments are loaded by ID on demand."""
+    row = MagicMock()
+    row.id = 1
+    row.comment = "発言内容"
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [row]
+    mock_async_session.execute.return_value = mock_result
+
+    comments = await conversation_repo_async.get_comments([1])
+
+    assert comments == {1: "発言内容"}
+    assert mock_async_session.execute.call_args[0][1] == {"ids": [1]}
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_counts_by_meeting(
+    conversation_repo_async, mock_async_session
+):
+    """Counts for all meetings come from one aggregate query."""
+    row = MagicMock()
+    row.meeting_id = 1
+    row.conversation_count = 5
+    row.speaker_count = 2
+    mock_result = MagicMock()
+    mock_result.fetchall.return_value = [row]
+    mock_async_session.execute.return_value = mock_result
+
+    counts = await conversation_repo_async.get_conversation_counts_by_meeting([1, 2])
+
+    assert counts == {1: {"conversation_count": 5, "speaker_count": 2}}
+    mock_async_session.execute.assert_called_once()
+    params = mock_async_session.execute.call_args[0][1]
+    assert params == {"meeting_ids": [1, 2]}
+
+
+@pytest.mark.asyncio
+async def test_get_conversation_counts_by_meeting_empty(
+    conversation_repo_async, mock_async_session
+):
+    """No query is issued for an empty list of meetings."""
+    counts = await conversation_repo_async.get_conversation_counts_by_meeting([])
+
+    assert counts == {}
+    mock_async_session.execute.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_update_speaker_links_with_service(
     conversation_repo_async, mock_async_session
@@ -361,15 +639,16 @@ async def test_update_speaker_links_without_service(
 def test_get_by_minutes_sync(conversation_repo_sync, mock_sync_session):
     """Test get_by_minutes with sync session."""
     # Setup mock data
-    mock_row = MagicMock()
-    mock_row.id = 1
-    mock_row.comment = "Sync comment"
-    mock_row.sequence_number = 1
-    mock_row.minutes_id = 100
-    mock_row.speaker_id = 10
-    mock_row.speaker_name = "Sync Speaker"
-    mock_row.chapter_number = 1
-    mock_row.sub_chapter_number = None
+    mock_row = make_entity_row(
+        id=1,
+        comment="Sync comment",
+        sequence_number=1,
+        minutes_id=100,
+        speaker_id=10,
+        speaker_name="Sync Speaker",
+        chapter_number=1,
+        sub_chapter_number=None,
+    )
 
     mock_result = MagicMock()
     mock_result.fetchall.return_value = [mock_row]
@@ -406,7 +685,7 @@ def test_bulk_create_sync(conversation_repo_sync, mock_sync_session):
 
     # Mock the insert operation
     mock_result = MagicMock()
-    mock_result.scalar.return_value = 1
+    mock_result.scalars.return_value.all.return_value = [1]
 
     # Make execute return an awaitable (async coroutine)
     async def mock_execute(*args, **kwargs):
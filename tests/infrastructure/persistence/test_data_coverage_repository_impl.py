@@ -2,6 +2,7 @@
 
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import pytest_asyncio
@@ -121,7 +122,7 @@ async def repository(async_session: AsyncSession) -> DataCoverageRepositoryImpl:
     Returns:
         DataCoverageRepositoryImpl instance
     """
-    return DataCoverageRepositoryImpl(async_session)
+    return DataCoverageRepositoryImpl(async_session, use_summary_views=False)
 
 
 @pytest_asyncio.fixture
@@ -564,3 +565,45 @@ async def test_get_activity_trend_invalid_period(
 
     with pytest.raises(ValueError, match="Period must be between 1 and 365 days"):
         await repository.get_activity_trend(period="400d")
+
+
+@pytest.mark.asyncio
+async def test_summary_views_are_read_by_default() -> None:
+    """Test that statistics come from the materialized views by default."""
+    session = AsyncMock()
+    row = MagicMock(
+        total=3, with_conferences=2, with_meetings=1, coverage_percentage=33.33
+    )
+    session.execute.return_value.fetchone = MagicMock(return_value=row)
+    repository = DataCoverageRepositoryImpl(session)
+
+    stats = await repository.get_governing_body_stats()
+
+    assert stats["total"] == 3
+    assert stats["coverage_percentage"] == 33.33
+    assert "FROM mv_coverage_summary" in str(session.execute.call_args[0][0])
+
+
+@pytest.mark.asyncio
+async def test_refresh_statistics() -> None:
+    """Test that refresh_statistics refreshes the views and commits."""
+    session = AsyncMock()
+    session.execute.return_value.scalar = MagicMock(return_value=True)
+    repository = DataCoverageRepositoryImpl(session)
+
+    refreshed = await repository.refresh_statistics(min_interval_seconds=300)
+
+    assert refreshed is True
+    query, params = session.execute.call_args[0]
+    assert "refresh_statistics_views" in str(query)
+    assert params == {"min_interval_seconds": 300}
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_refresh_statistics_without_summary_views(
+    repository: DataCoverageRepositoryImpl,
+) -> None:
+    """Test that live aggregation has nothing to refresh."""
+    assert await repository.refresh_statistics() is False
+    assert await repository.get_statistics_refreshed_at() is None
@@ -119,7 +119,7 @@ async def async_session() -> AsyncGenerator[AsyncSession]:
 @pytest.mark.asyncio
 async def test_get_overall_metrics_empty(async_session: AsyncSession) -> None:
     """Test getting overall metrics with empty database."""
-    repo = MonitoringRepositoryImpl(async_session)
+    repo = MonitoringRepositoryImpl(async_session, use_summary_views=False)
 
     metrics = await repo.get_overall_metrics()
 
@@ -130,10 +130,29 @@ async def test_get_overall_metrics_empty(async_session: AsyncSession) -> None:
     assert metrics["governing_bodies"]["coverage"] == 0.0
 
 
+@pytest.mark.asyncio
+async def test_get_overall_metrics_counts_linked_conversations(
+    async_session: AsyncSession,
+) -> None:
+    """Linked conversations are counted per conversation, as in the view."""
+    await async_session.execute(
+        text(
+            "INSERT INTO conversations (id, meeting_id, speaker_id) "
+            "VALUES (1, 1, 10), (2, 1, 10), (3, 1, NULL)"
+        )
+    )
+    repo = MonitoringRepositoryImpl(async_session, use_summary_views=False)
+
+    metrics = await repo.get_overall_metrics()
+
+    assert metrics["conversations"]["total"] == 3
+    assert metrics["conversations"]["linked"] == 2
+
+
 @pytest.mark.asyncio
 async def test_get_recent_activities_empty(async_session: AsyncSession) -> None:
     """Test getting recent activities with empty database."""
-    repo = MonitoringRepositoryImpl(async_session)
+    repo = MonitoringRepositoryImpl(async_session, use_summary_views=False)
 
     activities = await repo.get_recent_activities(limit=10)
 
@@ -145,7 +164,7 @@ async def test_get_recent_activities_empty(async_session: AsyncSession) -> None:
 @pytest.mark.asyncio
 async def test_get_conference_coverage_empty(async_session: AsyncSession) -> None:
     """Test getting conference coverage with empty database."""
-    repo = MonitoringRepositoryImpl(async_session)
+    repo = MonitoringRepositoryImpl(async_session, use_summary_views=False)
 
     coverage = await repo.get_conference_coverage()
 
@@ -157,7 +176,7 @@ async def test_get_conference_coverage_empty(async_session: AsyncSession) -> Non
 @pytest.mark.asyncio
 async def test_get_party_coverage_empty(async_session: AsyncSession) -> None:
     """Test getting party coverage with empty database."""
-    repo = MonitoringRepositoryImpl(async_session)
+    repo = MonitoringRepositoryImpl(async_session, use_summary_views=False)
 
     coverage = await repo.get_party_coverage()
 
@@ -169,7 +188,7 @@ async def test_get_party_coverage_empty(async_session: AsyncSession) -> None:
 @pytest.mark.asyncio
 async def test_get_prefecture_coverage_empty(async_session: AsyncSession) -> None:
     """Test getting prefecture coverage with empty database."""
-    repo = MonitoringRepositoryImpl(async_session)
+    repo = MonitoringRepositoryImpl(async_session, use_summary_views=False)
 
     coverage = await repo.get_prefecture_coverage()
 
@@ -0,0 +1,41 @@
+"""Tests for positional row-to-entity mappers."""
+
+import pytest
+
+from src.domain.entities.politician import Politician
+from src.domain.entities.speaker import Speaker
+from src.infrastructure.persistence.row_mapper import make_row_mapper
+
+
+def test_maps_row_by_position():
+    mapper = make_row_mapper(Speaker, ("name", "type", "political_party_name"))
+
+    speaker = mapper(("山田太郎", "議員", "テスト党"))
+
+    assert isinstance(speaker, Speaker)
+    assert speaker.name == "山田太郎"
+    assert speaker.type == "議員"
+    assert speaker.political_party_name == "テスト党"
+    assert speaker.id is None
+
+
+def test_renames_columns():
+    mapper = make_row_mapper(
+        Politician,
+        ("name", "political_party_id", "furigana", "electoral_district"),
+        field_names={"electoral_district": "district"},
+    )
+
+    politician = mapper(("鈴木花子", 1, "すずきはなこ", "東京1区"))
+
+    assert politician.district == "東京1区"
+
+
+def test_rejects_unknown_column():
+    with pytest.raises(ValueError, match="leading constructor arguments"):
+        make_row_mapper(Speaker, ("name", "unknown"))
+
+
+def test_rejects_columns_out_of_constructor_order():
+    with pytest.raises(ValueError, match="leading constructor arguments"):
+        make_row_mapper(Speaker, ("id", "name"))
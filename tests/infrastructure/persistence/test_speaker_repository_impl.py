@@ -169,6 +169,144 @@ class TestSpeakerRepositoryImpl:
         assert result.political_party_name is None
         assert result.position is None
 
+    @pytest.mark.asyncio
+    async def test_get_by_name_party_pairs(self, repository, mock_session):
+        """Test get_by_name_party_pairs resolves all pairs in one query."""
+        # Setup - rows carry the ordinal of the pair they matched
+        mock_row = MagicMock()
+        mock_row._mapping = {
+            "ord": 1,
+            "id": 3,
+            "name": "鈴木花子",
+            "type": None,
+            "political_party_name": "立憲民主党",
+            "position": None,
+            "is_politician": True,
+        }
+        for key, value in mock_row._mapping.items():
+            setattr(mock_row, key, value)
+
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [mock_row]
+        executed = []
+
+        async def async_execute(query, params=None):
+            executed.append(params)
+            return mock_result
+
+        mock_session.execute = async_execute
+
+        # Execute
+        result = await repository.get_by_name_party_pairs(
+            [("山田太郎", None), ("鈴木花子", "立憲民主党"), ("山田太郎", None)]
+        )
+
+        # Verify
+        assert len(executed) == 1
+        assert executed[0]["name_1"] == "鈴木花子"
+        assert "name_2" not in executed[0]
+        assert list(result) == [("鈴木花子", "立憲民主党")]
+        assert result[("鈴木花子", "立憲民主党")].id == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_create(self, repository, mock_session):
+        """Test bulk_create inserts all speakers and keeps input order."""
+        speakers = [
+            Speaker(name="山田太郎", political_party_name="自民党", is_politician=True),
+            Speaker(name="鈴木花子"),
+        ]
+
+        # RETURNING rows come back in a different order than the input
+        rows = []
+        for id, speaker in ((11, speakers[1]), (10, speakers[0])):
+            row = MagicMock()
+            row._mapping = {
+                "id": id,
+                "name": speaker.name,
+                "type": None,
+                "political_party_name": speaker.political_party_name,
+                "position": None,
+                "is_politician": speaker.is_politician,
+            }
+            for key, value in row._mapping.items():
+                setattr(row, key, value)
+            rows.append(row)
+
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = rows
+        executed = []
+
+        async def async_execute(query, params=None):
+            executed.append(params)
+            return mock_result
+
+        mock_session.execute = async_execute
+
+        # Execute
+        result = await repository.bulk_create(speakers)
+
+        # Verify
+        assert len(executed) == 1
+        assert executed[0]["is_politician_0"] is True
+        assert [s.id for s in result] == [10, 11]
+        assert [s.name for s in result] == ["山田太郎", "鈴木花子"]
+        mock_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returns_existing_rows_on_conflict(
+        self, repository, mock_session
+    ):
+        """Test bulk_create skips duplicates and re-selects the existing rows."""
+        speakers = [
+            Speaker(name="山田太郎", political_party_name="自民党", position="議員"),
+            Speaker(name="鈴木花子"),
+        ]
+
+        def make_row(id: int, speaker: Speaker, **extra) -> MagicMock:
+            row = MagicMock()
+            row._mapping = {
+                "id": id,
+                "name": speaker.name,
+                "type": None,
+                "political_party_name": speaker.political_party_name,
+                "position": speaker.position,
+                "is_politician": speaker.is_politician,
+                **extra,
+            }
+            for key, value in row._mapping.items():
+                setattr(row, key, value)
+            return row
+
+        # Only the new speaker is inserted; the other one already exists
+        insert_result = MagicMock()
+        insert_result.fetchall.return_value = [make_row(11, speakers[1])]
+        select_result = MagicMock()
+        select_result.fetchall.return_value = [make_row(5, speakers[0], ord=0)]
+        executed = []
+
+        async def async_execute(query, params=None):
+            executed.append((str(query), params))
+            return insert_result if len(executed) == 1 else select_result
+
+        mock_session.execute = async_execute
+
+        # Execute
+        result = await repository.bulk_create(speakers)
+
+        # Verify
+        assert (
+            "ON CONFLICT (name, political_party_name, position) DO NOTHING"
+            in (executed[0][0])
+        )
+        assert len(executed) == 2
+        assert executed[1][1] == {
+            "ord_0": 0,
+            "name_0": "山田太郎",
+            "party_0": "自民党",
+            "position_0": "議員",
+        }
+        assert [s.id for s in result] == [5, 11]
+
     @pytest.mark.asyncio
     async def test_get_politicians(self, repository, mock_session):
         """Test get_politicians method."""
@@ -217,6 +355,59 @@ class TestSpeakerRepositoryImpl:
         assert result[0].name == "山田太郎"
         assert result[1].name == "鈴木花子"
 
+    @pytest.mark.asyncio
+    async def test_iter_politicians_fetches_keyset_batches(
+        self, repository, mock_session
+    ):
+        """Test iter_politicians pages by ID until a short batch is returned."""
+        rows = [MagicMock(id=i, name=f"議員{i}", is_politician=True) for i in (3, 5, 8)]
+        batches = [rows[:2], rows[2:]]
+        executed = []
+
+        async def async_execute(query, params=None):
+            executed.append((str(query), params))
+            result = MagicMock()
+            result.fetchall.return_value = batches[len(executed) - 1]
+            return result
+
+        mock_session.execute = async_execute
+
+        result = [s async for s in repository.iter_politicians(batch_size=2)]
+
+        assert [s.id for s in result] == [3, 5, 8]
+        assert [params for _, params in executed] == [
+            {"last_id": 0, "limit": 2},
+            {"last_id": 5, "limit": 2},
+        ]
+        assert "is_politician = true" in executed[0][0]
+        assert "ORDER BY id" in executed[0][0]
+
+    @pytest.mark.asyncio
+    async def test_iter_all_fetches_keyset_batches(self, repository, mock_session):
+        """Test iter_all pages over every speaker by ID."""
+        rows = [MagicMock(id=i, name=f"発言者{i}") for i in (2, 4, 6, 9)]
+        batches = [rows[:2], rows[2:], []]
+        executed = []
+
+        async def async_execute(query, params=None):
+            executed.append((str(query), params))
+            result = MagicMock()
+            result.fetchall.return_value = batches[len(executed) - 1]
+            return result
+
+        mock_session.execute = async_execute
+
+        result = [s async for s in repository.iter_all(batch_size=2)]
+
+        assert [s.id for s in result] == [2, 4, 6, 9]
+        assert [params for _, params in executed] == [
+            {"last_id": 0, "limit": 2},
+            {"last_id": 4, "limit": 2},
+            {"last_id": 9, "limit": 2},
+        ]
+        assert "FROM speakers" in executed[0][0]
+        assert "is_politician" not in executed[0][0]
+
     @pytest.mark.asyncio
     async def test_search_by_name(self, repository, mock_session):
         """Test search_by_name method."""
@@ -177,3 +177,61 @@ class TestMeetingRepositoryImplConversions:
         entity = async_repository._pydantic_to_entity(mock_pydantic)
 
         assert isinstance(entity, Meeting)
+
+
+class TestMeetingRepositoryImplKeysetPagination:
+    """Test keyset pagination of meeting listings"""
+
+    @staticmethod
+    def make_result(rows: list[dict]) -> list[MagicMock]:
+        mocks = []
+        for row in rows:
+            mock_row = MagicMock()
+            mock_row._mapping = row
+            mocks.append(mock_row)
+        return mocks
+
+    @pytest.mark.asyncio
+    async def test_next_cursor_carries_date_and_id(
+        self, async_repository, mock_async_session
+    ):
+        """Test that the next cursor resumes after the last (date, id)"""
+        mock_async_session.execute.side_effect = [
+            self.make_result(
+                [
+                    {"id": 3, "date": date(2024, 3, 1)},
+                    {"id": 2, "date": date(2024, 2, 1)},
+                    {"id": 1, "date": None},
+                ]
+            ),
+            self.make_result([{"id": 1, "date": None}]),
+        ]
+
+        first = await async_repository.get_meetings_page(limit=2)
+        second = await async_repository.get_meetings_page(
+            limit=2, cursor=first.next_cursor
+        )
+
+        assert [m["id"] for m in first.items] == [3, 2]
+        assert first.has_next
+        assert [m["id"] for m in second.items] == [1]
+        assert not second.has_next
+
+        query, params = mock_async_session.execute.call_args_list[1][0]
+        assert "< (CAST(:cursor_date AS DATE), :cursor_id)" in str(query)
+        assert "OFFSET" not in str(query)
+        assert params["cursor_date"] == "2024-02-01"
+        assert params["cursor_id"] == 2
+
+    @pytest.mark.asyncio
+    async def test_undated_meeting_cursor(self, async_repository, mock_async_session):
+        """Test that a page ending on an undated meeting still has a cursor"""
+        mock_async_session.execute.return_value = self.make_result(
+            [{"id": 5, "date": None}, {"id": 4, "date": None}]
+        )
+
+        page = await async_repository.get_meetings_page(limit=1)
+
+        from src.domain.pagination import Cursor
+
+        assert Cursor.decode(page.next_cursor) == Cursor(id=5, sort_value="-infinity")
@@ -309,3 +309,35 @@ class TestMinutesProcessingWithHistory:
         update_call = mock_history_repository.update.call_args[0][0]
         assert update_call.status == ProcessingStatus.FAILED
         assert update_call.error_message == "Processing failed"
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_with_retry_records_history(
+        self, mock_llm_service, mock_history_repository
+    ):
+        """Test that ainvoke_with_retry awaits the wrapped service and history."""
+        mock_result = Mock(
+            speaker_and_speech_content_list=[
+                Mock(speaker="田中議員", content="発言内容", speech_order=1)
+            ]
+        )
+        mock_llm_service.ainvoke_with_retry = AsyncMock(return_value=mock_result)
+
+        service = InstrumentedLLMService(
+            llm_service=mock_llm_service,
+            history_repository=mock_history_repository,
+            model_name="gemini-2.0-flash-exp",
+            model_version="latest",
+            input_reference_type="meeting",
+            input_reference_id=456,
+        )
+
+        inputs = {"section_string": "議事録セクション"}
+        result = await service.ainvoke_with_retry(Mock(), inputs)
+
+        assert result == mock_result
+        mock_llm_service.ainvoke_with_retry.assert_awaited_once()
+        mock_llm_service.invoke_with_retry.assert_not_called()
+        mock_history_repository.create.assert_awaited_once()
+        history_entry = mock_history_repository.update.call_args[0][0]
+        assert history_entry.processing_type == ProcessingType.SPEECH_EXTRACTION
+        assert history_entry.status == ProcessingStatus.COMPLETED
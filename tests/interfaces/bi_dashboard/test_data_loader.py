@@ -21,16 +21,16 @@ from src.interfaces.bi_dashboard.data.data_loader import (
 class TestLoadGoverningBodiesCoverage:
     """Tests for load_governing_bodies_coverage function."""
 
-    @patch("src.interfaces.bi_dashboard.data.data_loader.create_engine")
+    @patch("src.interfaces.bi_dashboard.data.data_loader.get_engine_registry")
     @patch("pandas.read_sql_query")
     def test_load_governing_bodies_coverage_returns_dataframe(
-        self, mock_read_sql: Mock, mock_create_engine: Mock
+        self, mock_read_sql: Mock, mock_get_registry: Mock
     ) -> None:
         """Test that load_governing_bodies_coverage returns a DataFrame."""
         # Arrange
         mock_engine = Mock()
         mock_conn = Mock()
-        mock_create_engine.return_value = mock_engine
+        mock_get_registry.return_value.get_engine.return_value = mock_engine
         mock_engine.connect.return_value.__enter__ = Mock(return_value=mock_conn)
         mock_engine.connect.return_value.__exit__ = Mock(return_value=False)
 
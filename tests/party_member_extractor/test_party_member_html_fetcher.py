@@ -6,7 +6,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import pytest_asyncio
 
-from src.party_member_extractor.html_fetcher import PartyMemberPageFetcher
+from src.infrastructure.external.browser_pool import BrowserPool, BrowserPoolSettings
+from src.party_member_extractor.html_fetcher import (
+    MEMBER_LIST_READINESS,
+    PartyMemberPageFetcher,
+)
 
 # Suppress the specific coroutine warning
 warnings.filterwarnings(
@@ -20,7 +24,7 @@ class TestPartyMemberPageFetcher:
     @pytest_asyncio.fixture
     async def mock_playwright(self):
         """Playwrightのモック"""
-        with patch("src.party_member_extractor.html_fetcher.async_playwright") as mock:
+        with patch("src.infrastructure.external.browser_pool.async_playwright") as mock:
             # async_playwright()の戻り値をモック
             mock_async_playwright = MagicMock()
             mock.return_value = mock_async_playwright
@@ -33,6 +37,7 @@ class TestPartyMemberPageFetcher:
 
             # ブラウザのモック
             mock_browser = AsyncMock()
+            mock_browser.is_connected = MagicMock(return_value=True)
             mock_playwright_instance.chromium.launch = AsyncMock(
                 return_value=mock_browser
             )
@@ -50,10 +55,10 @@ class TestPartyMemberPageFetcher:
     @pytest_asyncio.fixture
     async def fetcher(self, mock_playwright):
         """フェッチャーのフィクスチャ"""
-        fetcher = PartyMemberPageFetcher()
+        pool = BrowserPool(BrowserPoolSettings())
+        fetcher = PartyMemberPageFetcher(browser_pool=pool)
         await fetcher.__aenter__()
-        fetcher.browser = mock_playwright["browser"]
-        fetcher.context = mock_playwright["context"]
+        assert fetcher.context is mock_playwright["context"]
         yield fetcher
         await fetcher.__aexit__(None, None, None)
 
@@ -305,11 +310,29 @@ class TestPartyMemberPageFetcher:
         assert "Single page content" in result.html_content
         mock_page.close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_fetch_single_page_waits_for_readiness(self, fetcher):
+        """固定時間のsleepではなく描画完了の判定で待つことのテスト"""
+        mock_page = AsyncMock()
+        mock_page.content.return_value = "<html><body>Content</body></html>"
+        fetcher.context.new_page.return_value = mock_page
+        fetcher.page_readiness = MagicMock()
+        fetcher.page_readiness.wait = AsyncMock(return_value=True)
+
+        with patch("asyncio.sleep", AsyncMock()) as mock_sleep:
+            result = await fetcher.fetch_single_page("https://example.com/page")
+
+        assert result is not None
+        fetcher.page_readiness.wait.assert_awaited_once_with(
+            mock_page, MEMBER_LIST_READINESS
+        )
+        mock_sleep.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_context_manager(self):
         """コンテキストマネージャのテスト"""
         with patch(
-            "src.party_member_extractor.html_fetcher.async_playwright"
+            "src.infrastructure.external.browser_pool.async_playwright"
         ) as mock_playwright:
             # async_playwright()の戻り値をモック
             mock_async_playwright = MagicMock()
@@ -322,6 +345,7 @@ class TestPartyMemberPageFetcher:
             )
 
             mock_browser = AsyncMock()
+            mock_browser.is_connected = MagicMock(return_value=True)
             mock_playwright_instance.chromium.launch = AsyncMock(
                 return_value=mock_browser
             )
@@ -330,10 +354,14 @@ class TestPartyMemberPageFetcher:
             mock_browser.new_context = AsyncMock(return_value=mock_context)
 
             # テスト実行
-            async with PartyMemberPageFetcher() as fetcher:
-                assert fetcher.browser is not None
-                assert fetcher.context is not None
+            pool = BrowserPool(BrowserPoolSettings())
+            async with PartyMemberPageFetcher(browser_pool=pool) as fetcher:
+                assert fetcher.context is mock_context
 
-            # クリーンアップの確認
+            # コンテキストだけを閉じ、ブラウザはプールに残す
             mock_context.close.assert_called_once()
+            mock_browser.close.assert_not_called()
+            assert fetcher.context is None
+
+            await pool.close()
             mock_browser.close.assert_called_once()
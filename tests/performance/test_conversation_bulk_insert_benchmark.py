@@ -0,0 +1,104 @@
+"""Rows-per-second benchmark for ConversationRepositoryImpl.bulk_create.
+
+Compares the previous ORM path (add_all + flush + one refresh per row) with
+the chunked multi-row INSERT ... RETURNING path on 10k conversations. Needs a
+PostgreSQL database; every insert is rolled back.
+"""
+
+import os
+import time
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain.entities.conversation import Conversation
+from src.infrastructure.config.database import DATABASE_URL
+from src.infrastructure.persistence.conversation_repository_impl import (
+    ConversationModel,
+    ConversationRepositoryImpl,
+)
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        os.getenv("CI") == "true",
+        reason="Benchmark requires database connection not available in CI",
+    ),
+]
+
+ROWS = 10_000
+
+
+def make_conversations() -> list[Conversation]:
+    return [
+        Conversation(
+            comment=f"ベンチマーク発言{i}" * 20,
+            sequence_number=i,
+            speaker_name=f"議員{i % 50}",
+            chapter_number=1,
+            sub_chapter_number=1,
+        )
+        for i in range(1, ROWS + 1)
+    ]
+
+
+async def refresh_per_row_insert(
+    session: AsyncSession, repo: ConversationRepositoryImpl
+) -> list[int]:
+    """The previous bulk_create implementation."""
+    models = [repo._to_model(conv) for conv in make_conversations()]
+    session.add_all(models)
+    await session.flush()
+    for model in models:
+        await session.refresh(model)
+    return [model.id for model in models]
+
+
+async def returning_insert(
+    session: AsyncSession, repo: ConversationRepositoryImpl
+) -> list[int]:
+    created = await repo.bulk_create(make_conversations())
+    return [conv.id for conv in created if conv.id is not None]
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_rows_per_second():
+    async_url = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(async_url)
+    try:
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"Database not available: {e}")
+
+    rates: dict[str, float] = {}
+    try:
+        for name, insert in (
+            ("refresh per row", refresh_per_row_insert),
+            ("INSERT ... RETURNING", returning_insert),
+        ):
+            async with engine.connect() as connection:
+                transaction = await connection.begin()
+                session = AsyncSession(bind=connection)
+                repo = ConversationRepositoryImpl(
+                    session=session, model_class=ConversationModel
+                )
+
+                start = time.perf_counter()
+                ids = await insert(session, repo)
+                elapsed = time.perf_counter() - start
+
+                await session.close()
+                await transaction.rollback()
+
+            assert len(ids) == ROWS
+            assert ids == sorted(ids)
+            rates[name] = ROWS / elapsed
+    finally:
+        await engine.dispose()
+
+    print(
+        "\n" + "\n".join(f"{name}: {rate:,.0f} rows/s" for name, rate in rates.items())
+    )
+    assert rates["INSERT ... RETURNING"] > rates["refresh per row"]
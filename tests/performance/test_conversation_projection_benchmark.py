@@ -0,0 +1,99 @@
+"""Latency and memory benchmark for conversation projection queries.
+
+Loads 100k unlinked conversations with ~2 KB comments, then compares the
+full-entity query (get_unlinked) with the comment-free projection
+(get_unlinked_refs). Needs a PostgreSQL database; every insert is rolled back.
+"""
+
+import os
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domain.entities.conversation import Conversation
+from src.infrastructure.config.database import DATABASE_URL
+from src.infrastructure.persistence.conversation_repository_impl import (
+    ConversationModel,
+    ConversationRepositoryImpl,
+)
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        os.getenv("CI") == "true",
+        reason="Benchmark requires database connection not available in CI",
+    ),
+]
+
+ROWS = 100_000
+
+
+def make_conversations() -> list[Conversation]:
+    return [
+        Conversation(
+            comment=f"ベンチマーク発言{i}" * 100,
+            sequence_number=i,
+            speaker_name=f"議員{i % 50}",
+            chapter_number=1,
+            sub_chapter_number=1,
+        )
+        for i in range(1, ROWS + 1)
+    ]
+
+
+async def measure(
+    load: Callable[[], Awaitable[list[Any]]],
+) -> tuple[float, int, int]:
+    """Return elapsed seconds, peak traced bytes and row count of one load."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    rows = await load()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, len(rows)
+
+
+@pytest.mark.asyncio
+async def test_unlinked_projection_latency_and_memory():
+    async_url = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://")
+    engine = create_async_engine(async_url)
+    try:
+        async with engine.connect() as connection:
+            await connection.exec_driver_sql("SELECT 1")
+    except Exception as e:
+        await engine.dispose()
+        pytest.skip(f"Database not available: {e}")
+
+    results: dict[str, tuple[float, int, int]] = {}
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection)
+            repo = ConversationRepositoryImpl(
+                session=session, model_class=ConversationModel
+            )
+            await repo.bulk_create(make_conversations())
+
+            results["entities"] = await measure(lambda: repo.get_unlinked(limit=ROWS))
+            results["refs"] = await measure(lambda: repo.get_unlinked_refs(limit=ROWS))
+
+            await session.close()
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+    print(
+        "\n"
+        + "\n".join(
+            f"{name}: {elapsed * 1000:,.0f} ms, peak {peak / 1_048_576:,.1f} MiB"
+            for name, (elapsed, peak, _) in results.items()
+        )
+    )
+    assert results["entities"][2] == results["refs"][2] == ROWS
+    assert results["refs"][1] < results["entities"][1]
+    assert results["refs"][0] < results["entities"][0]
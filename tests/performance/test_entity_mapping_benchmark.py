@@ -0,0 +1,109 @@
+"""Objects-per-second and bytes-per-entity benchmark for entity mapping.
+
+Compares the previous path (a ``__dict__`` entity built attribute by
+attribute from a named row), the same hand-written mapping onto the
+``__slots__`` Conversation, and the positional row mapper, on 100k rows.
+Needs no database.
+"""
+
+import time
+import tracemalloc
+from collections import namedtuple
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from src.domain.entities.conversation import Conversation
+from src.infrastructure.persistence.row_mapper import make_row_mapper
+
+pytestmark = pytest.mark.slow
+
+ROWS = 100_000
+COLUMNS = (
+    "comment",
+    "sequence_number",
+    "minutes_id",
+    "speaker_id",
+    "speaker_name",
+    "chapter_number",
+    "sub_chapter_number",
+    "id",
+)
+
+Row = namedtuple("Row", COLUMNS)  # type: ignore[misc]
+
+
+class DictConversation(Conversation):
+    """Conversation with a per-instance ``__dict__``, as before slots."""
+
+
+def named_mapper(entity_class: type[Conversation]) -> Callable[[Any], Conversation]:
+    """The previous hand-written mapping onto ``entity_class``."""
+
+    def row_to_entity(row: Any) -> Conversation:
+        return entity_class(
+            id=row.id,
+            comment=row.comment,
+            sequence_number=row.sequence_number,
+            minutes_id=row.minutes_id,
+            speaker_id=row.speaker_id,
+            speaker_name=row.speaker_name,
+            chapter_number=row.chapter_number,
+            sub_chapter_number=row.sub_chapter_number,
+        )
+
+    return row_to_entity
+
+
+def make_rows() -> list[Row]:
+    comment = "ベンチマーク発言"
+    return [Row(comment, i, 1, None, f"議員{i % 50}", 1, 1, i) for i in range(ROWS)]
+
+
+def measure(
+    mapper: Callable[[Any], Conversation], rows: list[Row], repeat: int = 5
+) -> tuple[float, float]:
+    """Return objects per second (best of ``repeat``) and bytes per entity.
+
+    Memory is traced in a separate run: tracing slows allocation down enough
+    to hide the difference between the mappers.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        entities = list(map(mapper, rows))
+        best = min(best, time.perf_counter() - start)
+        del entities
+
+    tracemalloc.start()
+    entities = list(map(mapper, rows))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(entities) == ROWS
+    return ROWS / best, size / ROWS
+
+
+def test_entity_mapping_objects_per_second_and_size():
+    rows = make_rows()
+    results = {
+        "dict entity, named mapping": measure(named_mapper(DictConversation), rows),
+        "slots entity, named mapping": measure(named_mapper(Conversation), rows),
+        "slots entity, positional mapping": measure(
+            make_row_mapper(Conversation, COLUMNS), rows
+        ),
+    }
+
+    print(
+        "\n"
+        + "\n".join(
+            f"{name}: {rate:,.0f} objects/s, {size:,.0f} bytes/entity"
+            for name, (rate, size) in results.items()
+        )
+    )
+    before = results["dict entity, named mapping"]
+    named = results["slots entity, named mapping"]
+    after = results["slots entity, positional mapping"]
+    assert after[0] > named[0]
+    assert after[0] > before[0]
+    assert after[1] < before[1]
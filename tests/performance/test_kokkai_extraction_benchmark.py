@@ -0,0 +1,115 @@
+"""Extraction benchmark for KokkaiScraper on a saved Kokkai minutes page.
+
+Loads tests/fixtures/html/kokkai_minutes.html into a real Chromium page,
+grows it to the size of a long Diet session, then compares:
+
+- the former per-element walk (query_selector_all + inner_text per cell),
+- the single page.evaluate snapshot used by KokkaiScraper,
+- fetching the raw HTML once and parsing it in Python.
+
+Needs a Playwright Chromium installation; skipped when it cannot launch.
+"""
+
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.web_scraper.extractors import KokkaiPageSnapshot
+from src.web_scraper.kokkai_scraper import KokkaiScraper
+
+pytestmark = [
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        os.getenv("CI") == "true",
+        reason="Benchmark requires a Chromium browser not available in CI",
+    ),
+]
+
+FIXTURE = Path(__file__).parents[1] / "fixtures" / "html" / "kokkai_minutes.html"
+ROWS = 2_000
+SPEAKERS = 500
+
+# 保存済みページの行と発言者を複製して長い会議を再現する
+GROW_SCRIPT = """
+([rows, speakers]) => {
+    const grow = (parent, selector, count) => {
+        const originals = Array.from(parent.querySelectorAll(selector));
+        while (parent.querySelectorAll(selector).length < count) {
+            for (const node of originals) {
+                parent.appendChild(node.cloneNode(true));
+            }
+        }
+    };
+    grow(document.querySelector("table tbody"), ":scope > tr", rows);
+    grow(document.querySelector(".minutes-index"), ":scope > div", speakers);
+}
+"""
+
+
+async def per_element_walk(page: Any) -> tuple[list[str], list[str]]:
+    """Extraction as KokkaiScraper did it before the snapshot script."""
+    cells_text: list[str] = []
+    for table in await page.query_selector_all("table"):
+        for row in await table.query_selector_all("tr"):
+            cells = await row.query_selector_all("td")
+            if len(cells) >= 2:
+                cells_text.append(await cells[1].inner_text())
+    speaker_texts = [
+        await div.inner_text()
+        for div in await page.query_selector_all('div[class*="speaker"]')
+    ]
+    return cells_text, speaker_texts
+
+
+async def measure(extract: Callable[[], Awaitable[Any]]) -> tuple[float, Any]:
+    """Return elapsed seconds and the result of one extraction."""
+    start = time.perf_counter()
+    result = await extract()
+    return time.perf_counter() - start, result
+
+
+@pytest.mark.asyncio
+async def test_snapshot_extraction_beats_per_element_walk():
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+
+        try:
+            page = await browser.new_page()
+            await page.set_content(FIXTURE.read_text(encoding="utf-8"))
+            await page.evaluate(GROW_SCRIPT, [ROWS, SPEAKERS])
+            scraper = KokkaiScraper()
+
+            walk_time, (walk_cells, walk_speakers) = await measure(
+                lambda: per_element_walk(page)
+            )
+            snapshot_time, snapshot = await measure(
+                lambda: scraper._snapshot_page(page)
+            )
+
+            async def parse_html() -> KokkaiPageSnapshot:
+                return KokkaiPageSnapshot.from_html(await page.content())
+
+            html_time, parsed = await measure(parse_html)
+        finally:
+            await browser.close()
+
+    print(
+        f"\nper-element walk: {walk_time * 1000:,.0f} ms"
+        f"\nevaluate snapshot: {snapshot_time * 1000:,.0f} ms"
+        f"\nraw HTML + parse: {html_time * 1000:,.0f} ms"
+    )
+    assert snapshot.content_cells == walk_cells
+    assert snapshot.speaker_texts == walk_speakers
+    assert len(parsed.content_cells) == len(walk_cells)
+    assert scraper._extract_speakers(parsed) == scraper._extract_speakers(snapshot)
+    assert snapshot_time < walk_time
+    assert html_time < walk_time
@@ -0,0 +1,111 @@
+"""Throughput benchmark for the GCRA rate limiter against a fake LLM."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.infrastructure.external.concurrent_llm_service import (
+    ConcurrentLLMService,
+    ModelRateLimits,
+    RateLimiter,
+)
+
+
+class FakeLLMService:
+    """Fake LLM whose calls only wait for simulated network latency."""
+
+    model_name = "fake-model"
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+
+    async def extract_speeches_from_text(self, text: str) -> list[dict[str, str]]:
+        await asyncio.sleep(self.latency)
+        self.calls += 1
+        return [{"speaker": "議長", "content": text}]
+
+
+class TestRateLimiterBenchmark:
+    """Benchmarks showing the limiter saturates its configured QPS."""
+
+    @pytest.mark.asyncio
+    async def test_saturates_configured_qps(self):
+        """Slow calls must overlap so throughput tracks the configured rate."""
+        qps = 40
+        requests = 60
+        base_service = FakeLLMService(latency=0.2)
+        service = ConcurrentLLMService(
+            base_service, max_concurrent=20, max_per_second=qps, burst=1
+        )
+
+        start = time.perf_counter()
+        await asyncio.gather(
+            *[service.extract_speeches_from_text(f"発言{i}") for i in range(requests)]
+        )
+        elapsed = time.perf_counter() - start
+
+        achieved_qps = requests / elapsed
+        serial_qps = 1 / base_service.latency
+        print(
+            f"\nconfigured={qps} qps, achieved={achieved_qps:.1f} qps, "
+            f"serial baseline={serial_qps:.1f} qps, elapsed={elapsed:.2f}s"
+        )
+
+        assert base_service.calls == requests
+        assert achieved_qps >= qps * 0.75
+        assert achieved_qps <= qps * 1.25
+        assert achieved_qps > serial_qps * 5
+
+    @pytest.mark.asyncio
+    async def test_burst_is_not_serialized(self):
+        """A full burst is admitted immediately without sleeping under a lock."""
+        limiter = RateLimiter(max_per_second=10, max_concurrent=10, burst=10)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[limiter.acquire() for _ in range(10)])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.05
+        assert limiter.get_metrics().throttled == 0
+
+    @pytest.mark.asyncio
+    async def test_waiters_sleep_concurrently(self):
+        """Throttled waiters are released on schedule, not one after another."""
+        limiter = RateLimiter(max_per_second=20, max_concurrent=50, burst=1)
+
+        start = time.perf_counter()
+        await asyncio.gather(*[limiter.acquire() for _ in range(21)])
+        elapsed = time.perf_counter() - start
+
+        metrics = limiter.get_metrics()
+        assert 0.9 <= elapsed < 1.3
+        assert metrics.acquired == 21
+        assert metrics.throttled == 20
+        assert metrics.max_queue_depth == 20
+        assert metrics.queue_depth == 0
+        assert metrics.max_wait_seconds == pytest.approx(1.0, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_token_budget_throttles_large_requests(self):
+        """Requests are delayed once the per-minute token budget is spent."""
+        limits = ModelRateLimits(tokens_per_minute=6000, burst_tokens=100)
+        limiter = RateLimiter(max_per_second=None, limits=limits)
+
+        first = limiter.reserve(tokens=100)
+        second = limiter.reserve(tokens=50)
+
+        assert first == 0
+        assert second == pytest.approx(0.5, abs=0.01)
+        assert limiter.get_metrics().tokens_reserved == 150
+
+    @pytest.mark.asyncio
+    async def test_for_model_uses_known_budgets(self):
+        limiter = RateLimiter.for_model(
+            "custom", limits=ModelRateLimits(requests_per_minute=60, burst_requests=2)
+        )
+
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(1.0, abs=0.01)
@@ -1,5 +1,6 @@
 """Tests for CLI scraping commands with meeting ID support"""
 
+from dataclasses import replace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -7,6 +8,8 @@ from click.testing import CliRunner
 
 from src.interfaces.cli.commands.scraping_commands import ScrapingCommands
 from src.web_scraper.models import MinutesData
+from src.web_scraper.scraper_service import ScrapeResult
+from tests.fixtures.browser_pool_factories import create_browser_pool
 
 
 @pytest.fixture
@@ -94,6 +97,7 @@ async def test_async_scrape_minutes_with_url(mock_minutes_data):
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service
         mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
         mock_service.fetch_from_url = AsyncMock(return_value=mock_minutes_data)
         mock_service.export_to_text = Mock(return_value=(True, "gs://bucket/file.txt"))
         mock_service.export_to_json = Mock(return_value=(True, "gs://bucket/file.json"))
@@ -122,6 +126,7 @@ async def test_async_scrape_minutes_with_url(mock_minutes_data):
             mock_service.fetch_from_url.assert_called_once_with(
                 "https://example.com/minutes.html", use_cache=True
             )
+            mock_service.browser_pool.close.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -130,6 +135,7 @@ async def test_async_scrape_minutes_with_meeting_id(mock_minutes_data):
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service
         mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
         mock_service.fetch_from_meeting_id = AsyncMock(return_value=mock_minutes_data)
         mock_service.export_to_text = Mock(return_value=(True, "gs://bucket/file.txt"))
         mock_service.export_to_json = Mock(return_value=(True, "gs://bucket/file.json"))
@@ -166,6 +172,7 @@ async def test_async_scrape_minutes_failure(mock_minutes_data):
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service to return None (failure)
         mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
         mock_service.fetch_from_url = AsyncMock(return_value=None)
         mock_service_class.return_value = mock_service
 
@@ -198,6 +205,7 @@ async def test_async_scrape_minutes_with_gcs_uri_update_meeting_id(mock_minutes_
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service
         mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
         mock_service.fetch_from_meeting_id = AsyncMock(return_value=mock_minutes_data)
         mock_service.export_to_text = Mock(return_value=(True, "gs://bucket/file.txt"))
         mock_service.export_to_json = Mock(return_value=(True, "gs://bucket/file.json"))
@@ -236,6 +244,7 @@ async def test_async_scrape_minutes_with_gcs_uri_update_url(mock_minutes_data):
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service
         mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
         mock_service.fetch_from_url = AsyncMock(return_value=mock_minutes_data)
         mock_service.export_to_text = Mock(return_value=(True, "gs://bucket/file.txt"))
         mock_service.export_to_json = Mock(return_value=(True, "gs://bucket/file.json"))
@@ -277,6 +286,7 @@ async def test_async_scrape_minutes_with_gcs_uri_update_url_not_found(
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service
         mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
         mock_service.fetch_from_url = AsyncMock(return_value=mock_minutes_data)
         mock_service.export_to_text = Mock(return_value=(True, "gs://bucket/file.txt"))
         mock_service.export_to_json = Mock(return_value=(True, "gs://bucket/file.json"))
@@ -339,8 +349,9 @@ async def test_async_batch_scrape_with_gcs_uri_update():
     with patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class:
         # Mock the scraper service
         mock_service = Mock()
-        mock_service.fetch_multiple = AsyncMock(
-            return_value=[mock_minutes1, mock_minutes2]
+        mock_service.browser_pool = create_browser_pool()
+        mock_service.scrape_multiple = AsyncMock(
+            return_value=[ScrapeResult(mock_minutes1), ScrapeResult(mock_minutes2)]
         )
         mock_service.export_to_text = Mock(
             side_effect=[
@@ -399,3 +410,45 @@ async def test_async_batch_scrape_with_gcs_uri_update():
             mock_repo.update_meeting_gcs_uris.assert_any_call(
                 2, None, "gs://bucket/123_2.txt"
             )
+
+
+@pytest.mark.asyncio
+async def test_async_batch_scrape_counts_unchanged_minutes_as_scraped(
+    mock_minutes_data, tmp_path
+):
+    """Test unchanged minutes count towards the scraped URLs in the summary"""
+    # 前回の保存ファイルが残っている議事録
+    (tmp_path / "123_456.txt").write_text("前回の内容")
+    (tmp_path / "123_456.json").write_text("{}")
+    changed_minutes = replace(mock_minutes_data, schedule_id="789")
+
+    with (
+        patch("src.web_scraper.scraper_service.ScraperService") as mock_service_class,
+        patch.object(ScrapingCommands, "show_progress") as show_progress,
+    ):
+        mock_service = Mock()
+        mock_service.browser_pool = create_browser_pool()
+        mock_service.scrape_multiple = AsyncMock(
+            return_value=[
+                ScrapeResult(mock_minutes_data, changed=False),
+                ScrapeResult(changed_minutes),
+            ]
+        )
+        mock_service.export_to_text = Mock(return_value=(True, None))
+        mock_service.export_to_json = Mock(return_value=(True, None))
+        mock_service_class.return_value = mock_service
+
+        result = await ScrapingCommands._async_batch_scrape(
+            urls=["https://example.com/1", "https://example.com/2"],
+            output_dir=str(tmp_path),
+            concurrent=2,
+            upload_to_gcs=False,
+            gcs_bucket=None,
+        )
+
+    # 保存したのは変更のあった1件のみ
+    assert result == 1
+    assert mock_service.export_to_text.call_count == 1
+    messages = [call.args[0] for call in show_progress.call_args_list]
+    assert "\nCompleted: 2/2 URLs successfully scraped" in messages
+    assert any("Skipped saving 1 minutes unchanged" in m for m in messages)
@@ -9,6 +9,7 @@ from click.testing import CliRunner
 from src.interfaces.cli.commands.conference_member_commands import (
     ConferenceMemberCommands,
 )
+from tests.fixtures.browser_pool_factories import create_browser_pool
 
 
 class TestConferenceMemberCommands:
@@ -80,6 +81,7 @@ class TestConferenceMemberCommands:
                     }
                 )
                 mock_extractor.close = Mock()
+                mock_extractor.browser_pool = create_browser_pool()
                 mock_extractor_class.return_value = mock_extractor
 
                 # Execute
@@ -98,6 +100,7 @@ class TestConferenceMemberCommands:
                 assert "✅ 抽出総数: 5人" in result.output
                 assert "✅ 保存総数: 5人" in result.output
                 mock_extractor.extract_and_save_members.assert_called_once()
+                mock_extractor.browser_pool.close.assert_awaited_once()
 
     def test_extract_conference_members_with_force(self, runner, mock_progress):
         """Test extraction with force flag"""
@@ -148,6 +151,7 @@ class TestConferenceMemberCommands:
                     }
                 )
                 mock_extractor.close = Mock()
+                mock_extractor.browser_pool = create_browser_pool()
                 mock_extractor_class.return_value = mock_extractor
 
                 # Execute with --force
@@ -6,6 +6,7 @@ import pytest
 
 from src.conference_member_extractor.extractor import ConferenceMemberExtractor
 from src.conference_member_extractor.models import ExtractedMember
+from tests.fixtures.browser_pool_factories import create_browser_pool
 
 
 class TestConferenceMemberExtractor:
@@ -37,7 +38,7 @@ class TestConferenceMemberExtractor:
                 "src.conference_member_extractor.extractor.RepositoryAdapter",
                 return_value=mock_repo,
             ):
-                return ConferenceMemberExtractor()
+                return ConferenceMemberExtractor(browser_pool=create_browser_pool())
 
     def test_extract_members_with_llm_success(self, extractor, mock_llm_service):
         """Test successful extraction of members with LLM"""
@@ -152,27 +153,14 @@ class TestConferenceMemberExtractor:
             assert result == []
 
     @pytest.mark.asyncio
-    @patch("src.conference_member_extractor.extractor.async_playwright")
-    async def test_fetch_html_success(self, mock_playwright, extractor):
+    async def test_fetch_html_success(self, extractor):
         """Test successful HTML fetching"""
-        # Mock Playwright
+        # Mock a page leased from the browser pool
         mock_page = AsyncMock()
         mock_page.goto = AsyncMock()
         mock_page.wait_for_timeout = AsyncMock()
         mock_page.content = AsyncMock(return_value="<html>Test Content</html>")
-
-        mock_browser = AsyncMock()
-        mock_browser.new_page = AsyncMock(return_value=mock_page)
-        mock_browser.close = AsyncMock()
-
-        mock_playwright_instance = AsyncMock()
-        mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_playwright_instance.__aenter__ = AsyncMock(
-            return_value=mock_playwright_instance
-        )
-        mock_playwright_instance.__aexit__ = AsyncMock(return_value=None)
-
-        mock_playwright.return_value = mock_playwright_instance
+        extractor.browser_pool = create_browser_pool(page=mock_page)
 
         # Execute
         result = await extractor.fetch_html("https://example.com")
@@ -182,6 +170,7 @@ class TestConferenceMemberExtractor:
         mock_page.goto.assert_called_once_with(
             "https://example.com", wait_until="networkidle", timeout=30000
         )
+        extractor.browser_pool.page.assert_called_once_with()
 
     @pytest.mark.asyncio
     async def test_extract_and_save_members_full_flow(self, extractor, mock_repo):
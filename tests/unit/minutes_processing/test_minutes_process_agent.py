@@ -0,0 +1,229 @@
+"""Tests for section processing in MinutesProcessAgent."""
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.infrastructure.persistence.async_bridge import get_async_bridge
+from src.minutes_divide_processor.minutes_process_agent import MinutesProcessAgent
+from src.minutes_divide_processor.models import (
+    MinutesBoundary,
+    SectionInfo,
+    SectionInfoList,
+    SectionString,
+    SectionStringList,
+    SpeakerAndSpeechContent,
+    SpeakerAndSpeechContentList,
+)
+
+
+def make_agent(
+    sections: int, latency=lambda chapter: 0, speeches: int = 2, **kwargs
+) -> MinutesProcessAgent:
+    """Create an agent whose divider returns ``sections`` sections.
+
+    ``latency(chapter)`` gives the simulated LLM latency of each section and
+    every section yields ``speeches`` speeches. The sequential path uses
+    ``speech_divide_run``; the parallel path awaits ``aspeech_divide_run``.
+    """
+    agent = MinutesProcessAgent(llm_service=Mock(), **kwargs)
+    divider = agent.minutes_divider
+    divider.pre_process = Mock(side_effect=lambda text: text)
+    divider.detect_attendee_boundary = Mock(
+        return_value=MinutesBoundary(boundary_found=False, boundary_type="none")
+    )
+    divider.split_minutes_by_boundary = Mock(
+        side_effect=lambda text, boundary: ("", text)
+    )
+    divider.section_divide_run = Mock(
+        return_value=SectionInfoList(
+            section_info_list=[
+                SectionInfo(chapter_number=i, keyword=f"セクション{i}")
+                for i in range(1, sections + 1)
+            ]
+        )
+    )
+    divider.check_length = Mock(return_value=[])
+    divider.do_divide = Mock(
+        return_value=SectionStringList(
+            section_string_list=[
+                SectionString(chapter_number=i, section_string=f"セクション{i}")
+                for i in range(1, sections + 1)
+            ]
+        )
+    )
+
+    def speeches_of(section: SectionString) -> SpeakerAndSpeechContentList:
+        return SpeakerAndSpeechContentList(
+            speaker_and_speech_content_list=[
+                SpeakerAndSpeechContent(
+                    speaker=f"議員{section.chapter_number}",
+                    speech_content=f"発言{order}",
+                    chapter_number=section.chapter_number,
+                    speech_order=order,
+                )
+                for order in range(1, speeches + 1)
+            ]
+        )
+
+    def speech_divide_run(section: SectionString) -> SpeakerAndSpeechContentList:
+        time.sleep(latency(section.chapter_number))
+        return speeches_of(section)
+
+    async def aspeech_divide_run(
+        section: SectionString,
+    ) -> SpeakerAndSpeechContentList:
+        await asyncio.sleep(latency(section.chapter_number))
+        return speeches_of(section)
+
+    divider.speech_divide_run = Mock(side_effect=speech_divide_run)
+    divider.aspeech_divide_run = AsyncMock(side_effect=aspeech_divide_run)
+    return agent
+
+
+class TestParallelSectionProcessing:
+    """Tests for MinutesProcessAgent with max_concurrency > 1."""
+
+    def test_results_keep_section_and_speech_order(self):
+        # Later sections finish first
+        agent = make_agent(10, lambda chapter: 0.01 * (10 - chapter), max_concurrency=5)
+
+        results = agent.run("議事録")
+
+        assert [(r.chapter_number, r.speech_order) for r in results] == [
+            (chapter, order) for chapter in range(1, 11) for order in (1, 2)
+        ]
+
+    def test_wall_time_tracks_slowest_section(self):
+        """40 sections finish in about the latency of the slowest one."""
+        latencies = {chapter: 0.05 + 0.005 * chapter for chapter in range(1, 41)}
+        agent = make_agent(40, latencies.__getitem__, max_concurrency=40)
+
+        start = time.perf_counter()
+        results = agent.run("議事録")
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"\n40 sections: parallel={elapsed:.2f}s, "
+            f"sequential={sum(latencies.values()):.2f}s"
+        )
+        assert len(results) == 80
+        assert elapsed < max(latencies.values()) + 0.5
+        assert elapsed < sum(latencies.values()) / 4
+
+    def test_concurrency_limit_is_respected(self):
+        agent = make_agent(12, max_concurrency=3)
+        active = 0
+        peak = 0
+
+        async def aspeech_divide_run(
+            section: SectionString,
+        ) -> SpeakerAndSpeechContentList:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return SpeakerAndSpeechContentList(speaker_and_speech_content_list=[])
+
+        agent.minutes_divider.aspeech_divide_run.side_effect = aspeech_divide_run
+        agent.run("議事録")
+
+        assert peak == 3
+
+    def test_llm_waits_do_not_block_event_loop(self):
+        """Sections overlap their LLM waits on a single event loop thread."""
+        agent = make_agent(20, lambda chapter: 0.05, max_concurrency=20)
+
+        start = time.perf_counter()
+        agent.run("議事録")
+        elapsed = time.perf_counter() - start
+
+        assert agent.minutes_divider.speech_divide_run.call_count == 0
+        assert elapsed < 0.05 * 20 / 4
+
+    def test_failed_section_is_skipped(self):
+        agent = make_agent(5, lambda chapter: 0, max_concurrency=5)
+        aspeech_divide_run = agent.minutes_divider.aspeech_divide_run.side_effect
+
+        async def flaky(section: SectionString) -> SpeakerAndSpeechContentList:
+            if section.chapter_number == 3:
+                raise RuntimeError("LLM error")
+            return await aspeech_divide_run(section)
+
+        agent.minutes_divider.aspeech_divide_run.side_effect = flaky
+
+        results = agent.run("議事録")
+
+        assert sorted({r.chapter_number for r in results}) == [1, 2, 4, 5]
+        assert agent.failed_sections == [3]
+
+    @pytest.mark.asyncio
+    async def test_run_inside_event_loop(self):
+        agent = make_agent(3, lambda chapter: 0, max_concurrency=3)
+
+        results = agent.run("議事録")
+
+        assert len(results) == 6
+
+    def test_runs_reuse_the_bridge_loop(self):
+        """Sections run on the shared bridge loop, not a new loop per run."""
+        agent = make_agent(2, lambda chapter: 0, max_concurrency=2)
+        loops: set[asyncio.AbstractEventLoop] = set()
+        aspeech_divide_run = agent.minutes_divider.aspeech_divide_run.side_effect
+
+        async def record_loop(section: SectionString) -> SpeakerAndSpeechContentList:
+            loops.add(asyncio.get_running_loop())
+            return await aspeech_divide_run(section)
+
+        agent.minutes_divider.aspeech_divide_run.side_effect = record_loop
+        agent.run("議事録")
+        agent.run("議事録")
+
+        assert loops == {get_async_bridge().loop}
+
+
+class TestSequentialSectionProcessing:
+    """Tests for the sequential divide_speech loop."""
+
+    def test_results_keep_section_and_speech_order(self):
+        agent = make_agent(5)
+
+        results = agent.run("議事録")
+
+        assert [(r.chapter_number, r.speech_order) for r in results] == [
+            (chapter, order) for chapter in range(1, 6) for order in (1, 2)
+        ]
+
+    @pytest.mark.parametrize("max_concurrency", [1, 4])
+    def test_store_is_emptied_after_run(self, max_concurrency):
+        agent = make_agent(5, max_concurrency=max_concurrency)
+
+        agent.run("議事録")
+        agent.run("議事録")
+
+        assert agent.in_memory_store.search(("1",), limit=100) == []
+
+    def test_memory_per_section_is_flat(self):
+        """Retained memory grows linearly, not quadratically, with sections."""
+
+        def peak_memory(sections: int) -> int:
+            agent = make_agent(sections, speeches=50)
+            gc.collect()
+            tracemalloc.start()
+            agent.run("議事録")
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        small = peak_memory(50) / 50
+        large = peak_memory(200) / 200
+
+        print(
+            f"\nper-section peak: 50={small / 1024:.1f}KiB, 200={large / 1024:.1f}KiB"
+        )
+        assert large < small * 1.5
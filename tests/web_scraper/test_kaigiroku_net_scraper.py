@@ -6,6 +6,8 @@ import pytest
 
 from src.web_scraper.base_scraper import MinutesData
 from src.web_scraper.kaigiroku_net_scraper import KaigirokuNetScraper
+from tests.fixtures.browser_pool_factories import create_browser_pool
+from tests.fixtures.fetch_strategy_factories import create_fetch_strategy
 
 
 class TestKaigirokuNetScraper:
@@ -14,7 +16,9 @@ class TestKaigirokuNetScraper:
     @pytest.fixture
     def scraper(self):
         """テスト用スクレーパーインスタンスを作成"""
-        return KaigirokuNetScraper(headless=True)
+        return KaigirokuNetScraper(
+            headless=True, fetch_strategy=create_fetch_strategy()
+        )
 
     @pytest.mark.asyncio
     async def test_fetch_minutes_success(self, scraper):
@@ -49,22 +53,8 @@ class TestKaigirokuNetScraper:
         )
         mock_page.query_selector_all = AsyncMock(return_value=[])
 
-        # モックブラウザーを作成
-        mock_browser = AsyncMock()
-        mock_browser.close = AsyncMock()  # closeメソッドを追加
-        mock_browser.new_context = AsyncMock()
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-        mock_browser.new_context.return_value = mock_context
-
-        # playwrightのモック
-        with patch(
-            "src.web_scraper.kaigiroku_net_scraper.async_playwright"
-        ) as mock_playwright:
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_playwright.return_value.__aenter__.return_value = mock_p
-
+        # ブラウザプールのモック
+        with patch.object(scraper, "browser_pool", create_browser_pool(mock_page)):
             # 必要なメソッドをモック
             with patch.object(
                 scraper, "_extract_iframe_content", AsyncMock(return_value=None)
@@ -199,7 +189,7 @@ class TestKaigirokuNetScraper:
 @pytest.mark.asyncio
 async def test_scraper_integration():
     """統合テスト: スクレーパーをモックで動作確認"""
-    scraper = KaigirokuNetScraper(headless=True)
+    scraper = KaigirokuNetScraper(headless=True, fetch_strategy=create_fetch_strategy())
 
     # テスト用URL
     url = "https://ssp.kaigiroku.net/tenant/kyoto/MinuteView.html?council_id=6030&schedule_id=1"
@@ -232,22 +222,8 @@ async def test_scraper_integration():
     mock_page.query_selector_all = AsyncMock(return_value=[])
     mock_page.evaluate = AsyncMock(return_value="令和７年１月まちづくり委員会")
 
-    # モックブラウザーを作成
-    mock_browser = AsyncMock()
-    mock_browser.close = AsyncMock()
-    mock_browser.new_context = AsyncMock()
-    mock_context = AsyncMock()
-    mock_context.new_page = AsyncMock(return_value=mock_page)
-    mock_browser.new_context.return_value = mock_context
-
-    # playwrightのモック
-    with patch(
-        "src.web_scraper.kaigiroku_net_scraper.async_playwright"
-    ) as mock_playwright:
-        mock_p = AsyncMock()
-        mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_playwright.return_value.__aenter__.return_value = mock_p
-
+    # ブラウザプールのモック
+    with patch.object(scraper, "browser_pool", create_browser_pool(mock_page)):
         # 必要なメソッドをモック（PDFを見つけないように設定）
         with patch.object(
             scraper, "_find_pdf_download_url", AsyncMock(return_value=None)
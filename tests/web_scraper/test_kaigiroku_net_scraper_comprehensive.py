@@ -8,8 +8,17 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.web_scraper.kaigiroku_net_scraper import KaigirokuNetScraper
+from src.web_scraper.kaigiroku_net_scraper import (
+    MINUTE_VIEW_READINESS,
+    KaigirokuNetScraper,
+)
 from src.web_scraper.models import MinutesData
+from src.web_scraper.scrape_index import HTTP_VALIDATORS_KEY, hash_bytes
+from tests.fixtures.browser_pool_factories import create_browser_pool
+from tests.fixtures.fetch_strategy_factories import (
+    create_fetch_strategy,
+    create_http_response,
+)
 
 
 class TestKaigirokuNetScraperInitialization:
@@ -308,39 +317,31 @@ class TestKaigirokuNetScraperWaitForContent:
         scraper = KaigirokuNetScraper()
         mock_page = AsyncMock()
         mock_page.wait_for_selector = AsyncMock()  # Succeeds
+        mock_page.evaluate = AsyncMock(return_value={"settled": True, "grew": False})
         mock_page.query_selector_all = AsyncMock(return_value=[])
 
-        # Mock asyncio.sleep to avoid actual waiting
-        with patch("asyncio.sleep", AsyncMock()):
-            await scraper._wait_for_content(mock_page)
+        await scraper._wait_for_content(mock_page)
 
-            # Should have tried to wait for selector
-            mock_page.wait_for_selector.assert_called()
+        # Should have waited for selector and DOM, without checking iframes
+        mock_page.wait_for_selector.assert_awaited_once()
+        mock_page.evaluate.assert_awaited_once()
+        mock_page.query_selector_all.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_wait_for_content_timeout_then_success(self):
-        """Test waiting with initial timeout then success"""
+    async def test_wait_for_content_waits_for_any_selector_at_once(self):
+        """Test waiting for all content selectors in a single bounded wait"""
         scraper = KaigirokuNetScraper()
         mock_page = AsyncMock()
+        mock_page.wait_for_selector = AsyncMock()
+        mock_page.evaluate = AsyncMock(return_value={"settled": True, "grew": False})
 
-        # First call times out, second succeeds
-        call_count = 0
+        await scraper._wait_for_content(mock_page)
 
-        def wait_side_effect(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise Exception("Timeout")
-            return AsyncMock()
-
-        mock_page.wait_for_selector = AsyncMock(side_effect=wait_side_effect)
-        mock_page.query_selector_all = AsyncMock(return_value=[])
-
-        with patch("asyncio.sleep", AsyncMock()):
-            await scraper._wait_for_content(mock_page)
-
-            # Should have retried multiple selectors
-            assert mock_page.wait_for_selector.call_count >= 2
+        selector = mock_page.wait_for_selector.await_args.args[0]
+        assert "#minuteFrame" in selector
+        assert "#plain-minute" in selector
+        kwargs = mock_page.wait_for_selector.await_args.kwargs
+        assert kwargs["timeout"] <= MINUTE_VIEW_READINESS.max_wait_ms
 
 
 class TestKaigirokuNetScraperPDFDownload:
@@ -525,11 +526,10 @@ class TestKaigirokuNetScraperWaitForContentEdgeCases:
         mock_iframe = AsyncMock()
         mock_page.query_selector_all = AsyncMock(return_value=[mock_iframe])
 
-        with patch("asyncio.sleep", AsyncMock()):
-            await scraper._wait_for_content(mock_page)
+        await scraper._wait_for_content(mock_page)
 
-            # Should have checked for iframes
-            mock_page.query_selector_all.assert_called_with("iframe")
+        # Should have checked for iframes
+        mock_page.query_selector_all.assert_called_with("iframe")
 
 
 class TestKaigirokuNetScraperMainFlow:
@@ -540,25 +540,14 @@ class TestKaigirokuNetScraperMainFlow:
         """Test fetch_minutes when PDF is available"""
         from datetime import datetime
 
-        scraper = KaigirokuNetScraper()
+        scraper = KaigirokuNetScraper(fetch_strategy=create_fetch_strategy())
         test_url = "https://ssp.kaigiroku.net/tenant/kyoto/MinuteView.html?council_id=100&schedule_id=1"
 
         mock_page = AsyncMock()
         mock_page.goto = AsyncMock(return_value=AsyncMock(status=200))
         mock_page.wait_for_load_state = AsyncMock()
 
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        mock_browser = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_browser.close = AsyncMock()
-
-        with patch("src.web_scraper.kaigiroku_net_scraper.async_playwright") as mock_pw:
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_pw.return_value.__aenter__.return_value = mock_p
-
+        with patch.object(scraper, "browser_pool", create_browser_pool(mock_page)):
             # Mock to return PDF URL
             with patch.object(
                 scraper,
@@ -592,24 +581,13 @@ class TestKaigirokuNetScraperMainFlow:
     @pytest.mark.asyncio
     async def test_fetch_minutes_no_response(self):
         """Test fetch_minutes when server returns no response"""
-        scraper = KaigirokuNetScraper()
+        scraper = KaigirokuNetScraper(fetch_strategy=create_fetch_strategy())
         test_url = "https://ssp.kaigiroku.net/tenant/test/MinuteView.html?council_id=1&schedule_id=1"
 
         mock_page = AsyncMock()
         mock_page.goto = AsyncMock(return_value=None)  # No response
 
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        mock_browser = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_browser.close = AsyncMock()
-
-        with patch("src.web_scraper.kaigiroku_net_scraper.async_playwright") as mock_pw:
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_pw.return_value.__aenter__.return_value = mock_p
-
+        with patch.object(scraper, "browser_pool", create_browser_pool(mock_page)):
             result = await scraper.fetch_minutes(test_url)
 
             assert result is None
@@ -617,25 +595,107 @@ class TestKaigirokuNetScraperMainFlow:
     @pytest.mark.asyncio
     async def test_fetch_minutes_exception_handling(self):
         """Test fetch_minutes handles exceptions gracefully"""
-        scraper = KaigirokuNetScraper()
+        scraper = KaigirokuNetScraper(fetch_strategy=create_fetch_strategy())
         test_url = "https://ssp.kaigiroku.net/tenant/test/MinuteView.html?council_id=1&schedule_id=1"
 
         mock_page = AsyncMock()
         mock_page.goto = AsyncMock(side_effect=Exception("Network error"))
 
-        mock_context = AsyncMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        mock_browser = AsyncMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_browser.close = AsyncMock()
-
-        with patch("src.web_scraper.kaigiroku_net_scraper.async_playwright") as mock_pw:
-            mock_p = AsyncMock()
-            mock_p.chromium.launch = AsyncMock(return_value=mock_browser)
-            mock_pw.return_value.__aenter__.return_value = mock_p
-
+        with patch.object(scraper, "browser_pool", create_browser_pool(mock_page)):
             result = await scraper.fetch_minutes(test_url)
 
             # Should handle exception and return None
             assert result is None
+
+
+class TestKaigirokuNetScraperStaticFetch:
+    """Test fetching minutes without a browser"""
+
+    TEST_URL = "https://ssp.kaigiroku.net/tenant/kyoto/MinuteView.html?council_id=100&schedule_id=2"
+
+    @pytest.mark.asyncio
+    async def test_static_html_with_minutes_text(self):
+        """Test that static minutes are parsed without leasing a page"""
+        html = (
+            "<html><head><title>本会議</title></head><body>"
+            '<div class="minute-content">'
+            + "◯議長（山田太郎）ただいまから本会議を開きます。" * 5
+            + "</div></body></html>"
+        )
+        strategy = create_fetch_strategy(create_http_response(html, self.TEST_URL))
+        pool = create_browser_pool()
+        scraper = KaigirokuNetScraper(browser_pool=pool, fetch_strategy=strategy)
+
+        result = await scraper.fetch_minutes(self.TEST_URL)
+
+        assert result is not None
+        assert result.council_id == "100"
+        assert result.schedule_id == "2"
+        assert "本会議を開きます" in result.content
+        pool.page.assert_not_called()
+        assert result.metadata[HTTP_VALIDATORS_KEY]["body_hash"] == hash_bytes(
+            html.encode("utf-8")
+        )
+
+    @pytest.mark.asyncio
+    async def test_static_html_with_pdf_link(self):
+        """Test that a PDF link in static HTML is resolved and downloaded"""
+        from datetime import datetime
+
+        html = '<html><body><a href="files/minutes.pdf">PDF</a></body></html>'
+        strategy = create_fetch_strategy(create_http_response(html, self.TEST_URL))
+        pool = create_browser_pool()
+        scraper = KaigirokuNetScraper(browser_pool=pool, fetch_strategy=strategy)
+        minutes = MinutesData(
+            council_id="100",
+            schedule_id="2",
+            title="議事録 100_2",
+            date=None,
+            content="PDF本文",
+            speakers=[],
+            url=self.TEST_URL,
+            scraped_at=datetime.now(),
+        )
+        download = AsyncMock(return_value=minutes)
+
+        with patch.object(scraper, "_download_pdf_as_minutes", download):
+            result = await scraper.fetch_minutes(self.TEST_URL)
+
+        assert result is minutes
+        download.assert_awaited_once_with(
+            "https://ssp.kaigiroku.net/tenant/kyoto/files/minutes.pdf",
+            self.TEST_URL,
+            "100",
+            "2",
+        )
+        pool.page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_static_html_without_minutes_text_falls_back_to_browser(self):
+        """Test that short static content marks the site for rendering"""
+        html = '<html><body><div id="minute-root">読み込み中</div></body></html>'
+        strategy = create_fetch_strategy(create_http_response(html, self.TEST_URL))
+        mock_page = AsyncMock()
+        mock_page.goto = AsyncMock(return_value=None)
+        pool = create_browser_pool(mock_page)
+        scraper = KaigirokuNetScraper(browser_pool=pool, fetch_strategy=strategy)
+
+        result = await scraper.fetch_minutes(self.TEST_URL)
+
+        assert result is None
+        strategy.mark_needs_browser.assert_called_once()
+        pool.page.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_text_view_fetched_over_http(self):
+        """Test that a static text view is read without navigating the page"""
+        text_view_url = "https://ssp.kaigiroku.net/tenant/kyoto/TextView.html?id=1"
+        html = "<html><body><script>x()</script><p>本文</p><p>続き</p></body></html>"
+        strategy = create_fetch_strategy(create_http_response(html, text_view_url))
+        scraper = KaigirokuNetScraper(fetch_strategy=strategy)
+        mock_page = AsyncMock()
+
+        content = await scraper._fetch_text_view(mock_page, text_view_url)
+
+        assert content == "本文\n続き"
+        mock_page.goto.assert_not_awaited()
@@ -0,0 +1,68 @@
+"""Tests for the Kokkai page snapshot extraction"""
+
+from pathlib import Path
+
+from src.web_scraper.extractors import KokkaiPageSnapshot
+from src.web_scraper.kokkai_scraper import KokkaiScraper
+
+FIXTURE = Path(__file__).parents[1] / "fixtures" / "html" / "kokkai_minutes.html"
+
+
+class TestKokkaiPageSnapshot:
+    """Test building snapshots from script payloads and saved HTML"""
+
+    def test_from_payload(self):
+        snapshot = KokkaiPageSnapshot.from_payload(
+            {
+                "heading": "第217回国会",
+                "title": "会議録",
+                "contentCells": ["本文"],
+                "speakerTexts": ["001 牧義夫 発言者情報"],
+                "bodyText": None,
+            }
+        )
+
+        assert snapshot.heading == "第217回国会"
+        assert snapshot.title == "会議録"
+        assert snapshot.content_cells == ["本文"]
+        assert snapshot.speaker_texts == ["001 牧義夫 発言者情報"]
+        assert snapshot.body_text is None
+
+    def test_from_payload_missing_fields(self):
+        snapshot = KokkaiPageSnapshot.from_payload({})
+
+        assert snapshot == KokkaiPageSnapshot()
+
+    def test_from_html_fixture(self):
+        snapshot = KokkaiPageSnapshot.from_html(FIXTURE.read_text(encoding="utf-8"))
+
+        assert snapshot.heading is not None
+        assert snapshot.heading.startswith("第217回国会")
+        assert snapshot.title.endswith("国会会議録検索システム")
+        assert len(snapshot.content_cells) == 5
+        assert "\n" in snapshot.content_cells[0]  # <br>は改行として扱う
+        assert len(snapshot.speaker_texts) == 5
+        # 本文テーブルがあるのでページ全体のテキストは不要
+        assert snapshot.body_text is None
+
+    def test_from_html_without_tables_keeps_body_text(self):
+        snapshot = KokkaiPageSnapshot.from_html(
+            "<html><body><p>本文テーブルのないページ</p></body></html>"
+        )
+
+        assert snapshot.content_cells == []
+        assert snapshot.body_text == "本文テーブルのないページ"
+
+    def test_scraper_extracts_fixture(self):
+        scraper = KokkaiScraper()
+        snapshot = KokkaiPageSnapshot.from_html(FIXTURE.read_text(encoding="utf-8"))
+
+        minutes = scraper._minutes_from_snapshot(
+            snapshot, "https://kokkai.ndl.go.jp/txt/121705253X00320250423"
+        )
+
+        assert minutes is not None
+        assert minutes.content.count("\n\n") == 3  # 短い行は除外
+        assert [s.name for s in minutes.speakers] == ["牧義夫", "外務大臣", "山田太郎"]
+        assert minutes.date is not None
+        assert minutes.date.year == 2025
@@ -0,0 +1,296 @@
+"""Tests for the scrape index and change detection in ScraperService"""
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.web_scraper.models import MinutesData
+from src.web_scraper.scrape_index import (
+    ScrapeIndex,
+    ScrapeIndexEntry,
+    hash_bytes,
+    hash_text,
+    record_validators,
+)
+from src.web_scraper.scraper_service import ScraperService
+from tests.fixtures.browser_pool_factories import create_browser_pool
+from tests.fixtures.fetch_strategy_factories import create_http_response
+
+URL = (
+    "https://ssp.kaigiroku.net/tenant/kyoto/MinuteView.html?council_id=1&schedule_id=2"
+)
+PAGE = "<html><body>本会議の会議録</body></html>"
+
+
+def create_minutes(content: str = "議事録の本文", static: bool = True) -> MinutesData:
+    """Create minutes as returned by a scraper."""
+    return MinutesData(
+        council_id="1",
+        schedule_id="2",
+        title="本会議",
+        date=datetime(2024, 6, 1),
+        content=content,
+        speakers=[],
+        url=URL,
+        scraped_at=datetime.now(),
+        metadata={"fetch_mode": "http"} if static else {},
+    )
+
+
+@pytest.fixture
+def http_client():
+    client = MagicMock()
+    client.get = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def scraper():
+    scraper = MagicMock()
+    scraper.fetch_minutes = AsyncMock(return_value=create_minutes())
+    return scraper
+
+
+@pytest.fixture
+def service(tmp_path, http_client, scraper):
+    service = ScraperService(
+        cache_dir=str(tmp_path),
+        enable_gcs=False,
+        browser_pool=create_browser_pool(),
+        http_client=http_client,
+        revalidate_after=timedelta(hours=24),
+    )
+    with patch.object(service, "_get_scraper_for_url", return_value=scraper):
+        yield service
+
+
+class TestScrapeIndex:
+    """Test ScrapeIndex persistence"""
+
+    def test_entries_are_persisted(self, tmp_path):
+        now = datetime(2024, 6, 1, 12, 0)
+        index = ScrapeIndex(tmp_path / "index.json")
+        index.put(
+            ScrapeIndexEntry(
+                url=URL,
+                content_hash=hash_text("本文"),
+                checked_at=now,
+                changed_at=now,
+                static=True,
+                etag='"v1"',
+                body_hash=hash_bytes(PAGE.encode()),
+            )
+        )
+
+        reloaded = ScrapeIndex(tmp_path / "index.json")
+
+        assert len(reloaded) == 1
+        assert reloaded.get(URL) == index.get(URL)
+
+    def test_deferred_writes_once(self, tmp_path):
+        now = datetime(2024, 6, 1, 12, 0)
+        index = ScrapeIndex(tmp_path / "index.json")
+
+        with patch.object(index, "_save", wraps=index._save) as save:
+            with index.deferred():
+                for i in range(3):
+                    index.put(
+                        ScrapeIndexEntry(
+                            url=f"{URL}&page={i}",
+                            content_hash=hash_text("本文"),
+                            checked_at=now,
+                            changed_at=now,
+                        )
+                    )
+                assert not (tmp_path / "index.json").exists()
+
+        save.assert_called_once()
+        assert len(ScrapeIndex(tmp_path / "index.json")) == 3
+
+    def test_corrupt_index_starts_empty(self, tmp_path):
+        path = tmp_path / "index.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        assert len(ScrapeIndex(path)) == 0
+
+    def test_is_stale(self):
+        checked_at = datetime(2024, 6, 1, 12, 0)
+        entry = ScrapeIndexEntry(
+            url=URL, content_hash="x", checked_at=checked_at, changed_at=checked_at
+        )
+
+        assert not entry.is_stale(timedelta(hours=24), checked_at + timedelta(hours=1))
+        assert entry.is_stale(timedelta(hours=24), checked_at + timedelta(days=1))
+        assert not entry.is_stale(None, checked_at + timedelta(days=365))
+
+
+class TestScraperServiceChangeDetection:
+    """Test conditional re-scrapes in ScraperService"""
+
+    @pytest.mark.asyncio
+    async def test_first_scrape_is_recorded_as_changed(self, service, http_client):
+        result = await service.scrape(URL)
+
+        assert result.changed is True
+        assert result.from_cache is False
+        entry = service.index.get(URL)
+        assert entry.static is True
+        assert entry.content_hash == hash_text("議事録の本文")
+        http_client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_is_used_without_requests(
+        self, service, http_client, scraper
+    ):
+        await service.scrape(URL)
+
+        result = await service.scrape(URL)
+
+        assert result.from_cache is True
+        assert result.changed is False
+        assert scraper.fetch_minutes.await_count == 1
+        http_client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_not_modified_skips_scraping(self, service, http_client, scraper):
+        await service.scrape(URL)
+        entry = service.index.get(URL)
+        entry.etag = '"v1"'
+        service.index.put(entry)
+        http_client.get.return_value = create_http_response("", URL, status=304)
+
+        result = await service.scrape(URL, use_cache=False)
+
+        assert result.from_cache is True
+        assert result.changed is False
+        assert result.minutes.content == "議事録の本文"
+        http_client.get.assert_awaited_once_with(URL, etag='"v1"', last_modified=None)
+        assert scraper.fetch_minutes.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_validators_are_recorded_on_first_scrape(
+        self, service, http_client, scraper
+    ):
+        minutes = create_minutes()
+        record_validators(
+            minutes,
+            create_http_response(
+                PAGE, URL, etag='"v1"', last_modified="Sat, 01 Jun 2024 00:00:00 GMT"
+            ),
+        )
+        scraper.fetch_minutes.return_value = minutes
+        await service.scrape(URL)
+        http_client.get.return_value = create_http_response("", URL, status=304)
+
+        # 初回取得時の検証子で条件付きリクエストを送るため、取得し直さない
+        result = await service.scrape(URL, use_cache=False)
+
+        assert result.from_cache is True
+        assert scraper.fetch_minutes.await_count == 1
+        http_client.get.assert_awaited_once_with(
+            URL, etag='"v1"', last_modified="Sat, 01 Jun 2024 00:00:00 GMT"
+        )
+        assert service.index.get(URL).body_hash == hash_bytes(PAGE.encode())
+
+    @pytest.mark.asyncio
+    async def test_body_hash_is_recorded_on_first_scrape(
+        self, service, http_client, scraper
+    ):
+        minutes = create_minutes()
+        record_validators(minutes, create_http_response(PAGE, URL))
+        scraper.fetch_minutes.return_value = minutes
+        await service.scrape(URL)
+        # 検証子を返さないサーバーでも本文のハッシュで変更なしと判定できる
+        http_client.get.return_value = create_http_response(PAGE, URL)
+
+        result = await service.scrape(URL, use_cache=False)
+
+        assert result.from_cache is True
+        assert scraper.fetch_minutes.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_validators_are_learned_on_first_revalidation(
+        self, service, http_client, scraper
+    ):
+        # スクレーパーが検証子を記録しなかった場合は確認時のレスポンスから保存する
+        await service.scrape(URL)
+        http_client.get.return_value = create_http_response(
+            PAGE, URL, etag='"v1"', last_modified="Sat, 01 Jun 2024 00:00:00 GMT"
+        )
+
+        first = await service.scrape(URL, use_cache=False)
+        second = await service.scrape(URL, use_cache=False)
+
+        assert first.from_cache is False
+        assert second.from_cache is True
+        assert scraper.fetch_minutes.await_count == 2
+        assert service.index.get(URL).etag == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_changed_page_is_rescraped(self, service, http_client, scraper):
+        await service.scrape(URL)
+        entry = service.index.get(URL)
+        entry.body_hash = hash_bytes(PAGE.encode())
+        service.index.put(entry)
+        http_client.get.return_value = create_http_response(PAGE + "訂正", URL)
+        scraper.fetch_minutes.return_value = create_minutes("訂正後の本文")
+
+        result = await service.scrape(URL, use_cache=False)
+
+        assert result.changed is True
+        assert result.minutes.content == "訂正後の本文"
+        assert service.index.get(URL).content_hash == hash_text("訂正後の本文")
+
+    @pytest.mark.asyncio
+    async def test_rendered_pages_compare_content_hash(
+        self, service, http_client, scraper
+    ):
+        scraper.fetch_minutes.return_value = create_minutes(static=False)
+        await service.scrape(URL)
+
+        result = await service.scrape(URL, use_cache=False)
+
+        # ブラウザで描画したページは条件付きリクエストを使わない
+        http_client.get.assert_not_awaited()
+        assert scraper.fetch_minutes.await_count == 2
+        assert result.changed is False
+        assert result.from_cache is False
+
+    @pytest.mark.asyncio
+    async def test_stale_cache_is_revalidated(self, service, http_client):
+        await service.scrape(URL)
+        entry = service.index.get(URL)
+        entry.checked_at -= timedelta(days=2)
+        entry.etag = '"v1"'
+        service.index.put(entry)
+        http_client.get.return_value = create_http_response("", URL, status=304)
+
+        result = await service.scrape(URL)
+
+        assert result.from_cache is True
+        http_client.get.assert_awaited_once()
+        assert datetime.now() - service.index.get(URL).checked_at < timedelta(minutes=1)
+
+    @pytest.mark.asyncio
+    async def test_cache_without_index_entry_is_indexed(self, service, scraper):
+        service._save_to_cache(URL, create_minutes())
+
+        result = await service.scrape(URL)
+
+        assert result.from_cache is True
+        assert service.index.get(URL).content_hash == hash_text("議事録の本文")
+        scraper.fetch_minutes.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_scrape_multiple_saves_index_once(self, service, scraper):
+        urls = [f"{URL}&page={i}" for i in range(3)]
+        scraper.fetch_minutes.side_effect = [
+            create_minutes(f"本文{i}") for i in range(len(urls))
+        ]
+
+        with patch.object(service.index, "_save") as save:
+            results = await service.scrape_multiple(urls)
+
+        assert [result.changed for result in results] == [True, True, True]
+        save.assert_called_once()